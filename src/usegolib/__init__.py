@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+import importlib.metadata
+
+try:
+    __version__ = importlib.metadata.version("usegolib")
+except importlib.metadata.PackageNotFoundError:  # pragma: no cover - source tree without metadata
+    __version__ = "0.0.0"
+
 from . import abi, errors
 from .artifact import load_artifact
-from .importer import import_
+from .importer import import_, preload
 
 __all__ = [
+    "__version__",
     "abi",
     "errors",
     "import_",
     "load_artifact",
+    "preload",
 ]
 
@@ -26,7 +26,24 @@ class ABIResponse:
     error: ABIError | None = None
 
 
-def encode_call_request(*, pkg: str, fn: str, args: list[Any]) -> bytes:
+def _add_call_options(payload: dict[str, Any], *, timeout_ns: int | None, cancel: int | None) -> None:
+    if timeout_ns is not None:
+        payload["timeout_ns"] = timeout_ns
+    if cancel is not None:
+        payload["cancel"] = cancel
+
+
+def encode_call_request(
+    *,
+    pkg: str,
+    fn: str,
+    args: list[Any],
+    timeout_ns: int | None = None,
+    cancel: int | None = None,
+    select: list[str] | None = None,
+    lazy: bool = False,
+    packed: bool = False,
+) -> bytes:
     payload = {
         "abi": ABI_VERSION,
         "op": "call",
@@ -34,10 +51,22 @@ def encode_call_request(*, pkg: str, fn: str, args: list[Any]) -> bytes:
         "fn": fn,
         "args": args,
     }
+    _add_call_options(payload, timeout_ns=timeout_ns, cancel=cancel)
+    if select:
+        payload["select"] = select
+    if lazy:
+        payload["lazy"] = True
+    if packed:
+        payload["packed"] = True
     return msgpack.packb(payload, use_bin_type=True)
 
 
-def encode_obj_new_request(*, pkg: str, type_name: str, init: Any | None) -> bytes:
+def pack_args(args: list[Any]) -> bytes:
+    """Pack call arguments as they appear in a call request (used as cache keys)."""
+    return msgpack.packb(args, use_bin_type=True)
+
+
+def encode_obj_new_request(*, pkg: str, type_name: str, init: Any | None, mode: str | None = None) -> bytes:
     payload = {
         "abi": ABI_VERSION,
         "op": "obj_new",
@@ -46,10 +75,24 @@ def encode_obj_new_request(*, pkg: str, type_name: str, init: Any | None) -> byt
     }
     if init is not None:
         payload["init"] = init
+    if mode is not None:
+        payload["mode"] = mode
     return msgpack.packb(payload, use_bin_type=True)
 
 
-def encode_obj_call_request(*, pkg: str, type_name: str, obj_id: int, method: str, args: list[Any]) -> bytes:
+def encode_obj_call_request(
+    *,
+    pkg: str,
+    type_name: str,
+    obj_id: int,
+    method: str,
+    args: list[Any],
+    timeout_ns: int | None = None,
+    cancel: int | None = None,
+    select: list[str] | None = None,
+    lazy: bool = False,
+    packed: bool = False,
+) -> bytes:
     payload = {
         "abi": ABI_VERSION,
         "op": "obj_call",
@@ -59,9 +102,193 @@ def encode_obj_call_request(*, pkg: str, type_name: str, obj_id: int, method: st
         "method": method,
         "args": args,
     }
+    _add_call_options(payload, timeout_ns=timeout_ns, cancel=cancel)
+    if select:
+        payload["select"] = select
+    if lazy:
+        payload["lazy"] = True
+    if packed:
+        payload["packed"] = True
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def encode_obj_get_request(*, pkg: str, type_name: str, obj_id: int, fields: list[str]) -> bytes:
+    payload = {
+        "abi": ABI_VERSION,
+        "op": "obj_get",
+        "pkg": pkg,
+        "type": type_name,
+        "id": obj_id,
+        "fields": fields,
+    }
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def encode_obj_set_request(*, pkg: str, type_name: str, obj_id: int, field: str, value: Any) -> bytes:
+    payload = {
+        "abi": ABI_VERSION,
+        "op": "obj_set",
+        "pkg": pkg,
+        "type": type_name,
+        "id": obj_id,
+        "fields": [field],
+        "value": value,
+    }
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def encode_lazy_request(
+    *, op: str, lazy_id: int, start: int | None = None, stop: int | None = None, keys: list[str] | None = None
+) -> bytes:
+    """Encode `lazy_range` (start/stop), `lazy_get` (keys) or `lazy_free` for a lazy result."""
+    payload: dict[str, Any] = {"abi": ABI_VERSION, "op": op, "id": lazy_id}
+    if start is not None:
+        payload["start"] = start
+    if stop is not None:
+        payload["stop"] = stop
+    if keys is not None:
+        payload["fields"] = keys
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def encode_stream_request(
+    *,
+    op: str,
+    stream_id: int,
+    chunk: int | None = None,
+    timeout_ns: int | None = None,
+    cancel: int | None = None,
+) -> bytes:
+    """Encode `stream_next` (up to `chunk` items) or `stream_close` for a stream result."""
+    payload: dict[str, Any] = {"abi": ABI_VERSION, "op": op, "id": stream_id}
+    if chunk is not None:
+        payload["chunk"] = chunk
+    _add_call_options(payload, timeout_ns=timeout_ns, cancel=cancel)
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def encode_reader_request(
+    *,
+    op: str,
+    reader_id: int | None = None,
+    value: Any | None = None,
+    eof: bool = False,
+    err: str | None = None,
+    path: str | None = None,
+    fd: int | None = None,
+) -> bytes:
+    """Encode `reader_new` (path/fd), `reader_push` (value/eof/err) or `reader_free`."""
+    payload: dict[str, Any] = {"abi": ABI_VERSION, "op": op}
+    if reader_id is not None:
+        payload["id"] = reader_id
+    if value is not None:
+        payload["value"] = value
+    if eof:
+        payload["eof"] = True
+    if err is not None:
+        payload["err"] = err
+    if path is not None:
+        payload["path"] = path
+    if fd is not None:
+        payload["fd"] = fd
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def encode_io_request(*, op: str, obj_id: int, chunk: int | None = None, value: Any | None = None) -> bytes:
+    """Encode `io_read` (chunk), `io_write` (value), `io_info` or `io_close` on an io handle."""
+    payload: dict[str, Any] = {"abi": ABI_VERSION, "op": op, "id": obj_id}
+    if chunk is not None:
+        payload["chunk"] = chunk
+    if value is not None:
+        payload["value"] = value
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def encode_obj_new_many_request(*, pkg: str, type_name: str, inits: list[Any], mode: str | None = None) -> bytes:
+    payload: dict[str, Any] = {
+        "abi": ABI_VERSION,
+        "op": "obj_new_many",
+        "pkg": pkg,
+        "type": type_name,
+        "inits": inits,
+    }
+    if mode is not None:
+        payload["mode"] = mode
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def encode_obj_call_many_request(
+    *,
+    pkg: str,
+    type_name: str,
+    ids: bytes,
+    method: str,
+    args: list[Any],
+    parallel: int = 0,
+    timeout_ns: int | None = None,
+    cancel: int | None = None,
+) -> bytes:
+    """Encode `obj_call_many`; `ids` are little-endian uint64 object ids packed into bytes."""
+    payload: dict[str, Any] = {
+        "abi": ABI_VERSION,
+        "op": "obj_call_many",
+        "pkg": pkg,
+        "type": type_name,
+        "ids": ids,
+        "method": method,
+        "args": args,
+    }
+    if parallel > 1:
+        payload["parallel"] = parallel
+    _add_call_options(payload, timeout_ns=timeout_ns, cancel=cancel)
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def encode_pipeline_request(
+    *,
+    pkg: str,
+    steps: list[dict[str, Any]],
+    outputs: list[int],
+    free: list[dict[str, Any]],
+    timeout_ns: int | None = None,
+    cancel: int | None = None,
+) -> bytes:
+    payload = {
+        "abi": ABI_VERSION,
+        "op": "pipeline",
+        "pkg": pkg,
+        "steps": steps,
+        "outputs": outputs,
+        "free": free,
+    }
+    _add_call_options(payload, timeout_ns=timeout_ns, cancel=cancel)
     return msgpack.packb(payload, use_bin_type=True)
 
 
+def encode_batch_request(requests: list[bytes]) -> bytes:
+    """Encode already-encoded requests as one `batch` request (served concurrently Go-side)."""
+    payload = {"abi": ABI_VERSION, "op": "batch", "batch": list(requests)}
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def request_op(request: bytes) -> str | None:
+    """Return the `op` of an encoded request without decoding its arguments (None if not found).
+
+    Every encoder writes `abi` and `op` first, so only the head of the request is read.
+    """
+    unpacker = msgpack.Unpacker(raw=False)
+    unpacker.feed(request[:64])
+    try:
+        for _ in range(unpacker.read_map_header()):
+            if unpacker.unpack() == "op":
+                op = unpacker.unpack()
+                return op if isinstance(op, str) else None
+            unpacker.skip()
+    except Exception:  # noqa: BLE001 - truncated head or not a map
+        return None
+    return None
+
+
 def encode_obj_free_request(*, obj_id: int) -> bytes:
     payload = {
         "abi": ABI_VERSION,
@@ -71,6 +298,39 @@ def encode_obj_free_request(*, obj_id: int) -> bytes:
     return msgpack.packb(payload, use_bin_type=True)
 
 
+def encode_obj_free_many_request(*, ids: bytes) -> bytes:
+    payload = {"abi": ABI_VERSION, "op": "obj_free_many", "ids": ids}
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def encode_cancel_request(*, op: str, token_id: int | None = None) -> bytes:
+    """Encode a cancel-token op: `cancel_new`, `cancel` or `cancel_free`."""
+    payload: dict[str, Any] = {"abi": ABI_VERSION, "op": op}
+    if token_id is not None:
+        payload["id"] = token_id
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def encode_pin_request(*, op: str, value: Any = None, pin_id: int | None = None) -> bytes:
+    """Encode a pinned-value op: `pin_new`/`pin_mem` (with `value`) or `pin_free` (with `pin_id`)."""
+    payload: dict[str, Any] = {"abi": ABI_VERSION, "op": op}
+    if op in ("pin_new", "pin_mem"):
+        payload["value"] = value
+    if pin_id is not None:
+        payload["id"] = pin_id
+    return msgpack.packb(payload, use_bin_type=True)
+
+
+def encode_limits_request(*, op: str, key: str | None = None, limit: dict[str, Any] | None = None) -> bytes:
+    """Encode an admission-limit op: `limits_set` or `limits_stats`."""
+    payload: dict[str, Any] = {"abi": ABI_VERSION, "op": op}
+    if key:
+        payload["key"] = key
+    if limit is not None:
+        payload["limit"] = limit
+    return msgpack.packb(payload, use_bin_type=True)
+
+
 def decode_response(payload: bytes) -> ABIResponse:
     try:
         obj = msgpack.unpackb(payload, raw=False)
@@ -0,0 +1,177 @@
+"""Record slices exported through the Arrow C data interface."""
+
+from __future__ import annotations
+
+import ctypes
+from typing import TYPE_CHECKING, Any
+
+from . import abi
+from .errors import UnsupportedTypeError
+
+if TYPE_CHECKING:
+    from .lazy import GoSequence
+
+
+class ArrowSchema(ctypes.Structure):
+    pass
+
+
+class ArrowArray(ctypes.Structure):
+    pass
+
+
+ArrowSchema._fields_ = [
+    ("format", ctypes.c_char_p),
+    ("name", ctypes.c_char_p),
+    ("metadata", ctypes.c_char_p),
+    ("flags", ctypes.c_int64),
+    ("n_children", ctypes.c_int64),
+    ("children", ctypes.POINTER(ctypes.POINTER(ArrowSchema))),
+    ("dictionary", ctypes.POINTER(ArrowSchema)),
+    ("release", ctypes.CFUNCTYPE(None, ctypes.POINTER(ArrowSchema))),
+    ("private_data", ctypes.c_void_p),
+]
+ArrowArray._fields_ = [
+    ("length", ctypes.c_int64),
+    ("null_count", ctypes.c_int64),
+    ("offset", ctypes.c_int64),
+    ("n_buffers", ctypes.c_int64),
+    ("n_children", ctypes.c_int64),
+    ("buffers", ctypes.POINTER(ctypes.c_void_p)),
+    ("children", ctypes.POINTER(ctypes.POINTER(ArrowArray))),
+    ("dictionary", ctypes.POINTER(ArrowArray)),
+    ("release", ctypes.CFUNCTYPE(None, ctypes.POINTER(ArrowArray))),
+    ("private_data", ctypes.c_void_p),
+]
+
+# Fixed-width Arrow formats and their NumPy dtypes.
+_DTYPES = {
+    "c": "i1",
+    "s": "i2",
+    "i": "i4",
+    "l": "i8",
+    "C": "u1",
+    "S": "u2",
+    "I": "u4",
+    "L": "u8",
+    "f": "f4",
+    "g": "f8",
+    "tsn:UTC": "datetime64[ns]",
+    "tDn": "timedelta64[ns]",
+}
+
+
+def export(seq: "GoSequence") -> tuple[ArrowSchema, ArrowArray]:
+    """Export a lazy slice of record structs; the caller owns (and releases) the structs."""
+    from .handle import _raise_call_error
+
+    fn = getattr(seq._pkg._client, "arrow_export", None)  # noqa: SLF001 - internal linkage
+    if fn is None:
+        raise UnsupportedTypeError("arrow: export needs the in-process library client")
+    schema, array = ArrowSchema(), ArrowArray()
+    err = fn(seq.id, ctypes.addressof(schema), ctypes.addressof(array))
+    if err is not None:
+        _raise_call_error(abi.decode_response(err).error)
+    return schema, array
+
+
+def to_pyarrow(seq: "GoSequence") -> Any:
+    """Export a lazy slice of record structs as a `pyarrow.RecordBatch` (no copy)."""
+    try:
+        import pyarrow as pa
+    except ImportError as e:  # pragma: no cover - depends on the environment
+        raise UnsupportedTypeError("arrow results need pyarrow installed (or use .columns())") from e
+    schema, array = export(seq)
+    try:
+        # pyarrow moves the structs, taking over their release callbacks.
+        return pa.RecordBatch._import_from_c(ctypes.addressof(array), ctypes.addressof(schema))
+    finally:
+        _release(schema)
+        _release(array)
+
+
+def to_columns(seq: "GoSequence") -> dict[str, Any]:
+    """Export a lazy slice of record structs as a dict of NumPy arrays, one per field.
+
+    Fixed-width columns share the exported buffers. Nulls (nil pointers) are masked
+    in numeric columns and None in object columns; strings, bytes and slices are
+    object arrays, and nested structs are nested dicts of columns.
+    """
+    try:
+        import numpy as np
+    except ImportError as e:  # pragma: no cover - depends on the environment
+        raise UnsupportedTypeError("column results need NumPy installed") from e
+    schema, array = export(seq)
+    owner = _Owner(array)
+    try:
+        return _struct_columns(np, schema, array, owner, None)
+    finally:
+        _release(schema)
+
+
+class _Owner:
+    """Releases the exported array once no column shares its buffers."""
+
+    def __init__(self, array: ArrowArray) -> None:
+        self._array = array
+
+    def __del__(self) -> None:
+        _release(self._array)
+
+
+def _release(c: Any) -> None:
+    if c.release:
+        c.release(ctypes.byref(c))
+
+
+def _buffer(np: Any, a: ArrowArray, i: int, nbytes: int, dtype: str, owner: _Owner) -> Any:
+    ptr = a.buffers[i]
+    if not ptr or nbytes == 0:
+        return np.zeros(0, dtype=dtype)
+    raw = (ctypes.c_char * nbytes).from_address(ptr)
+    raw._owner = owner  # keep the export alive while NumPy views the memory
+    return np.frombuffer(raw, dtype=dtype)
+
+
+def _bits(np: Any, a: ArrowArray, i: int, n: int, owner: _Owner) -> Any:
+    packed = _buffer(np, a, i, (n + 7) // 8, "u1", owner)
+    return np.unpackbits(packed, bitorder="little")[:n].astype(bool)
+
+
+def _struct_columns(np: Any, s: ArrowSchema, a: ArrowArray, owner: _Owner, mask: Any) -> dict[str, Any]:
+    return {
+        s.children[i].contents.name.decode(): _column(np, s.children[i].contents, a.children[i].contents, owner, mask)
+        for i in range(s.n_children)
+    }
+
+
+def _column(np: Any, s: ArrowSchema, a: ArrowArray, owner: _Owner, parent_mask: Any) -> Any:
+    fmt = s.format.decode()
+    n = a.length
+    mask = ~_bits(np, a, 0, n, owner) if a.null_count else None
+    if parent_mask is not None:
+        mask = parent_mask if mask is None else mask | parent_mask
+
+    if fmt == "+s":
+        return _struct_columns(np, s, a, owner, mask)
+    if fmt in _DTYPES or fmt.startswith("w:"):
+        dtype = np.dtype(_DTYPES.get(fmt) or f"V{fmt[2:]}")
+        values = _buffer(np, a, 1, n * dtype.itemsize, dtype.str, owner)
+    elif fmt == "b":
+        values = _bits(np, a, 1, n, owner)
+    else:
+        offsets = _buffer(np, a, 1, (n + 1) * 8, "<i8", owner)
+        values = np.empty(n, dtype=object)
+        if fmt == "+L":
+            items = _column(np, s.children[0].contents, a.children[0].contents, owner, None)
+            for i in range(n):
+                values[i] = items[offsets[i] : offsets[i + 1]]
+        else:
+            data = ctypes.string_at(a.buffers[2], int(offsets[-1])) if n and offsets[-1] else b""
+            for i in range(n):
+                chunk = data[offsets[i] : offsets[i + 1]]
+                values[i] = chunk.decode() if fmt == "U" else chunk
+        if mask is not None:
+            values[mask] = None
+        return values
+    return values if mask is None else np.ma.masked_array(values, mask=mask)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import os
 import shutil
@@ -14,6 +16,15 @@ from .errors import AmbiguousArtifactError, ArtifactNotFoundError, LoadError
 from .runtime.platform import host_goarch, host_goos
 
 
+@dataclass(frozen=True)
+class BundleModule:
+    """A Go module built into a bundle artifact."""
+
+    module: str
+    version: str
+    packages: list[str]
+
+
 @dataclass(frozen=True)
 class ArtifactManifest:
     manifest_version: int
@@ -27,11 +38,76 @@ class ArtifactManifest:
     schema: dict[str, Any] | None
     library_path: Path
     library_sha256: str
+    manifest_path: Path | None = None
+    # Set for bundle artifacts: several Go modules sharing one library/runtime.
+    bundle_modules: list[BundleModule] | None = None
+
+    def member_for_package(self, package: str) -> tuple[str, str]:
+        """Return `(module, version)` of the Go module providing `package`.
+
+        For regular artifacts this is the artifact module itself. For bundles it is
+        the member module that lists `package` (or whose path prefixes it).
+        """
+        return _member_for_package(
+            module=self.module,
+            version=self.version,
+            bundle_modules=self.bundle_modules,
+            package=package,
+        )
+
+    def members(self) -> list[tuple[str, str]]:
+        """Return `(module, version)` for every Go module in this artifact."""
+        if self.bundle_modules is None:
+            return [(self.module, self.version)]
+        return [(b.module, b.version) for b in self.bundle_modules]
+
+
+def _member_for_package(
+    *, module: str, version: str, bundle_modules: list[BundleModule] | None, package: str
+) -> tuple[str, str]:
+    if bundle_modules is None:
+        return module, version
+    best: BundleModule | None = None
+    for b in bundle_modules:
+        if package in b.packages:
+            return b.module, b.version
+        if package == b.module or package.startswith(b.module + "/"):
+            if best is None or len(b.module) > len(best.module):
+                best = b
+    if best is not None:
+        return best.module, best.version
+    return module, version
+
+
+def _parse_bundle_modules(obj: Any) -> list[BundleModule] | None:
+    if obj is None:
+        return None
+    if not isinstance(obj, dict) or not isinstance(obj.get("modules"), list):
+        raise ValueError("bundle must be an object with a 'modules' list")
+    out: list[BundleModule] = []
+    for m in obj["modules"]:
+        if not isinstance(m, dict):
+            raise ValueError("bundle module entry must be an object")
+        out.append(
+            BundleModule(
+                module=str(m["module"]),
+                version=str(m["version"]),
+                packages=list(m.get("packages", [])),
+            )
+        )
+    return out
 
 
 _INDEX_VERSION = 1
 _INDEX_NAME = ".usegolib-index.json"
 
+# Sidecars written next to `manifest.json` by the runtime (best-effort) and by
+# `usegolib warm`. They only cache work derived from the artifact itself.
+_VERIFY_CACHE_VERSION = 1
+_VERIFY_CACHE_NAME = ".usegolib-verified.json"
+_SCHEMA_SIDECAR_VERSION = 3
+_SCHEMA_SIDECAR_NAME = ".usegolib-schema.msgpack"
+
 
 def _index_path(root: Path) -> Path:
     return Path(root) / _INDEX_NAME
@@ -83,6 +159,8 @@ def read_manifest(path_or_dir: Path) -> ArtifactManifest:
         schema=schema,
         library_path=lib_path,
         library_sha256=str(lib.get("sha256", "")),
+        manifest_path=manifest_path,
+        bundle_modules=_parse_bundle_modules(obj.get("bundle")),
     )
     except Exception as e:  # noqa: BLE001 - boundary parse
         raise LoadError(f"invalid manifest.json schema: {e}") from e
@@ -93,7 +171,11 @@ def load_artifact(path_or_dir: str | Path):
     from .handle import PackageHandle  # local import to avoid cycles
 
     manifest = read_manifest(Path(path_or_dir))
-    return PackageHandle.from_manifest(manifest, package=manifest.module)
+    package = manifest.module
+    if manifest.bundle_modules:
+        # A bundle has no package of its own; default to its first member module.
+        package = manifest.bundle_modules[0].module
+    return PackageHandle.from_manifest(manifest, package=package)
 
 
 def _scan_manifest_dirs(artifact_root: Path) -> list[Path]:
@@ -114,29 +196,36 @@ def _build_index(artifact_root: Path) -> dict[str, Any]:
         except Exception:
             # Only index manifests under the artifact root.
             continue
-        entries.append(
-            {
-                "manifest_dir": rel,
-                "module": m.module,
-                "version": m.version,
-                "goos": m.goos,
-                "goarch": m.goarch,
-                "packages": m.packages,
-            }
-        )
+        entry: dict[str, Any] = {
+            "manifest_dir": rel,
+            "module": m.module,
+            "version": m.version,
+            "goos": m.goos,
+            "goarch": m.goarch,
+            "packages": m.packages,
+        }
+        if m.bundle_modules is not None:
+            entry["bundle_modules"] = [
+                {"module": b.module, "version": b.version, "packages": b.packages}
+                for b in m.bundle_modules
+            ]
+        entries.append(entry)
     return {"index_version": _INDEX_VERSION, "entries": entries}
 
 
 def _write_index_atomic(artifact_root: Path, index_obj: dict[str, Any]) -> None:
     root = Path(artifact_root)
-    path = _index_path(root)
     root.mkdir(parents=True, exist_ok=True)
+    _write_bytes_atomic(_index_path(root), json.dumps(index_obj, indent=2).encode("utf-8"))
 
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    path = Path(path)
     # Atomic replace to be safe under concurrent writers.
-    fd, tmp = tempfile.mkstemp(prefix=path.name + ".", dir=str(root))
+    fd, tmp = tempfile.mkstemp(prefix=path.name + ".", dir=str(path.parent))
     try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(index_obj, f, indent=2)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
         os.replace(tmp, path)
     finally:
         try:
@@ -146,6 +235,129 @@ def _write_index_atomic(artifact_root: Path, index_obj: dict[str, Any]) -> None:
             pass
 
 
+def _file_stamp(path: Path) -> dict[str, int]:
+    st = os.stat(path)
+    return {"size": int(st.st_size), "mtime_ns": int(st.st_mtime_ns)}
+
+
+def library_stamp(lib_path: Path) -> dict[str, int] | None:
+    """Return the stat fingerprint used to key the verification cache."""
+    try:
+        return _file_stamp(Path(lib_path))
+    except OSError:
+        return None
+
+
+def read_verified_sha256(lib_path: Path) -> str | None:
+    """Return the cached sha256 for `lib_path` if the file is unchanged since it was hashed.
+
+    The cache lives next to the library (`.usegolib-verified.json`) and is keyed by
+    file name, size and mtime. Any mismatch or parse failure is a cache miss.
+    """
+    lib_path = Path(lib_path)
+    path = lib_path.parent / _VERIFY_CACHE_NAME
+    try:
+        obj = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    if not isinstance(obj, dict) or obj.get("cache_version") != _VERIFY_CACHE_VERSION:
+        return None
+    if obj.get("library") != lib_path.name:
+        return None
+    stamp = library_stamp(lib_path)
+    if stamp is None or obj.get("stamp") != stamp:
+        return None
+    sha = obj.get("sha256")
+    return sha if isinstance(sha, str) else None
+
+
+def write_verified_sha256(lib_path: Path, sha256: str, *, stamp: dict[str, int] | None = None) -> None:
+    """Record that `lib_path` hashed to `sha256`.
+
+    Pass the `stamp` taken before hashing so a file that changed while it was
+    being hashed is not recorded as verified. Raises OSError on write failure.
+    """
+    lib_path = Path(lib_path)
+    current = _file_stamp(lib_path)
+    if stamp is not None and stamp != current:
+        return
+    obj = {
+        "cache_version": _VERIFY_CACHE_VERSION,
+        "library": lib_path.name,
+        "stamp": current,
+        "sha256": sha256,
+    }
+    _write_bytes_atomic(lib_path.parent / _VERIFY_CACHE_NAME, json.dumps(obj, indent=2).encode("utf-8"))
+
+
+@functools.lru_cache(maxsize=1)
+def _schema_code_fingerprint() -> str:
+    """Hash of the code that compiles and serializes schemas.
+
+    Editable and dev installs keep one `__version__` across code changes; keying
+    sidecars on the source as well makes them stale whenever that code changes.
+    """
+    from . import __version__, schema
+
+    h = hashlib.sha256(__version__.encode("utf-8"))
+    try:
+        h.update(Path(schema.__file__).read_bytes())
+    except (OSError, TypeError):
+        pass
+    return h.hexdigest()
+
+
+def _schema_sidecar_key(manifest: ArtifactManifest) -> dict[str, Any] | None:
+    if manifest.manifest_path is None:
+        return None
+    try:
+        stamp = _file_stamp(manifest.manifest_path)
+    except OSError:
+        return None
+    return {
+        "sidecar_version": _SCHEMA_SIDECAR_VERSION,
+        "code": _schema_code_fingerprint(),
+        "manifest": stamp,
+        "library_sha256": manifest.library_sha256,
+    }
+
+
+def read_schema_sidecar(manifest: ArtifactManifest):
+    """Return the precompiled `Schema` for `manifest`, or None on a cache miss.
+
+    The sidecar is a JSON key line followed by `Schema.to_dict()` as MessagePack
+    (plain data, never executable); the payload is only decoded when the key
+    matches, and any read or decode failure is a miss.
+    """
+    import msgpack
+
+    from .schema import Schema
+
+    key = _schema_sidecar_key(manifest)
+    if key is None:
+        return None
+    path = Path(manifest.manifest_path).parent / _SCHEMA_SIDECAR_NAME
+    try:
+        header, _, payload = path.read_bytes().partition(b"\n")
+        if json.loads(header) != key:
+            return None
+        return Schema.from_dict(msgpack.unpackb(payload, raw=False, strict_map_key=True))
+    except Exception:  # noqa: BLE001 - a broken cache file must never fail an import
+        return None
+
+
+def write_schema_sidecar(manifest: ArtifactManifest, schema) -> None:
+    """Write the compiled `Schema` next to `manifest.json`. Raises OSError on write failure."""
+    import msgpack
+
+    key = _schema_sidecar_key(manifest)
+    if key is None:
+        return
+    header = json.dumps(key, sort_keys=True).encode("utf-8")
+    data = header + b"\n" + msgpack.packb(schema.to_dict(), use_bin_type=True)
+    _write_bytes_atomic(Path(manifest.manifest_path).parent / _SCHEMA_SIDECAR_NAME, data)
+
+
 def _load_index(artifact_root: Path) -> dict[str, Any] | None:
     path = _index_path(Path(artifact_root))
     if not path.exists():
@@ -183,8 +395,22 @@ def _resolve_from_index(
         pkgs = e.get("packages")
         if not isinstance(pkgs, list) or package not in pkgs:
             continue
-        if version is not None and e.get("version") != version:
-            continue
+        if version is not None:
+            try:
+                bundle = _parse_bundle_modules(
+                    {"modules": e["bundle_modules"]} if "bundle_modules" in e else None
+                )
+            except Exception:
+                dirty = True
+                continue
+            _mod, member_version = _member_for_package(
+                module=str(e.get("module")),
+                version=str(e.get("version")),
+                bundle_modules=bundle,
+                package=package,
+            )
+            if member_version != version:
+                continue
 
         rel = e.get("manifest_dir")
         if not isinstance(rel, str) or not rel:
@@ -238,9 +464,7 @@ def resolve_manifest(
                 continue
             if m.goos != goos or m.goarch != goarch:
                 continue
-            if package not in m.packages:
-                continue
-            if version is not None and m.version != version:
+            if not _manifest_matches(m, package=package, version=version):
                 continue
             scanned.append(m)
         candidates = scanned
@@ -255,16 +479,28 @@ def resolve_manifest(
             f"no matching artifact found for {wanted} on {goos}/{goarch} under {artifact_root}"
         )
 
-    if version is None and len(candidates) != 1:
-        versions = sorted({c.version for c in candidates})
+    versions = sorted({c.member_for_package(package)[1] for c in candidates})
+    if version is None and len(versions) != 1:
         raise AmbiguousArtifactError(
             f"multiple artifacts found for {package} on {goos}/{goarch}: {versions}"
         )
 
-    # version specified: take first (should be unique in a well-formed artifact dir)
+    # One version: prefer a bundle (one shared Go runtime) over a standalone
+    # artifact of the same module version, otherwise take the first.
+    for c in candidates:
+        if c.bundle_modules is not None:
+            return c
     return candidates[0]
 
 
+def _manifest_matches(m: ArtifactManifest, *, package: str, version: str | None) -> bool:
+    if package not in m.packages:
+        return False
+    if version is not None and m.member_for_package(package)[1] != version:
+        return False
+    return True
+
+
 def find_manifest_dirs(
     artifact_root: Path,
     *,
@@ -293,9 +529,7 @@ def find_manifest_dirs(
             continue
         if m.goos != goos or m.goarch != goarch:
             continue
-        if package not in m.packages:
-            continue
-        if version is not None and m.version != version:
+        if not _manifest_matches(m, package=package, version=version):
             continue
         out.append(Path(d))
     return out
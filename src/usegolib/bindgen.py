@@ -29,7 +29,7 @@ def _py_type_expr(*, schema: Schema, pkg: str, go_type: str) -> str:
         expr = "bool"
     elif base in {"float32", "float64"}:
         expr = "float"
-    elif base in {"int", "int8", "int16", "int32", "int64"}:
+    elif base in {"int", "int8", "int16", "int32", "int64", "uint", "uint8", "uint16", "uint32", "uint64"}:
         expr = "int"
     elif base in schema.structs_by_pkg.get(pkg, {}):
         expr = base
@@ -176,6 +176,10 @@ def generate_python_bindings(*, schema: Schema, pkg: str, out_file: Path, opts:
             arg_name = f"arg{i}"
             arg_parts.append(f"{arg_name}: {_py_type_expr(schema=schema, pkg=pkg, go_type=t)}")
             call_args.append(arg_name)
+        if fn_name in schema.context_symbols_by_pkg.get(pkg, set()):
+            # Go function takes context.Context: expose per-call deadline/cancellation.
+            arg_parts.extend(["*", "timeout: float | None = None", "cancel: Any = None"])
+            call_args.extend(["timeout=timeout", "cancel=cancel"])
         args_sig = ", ".join(["self", *arg_parts])
         lines.append(f"    def {fn_name}({args_sig}) -> {ret_py}:")
         doc = schema.symbol_docs_by_pkg.get(pkg, {}).get(fn_name)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ..errors import BuildError
+from ..schema import OBJECT_MODES
+from .symbols import ExportedFunc, ExportedMethod
+
+
+@dataclass(frozen=True)
+class TypeAnnotation:
+    pkg: str
+    name: str
+    # Default concurrency mode for handles of this type (None -> "unsafe", no locking).
+    concurrency: str | None = None
+    # Methods that only read the receiver; they share the lock in "rwlock" mode.
+    readonly: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class FunctionAnnotation:
+    pkg: str
+    name: str
+    # Deterministic and side-effect free: results may be cached by the runtime.
+    pure: bool = False
+
+
+@dataclass(frozen=True)
+class Annotations:
+    types: list[TypeAnnotation] = field(default_factory=list)
+    functions: list[FunctionAnnotation] = field(default_factory=list)
+
+    def schema_types(self) -> list[dict]:
+        return [
+            {"pkg": t.pkg, "name": t.name, "concurrency": t.concurrency, "readonly": list(t.readonly)}
+            for t in self.types
+        ]
+
+    def schema_functions(self) -> list[dict]:
+        return [{"pkg": f.pkg, "name": f.name, "pure": f.pure} for f in self.functions]
+
+
+def load_annotations(
+    *,
+    annotations: Path,
+    methods: list[ExportedMethod],
+    struct_types_by_pkg: dict[str, set[str]],
+    functions: list[ExportedFunc] | None = None,
+) -> Annotations:
+    """Load and validate a build-time annotations JSON file.
+
+    Format:
+      {"types": [{"pkg": "...", "name": "T", "concurrency": "rwlock", "readonly": ["Get"]}],
+       "functions": [{"pkg": "...", "name": "Fn", "pure": true}]}
+    """
+    annotations = Path(annotations)
+    if not annotations.exists():
+        raise BuildError(f"annotations file not found: {annotations}")
+    try:
+        obj = json.loads(annotations.read_text(encoding="utf-8"))
+    except Exception as e:  # noqa: BLE001
+        raise BuildError(f"failed to parse annotations JSON: {e}") from e
+    if not isinstance(obj, dict):
+        raise BuildError("annotations file must be a JSON object")
+
+    raw_types = obj.get("types", [])
+    if not isinstance(raw_types, list):
+        raise BuildError("annotations 'types' must be a list")
+
+    methods_by_type: dict[tuple[str, str], set[str]] = {}
+    for m in methods:
+        methods_by_type.setdefault((m.pkg, m.recv), set()).add(m.name)
+
+    types: list[TypeAnnotation] = []
+    seen: set[tuple[str, str]] = set()
+    for item in raw_types:
+        if not isinstance(item, dict):
+            raise BuildError("annotations type entry must be an object")
+        pkg = item.get("pkg")
+        name = item.get("name")
+        if not isinstance(pkg, str) or not isinstance(name, str):
+            raise BuildError("annotations type entry must include 'pkg' and 'name' strings")
+        if name not in struct_types_by_pkg.get(pkg, set()):
+            raise BuildError(f"annotations: struct type not found: {pkg}.{name}")
+        if (pkg, name) in seen:
+            raise BuildError(f"annotations: duplicate type entry: {pkg}.{name}")
+        seen.add((pkg, name))
+
+        concurrency = item.get("concurrency")
+        if concurrency is not None and concurrency not in OBJECT_MODES:
+            raise BuildError(
+                f"annotations: invalid concurrency for {pkg}.{name}: {concurrency!r} "
+                f"(expected one of {', '.join(OBJECT_MODES)})"
+            )
+        readonly = item.get("readonly", [])
+        if not isinstance(readonly, list) or not all(isinstance(x, str) for x in readonly):
+            raise BuildError(f"annotations: 'readonly' for {pkg}.{name} must be a list of method names")
+        known = methods_by_type.get((pkg, name), set())
+        for meth in readonly:
+            if meth not in known:
+                raise BuildError(f"annotations: method not found: {pkg}.{name}.{meth}")
+
+        types.append(TypeAnnotation(pkg=pkg, name=name, concurrency=concurrency, readonly=sorted(set(readonly))))
+
+    raw_functions = obj.get("functions", [])
+    if not isinstance(raw_functions, list):
+        raise BuildError("annotations 'functions' must be a list")
+    known_functions = {(f.pkg, f.name) for f in functions or []}
+    funcs: list[FunctionAnnotation] = []
+    seen_functions: set[tuple[str, str]] = set()
+    for item in raw_functions:
+        if not isinstance(item, dict):
+            raise BuildError("annotations function entry must be an object")
+        pkg = item.get("pkg")
+        name = item.get("name")
+        if not isinstance(pkg, str) or not isinstance(name, str):
+            raise BuildError("annotations function entry must include 'pkg' and 'name' strings")
+        if (pkg, name) not in known_functions:
+            raise BuildError(f"annotations: function not found: {pkg}.{name}")
+        if (pkg, name) in seen_functions:
+            raise BuildError(f"annotations: duplicate function entry: {pkg}.{name}")
+        seen_functions.add((pkg, name))
+        pure = item.get("pure", False)
+        if not isinstance(pure, bool):
+            raise BuildError(f"annotations: 'pure' for {pkg}.{name} must be a boolean")
+        funcs.append(FunctionAnnotation(pkg=pkg, name=name, pure=pure))
+
+    return Annotations(types=types, functions=funcs)
@@ -9,16 +9,27 @@ import subprocess
 import sys
 import tempfile
 import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from ..errors import BuildError
+from ..schema import IO_TYPES, stream_item_types
+from .annotations import Annotations, load_annotations
 from .fingerprint import fingerprint_local_module_dir
 from .lock import leaf_lock
-from .resolve import resolve_module_target
+from .resolve import ResolvedModule, resolve_module_target
 from .reuse import artifact_ready
 from .scan import scan_module
-from .symbols import ExportedFunc, ExportedMethod, ExportedVar, GenericFuncDef, GenericInstantiation
+from .symbols import (
+    ExportedFunc,
+    ExportedMethod,
+    ExportedVar,
+    GenericFuncDef,
+    GenericInstantiation,
+    ModuleScan,
+    StructField,
+)
 from .zig import ensure_zig
 
 
@@ -153,6 +164,11 @@ def _is_supported_type(t: str, *, struct_types: set[str] | None = None) -> bool:
         "int16",
         "int32",
         "int64",
+        "uint",
+        "uint8",
+        "uint16",
+        "uint32",
+        "uint64",
         "float32",
         "float64",
     }
@@ -181,10 +197,41 @@ def _is_supported_type(t: str, *, struct_types: set[str] | None = None) -> bool:
     return False
 
 
+def _are_supported_params(params: list[str], *, struct_types: set[str] | None = None) -> bool:
+    """Params must be supported types; `io.Reader` is accepted as a whole (non-variadic) param."""
+    return all(t.strip() == "io.Reader" or _is_supported_type(t, struct_types=struct_types) for t in params)
+
+
+def _are_supported_results(results: list[str], *, struct_types: set[str] | None = None) -> bool:
+    """Value results must be supported types, `io` reader/writer interfaces (returned as
+    handles), or a single stream (`<-chan T`, `iter.Seq[T]`, `iter.Seq2[K, V]`) of supported items."""
+    values = [t for t in results if t.strip() != "error"]
+    for t in values:
+        items = stream_item_types(t)
+        if items is None:
+            if t.strip() not in IO_TYPES and not _is_supported_type(t, struct_types=struct_types):
+                return False
+        elif len(values) != 1 or not all(_is_supported_type(it, struct_types=struct_types) for it in items):
+            return False
+    return True
+
+
+def _abi_params(params: list[str]) -> list[str]:
+    """Drop a leading `context.Context` parameter; the bridge supplies it per request."""
+    if params and params[0].strip() == "context.Context":
+        return list(params[1:])
+    return list(params)
+
+
+def _context_flag(params: list[str]) -> dict[str, Any]:
+    # Manifest marker for symbols that accept a per-call deadline/cancellation.
+    return {"context": True} if len(_abi_params(params)) != len(params) else {}
+
+
 def _is_supported_sig(fn: ExportedFunc, *, struct_types: set[str] | None = None) -> bool:
-    if any(not _is_supported_type(t, struct_types=struct_types) for t in fn.params):
+    if not _are_supported_params(_abi_params(fn.params), struct_types=struct_types):
         return False
-    if any(not _is_supported_type(t, struct_types=struct_types) and t.strip() != "error" for t in fn.results):
+    if not _are_supported_results(fn.results, struct_types=struct_types):
         return False
     errs = [i for i, t in enumerate(fn.results) if t.strip() == "error"]
     if len(errs) > 1:
@@ -196,9 +243,9 @@ def _is_supported_sig(fn: ExportedFunc, *, struct_types: set[str] | None = None)
 
 
 def _is_supported_method_sig(m: ExportedMethod, *, struct_types: set[str] | None = None) -> bool:
-    if any(not _is_supported_type(t, struct_types=struct_types) for t in m.params):
+    if not _are_supported_params(_abi_params(m.params), struct_types=struct_types):
         return False
-    if any(not _is_supported_type(t, struct_types=struct_types) and t.strip() != "error" for t in m.results):
+    if not _are_supported_results(m.results, struct_types=struct_types):
         return False
     errs = [i for i, t in enumerate(m.results) if t.strip() == "error"]
     if len(errs) > 1:
@@ -345,23 +392,27 @@ def _load_generic_instantiations(
 def _bridge_go_mod(
     *,
     bridge_dir: Path,
-    module_path: str,
-    module_dir: Path,
-    module_version: str,
-    local_replace: bool,
+    requires: list[tuple[str, str, Path | None]],
 ) -> None:
+    """Write the bridge go.mod.
+
+    `requires` lists `(module_path, version, local_dir)`; modules with a
+    `local_dir` are wired through a `replace` directive.
+    """
     lines: list[str] = [
         "module usegolib.bridge",
         "",
         "go 1.22",
         "",
         "require github.com/vmihailenco/msgpack/v5 v5.4.1",
-        f"require {module_path} {module_version}",
-        "",
     ]
-    if local_replace:
-        lines.append(f"replace {module_path} => {module_dir.as_posix()}")
-        lines.append("")
+    for module_path, module_version, _local_dir in requires:
+        lines.append(f"require {module_path} {module_version}")
+    lines.append("")
+    for module_path, _module_version, local_dir in requires:
+        if local_dir is not None:
+            lines.append(f"replace {module_path} => {local_dir.as_posix()}")
+            lines.append("")
     (bridge_dir / "go.mod").write_text(
         "\n".join(lines),
         encoding="utf-8",
@@ -399,52 +450,41 @@ def _artifact_leaf_dir(
     return out_root.joinpath(*parts, f"{goos}-{goarch}")
 
 
-def build_artifact(
-    *,
-    module: str | Path,
-    out_dir: Path,
-    version: str | None = None,
-    force: bool = False,
-    generics: Path | None = None,
-    gomodcache_dir: Path | None = None,
-    clean_gomodcache: bool = False,
-) -> Path:
-    env_base = dict(os.environ)
-    if gomodcache_dir is not None:
-        gomodcache_dir = Path(gomodcache_dir).resolve()
-        if clean_gomodcache and gomodcache_dir.exists():
-            shutil.rmtree(gomodcache_dir, ignore_errors=True)
-        gomodcache_dir.mkdir(parents=True, exist_ok=True)
-        env_base["GOMODCACHE"] = str(gomodcache_dir)
+@dataclass(frozen=True)
+class _ModuleInputs:
+    """A resolved and scanned Go module, filtered to bridge-supported symbols."""
+
+    resolved: ResolvedModule
+    packages: list[str]
+    scan: ModuleScan
+    functions: list[ExportedFunc]
+    methods: list[ExportedMethod]
+    vars: list[ExportedVar]
 
-    resolved = resolve_module_target(target=str(module), version=version, env=env_base)
-    module_dir = resolved.module_dir
-    out_root = Path(out_dir).resolve()
-    out_root.mkdir(parents=True, exist_ok=True)
 
-    module_path = resolved.module_path
-    packages = _list_packages(module_dir, env=env_base)
-    scan = scan_module(module_dir=module_dir, env=env_base)
-    exported = scan.funcs
-    methods = scan.methods
-    generic_defs = scan.generic_funcs
-    vars_ = scan.vars
+def _collect_module_inputs(
+    *, module: str | Path, version: str | None, env: dict[str, str]
+) -> _ModuleInputs:
+    resolved = resolve_module_target(target=str(module), version=version, env=env)
+    module_dir = resolved.module_dir
+    packages = _list_packages(module_dir, env=env)
+    scan = scan_module(module_dir=module_dir, env=env)
 
     exported = [
         fn
-        for fn in exported
+        for fn in scan.funcs
         if _is_supported_sig(fn, struct_types=scan.struct_types_by_pkg.get(fn.pkg))
     ]
     methods = [
         m
-        for m in methods
+        for m in scan.methods
         if _is_supported_method_sig(m, struct_types=scan.struct_types_by_pkg.get(m.pkg))
     ]
 
     # Vars: only expose exported vars whose type is a named struct type in the same package.
     # This supports "namespace" patterns like `isr.DL.Of(...)`.
     usable_vars: list[ExportedVar] = []
-    for v in vars_:
+    for v in scan.vars:
         base = v.type.strip()
         if base.startswith("*"):
             base = base[1:].strip()
@@ -456,6 +496,171 @@ def build_artifact(
             continue
         usable_vars.append(v)
 
+    return _ModuleInputs(
+        resolved=resolved,
+        packages=packages,
+        scan=scan,
+        functions=exported,
+        methods=methods,
+        vars=usable_vars,
+    )
+
+
+def _gomodcache_env(gomodcache_dir: Path | None, clean_gomodcache: bool) -> dict[str, str]:
+    env_base = dict(os.environ)
+    if gomodcache_dir is not None:
+        gomodcache_dir = Path(gomodcache_dir).resolve()
+        if clean_gomodcache and gomodcache_dir.exists():
+            shutil.rmtree(gomodcache_dir, ignore_errors=True)
+        gomodcache_dir.mkdir(parents=True, exist_ok=True)
+        env_base["GOMODCACHE"] = str(gomodcache_dir)
+    return env_base
+
+
+def build_artifact(
+    *,
+    module: str | Path,
+    out_dir: Path,
+    version: str | None = None,
+    force: bool = False,
+    generics: Path | None = None,
+    gomodcache_dir: Path | None = None,
+    clean_gomodcache: bool = False,
+    annotations: Path | None = None,
+) -> Path:
+    env_base = _gomodcache_env(gomodcache_dir, clean_gomodcache)
+    inputs = _collect_module_inputs(module=module, version=version, env=env_base)
+    resolved = inputs.resolved
+
+    expected_fp: str | None = None
+    if resolved.version == "local":
+        expected_fp = fingerprint_local_module_dir(resolved.module_dir)
+
+    return _build_library(
+        inputs=[inputs],
+        out_dir=out_dir,
+        artifact_module=resolved.module_path,
+        artifact_version=resolved.version,
+        expected_fp=expected_fp,
+        force=force,
+        generics=generics,
+        annotations=annotations,
+        env_base=env_base,
+        manifest_extra={},
+    )
+
+
+def build_bundle_artifact(
+    *,
+    modules: list[tuple[str | Path, str | None]],
+    out_dir: Path,
+    name: str = "bundle",
+    force: bool = False,
+    generics: Path | None = None,
+    gomodcache_dir: Path | None = None,
+    clean_gomodcache: bool = False,
+    annotations: Path | None = None,
+) -> Path:
+    """Build several Go modules into one shared library (one Go runtime).
+
+    `modules` lists `(module, version)` targets with the same meaning as
+    `build_artifact(module=..., version=...)`. The bundle manifest lists every
+    member module and version; `import_` resolves each member module to the
+    bundle. The bundle's own version is derived from its members, so changing
+    any member (or a local member's sources) produces a new bundle version.
+    """
+    if not modules:
+        raise BuildError("bundle requires at least one module")
+    if not name or "@" in name or name.startswith("/") or ".." in name.split("/"):
+        raise BuildError(f"invalid bundle name: {name!r}")
+
+    env_base = _gomodcache_env(gomodcache_dir, clean_gomodcache)
+    inputs = [_collect_module_inputs(module=m, version=v, env=env_base) for m, v in modules]
+
+    seen: set[str] = set()
+    h = hashlib.sha256()
+    for inp in sorted(inputs, key=lambda i: i.resolved.module_path):
+        mp = inp.resolved.module_path
+        if mp in seen:
+            raise BuildError(f"module listed more than once in bundle: {mp}")
+        seen.add(mp)
+        h.update(f"{mp}@{inp.resolved.version}\n".encode("utf-8"))
+        if inp.resolved.version == "local":
+            h.update(fingerprint_local_module_dir(inp.resolved.module_dir).encode("utf-8"))
+            h.update(b"\n")
+    if generics is not None:
+        try:
+            h.update(Path(generics).read_bytes())
+        except OSError as e:
+            raise BuildError(f"generics config not found: {generics}") from e
+    if annotations is not None:
+        try:
+            h.update(Path(annotations).read_bytes())
+        except OSError as e:
+            raise BuildError(f"annotations file not found: {annotations}") from e
+    fp = h.hexdigest()
+
+    return _build_library(
+        inputs=inputs,
+        out_dir=out_dir,
+        artifact_module=name,
+        artifact_version=f"bundle-{fp[:12]}",
+        expected_fp=fp,
+        force=force,
+        generics=generics,
+        annotations=annotations,
+        env_base=env_base,
+        manifest_extra={
+            "bundle": {
+                "name": name,
+                "modules": [
+                    {
+                        "module": inp.resolved.module_path,
+                        "version": inp.resolved.version,
+                        "packages": inp.packages,
+                    }
+                    for inp in inputs
+                ],
+            }
+        },
+    )
+
+
+def _build_library(
+    *,
+    inputs: list[_ModuleInputs],
+    out_dir: Path,
+    artifact_module: str,
+    artifact_version: str,
+    expected_fp: str | None,
+    force: bool,
+    generics: Path | None,
+    annotations: Path | None,
+    env_base: dict[str, str],
+    manifest_extra: dict[str, Any],
+) -> Path:
+    out_root = Path(out_dir).resolve()
+    out_root.mkdir(parents=True, exist_ok=True)
+    first_dir = inputs[0].resolved.module_dir
+
+    # Combine per-module scans. Package paths never overlap across modules, so
+    # the per-package maps can be merged directly.
+    packages: list[str] = []
+    exported: list[ExportedFunc] = []
+    methods: list[ExportedMethod] = []
+    usable_vars: list[ExportedVar] = []
+    generic_defs: list[GenericFuncDef] = []
+    struct_types_by_pkg: dict[str, set[str]] = {}
+    structs_by_pkg: dict[str, dict[str, list[StructField]]] = {}
+    for inp in inputs:
+        packages.extend(inp.packages)
+        exported.extend(inp.functions)
+        methods.extend(inp.methods)
+        usable_vars.extend(inp.vars)
+        generic_defs.extend(inp.scan.generic_funcs)
+        struct_types_by_pkg.update(inp.scan.struct_types_by_pkg)
+        structs_by_pkg.update(inp.scan.structs_by_pkg)
+
     # Methods for bridge wrappers require exported receiver type names (the bridge package
     # cannot reference unexported identifiers from imported packages). Unexported receiver
     # methods remain in the manifest schema and are invoked via reflective dispatch.
@@ -466,17 +671,30 @@ def build_artifact(
         generic_insts = _load_generic_instantiations(
             generics=Path(generics),
             defs=generic_defs,
-            struct_types_by_pkg=scan.struct_types_by_pkg,
+            struct_types_by_pkg=struct_types_by_pkg,
+        )
+
+    ann = Annotations()
+    if annotations is not None:
+        ann = load_annotations(
+            annotations=Path(annotations),
+            methods=methods,
+            struct_types_by_pkg=struct_types_by_pkg,
+            functions=exported,
         )
 
     with tempfile.TemporaryDirectory(prefix="usegolib-bridge-") as td:
         bridge_dir = Path(td)
         _bridge_go_mod(
             bridge_dir=bridge_dir,
-            module_path=module_path,
-            module_dir=module_dir,
-            module_version=resolved.version if resolved.version != "local" else "v0.0.0",
-            local_replace=(resolved.version == "local"),
+            requires=[
+                (
+                    inp.resolved.module_path,
+                    inp.resolved.version if inp.resolved.version != "local" else "v0.0.0",
+                    inp.resolved.module_dir if inp.resolved.version == "local" else None,
+                )
+                for inp in inputs
+            ],
         )
 
         from .gobridge import write_bridge
@@ -504,7 +722,7 @@ def build_artifact(
                 adapter_types.add("time.Duration")
             if "uuid.UUID" in gi.params or "uuid.UUID" in gi.results:
                 adapter_types.add("uuid.UUID")
-        for pkg, by_name in scan.structs_by_pkg.items():
+        for pkg, by_name in structs_by_pkg.items():
             for _name, fields in by_name.items():
                 for f in fields:
                     if "time.Time" in f.type:
@@ -518,10 +736,10 @@ def build_artifact(
         # schema. For pointers to these types, we treat values as opaque object
         # handles (uint64 ids), so the returned value remains callable in Python.
         opaque_struct_types_by_pkg: dict[str, set[str]] = {}
-        all_pkgs = set(scan.struct_types_by_pkg.keys()) | set(scan.structs_by_pkg.keys())
+        all_pkgs = set(struct_types_by_pkg.keys()) | set(structs_by_pkg.keys())
         for pkg in all_pkgs:
-            all_structs = set(scan.struct_types_by_pkg.get(pkg, set()))
-            with_fields = set(scan.structs_by_pkg.get(pkg, {}).keys())
+            all_structs = set(struct_types_by_pkg.get(pkg, set()))
+            with_fields = set(structs_by_pkg.get(pkg, {}).keys())
             opaque = all_structs - with_fields
             # Unexported structs are always treated as opaque object handles.
             opaque |= {n for n in all_structs if not n[:1].isupper()}
@@ -530,23 +748,23 @@ def build_artifact(
 
         write_bridge(
             bridge_dir=bridge_dir,
-            module_path=module_path,
+            module_path=artifact_module,
             functions=exported,
             methods=methods_for_bridge,
             generic_instantiations=generic_insts,
             vars=usable_vars,
-            struct_types_by_pkg=scan.struct_types_by_pkg,
+            struct_types_by_pkg=struct_types_by_pkg,
             opaque_struct_types_by_pkg=opaque_struct_types_by_pkg,
             adapter_types=adapter_types,
+            type_annotations=ann.types,
         )
 
-        goos = _run(["go", "env", "GOOS"], cwd=module_dir).strip()
-        goarch = _run(["go", "env", "GOARCH"], cwd=module_dir).strip()
+        goos = _run(["go", "env", "GOOS"], cwd=first_dir).strip()
+        goarch = _run(["go", "env", "GOARCH"], cwd=first_dir).strip()
 
-        artifact_version = resolved.version
         out_leaf = _artifact_leaf_dir(
             out_root=out_root,
-            module_path=module_path,
+            module_path=artifact_module,
             version=artifact_version,
             goos=goos,
             goarch=goarch,
@@ -555,10 +773,6 @@ def build_artifact(
 
         lock_path = out_leaf / ".usegolib.lock"
         with leaf_lock(lock_path):
-            expected_fp: str | None = None
-            if artifact_version == "local":
-                expected_fp = fingerprint_local_module_dir(module_dir)
-
             if not force and artifact_ready(out_leaf, expected_input_fingerprint=expected_fp):
                 return out_leaf / "manifest.json"
 
@@ -581,16 +795,17 @@ def build_artifact(
             )
 
             sha = _sha256_file(lib_path)
-            go_version = _run(["go", "version"], cwd=module_dir).strip()
-            zig_version = _run([str(zig), "version"], cwd=module_dir).strip()
+            go_version = _run(["go", "version"], cwd=first_dir).strip()
+            zig_version = _run([str(zig), "version"], cwd=first_dir).strip()
 
             all_symbol_entries: list[dict[str, Any]] = [
                 {
                     "pkg": fn.pkg,
                     "name": fn.name,
-                    "params": fn.params,
+                    "params": _abi_params(fn.params),
                     "results": fn.results,
                     "doc": fn.doc,
+                    **_context_flag(fn.params),
                 }
                 for fn in exported
             ]
@@ -599,10 +814,11 @@ def build_artifact(
                     {
                         "pkg": gi.pkg,
                         "name": gi.symbol,
-                        "params": gi.params,
+                        "params": _abi_params(gi.params),
                         "results": gi.results,
                         "doc": gi.doc,
                         "generic": {"name": gi.generic_name, "type_args": gi.type_args},
+                        **_context_flag(gi.params),
                     }
                     for gi in generic_insts
                 ]
@@ -612,11 +828,8 @@ def build_artifact(
             # even when a struct has zero exported fields (empty schema). This matters
             # for methods that return fluent receivers like `*DataList`.
             struct_schema: dict[str, dict[str, list[dict[str, Any]]]] = {}
-            all_pkgs = set(scan.struct_types_by_pkg.keys()) | set(scan.structs_by_pkg.keys())
             for pkg in sorted(all_pkgs):
-                names = set(scan.struct_types_by_pkg.get(pkg, set())) | set(
-                    scan.structs_by_pkg.get(pkg, {}).keys()
-                )
+                names = set(struct_types_by_pkg.get(pkg, set())) | set(structs_by_pkg.get(pkg, {}).keys())
                 by_name: dict[str, list[dict[str, Any]]] = {}
                 for name in sorted(names):
                     # Treat unexported structs as opaque by default: even if they have
@@ -625,7 +838,7 @@ def build_artifact(
                     if not name[:1].isupper():
                         fields = []
                     else:
-                        fields = scan.structs_by_pkg.get(pkg, {}).get(name, [])
+                        fields = structs_by_pkg.get(pkg, {}).get(name, [])
                     by_name[name] = [
                         {
                             "name": f.name,
@@ -644,7 +857,7 @@ def build_artifact(
             manifest = {
                 "manifest_version": 1,
                 "abi_version": 0,
-                "module": module_path,
+                "module": artifact_module,
                 "version": artifact_version,
                 "goos": goos,
                 "goarch": goarch,
@@ -660,9 +873,10 @@ def build_artifact(
                             "pkg": m.pkg,
                             "recv": m.recv,
                             "name": m.name,
-                            "params": m.params,
+                            "params": _abi_params(m.params),
                             "results": m.results,
                             "doc": m.doc,
+                            **_context_flag(m.params),
                         }
                         for m in methods
                     ],
@@ -684,9 +898,12 @@ def build_artifact(
                         }
                         for v in usable_vars
                     ],
+                    "types": ann.schema_types(),
+                    "functions": ann.schema_functions(),
                 },
                 "library": {"path": lib_name, "sha256": sha},
             }
+            manifest.update(manifest_extra)
             if expected_fp is not None:
                 manifest["input_fingerprint"] = expected_fp
 
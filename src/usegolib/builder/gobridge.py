@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from ..schema import IO_TYPES, numeric_array_type, stream_item_types
+from .annotations import TypeAnnotation
 from .symbols import ExportedFunc, ExportedMethod, ExportedVar, GenericInstantiation
 
 
@@ -16,6 +18,7 @@ def write_bridge(
     struct_types_by_pkg: dict[str, set[str]] | None = None,
     opaque_struct_types_by_pkg: dict[str, set[str]] | None = None,
     adapter_types: set[str] | None = None,
+    type_annotations: list[TypeAnnotation] | None = None,
 ) -> None:
     # Generate a single `main` package for `-buildmode=c-shared`.
     struct_types_by_pkg = struct_types_by_pkg or {}
@@ -24,6 +27,7 @@ def write_bridge(
     generic_instantiations = generic_instantiations or []
     vars = vars or []
     adapter_types = adapter_types or set()
+    type_annotations = type_annotations or []
     imports: dict[str, str] = {}
     for fn in functions:
         if fn.pkg not in imports:
@@ -144,12 +148,78 @@ def write_bridge(
         alias = imports[m.pkg]
         type_lines.append(f'        "{type_key}": reflect.TypeOf({alias}.{m.recv}{{}}),')
 
+    # Per-type concurrency defaults and read-only methods (build-time annotations).
+    mode_consts = {"exclusive": "objModeExclusive", "rwlock": "objModeRWLock", "unsafe": "objModeUnsafe"}
+    obj_mode_lines: list[str] = []
+    readonly_lines: list[str] = []
+    for ta in type_annotations:
+        type_key = f"{ta.pkg}.{ta.name}"
+        if ta.concurrency is not None:
+            obj_mode_lines.append(f'        "{type_key}": {mode_consts[ta.concurrency]},')
+        for meth in ta.readonly:
+            readonly_lines.append(f'        "{type_key}:{meth}": true,')
+
     src = "\n".join(
         [
             "package main",
             "",
             "/*",
             "#include <stdlib.h>",
+            "#include <stdint.h>",
+            "",
+            "#ifndef ARROW_C_DATA_INTERFACE",
+            "#define ARROW_C_DATA_INTERFACE",
+            "#define ARROW_FLAG_NULLABLE 2",
+            "struct ArrowSchema {",
+            "    const char* format;",
+            "    const char* name;",
+            "    const char* metadata;",
+            "    int64_t flags;",
+            "    int64_t n_children;",
+            "    struct ArrowSchema** children;",
+            "    struct ArrowSchema* dictionary;",
+            "    void (*release)(struct ArrowSchema*);",
+            "    void* private_data;",
+            "};",
+            "struct ArrowArray {",
+            "    int64_t length;",
+            "    int64_t null_count;",
+            "    int64_t offset;",
+            "    int64_t n_buffers;",
+            "    int64_t n_children;",
+            "    const void** buffers;",
+            "    struct ArrowArray** children;",
+            "    struct ArrowArray* dictionary;",
+            "    void (*release)(struct ArrowArray*);",
+            "    void* private_data;",
+            "};",
+            "#endif",
+            "",
+            "// Exported Arrow schemas and arrays list the malloc'd blocks they own in",
+            "// private_data (NULL-terminated). release frees the children, then the blocks.",
+            "static void usegolib_arrow_free_blocks(void* blocks) {",
+            "    if (blocks == NULL) return;",
+            "    for (void** b = (void**)blocks; *b != NULL; b++) free(*b);",
+            "    free(blocks);",
+            "}",
+            "static void usegolib_arrow_release_schema(struct ArrowSchema* s) {",
+            "    for (int64_t i = 0; i < s->n_children; i++) {",
+            "        if (s->children[i]->release != NULL) s->children[i]->release(s->children[i]);",
+            "    }",
+            "    usegolib_arrow_free_blocks(s->private_data);",
+            "    s->release = NULL;",
+            "}",
+            "static void usegolib_arrow_release_array(struct ArrowArray* a) {",
+            "    for (int64_t i = 0; i < a->n_children; i++) {",
+            "        if (a->children[i]->release != NULL) a->children[i]->release(a->children[i]);",
+            "    }",
+            "    usegolib_arrow_free_blocks(a->private_data);",
+            "    a->release = NULL;",
+            "}",
+            "static void usegolib_arrow_set_release(struct ArrowSchema* s, struct ArrowArray* a) {",
+            "    s->release = usegolib_arrow_release_schema;",
+            "    a->release = usegolib_arrow_release_array;",
+            "}",
             "*/",
             'import "C"',
             "",
@@ -169,9 +239,52 @@ def write_bridge(
             '    ID uint64 `msgpack:"id,omitempty"`',
             '    Method string `msgpack:"method,omitempty"`',
             '    Init any `msgpack:"init,omitempty"`',
+            '    Mode string `msgpack:"mode,omitempty"`',
+            '    TimeoutNs int64 `msgpack:"timeout_ns,omitempty"`',
+            '    Cancel uint64 `msgpack:"cancel,omitempty"`',
+            '    Key string `msgpack:"key,omitempty"`',
+            '    Limit *LimitSpec `msgpack:"limit,omitempty"`',
+            '    Steps []PipelineStep `msgpack:"steps,omitempty"`',
+            '    Outputs []int `msgpack:"outputs,omitempty"`',
+            '    Free []any `msgpack:"free,omitempty"`',
+            '    Batch [][]byte `msgpack:"batch,omitempty"`',
+            '    Value any `msgpack:"value"`',
+            '    Inits []any `msgpack:"inits,omitempty"`',
+            '    IDs []byte `msgpack:"ids,omitempty"`',
+            '    Parallel int `msgpack:"parallel,omitempty"`',
+            '    Select []string `msgpack:"select,omitempty"`',
+            '    Fields []string `msgpack:"fields,omitempty"`',
+            '    Lazy bool `msgpack:"lazy,omitempty"`',
+            '    Packed bool `msgpack:"packed,omitempty"`',
+            '    Start int `msgpack:"start,omitempty"`',
+            '    Stop int `msgpack:"stop,omitempty"`',
+            '    Chunk int `msgpack:"chunk,omitempty"`',
+            '    Path string `msgpack:"path,omitempty"`',
+            '    Fd *int `msgpack:"fd,omitempty"`',
+            '    EOF bool `msgpack:"eof,omitempty"`',
+            '    Err string `msgpack:"err,omitempty"`',
+            '    Args []any `msgpack:"args"`',
+            "}",
+            "",
+            "// PipelineStep is one call of a pipeline request. Args (and an obj_call Target)",
+            "// may hold {\"$usegolib_ref\": i[, \"index\": k]} markers naming earlier step results.",
+            "type PipelineStep struct {",
+            '    Op string `msgpack:"op"`',
+            '    Fn string `msgpack:"fn,omitempty"`',
+            '    Type string `msgpack:"type,omitempty"`',
+            '    Target any `msgpack:"target,omitempty"`',
+            '    Method string `msgpack:"method,omitempty"`',
             '    Args []any `msgpack:"args"`',
             "}",
             "",
+            "// LimitSpec configures an admission limit (op limits_set).",
+            "type LimitSpec struct {",
+            '    Max int64 `msgpack:"max"`',
+            '    Weight int64 `msgpack:"weight"`',
+            '    Policy string `msgpack:"policy"`',
+            '    QueueTimeoutNs int64 `msgpack:"queue_timeout_ns"`',
+            "}",
+            "",
             "type ErrorObj struct {",
             '    Type string `msgpack:"type"`',
             '    Message string `msgpack:"message"`',
@@ -184,50 +297,1926 @@ def write_bridge(
             '    Error *ErrorObj `msgpack:"error,omitempty"`',
             "}",
             "",
-            "type Handler func(args []any) (any, *ErrorObj)",
-            "type MethodHandler func(obj any, args []any) (any, *ErrorObj)",
+            "// Handlers receive the request context; symbols whose first parameter is",
+            "// context.Context get it passed through (timeouts and cancel tokens).",
+            "type Handler func(ctx context.Context, args []any) (any, *ErrorObj)",
+            "type MethodHandler func(ctx context.Context, obj any, args []any) (any, *ErrorObj)",
             "",
             "var dispatch = map[string]Handler{}",
             "var methodDispatch = map[string]MethodHandler{}",
             "var typeByKey = map[string]reflect.Type{}",
             "",
+            "// Object concurrency modes: exclusive serializes all method calls on a handle,",
+            "// rwlock lets read-only methods run concurrently, unsafe takes no lock. Types",
+            "// without an annotation are unsafe (the zero value): locking is opt-in.",
+            "const (",
+            "    objModeUnsafe uint8 = iota",
+            "    objModeExclusive",
+            "    objModeRWLock",
+            ")",
+            "",
             "type ObjEntry struct {",
             "    Key string",
             "    Obj any",
+            "    Mode uint8",
+            "    Mu sync.RWMutex",
             "}",
             "",
             "var objNext uint64",
             "var objMu sync.RWMutex",
-            "var objByID = map[uint64]ObjEntry{}",
+            "var objByID = map[uint64]*ObjEntry{}",
+            "var objModeByType = map[string]uint8{}",
+            "var objReadOnly = map[string]bool{}",
             "",
             "func storeObj(typeKey string, obj any) uint64 {",
+            "    return storeObjMode(typeKey, obj, objModeByType[typeKey])",
+            "}",
+            "",
+            "func storeObjMode(typeKey string, obj any, mode uint8) uint64 {",
                 "    id := atomic.AddUint64(&objNext, 1)",
             "    objMu.Lock()",
-            "    objByID[id] = ObjEntry{Key: typeKey, Obj: obj}",
+            "    objByID[id] = &ObjEntry{Key: typeKey, Obj: obj, Mode: mode}",
             "    objMu.Unlock()",
             "    return id",
             "}",
             "",
-            "func isExportedIdent(name string) bool {",
-            "    if name == \"\" {",
-            "        return false",
+            "func parseObjMode(s string) (uint8, bool) {",
+            "    switch s {",
+            '    case "exclusive":',
+            "        return objModeExclusive, true",
+            '    case "rwlock":',
+            "        return objModeRWLock, true",
+            '    case "unsafe":',
+            "        return objModeUnsafe, true",
             "    }",
-            "    r := rune(name[0])",
-            "    return r >= 'A' && r <= 'Z'",
+            "    return 0, false",
             "}",
             "",
-            "func reflectCallMethod(pkg string, typeName string, obj any, method string, args []any) (any, *ErrorObj) {",
-            "    rv := reflect.ValueOf(obj)",
-            "    if !rv.IsValid() {",
-            '        return nil, &ErrorObj{Type: "ObjectNotFound", Message: "invalid object"}',
+            "// lockObj takes the lock the entry's mode requires for calling method and",
+            "// returns the matching unlock function.",
+            "func lockObj(ent *ObjEntry, method string) func() {",
+            '    return lockObjAccess(ent, !objReadOnly[ent.Key+":"+method])',
+            "}",
+            "",
+            "// lockObjAccess locks the entry for reading or writing as its mode requires.",
+            "func lockObjAccess(ent *ObjEntry, write bool) func() {",
+            "    switch ent.Mode {",
+            "    case objModeUnsafe:",
+            "        return func() {}",
+            "    case objModeRWLock:",
+            "        if !write {",
+            "            ent.Mu.RLock()",
+            "            return ent.Mu.RUnlock",
+            "        }",
             "    }",
-            "    mv := rv.MethodByName(method)",
-            "    if !mv.IsValid() {",
-            '        return nil, &ErrorObj{Type: "MethodNotFound", Message: "method not found"}',
+            "    ent.Mu.Lock()",
+            "    return ent.Mu.Unlock",
+            "}",
+            "",
+            "// fieldIndexByType caches, per struct type, the index of every exported field",
+            "// by canonical key and by Go field name (ops obj_get / obj_set).",
+            "var fieldIndexByType sync.Map",
+            "",
+            "func structFieldIndex(rt reflect.Type) map[string]int {",
+            "    if m, ok := fieldIndexByType.Load(rt); ok {",
+            "        return m.(map[string]int)",
+            "    }",
+            "    m := map[string]int{}",
+            "    for i := 0; i < rt.NumField(); i++ {",
+            "        sf := rt.Field(i)",
+            "        if sf.PkgPath != \"\" || fieldIgnored(sf) {",
+            "            continue",
+            "        }",
+            "        if k := fieldOutputKey(sf); k != \"\" {",
+            "            m[k] = i",
+            "        }",
+            "    }",
+            "    for i := 0; i < rt.NumField(); i++ {",
+            "        sf := rt.Field(i)",
+            "        if sf.PkgPath != \"\" || fieldIgnored(sf) {",
+            "            continue",
+            "        }",
+            "        // Canonical keys win over Go names when they collide.",
+            "        if _, ok := m[sf.Name]; !ok {",
+            "            m[sf.Name] = i",
+            "        }",
+            "    }",
+            "    m2, _ := fieldIndexByType.LoadOrStore(rt, m)",
+            "    return m2.(map[string]int)",
+            "}",
+            "",
+            "// objFields resolves field names on the struct behind an object handle.",
+            "func objFields(ent *ObjEntry, names []string) (reflect.Value, []int, *ErrorObj) {",
+            "    v := reflect.ValueOf(ent.Obj)",
+            "    if v.Kind() != reflect.Ptr || v.IsNil() || v.Elem().Kind() != reflect.Struct {",
+            '        return reflect.Value{}, nil, &ErrorObj{Type: "UnsupportedTypeError", Message: "object is not a struct", Detail: map[string]any{"type": ent.Key}}',
+            "    }",
+            "    v = v.Elem()",
+            "    index := structFieldIndex(v.Type())",
+            "    out := make([]int, len(names))",
+            "    for i, name := range names {",
+            "        fi, ok := index[name]",
+            "        if !ok {",
+            '            return reflect.Value{}, nil, &ErrorObj{Type: "FieldNotFound", Message: "field not found", Detail: map[string]any{"type": ent.Key, "field": name}}',
+            "        }",
+            "        out[i] = fi",
+            "    }",
+            "    return v, out, nil",
+            "}",
+            "",
+            "type cancelToken struct {",
+            "    ctx context.Context",
+            "    cancel context.CancelFunc",
+            "}",
+            "",
+            "var cancelNext uint64",
+            "var cancelMu sync.Mutex",
+            "var cancelByID = map[uint64]*cancelToken{}",
+            "",
+            "func requestContext(req *Request) (context.Context, context.CancelFunc, *ErrorObj) {",
+            "    ctx := context.Background()",
+            "    if req.Cancel != 0 {",
+            "        cancelMu.Lock()",
+            "        tok := cancelByID[req.Cancel]",
+            "        cancelMu.Unlock()",
+            "        if tok == nil {",
+            '            return nil, nil, &ErrorObj{Type: "ABIError", Message: "cancel token not found", Detail: map[string]any{"cancel": req.Cancel}}',
+            "        }",
+            "        ctx = tok.ctx",
+            "    }",
+            "    if req.Lazy {",
+            "        ctx = context.WithValue(ctx, lazyKey{}, true)",
+            "    }",
+            "    if len(req.Select) > 0 {",
+            "        ctx = context.WithValue(ctx, selectionKey{}, parseSelection(req.Select))",
+            "    }",
+            "    if req.TimeoutNs > 0 {",
+            "        ctx, cancel := context.WithTimeout(ctx, time.Duration(req.TimeoutNs))",
+            "        return ctx, cancel, nil",
+            "    }",
+            "    return ctx, func() {}, nil",
+            "}",
+            "",
+            "// contextError reports Go errors returned after the request context ended as",
+            "// cancellation/deadline errors.",
+            "func contextError(ctx context.Context, errObj *ErrorObj) *ErrorObj {",
+            '    if errObj == nil || errObj.Type != "GoError" {',
+            "        return errObj",
+            "    }",
+            "    switch ctx.Err() {",
+            "    case context.DeadlineExceeded:",
+            '        errObj.Type = "DeadlineExceeded"',
+            "    case context.Canceled:",
+            '        errObj.Type = "Cancelled"',
+            "    }",
+            "    return errObj",
+            "}",
+            "",
+            "// pinnedValue is an argument value uploaded once (op pin_new) and referenced by",
+            "// {\"$usegolib_pin\": id} markers. Each parameter type converts it at most once;",
+            "// converted values are shared by every call that uses the pin. A pin made by",
+            "// op pin_mem holds caller memory instead, viewed as a slice on every use.",
+            "type pinnedValue struct {",
+            "    raw any",
+            "    mem *memRef",
+            "    conv sync.Map",
+            "}",
+            "",
+            "func (p *pinnedValue) converted(key string) (any, bool) {",
+            "    if p == nil {",
+            "        return nil, false",
+            "    }",
+            "    return p.conv.Load(key)",
+            "}",
+            "",
+            "func (p *pinnedValue) store(key string, v any) {",
+            "    if p != nil {",
+            "        p.conv.Store(key, v)",
+            "    }",
+            "}",
+            "",
+            "var pinNext uint64",
+            "var pinMu sync.RWMutex",
+            "var pinByID = map[uint64]*pinnedValue{}",
+            "",
+            "// pinOf reports whether v is a pin marker and returns its value (nil if the pin",
+            "// does not exist).",
+            "func pinOf(v any) (*pinnedValue, bool) {",
+            "    m, ok := v.(map[string]any)",
+            "    if !ok || len(m) != 1 {",
+            "        return nil, false",
+            "    }",
+            '    raw, ok := m["$usegolib_pin"]',
+            "    if !ok {",
+            "        return nil, false",
+            "    }",
+            "    id, ok := toInt64(raw)",
+            "    if !ok {",
+            "        return nil, true",
+            "    }",
+            "    pinMu.RLock()",
+            "    p := pinByID[uint64(id)]",
+            "    pinMu.RUnlock()",
+            "    return p, true",
+            "}",
+            "",
+            "func pinNotFound() *ErrorObj {",
+            '    return &ErrorObj{Type: "PinNotFound", Message: "pinned value not found"}',
+            "}",
+            "",
+            "// convertArg is convertToType for call arguments that may be pin markers.",
+            "func convertArg(v any, t reflect.Type) (reflect.Value, bool) {",
+            "    p, isPin := pinOf(v)",
+            "    if !isPin {",
+            "        return convertToType(v, t)",
+            "    }",
+            "    if p == nil {",
+            "        return reflect.Value{}, false",
+            "    }",
+            "    if p.mem != nil {",
+            "        return memValue(p.mem, t)",
+            "    }",
+            '    key := "reflect:" + t.String()',
+            "    if cv, ok := p.converted(key); ok {",
+            "        return cv.(reflect.Value), true",
+            "    }",
+            "    cv, ok := convertToType(p.raw, t)",
+            "    if ok {",
+            "        p.store(key, cv)",
+            "    }",
+            "    return cv, ok",
+            "}",
+            "",
+            "// limiter is a FIFO weighted semaphore with admission metrics; max == 0 means",
+            "// unlimited. Waiters are admitted in arrival order, so a heavy call at the",
+            "// head of the queue is not starved by lighter ones.",
+            "type limiter struct {",
+            "    mu sync.Mutex",
+            "    max int64",
+            "    failFast bool",
+            "    queueTimeout time.Duration",
+            "    cur int64",
+            "    waiters []*limitWaiter",
+            "    maxWaiting int",
+            "    admitted uint64",
+            "    rejected uint64",
+            "    timedOut uint64",
+            "    waitNs int64",
+            "    maxWaitNs int64",
+            "}",
+            "",
+            "type limitWaiter struct {",
+            "    n int64",
+            "    ready chan struct{}",
+            "}",
+            "",
+            "func (l *limiter) configure(max int64, failFast bool, queueTimeout time.Duration) {",
+            "    l.mu.Lock()",
+            "    l.max = max",
+            "    l.failFast = failFast",
+            "    l.queueTimeout = queueTimeout",
+            "    l.notifyLocked()",
+            "    l.mu.Unlock()",
+            "}",
+            "",
+            "// acquire takes n units (clamped to the limit) and returns the units taken,",
+            "// which must be passed to release.",
+            "func (l *limiter) acquire(ctx context.Context, key string, n int64) (int64, *ErrorObj) {",
+            "    l.mu.Lock()",
+            "    if l.max > 0 && n > l.max {",
+            "        n = l.max",
+            "    }",
+            "    if l.max == 0 || (len(l.waiters) == 0 && l.cur+n <= l.max) {",
+            "        l.cur += n",
+            "        l.admitted++",
+            "        l.mu.Unlock()",
+            "        return n, nil",
+            "    }",
+            "    if l.failFast {",
+            "        l.rejected++",
+            "        l.mu.Unlock()",
+            '        return 0, busyError(key, "limit reached")',
+            "    }",
+            "    w := &limitWaiter{n: n, ready: make(chan struct{})}",
+            "    l.waiters = append(l.waiters, w)",
+            "    if len(l.waiters) > l.maxWaiting {",
+            "        l.maxWaiting = len(l.waiters)",
+            "    }",
+            "    timeout := l.queueTimeout",
+            "    l.mu.Unlock()",
+            "",
+            "    start := time.Now()",
+            "    var expired <-chan time.Time",
+            "    if timeout > 0 {",
+            "        t := time.NewTimer(timeout)",
+            "        defer t.Stop()",
+            "        expired = t.C",
+            "    }",
+            "    var errObj *ErrorObj",
+            "    select {",
+            "    case <-w.ready:",
+            "    case <-expired:",
+            '        errObj = busyError(key, "queue timeout")',
+            "    case <-ctx.Done():",
+            "        errObj = contextError(ctx, &ErrorObj{Type: \"GoError\", Message: ctx.Err().Error()})",
+            "    }",
+            "",
+            "    l.mu.Lock()",
+            "    defer l.mu.Unlock()",
+            "    select {",
+            "    case <-w.ready:",
+            "        // Admitted (possibly while giving up): keep the units.",
+            "        d := time.Since(start).Nanoseconds()",
+            "        l.waitNs += d",
+            "        if d > l.maxWaitNs {",
+            "            l.maxWaitNs = d",
+            "        }",
+            "        return w.n, nil",
+            "    default:",
+            "    }",
+            "    for i, x := range l.waiters {",
+            "        if x == w {",
+            "            l.waiters = append(l.waiters[:i], l.waiters[i+1:]...)",
+            "            break",
+            "        }",
+            "    }",
+            '    if errObj.Type == "Busy" {',
+            "        l.timedOut++",
+            "    }",
+            "    // The head waiter may have been blocking lighter ones behind it.",
+            "    l.notifyLocked()",
+            "    return 0, errObj",
+            "}",
+            "",
+            "func (l *limiter) release(n int64) {",
+            "    l.mu.Lock()",
+            "    l.cur -= n",
+            "    l.notifyLocked()",
+            "    l.mu.Unlock()",
+            "}",
+            "",
+            "func (l *limiter) notifyLocked() {",
+            "    for len(l.waiters) > 0 {",
+            "        w := l.waiters[0]",
+            "        if l.max > 0 && w.n > l.max {",
+            "            w.n = l.max",
+            "        }",
+            "        if l.max > 0 && l.cur+w.n > l.max {",
+            "            return",
+            "        }",
+            "        l.cur += w.n",
+            "        l.admitted++",
+            "        l.waiters[0] = nil",
+            "        l.waiters = l.waiters[1:]",
+            "        close(w.ready)",
+            "    }",
+            "}",
+            "",
+            "func (l *limiter) stats() map[string]any {",
+            "    l.mu.Lock()",
+            "    defer l.mu.Unlock()",
+            '    policy := "queue"',
+            "    if l.failFast {",
+            '        policy = "fail"',
+            "    }",
+            "    return map[string]any{",
+            '        "max": l.max,',
+            '        "policy": policy,',
+            '        "queue_timeout_ns": int64(l.queueTimeout),',
+            '        "in_use": l.cur,',
+            '        "waiting": len(l.waiters),',
+            '        "max_waiting": l.maxWaiting,',
+            '        "admitted": l.admitted,',
+            '        "rejected": l.rejected,',
+            '        "timed_out": l.timedOut,',
+            '        "wait_ns_total": l.waitNs,',
+            '        "wait_ns_max": l.maxWaitNs,',
+            "    }",
+            "}",
+            "",
+            "func busyError(key string, reason string) *ErrorObj {",
+            '    if key == "" {',
+            '        key = "global"',
+            "    }",
+            '    return &ErrorObj{Type: "Busy", Message: "admission limit: " + reason, Detail: map[string]any{"key": key, "reason": reason}}',
+            "}",
+            "",
+            "type symbolLimit struct {",
+            "    lim *limiter",
+            "    weight int64",
+            "}",
+            "",
+            "// limitTable is replaced copy-on-write by limits_set so calls read it without locking.",
+            "type limitTable struct {",
+            "    global *limiter",
+            "    symbols map[string]*symbolLimit",
+            "}",
+            "",
+            "var limitsMu sync.Mutex",
+            "var limits atomic.Value",
+            "",
+            "func setLimit(key string, max int64, weight int64, failFast bool, queueTimeout time.Duration) {",
+            "    limitsMu.Lock()",
+            "    defer limitsMu.Unlock()",
+            "    next := &limitTable{symbols: map[string]*symbolLimit{}}",
+            "    if old, _ := limits.Load().(*limitTable); old != nil {",
+            "        next.global = old.global",
+            "        for k, v := range old.symbols {",
+            "            next.symbols[k] = v",
+            "        }",
+            "    }",
+            "    if weight < 1 {",
+            "        weight = 1",
+            "    }",
+            "    // Removed limiters are reconfigured as unlimited so queued calls proceed.",
+            '    if key == "" {',
+            "        if next.global == nil {",
+            "            next.global = &limiter{}",
+            "        }",
+            "        next.global.configure(max, failFast, queueTimeout)",
+            "        if max == 0 {",
+            "            next.global = nil",
+            "        }",
+            "    } else {",
+            "        lim := &limiter{}",
+            "        if sl := next.symbols[key]; sl != nil {",
+            "            lim = sl.lim",
+            "        }",
+            "        lim.configure(max, failFast, queueTimeout)",
+            "        if max == 0 && weight == 1 {",
+            "            delete(next.symbols, key)",
+            "        } else {",
+            "            next.symbols[key] = &symbolLimit{lim: lim, weight: weight}",
+            "        }",
+            "    }",
+            "    limits.Store(next)",
+            "}",
+            "",
+            "// admit applies the per-symbol and global admission limits for key (\"pkg:Fn\" or",
+            "// \"pkg.T:Method\") and returns the matching release function. A symbol's weight",
+            "// is the number of global units each of its calls takes.",
+            "func admit(ctx context.Context, key string) (func(), *ErrorObj) {",
+            "    t, _ := limits.Load().(*limitTable)",
+            "    if t == nil {",
+            "        return func() {}, nil",
+            "    }",
+            "    weight := int64(1)",
+            "    var sym *limiter",
+            "    var symN int64",
+            "    if sl := t.symbols[key]; sl != nil {",
+            "        weight = sl.weight",
+            "        sym = sl.lim",
+            "        n, errObj := sym.acquire(ctx, key, 1)",
+            "        if errObj != nil {",
+            "            return nil, errObj",
+            "        }",
+            "        symN = n",
+            "    }",
+            "    var global *limiter",
+            "    var globalN int64",
+            "    if t.global != nil {",
+            "        global = t.global",
+            '        n, errObj := global.acquire(ctx, "", weight)',
+            "        if errObj != nil {",
+            "            if sym != nil {",
+            "                sym.release(symN)",
+            "            }",
+            "            return nil, errObj",
+            "        }",
+            "        globalN = n",
+            "    }",
+            "    return func() {",
+            "        if global != nil {",
+            "            global.release(globalN)",
+            "        }",
+            "        if sym != nil {",
+            "            sym.release(symN)",
+            "        }",
+            "    }, nil",
+            "}",
+            "",
+            "func limitStats() map[string]any {",
+            "    out := map[string]any{\"global\": nil}",
+            "    symbols := map[string]any{}",
+            "    if t, _ := limits.Load().(*limitTable); t != nil {",
+            "        if t.global != nil {",
+            '            out["global"] = t.global.stats()',
+            "        }",
+            "        for k, sl := range t.symbols {",
+            "            st := sl.lim.stats()",
+            '            st["weight"] = sl.weight',
+            "            symbols[k] = st",
+            "        }",
+            "    }",
+            '    out["symbols"] = symbols',
+            "    return out",
+            "}",
+            "",
+            "// objType resolves the struct type and object mode of an obj_new(_many) request.",
+            "func objType(req *Request) (string, reflect.Type, uint8, *ErrorObj) {",
+            "    typeKey := req.Pkg + \".\" + req.Type",
+            "    rt, ok := typeByKey[typeKey]",
+            "    if !ok {",
+            '        return "", nil, 0, &ErrorObj{Type: "TypeNotFound", Message: "type not found", Detail: map[string]any{"type": typeKey}}',
+            "    }",
+            "    if rt.Kind() != reflect.Struct {",
+            '        return "", nil, 0, &ErrorObj{Type: "ABIError", Message: "type is not a struct", Detail: map[string]any{"type": typeKey}}',
+            "    }",
+            "    mode := objModeByType[typeKey]",
+            '    if req.Mode != "" {',
+            "        m, ok := parseObjMode(req.Mode)",
+            "        if !ok {",
+            '            return "", nil, 0, &ErrorObj{Type: "ABIError", Message: "invalid object mode", Detail: map[string]any{"mode": req.Mode}}',
+            "        }",
+            "        mode = m",
+            "    }",
+            "    return typeKey, rt, mode, nil",
+            "}",
+            "",
+            "// newObject allocates a *T for struct type rt, initialized from init (nil: zero value).",
+            "func newObject(typeKey string, rt reflect.Type, init any) (any, *ErrorObj) {",
+            "    pv := reflect.New(rt)",
+            "    if init != nil {",
+            "        cv, ok := convertToType(init, rt)",
+            "        if !ok {",
+            '            return nil, &ErrorObj{Type: "UnsupportedTypeError", Message: "invalid init", Detail: map[string]any{"type": typeKey}}',
+            "        }",
+            "        pv.Elem().Set(cv)",
+            "    }",
+            "    return pv.Interface(), nil",
+            "}",
+            "",
+            "func freeObjects(ids []uint64) {",
+            "    objMu.Lock()",
+            "    for _, id := range ids {",
+            "        delete(objByID, id)",
+            "    }",
+            "    objMu.Unlock()",
+            "}",
+            "",
+            "// Object id arrays travel as little-endian uint64s packed into one binary string.",
+            "func packIDs(ids []uint64) []byte {",
+            "    out := make([]byte, 8*len(ids))",
+            "    for i, id := range ids {",
+            "        binary.LittleEndian.PutUint64(out[8*i:], id)",
+            "    }",
+            "    return out",
+            "}",
+            "",
+            "func unpackIDs(b []byte) ([]uint64, bool) {",
+            "    if len(b)%8 != 0 {",
+            "        return nil, false",
+            "    }",
+            "    ids := make([]uint64, len(b)/8)",
+            "    for i := range ids {",
+            "        ids[i] = binary.LittleEndian.Uint64(b[8*i:])",
+            "    }",
+            "    return ids, true",
+            "}",
+            "",
+            "// lazyValue is a slice or map result kept Go-side for a lazy call (Request.Lazy).",
+            "// Python reads windows of it with lazy_range / lazy_get.",
+            "type lazyValue struct {",
+            "    v reflect.Value",
+            "    once sync.Once",
+            "    keys []reflect.Value",
+            "}",
+            "",
+            "// sortedKeys returns the map's keys in a stable (sorted) order, computed once.",
+            "func (lv *lazyValue) sortedKeys() []reflect.Value {",
+            "    lv.once.Do(func() {",
+            "        keys := lv.v.MapKeys()",
+            "        sort.Slice(keys, func(i, j int) bool { return keys[i].String() < keys[j].String() })",
+            "        lv.keys = keys",
+            "    })",
+            "    return lv.keys",
+            "}",
+            "",
+            "// lazyRef is what a lazy call returns instead of the encoded value.",
+            "type lazyRef struct {",
+            '    ID uint64 `msgpack:"$usegolib_lazy"`',
+            '    Kind string `msgpack:"kind"`',
+            '    Len int `msgpack:"len"`',
+            "}",
+            "",
+            "type lazyKey struct{}",
+            "",
+            "var lazyNext uint64",
+            "var lazyMu sync.RWMutex",
+            "var lazyByID = map[uint64]*lazyValue{}",
+            "",
+            "// storeLazy registers a slice or string-keyed map and returns its lazyRef; other",
+            "// values are exported as usual.",
+            "func storeLazy(v reflect.Value) (any, bool) {",
+            "    for v.IsValid() && (v.Kind() == reflect.Ptr || v.Kind() == reflect.Interface) {",
+            "        if v.IsNil() {",
+            "            return nil, true",
+            "        }",
+            "        v = v.Elem()",
+            "    }",
+            "    if !v.IsValid() {",
+            "        return nil, true",
+            "    }",
+            "    kind := \"\"",
+            "    switch v.Kind() {",
+            "    case reflect.Slice:",
+            "        if v.Type().Elem().Kind() != reflect.Uint8 {",
+            "            kind = \"slice\"",
+            "        }",
+            "    case reflect.Map:",
+            "        if v.Type().Key().Kind() == reflect.String {",
+            "            kind = \"map\"",
+            "        }",
+            "    }",
+            "    if kind == \"\" {",
+            "        return exportAny(v)",
+            "    }",
+            "    id := atomic.AddUint64(&lazyNext, 1)",
+            "    lazyMu.Lock()",
+            "    lazyByID[id] = &lazyValue{v: v}",
+            "    lazyMu.Unlock()",
+            "    return lazyRef{ID: id, Kind: kind, Len: v.Len()}, true",
+            "}",
+            "",
+            "// lazyResult stores a lazy call's result when the wrapper returned it as-is",
+            "// (slices and maps of plain types skip exportResult).",
+            "func lazyResult(result any) (any, *ErrorObj) {",
+            "    if _, ok := result.(lazyRef); ok || result == nil {",
+            "        return result, nil",
+            "    }",
+            "    out, ok := storeLazy(reflect.ValueOf(result))",
+            "    if !ok {",
+            '        return nil, &ErrorObj{Type: "UnsupportedTypeError", Message: "unsupported return type"}',
+            "    }",
+            "    return out, nil",
+            "}",
+            "",
+            "// ndRef is a packed numeric array ({\"$usegolib_nd\": dtype, \"shape\": [...],",
+            "// \"data\": bytes}): little-endian elements in row-major order. Numeric slice",
+            "// arguments accept it, and packed calls return numeric slice results as one.",
+            "type ndRef struct {",
+            '    Dtype string `msgpack:"$usegolib_nd"`',
+            '    Shape []int `msgpack:"shape"`',
+            '    Data []byte `msgpack:"data"`',
+            "}",
+            "",
+            "// ndNative reports a little-endian host, whose slices are packed as they are.",
+            "var ndNative = func() bool {",
+            "    x := uint16(1)",
+            "    return *(*byte)(unsafe.Pointer(&x)) == 1",
+            "}()",
+            "",
+            "// ndDtype names the packed element type of t (\"f8\", \"i4\", \"u2\", ...), or \"\".",
+            "// Byte slices are not packed: they already travel as binary strings.",
+            "func ndDtype(t reflect.Type) string {",
+            "    var kind byte",
+            "    switch t.Kind() {",
+            "    case reflect.Float32, reflect.Float64:",
+            "        kind = 'f'",
+            "    case reflect.Int, reflect.Int8, reflect.Int16, reflect.Int32, reflect.Int64:",
+            "        kind = 'i'",
+            "    case reflect.Uint, reflect.Uint16, reflect.Uint32, reflect.Uint64:",
+            "        kind = 'u'",
+            "    default:",
+            '        return ""',
+            "    }",
+            "    return string([]byte{kind, byte('0' + t.Size())})",
+            "}",
+            "",
+            "// ndBytes is the memory of a numeric slice (not copied).",
+            "func ndBytes(v reflect.Value) []byte {",
+            "    n := v.Len() * int(v.Type().Elem().Size())",
+            "    if n == 0 {",
+            "        return []byte{}",
+            "    }",
+            "    return unsafe.Slice((*byte)(v.UnsafePointer()), n)",
+            "}",
+            "",
+            "// ndPack packs a numeric slice, or a slice of numeric slices (rows of",
+            "// different lengths are packed one by one). ok is false for other values.",
+            "func ndPack(v reflect.Value) (any, bool) {",
+            "    for v.IsValid() && (v.Kind() == reflect.Ptr || v.Kind() == reflect.Interface) {",
+            "        if v.IsNil() {",
+            "            return nil, true",
+            "        }",
+            "        v = v.Elem()",
+            "    }",
+            "    if !ndNative || !v.IsValid() || v.Kind() != reflect.Slice {",
+            "        return nil, false",
+            "    }",
+            "    et := v.Type().Elem()",
+            "    if dt := ndDtype(et); dt != \"\" {",
+            "        if v.IsNil() {",
+            "            return nil, true",
+            "        }",
+            "        return ndRef{Dtype: dt, Shape: []int{v.Len()}, Data: ndBytes(v)}, true",
+            "    }",
+            "    if et.Kind() != reflect.Slice || ndDtype(et.Elem()) == \"\" {",
+            "        return nil, false",
+            "    }",
+            "    if v.IsNil() {",
+            "        return nil, true",
+            "    }",
+            "    rows, cols := v.Len(), 0",
+            "    if rows > 0 {",
+            "        cols = v.Index(0).Len()",
+            "    }",
+            "    for i := 1; i < rows; i++ {",
+            "        if v.Index(i).Len() != cols {",
+            "            out := make([]any, rows)",
+            "            for j := range out {",
+            "                out[j], _ = ndPack(v.Index(j))",
+            "            }",
+            "            return out, true",
+            "        }",
+            "    }",
+            "    data := make([]byte, 0, rows*cols*int(et.Elem().Size()))",
+            "    for i := 0; i < rows; i++ {",
+            "        data = append(data, ndBytes(v.Index(i))...)",
+            "    }",
+            "    return ndRef{Dtype: ndDtype(et.Elem()), Shape: []int{rows, cols}, Data: data}, true",
+            "}",
+            "",
+            "// packedResult packs a packed call's result; other results are returned as-is.",
+            "func packedResult(result any) any {",
+            "    if out, ok := ndPack(reflect.ValueOf(result)); ok {",
+            "        return out",
+            "    }",
+            "    return result",
+            "}",
+            "",
+            "// ndOf decodes a packed array argument.",
+            "func ndOf(v any) (*ndRef, bool) {",
+            "    m, ok := v.(map[string]any)",
+            "    if !ok || len(m) != 3 {",
+            "        return nil, false",
+            "    }",
+            '    dt, ok := m["$usegolib_nd"].(string)',
+            "    if !ok {",
+            "        return nil, false",
+            "    }",
+            '    data, ok := m["data"].([]byte)',
+            "    if !ok {",
+            "        return nil, false",
+            "    }",
+            '    raw, ok := m["shape"].([]any)',
+            "    if !ok {",
+            "        return nil, false",
+            "    }",
+            "    shape := make([]int, len(raw))",
+            "    for i, x := range raw {",
+            "        n, ok := toInt64(x)",
+            "        if !ok || n < 0 {",
+            "            return nil, false",
+            "        }",
+            "        shape[i] = int(n)",
+            "    }",
+            "    return &ndRef{Dtype: dt, Shape: shape, Data: data}, true",
+            "}",
+            "",
+            "// ndValue copies a packed array into a new value of slice type t. The element",
+            "// type and the number of dimensions must match exactly.",
+            "func ndValue(a *ndRef, t reflect.Type) (reflect.Value, bool) {",
+            "    if !ndNative || len(a.Shape) == 0 || len(a.Dtype) != 2 {",
+            "        return reflect.Value{}, false",
+            "    }",
+            "    n := int(a.Dtype[1] - '0')",
+            "    for _, d := range a.Shape {",
+            "        n *= d",
+            "    }",
+            "    if len(a.Data) != n {",
+            "        return reflect.Value{}, false",
+            "    }",
+            "    return ndFill(a.Dtype, a.Shape, a.Data, t)",
+            "}",
+            "",
+            "func ndFill(dt string, shape []int, data []byte, t reflect.Type) (reflect.Value, bool) {",
+            "    if t.Kind() != reflect.Slice {",
+            "        return reflect.Value{}, false",
+            "    }",
+            "    out := reflect.MakeSlice(t, shape[0], shape[0])",
+            "    if len(shape) == 1 {",
+            "        if ndDtype(t.Elem()) != dt {",
+            "            return reflect.Value{}, false",
+            "        }",
+            "        copy(ndBytes(out), data)",
+            "        return out, true",
+            "    }",
+            "    stride := 0",
+            "    if shape[0] > 0 {",
+            "        stride = len(data) / shape[0]",
+            "    }",
+            "    for i := 0; i < shape[0]; i++ {",
+            "        row, ok := ndFill(dt, shape[1:], data[i*stride:(i+1)*stride], t.Elem())",
+            "        if !ok {",
+            "            return reflect.Value{}, false",
+            "        }",
+            "        out.Index(i).Set(row)",
+            "    }",
+            "    return out, true",
+            "}",
+            "",
+            "// memRef is caller memory (a file mapping) viewed as a slice without copying.",
+            "// It is only created by op pin_mem; the caller keeps the memory valid while",
+            "// the pin exists or a call using it runs.",
+            "type memRef struct {",
+            "    Dtype string",
+            "    Addr uintptr",
+            "    Len int",
+            "}",
+            "",
+            "// memRefOf decodes the value of a pin_mem request.",
+            "func memRefOf(v any) (*memRef, bool) {",
+            "    m, ok := v.(map[string]any)",
+            "    if !ok {",
+            "        return nil, false",
+            "    }",
+            '    dt, ok := m["dtype"].(string)',
+            "    if !ok {",
+            "        return nil, false",
+            "    }",
+            '    addr, ok := m["addr"].(uint64)',
+            "    if !ok {",
+            '        a, ok := toInt64(m["addr"])',
+            "        if !ok || a < 0 {",
+            "            return nil, false",
+            "        }",
+            "        addr = uint64(a)",
+            "    }",
+            '    n, ok := toInt64(m["len"])',
+            "    if !ok || n < 0 {",
+            "        return nil, false",
+            "    }",
+            "    return &memRef{Dtype: dt, Addr: uintptr(addr), Len: int(n)}, true",
+            "}",
+            "",
+            "// memValue views the memory as a value of slice type t, whose element type must",
+            "// match the dtype exactly (\"u1\" is []byte).",
+            "func memValue(m *memRef, t reflect.Type) (reflect.Value, bool) {",
+            "    if t.Kind() != reflect.Slice || !ndNative {",
+            "        return reflect.Value{}, false",
+            "    }",
+            "    et := t.Elem()",
+            '    if ndDtype(et) != m.Dtype && !(m.Dtype == "u1" && et.Kind() == reflect.Uint8) {',
+            "        return reflect.Value{}, false",
+            "    }",
+            "    if m.Len > 0 && (m.Addr == 0 || m.Addr%uintptr(et.Align()) != 0) {",
+            "        return reflect.Value{}, false",
+            "    }",
+            "    out := reflect.New(t).Elem()",
+            "    if m.Len > 0 {",
+            "        // A slice header does not depend on the element type.",
+            "        view := unsafe.Slice((*byte)(unsafe.Pointer(m.Addr)), m.Len)",
+            "        *(*[]byte)(out.Addr().UnsafePointer()) = view",
+            "    }",
+            "    return out, true",
+            "}",
+            "",
+            "// colsRef is a slice of record structs sent column by column.",
+            "type colsRef struct {",
+            "    N int",
+            "    Columns map[string]any",
+            "}",
+            "",
+            "// colsOf decodes a columnar argument.",
+            "func colsOf(v any) (*colsRef, bool) {",
+            "    m, ok := v.(map[string]any)",
+            "    if !ok || len(m) != 2 {",
+            "        return nil, false",
+            "    }",
+            '    n, ok := toInt64(m["$usegolib_columns"])',
+            "    if !ok || n < 0 {",
+            "        return nil, false",
+            "    }",
+            '    cols, ok := m["columns"].(map[string]any)',
+            "    if !ok {",
+            "        return nil, false",
+            "    }",
+            "    return &colsRef{N: int(n), Columns: cols}, true",
+            "}",
+            "",
+            "// colsFlat reports whether values of t can be copied as raw bytes.",
+            "func colsFlat(t reflect.Type) bool {",
+            "    switch t.Kind() {",
+            "    case reflect.Bool, reflect.Int, reflect.Int8, reflect.Int16, reflect.Int32, reflect.Int64,",
+            "        reflect.Uint, reflect.Uint8, reflect.Uint16, reflect.Uint32, reflect.Uint64, reflect.Float32, reflect.Float64:",
+            "        return true",
+            "    }",
+            "    return false",
+            "}",
+            "",
+            "// colsValue assembles a new value of type t (a slice of record structs or",
+            "// pointers to them) from its columns. Each column is converted once, as a",
+            "// slice of the field type, and written straight into the struct fields.",
+            "func colsValue(c *colsRef, t reflect.Type) (reflect.Value, bool) {",
+            "    et := t.Elem()",
+            "    st := et",
+            "    if st.Kind() == reflect.Ptr {",
+            "        st = st.Elem()",
+            "    }",
+            "    if st.Kind() != reflect.Struct || st == arrowTimeType || !isAllowedStructType(st) {",
+            "        return reflect.Value{}, false",
+            "    }",
+            "    rows := reflect.MakeSlice(reflect.SliceOf(st), c.N, c.N)",
+            "    if et == st {",
+            "        rows = reflect.MakeSlice(t, c.N, c.N)",
+            "    }",
+            "    for k, col := range c.Columns {",
+            "        sf, ok := fieldByKey(st, k)",
+            "        if !ok {",
+            "            return reflect.Value{}, false",
+            "        }",
+            "        cv, ok := convertToType(col, reflect.SliceOf(sf.Type))",
+            "        if !ok || cv.Len() != c.N {",
+            "            return reflect.Value{}, false",
+            "        }",
+            "        if c.N == 0 {",
+            "            continue",
+            "        }",
+            "        if len(sf.Index) == 1 && colsFlat(sf.Type) {",
+            "            size, stride := int(sf.Type.Size()), int(st.Size())",
+            "            src := unsafe.Slice((*byte)(cv.UnsafePointer()), c.N*size)",
+            "            base := unsafe.Add(rows.UnsafePointer(), sf.Offset)",
+            "            for i := 0; i < c.N; i++ {",
+            "                copy(unsafe.Slice((*byte)(unsafe.Add(base, i*stride)), size), src[i*size:])",
+            "            }",
+            "            continue",
+            "        }",
+            "        for i := 0; i < c.N; i++ {",
+            "            rows.Index(i).FieldByIndex(sf.Index).Set(cv.Index(i))",
+            "        }",
+            "    }",
+            "    if et == st {",
+            "        return rows, true",
+            "    }",
+            "    out := reflect.MakeSlice(t, c.N, c.N)",
+            "    for i := 0; i < c.N; i++ {",
+            "        out.Index(i).Set(rows.Index(i).Addr())",
+            "    }",
+            "    return out, true",
+            "}",
+            "",
+            "// arrowBlocks collects the C allocations owned by one exported Arrow node.",
+            "type arrowBlocks []unsafe.Pointer",
+            "",
+            "func (b *arrowBlocks) alloc(n int) unsafe.Pointer {",
+            "    if n < 1 {",
+            "        n = 1",
+            "    }",
+            "    p := C.calloc(1, C.size_t(n))",
+            "    if p == nil {",
+            '        panic("arrow: out of memory")',
+            "    }",
+            "    *b = append(*b, p)",
+            "    return p",
+            "}",
+            "",
+            "func (b *arrowBlocks) cstring(s string) *C.char {",
+            "    p := b.alloc(len(s) + 1)",
+            "    copy(unsafe.Slice((*byte)(p), len(s)), s)",
+            "    return (*C.char)(p)",
+            "}",
+            "",
+            "func (b *arrowBlocks) pointers(ps []unsafe.Pointer) unsafe.Pointer {",
+            "    p := b.alloc(len(ps) * int(unsafe.Sizeof(uintptr(0))))",
+            "    copy(unsafe.Slice((*unsafe.Pointer)(p), len(ps)), ps)",
+            "    return p",
+            "}",
+            "",
+            "// owned returns the NULL-terminated block list stored in private_data.",
+            "func (b arrowBlocks) owned() unsafe.Pointer {",
+            "    list := arrowBlocks{}",
+            "    p := list.alloc((len(b) + 1) * int(unsafe.Sizeof(uintptr(0))))",
+            "    copy(unsafe.Slice((*unsafe.Pointer)(p), len(b)), b)",
+            "    return p",
+            "}",
+            "",
+            "var (",
+            "    arrowTimeType = reflect.TypeOf(time.Time{})",
+            "    arrowDurationType = reflect.TypeOf(time.Duration(0))",
+            ")",
+            "",
+            "// arrowFormat is the Arrow format string of a Go type, or \"\" if it has none.",
+            "// Pointers are nullable columns of their element type.",
+            "func arrowFormat(t reflect.Type) string {",
+            "    if t.Kind() == reflect.Ptr {",
+            "        t = t.Elem()",
+            "    }",
+            "    switch {",
+            "    case t == arrowTimeType:",
+            '        return "tsn:UTC"',
+            "    case t == arrowDurationType:",
+            '        return "tDn"',
+            "    }",
+            "    switch t.Kind() {",
+            "    case reflect.Bool:",
+            '        return "b"',
+            "    case reflect.Int8:",
+            '        return "c"',
+            "    case reflect.Int16:",
+            '        return "s"',
+            "    case reflect.Int32:",
+            '        return "i"',
+            "    case reflect.Int64:",
+            '        return "l"',
+            "    case reflect.Int:",
+            "        if t.Size() == 4 {",
+            '            return "i"',
+            "        }",
+            '        return "l"',
+            "    case reflect.Uint8:",
+            '        return "C"',
+            "    case reflect.Uint16:",
+            '        return "S"',
+            "    case reflect.Uint32:",
+            '        return "I"',
+            "    case reflect.Uint64:",
+            '        return "L"',
+            "    case reflect.Uint:",
+            "        if t.Size() == 4 {",
+            '            return "I"',
+            "        }",
+            '        return "L"',
+            "    case reflect.Float32:",
+            '        return "f"',
+            "    case reflect.Float64:",
+            '        return "g"',
+            "    case reflect.String:",
+            '        return "U"',
+            "    case reflect.Array:",
+            "        if t.Elem().Kind() == reflect.Uint8 {",
+            '            return "w:" + strconv.Itoa(t.Len())',
+            "        }",
+            "    case reflect.Slice:",
+            "        if t.Elem().Kind() == reflect.Uint8 {",
+            '            return "Z"',
+            "        }",
+            '        return "+L"',
+            "    case reflect.Struct:",
+            "        if isAllowedStructType(t) {",
+            '            return "+s"',
+            "        }",
+            "    }",
+            '    return ""',
+            "}",
+            "",
+            "// arrowFields lists the exported, non-ignored fields of a record struct.",
+            "func arrowFields(t reflect.Type) []reflect.StructField {",
+            "    var out []reflect.StructField",
+            "    for i := 0; i < t.NumField(); i++ {",
+            "        sf := t.Field(i)",
+            "        if sf.PkgPath == \"\" && !fieldIgnored(sf) && fieldOutputKey(sf) != \"\" {",
+            "            out = append(out, sf)",
+            "        }",
+            "    }",
+            "    return out",
+            "}",
+            "",
+            "// arrowCheck reports the path of the first value in t that has no Arrow type.",
+            "func arrowCheck(t reflect.Type, path string, seen map[reflect.Type]bool) (string, bool) {",
+            "    if seen[t] {",
+            '        return "", true',
+            "    }",
+            "    seen[t] = true",
+            "    format := arrowFormat(t)",
+            "    if t.Kind() == reflect.Ptr {",
+            "        t = t.Elem()",
+            "    }",
+            "    switch format {",
+            '    case "":',
+            "        return path, false",
+            '    case "+L":',
+            '        return arrowCheck(t.Elem(), path+"[]", seen)',
+            '    case "+s":',
+            "        for _, sf := range arrowFields(t) {",
+            '            if p, ok := arrowCheck(sf.Type, path+"."+fieldOutputKey(sf), seen); !ok {',
+            "                return p, false",
+            "            }",
+            "        }",
+            "    }",
+            '    return "", true',
+            "}",
+            "",
+            "// arrowExport exports a slice of record structs as an Arrow struct array with",
+            "// one child column per field (a record batch).",
+            "func arrowExport(v reflect.Value, s *C.struct_ArrowSchema, a *C.struct_ArrowArray) (errObj *ErrorObj) {",
+            "    defer func() {",
+            "        if r := recover(); r != nil {",
+            '            msg, _ := r.(string)',
+            '            if msg == "" {',
+            '                msg = "panic"',
+            '            }',
+            '            errObj = &ErrorObj{Type: "GoPanicError", Message: msg}',
+            "        }",
+            "    }()",
+            "    et := v.Type().Elem()",
+            "    if v.Kind() != reflect.Slice || arrowFormat(et) != \"+s\" {",
+            '        return &ErrorObj{Type: "UnsupportedTypeError", Message: "arrow: result is not a slice of record structs"}',
+            "    }",
+            "    if path, ok := arrowCheck(et, \"\", map[reflect.Type]bool{}); !ok {",
+            '        return &ErrorObj{Type: "UnsupportedTypeError", Message: "arrow: unsupported field type at " + strings.TrimPrefix(path, ".")}',
+            "    }",
+            "    rows := make([]reflect.Value, v.Len())",
+            "    for i := range rows {",
+            "        rows[i] = v.Index(i)",
+            "        if rows[i].Kind() == reflect.Ptr && rows[i].IsNil() {",
+            '            return &ErrorObj{Type: "UnsupportedTypeError", Message: "arrow: nil row", Detail: map[string]any{"index": i}}',
+            "        }",
+            "    }",
+            '    arrowNode("", et, rows, s, a)',
+            "    return nil",
+            "}",
+            "",
+            "// arrowNode exports vals (of Go type t; invalid values are nulls) as one Arrow",
+            "// column into s and a. t must pass arrowCheck.",
+            "func arrowNode(name string, t reflect.Type, vals []reflect.Value, s *C.struct_ArrowSchema, a *C.struct_ArrowArray) {",
+            "    var sb, ab arrowBlocks",
+            "    format := arrowFormat(t)",
+            "    if t.Kind() == reflect.Ptr {",
+            "        t = t.Elem()",
+            "        s.flags = C.ARROW_FLAG_NULLABLE",
+            "        elems := make([]reflect.Value, len(vals))",
+            "        for i, v := range vals {",
+            "            if v.IsValid() && !v.IsNil() {",
+            "                elems[i] = v.Elem()",
+            "            }",
+            "        }",
+            "        vals = elems",
+            "    }",
+            "    n := len(vals)",
+            "    var validity unsafe.Pointer",
+            "    nulls := 0",
+            "    for _, v := range vals {",
+            "        if !v.IsValid() {",
+            "            nulls++",
+            "        }",
+            "    }",
+            "    if nulls > 0 {",
+            "        validity = ab.alloc((n + 7) / 8)",
+            "        bits := unsafe.Slice((*byte)(validity), (n+7)/8)",
+            "        for i, v := range vals {",
+            "            if v.IsValid() {",
+            "                bits[i/8] |= 1 << (i % 8)",
+            "            }",
+            "        }",
+            "    }",
+            "    buffers := []unsafe.Pointer{validity}",
+            "    var childNames []string",
+            "    var childTypes []reflect.Type",
+            "    var childVals [][]reflect.Value",
+            "    switch format {",
+            '    case "b":',
+            "        p := ab.alloc((n + 7) / 8)",
+            "        bits := unsafe.Slice((*byte)(p), (n+7)/8)",
+            "        for i, v := range vals {",
+            "            if v.IsValid() && v.Bool() {",
+            "                bits[i/8] |= 1 << (i % 8)",
+            "            }",
+            "        }",
+            "        buffers = append(buffers, p)",
+            '    case "tsn:UTC":',
+            "        p := ab.alloc(n * 8)",
+            "        out := unsafe.Slice((*int64)(p), n)",
+            "        for i, v := range vals {",
+            "            if v.IsValid() {",
+            "                out[i] = v.Interface().(time.Time).UnixNano()",
+            "            }",
+            "        }",
+            "        buffers = append(buffers, p)",
+            '    case "U", "Z":',
+            "        offsets := ab.alloc((n + 1) * 8)",
+            "        offs := unsafe.Slice((*int64)(offsets), n+1)",
+            "        total := 0",
+            "        for i, v := range vals {",
+            "            if v.IsValid() {",
+            "                total += v.Len()",
+            "            }",
+            "            offs[i+1] = int64(total)",
+            "        }",
+            "        data := ab.alloc(total)",
+            "        out := unsafe.Slice((*byte)(data), total)",
+            "        for i, v := range vals {",
+            "            if !v.IsValid() {",
+            "                continue",
+            "            }",
+            "            if v.Kind() == reflect.String {",
+            "                copy(out[offs[i]:], v.String())",
+            "            } else {",
+            "                copy(out[offs[i]:], v.Bytes())",
+            "            }",
+            "        }",
+            "        buffers = append(buffers, offsets, data)",
+            '    case "+s":',
+            "        for _, sf := range arrowFields(t) {",
+            "            col := make([]reflect.Value, n)",
+            "            for i, v := range vals {",
+            "                if v.IsValid() {",
+            "                    col[i] = v.FieldByIndex(sf.Index)",
+            "                }",
+            "            }",
+            "            childNames = append(childNames, fieldOutputKey(sf))",
+            "            childTypes = append(childTypes, sf.Type)",
+            "            childVals = append(childVals, col)",
+            "        }",
+            '    case "+L":',
+            "        offsets := ab.alloc((n + 1) * 8)",
+            "        offs := unsafe.Slice((*int64)(offsets), n+1)",
+            "        var items []reflect.Value",
+            "        for i, v := range vals {",
+            "            if v.IsValid() {",
+            "                for j := 0; j < v.Len(); j++ {",
+            "                    items = append(items, v.Index(j))",
+            "                }",
+            "            }",
+            "            offs[i+1] = int64(len(items))",
+            "        }",
+            "        buffers = append(buffers, offsets)",
+            '        childNames = append(childNames, "item")',
+            "        childTypes = append(childTypes, t.Elem())",
+            "        childVals = append(childVals, items)",
+            "    default:",
+            "        // Fixed-width values (numbers, durations, byte arrays) are copied as they are.",
+            "        size := int(t.Size())",
+            "        p := ab.alloc(n * size)",
+            "        for i, v := range vals {",
+            "            if v.IsValid() {",
+            "                reflect.NewAt(t, unsafe.Add(p, i*size)).Elem().Set(v)",
+            "            }",
+            "        }",
+            "        buffers = append(buffers, p)",
+            "    }",
+            "    if k := len(childNames); k > 0 {",
+            "        sChildren := make([]unsafe.Pointer, k)",
+            "        aChildren := make([]unsafe.Pointer, k)",
+            "        for i := range childNames {",
+            "            sChildren[i] = sb.alloc(int(unsafe.Sizeof(C.struct_ArrowSchema{})))",
+            "            aChildren[i] = ab.alloc(int(unsafe.Sizeof(C.struct_ArrowArray{})))",
+            "            arrowNode(childNames[i], childTypes[i], childVals[i], (*C.struct_ArrowSchema)(sChildren[i]), (*C.struct_ArrowArray)(aChildren[i]))",
+            "        }",
+            "        s.n_children = C.int64_t(k)",
+            "        s.children = (**C.struct_ArrowSchema)(sb.pointers(sChildren))",
+            "        a.n_children = C.int64_t(k)",
+            "        a.children = (**C.struct_ArrowArray)(ab.pointers(aChildren))",
+            "    }",
+            "    s.format = sb.cstring(format)",
+            "    s.name = sb.cstring(name)",
+            "    if nulls > 0 {",
+            "        s.flags = C.ARROW_FLAG_NULLABLE",
+            "    }",
+            "    a.length = C.int64_t(n)",
+            "    a.null_count = C.int64_t(nulls)",
+            "    a.n_buffers = C.int64_t(len(buffers))",
+            "    a.buffers = (*unsafe.Pointer)(ab.pointers(buffers))",
+            "    s.private_data = sb.owned()",
+            "    a.private_data = ab.owned()",
+            "    C.usegolib_arrow_set_release(s, a)",
+            "}",
+            "",
+            "func lookupLazy(id uint64) (*lazyValue, *ErrorObj) {",
+            "    lazyMu.RLock()",
+            "    lv := lazyByID[id]",
+            "    lazyMu.RUnlock()",
+            "    if lv == nil {",
+            '        return nil, &ErrorObj{Type: "ObjectNotFound", Message: "lazy value not found", Detail: map[string]any{"id": id}}',
+            "    }",
+            "    return lv, nil",
+            "}",
+            "",
+            "// lazyRange exports elements [start, stop) of a slice, or the keys at those",
+            "// positions of a map (in sortedKeys order).",
+            "func lazyRange(lv *lazyValue, start int, stop int) ([]any, *ErrorObj) {",
+            "    if start < 0 || stop < start || stop > lv.v.Len() {",
+            '        return nil, &ErrorObj{Type: "ABIError", Message: "range out of bounds", Detail: map[string]any{"start": start, "stop": stop, "len": lv.v.Len()}}',
+            "    }",
+            "    out := make([]any, 0, stop-start)",
+            "    if lv.v.Kind() == reflect.Map {",
+            "        for _, k := range lv.sortedKeys()[start:stop] {",
+            "            out = append(out, k.String())",
+            "        }",
+            "        return out, nil",
+            "    }",
+            "    for i := start; i < stop; i++ {",
+            "        av, ok := exportAny(lv.v.Index(i))",
+            "        if !ok {",
+            '            return nil, &ErrorObj{Type: "UnsupportedTypeError", Message: "unsupported element type"}',
+            "        }",
+            "        out = append(out, av)",
+            "    }",
+            "    return out, nil",
+            "}",
+            "",
+            "// lazyGet exports the values of the given map keys; missing keys are left out.",
+            "func lazyGet(lv *lazyValue, keys []string) (map[string]any, *ErrorObj) {",
+            "    if lv.v.Kind() != reflect.Map {",
+            '        return nil, &ErrorObj{Type: "ABIError", Message: "lazy value is not a map"}',
+            "    }",
+            "    kt := lv.v.Type().Key()",
+            "    out := make(map[string]any, len(keys))",
+            "    for _, k := range keys {",
+            "        mv := lv.v.MapIndex(reflect.ValueOf(k).Convert(kt))",
+            "        if !mv.IsValid() {",
+            "            continue",
+            "        }",
+            "        av, ok := exportAny(mv)",
+            "        if !ok {",
+            '            return nil, &ErrorObj{Type: "UnsupportedTypeError", Message: "unsupported element type"}',
+            "        }",
+            "        out[k] = av",
+            "    }",
+            "    return out, nil",
+            "}",
+            "",
+            "// readerArg is an io.Reader argument registered by reader_new: a file that Go",
+            "// opens and reads itself, or chunks pushed from Python with reader_push. A push",
+            "// blocks until the Go function has read the previous chunk (backpressure).",
+            "type readerArg struct {",
+            "    file *os.File",
+            "    chunks chan []byte",
+            "    done chan struct{}",
+            "    eofOnce sync.Once",
+            "    freeOnce sync.Once",
+            "    buf []byte",
+            "    eof bool",
+            "    // err is set by reader_push before chunks is closed.",
+            "    err error",
+            "}",
+            "",
+            "var readerIDNext uint64",
+            "var readerMu sync.Mutex",
+            "var readerByID = map[uint64]*readerArg{}",
+            "",
+            "func (r *readerArg) Read(p []byte) (int, error) {",
+            "    if r.file != nil {",
+            "        return r.file.Read(p)",
+            "    }",
+            "    for len(r.buf) == 0 {",
+            "        if r.eof {",
+            "            if r.err != nil {",
+            "                return 0, r.err",
+            "            }",
+            "            return 0, io.EOF",
+            "        }",
+            "        select {",
+            "        case c, ok := <-r.chunks:",
+            "            if !ok {",
+            "                r.eof = true",
+            "                continue",
+            "            }",
+            "            r.buf = c",
+            "        case <-r.done:",
+            "            return 0, io.ErrClosedPipe",
+            "        }",
+            "    }",
+            "    n := copy(p, r.buf)",
+            "    r.buf = r.buf[n:]",
+            "    return n, nil",
+            "}",
+            "",
+            "func (r *readerArg) free() {",
+            "    r.freeOnce.Do(func() {",
+            "        close(r.done)",
+            "        if r.file != nil {",
+            "            r.file.Close()",
+            "        }",
+            "    })",
+            "}",
+            "",
+            "// readerOf converts an io.Reader argument: bytes are read in place, and",
+            "// {\"$usegolib_reader\": id} uses a reader registered by reader_new.",
+            "func readerOf(v any) (io.Reader, *ErrorObj) {",
+            "    switch x := v.(type) {",
+            "    case nil:",
+            "        return nil, nil",
+            "    case []byte:",
+            "        return bytes.NewReader(x), nil",
+            "    case string:",
+            "        return strings.NewReader(x), nil",
+            "    case map[string]any:",
+            '        if raw, ok := x["$usegolib_reader"]; ok && len(x) == 1 {',
+            "            id, _ := toInt64(raw)",
+            "            readerMu.Lock()",
+            "            r := readerByID[uint64(id)]",
+            "            readerMu.Unlock()",
+            "            if r == nil {",
+            '                return nil, &ErrorObj{Type: "ObjectNotFound", Message: "reader not found"}',
+            "            }",
+            "            return r, nil",
+            "        }",
+            "    }",
+            '    return nil, &ErrorObj{Type: "UnsupportedTypeError", Message: "unsupported io.Reader argument"}',
+            "}",
+            "",
+            "// ioPending holds, per object id, the error an io.Reader returned together",
+            "// with data; it is reported by the next read.",
+            "var ioPending sync.Map",
+            "",
+            "func lookupIO(id uint64) (*ObjEntry, *ErrorObj) {",
+            "    objMu.RLock()",
+            "    ent, ok := objByID[id]",
+            "    objMu.RUnlock()",
+            "    if !ok {",
+            '        return nil, &ErrorObj{Type: "ObjectNotFound", Message: "object not found", Detail: map[string]any{"id": id}}',
+            "    }",
+            "    return ent, nil",
+            "}",
+            "",
+            "func ioReadErr(err error) (int, *ErrorObj) {",
+            "    if err == io.EOF {",
+            "        return -1, nil",
+            "    }",
+            '    return 0, &ErrorObj{Type: "GoError", Message: err.Error()}',
+            "}",
+            "",
+            "// ioRead reads into p from the io.Reader handle id; -1 means EOF.",
+            "func ioRead(id uint64, p []byte) (n int, errObj *ErrorObj) {",
+            "    ent, errObj := lookupIO(id)",
+            "    if errObj != nil {",
+            "        return 0, errObj",
+            "    }",
+            "    r, ok := ent.Obj.(io.Reader)",
+            "    if !ok {",
+            '        return 0, &ErrorObj{Type: "ABIError", Message: "object is not an io.Reader"}',
+            "    }",
+            "    unlock := lockObjAccess(ent, true)",
+            "    defer unlock()",
+            "    defer func() {",
+            "        if rec := recover(); rec != nil {",
+            '            n, errObj = 0, &ErrorObj{Type: "GoPanicError", Message: "panic"}',
+            "        }",
+            "    }()",
+            "    if err, ok := ioPending.LoadAndDelete(id); ok {",
+            "        return ioReadErr(err.(error))",
+            "    }",
+            "    for i := 0; i < 100; i++ {",
+            "        k, err := r.Read(p)",
+            "        if k > 0 {",
+            "            if err != nil {",
+            "                ioPending.Store(id, err)",
+            "            }",
+            "            return k, nil",
+            "        }",
+            "        if err != nil {",
+            "            return ioReadErr(err)",
+            "        }",
+            "    }",
+            "    return ioReadErr(io.ErrNoProgress)",
+            "}",
+            "",
+            "// ioWrite writes p to the io.Writer handle id.",
+            "func ioWrite(id uint64, p []byte) (n int, errObj *ErrorObj) {",
+            "    ent, errObj := lookupIO(id)",
+            "    if errObj != nil {",
+            "        return 0, errObj",
+            "    }",
+            "    w, ok := ent.Obj.(io.Writer)",
+            "    if !ok {",
+            '        return 0, &ErrorObj{Type: "ABIError", Message: "object is not an io.Writer"}',
+            "    }",
+            "    unlock := lockObjAccess(ent, true)",
+            "    defer unlock()",
+            "    defer func() {",
+            "        if rec := recover(); rec != nil {",
+            '            n, errObj = 0, &ErrorObj{Type: "GoPanicError", Message: "panic"}',
+            "        }",
+            "    }()",
+            "    k, err := w.Write(p)",
+            "    if err != nil {",
+            '        return k, &ErrorObj{Type: "GoError", Message: err.Error(), Detail: map[string]any{"written": k}}',
+            "    }",
+            "    return k, nil",
+            "}",
+            "",
+            "// goStream is a channel or iterator result read with stream_next. Iterators",
+            "// (iter.Seq / iter.Seq2, i.e. func(yield func(...) bool)) run on their own",
+            "// goroutine and hand exported items over a buffered channel, so a reader that",
+            "// falls behind blocks the producer (backpressure). Streams returned by object",
+            "// methods are read outside the object's lock (see lockObj): a parked producer",
+            "// holding it would deadlock a reader that calls a write method.",
+            "type goStream struct {",
+            "    ch reflect.Value",
+            "    // export is set for Go channels, whose items are exported when received.",
+            "    export bool",
+            "    stop chan struct{}",
+            "    stopOnce sync.Once",
+            "    // err is set by the iterator goroutine before it closes ch.",
+            "    err *ErrorObj",
+            "}",
+            "",
+            "// streamRef is what a call returning a stream encodes as its result.",
+            "type streamRef struct {",
+            '    ID uint64 `msgpack:"$usegolib_stream"`',
+            "}",
+            "",
+            "const streamBuffer = 256",
+            "",
+            "var streamIDNext uint64",
+            "var streamMu sync.Mutex",
+            "var streamByID = map[uint64]*goStream{}",
+            "",
+            "func storeStream(v reflect.Value) (any, bool) {",
+            "    if v.IsNil() {",
+            "        return nil, true",
+            "    }",
+            "    st := &goStream{stop: make(chan struct{})}",
+            "    if v.Kind() == reflect.Chan {",
+            "        if v.Type().ChanDir()&reflect.RecvDir == 0 {",
+            "            return nil, false",
+            "        }",
+            "        st.ch = v",
+            "        st.export = true",
+            "    } else {",
+            "        ft := v.Type()",
+            "        if ft.NumIn() != 1 || ft.In(0).Kind() != reflect.Func {",
+            "            return nil, false",
+            "        }",
+            "        items := make(chan any, streamBuffer)",
+            "        st.ch = reflect.ValueOf(items)",
+            "        go st.run(v, items)",
+            "    }",
+            "    id := atomic.AddUint64(&streamIDNext, 1)",
+            "    streamMu.Lock()",
+            "    streamByID[id] = st",
+            "    streamMu.Unlock()",
+            "    return streamRef{ID: id}, true",
+            "}",
+            "",
+            "func (st *goStream) run(seq reflect.Value, items chan any) {",
+            "    defer close(items)",
+            "    defer func() {",
+            "        if r := recover(); r != nil {",
+            '            st.err = &ErrorObj{Type: "GoPanicError", Message: "panic"}',
+            "        }",
+            "    }()",
+            "    yield := reflect.MakeFunc(seq.Type().In(0), func(args []reflect.Value) []reflect.Value {",
+            "        var item any",
+            "        ok := true",
+            "        if len(args) == 2 {",
+            "            k, okK := exportAny(args[0])",
+            "            val, okV := exportAny(args[1])",
+            "            item, ok = []any{k, val}, okK && okV",
+            "        } else {",
+            "            item, ok = exportAny(args[0])",
+            "        }",
+            "        if !ok {",
+            '            st.err = &ErrorObj{Type: "UnsupportedTypeError", Message: "unsupported stream item type"}',
+            "            return []reflect.Value{reflect.ValueOf(false)}",
+            "        }",
+            "        select {",
+            "        case items <- item:",
+            "            return []reflect.Value{reflect.ValueOf(true)}",
+            "        case <-st.stop:",
+            "            return []reflect.Value{reflect.ValueOf(false)}",
+            "        }",
+            "    })",
+            "    seq.Call([]reflect.Value{yield})",
+            "}",
+            "",
+            "func (st *goStream) close() {",
+            "    st.stopOnce.Do(func() { close(st.stop) })",
+            "}",
+            "",
+            "// next waits for at least one item (or the end of the stream), then takes up to",
+            "// max items that are ready without blocking.",
+            "func (st *goStream) next(ctx context.Context, max int) (map[string]any, *ErrorObj) {",
+            "    if max <= 0 {",
+            "        max = streamBuffer",
+            "    }",
+            "    cases := []reflect.SelectCase{",
+            "        {Dir: reflect.SelectRecv, Chan: st.ch},",
+            "        {Dir: reflect.SelectRecv, Chan: reflect.ValueOf(ctx.Done())},",
+            "    }",
+            "    chosen, v, ok := reflect.Select(cases)",
+            "    if chosen == 1 {",
+            "        if ctx.Err() == context.DeadlineExceeded {",
+            '            return nil, &ErrorObj{Type: "DeadlineExceeded", Message: "stream_next: deadline exceeded"}',
+            "        }",
+            '        return nil, &ErrorObj{Type: "Cancelled", Message: "stream_next: cancelled"}',
+            "    }",
+            "    items := []any{}",
+            "    for {",
+            "        if !ok {",
+            "            if len(items) == 0 && st.err != nil {",
+            "                return nil, st.err",
+            "            }",
+            '            return map[string]any{"items": items, "done": len(items) == 0 || st.err == nil}, nil',
+            "        }",
+            "        item := v.Interface()",
+            "        if st.export {",
+            "            av, exported := exportAny(v)",
+            "            if !exported {",
+            '                return nil, &ErrorObj{Type: "UnsupportedTypeError", Message: "unsupported stream item type"}',
+            "            }",
+            "            item = av",
+            "        }",
+            "        items = append(items, item)",
+            "        if len(items) >= max {",
+            "            break",
+            "        }",
+            "        v, ok = st.ch.TryRecv()",
+            "        if !v.IsValid() {",
+            "            break",
+            "        }",
+            "    }",
+            '    return map[string]any{"items": items, "done": false}, nil',
+            "}",
+            "",
+            "// callMany calls one method on many objects (op obj_call_many). Each call is",
+            "// admitted and locked like a standalone obj_call. With req.Parallel > 1 the",
+            "// objects are spread over that many goroutines. The first failure (lowest",
+            "// index) is reported with detail.index and stops handing out further objects.",
+            "func callMany(ctx context.Context, req *Request, ids []uint64) ([]any, *ErrorObj) {",
+            "    typeKey := req.Pkg + \".\" + req.Type",
+            "    out := make([]any, len(ids))",
+            "    one := func(i int) *ErrorObj {",
+            "        ent, errObj := lookupObj(ids[i], typeKey)",
+            "        if errObj != nil {",
+            "            return errObj",
+            "        }",
+            "        done, errObj := admit(ctx, ent.Key+\":\"+req.Method)",
+            "        if errObj != nil {",
+            "            return errObj",
+            "        }",
+            "        defer done()",
+            "        defer lockObj(ent, req.Method)()",
+            "        result, errObj := callMethod(ctx, req.Pkg, req.Type, ent, req.Method, req.Args)",
+            "        if errObj != nil {",
+            "            return contextError(ctx, errObj)",
+            "        }",
+            "        out[i] = result",
+            "        return nil",
+            "    }",
+            "",
+            "    var errMu sync.Mutex",
+            "    errIdx := -1",
+            "    var firstErr *ErrorObj",
+            "    var failed int32",
+            "    workers := req.Parallel",
+            "    if workers > len(ids) {",
+            "        workers = len(ids)",
+            "    }",
+            "    if workers <= 1 {",
+            "        for i := range ids {",
+            "            if errObj := one(i); errObj != nil {",
+            "                errIdx, firstErr = i, errObj",
+            "                break",
+            "            }",
+            "        }",
+            "    } else {",
+            "        next := int64(-1)",
+            "        var wg sync.WaitGroup",
+            "        for w := 0; w < workers; w++ {",
+            "            wg.Add(1)",
+            "            go func() {",
+            "                defer wg.Done()",
+            "                for atomic.LoadInt32(&failed) == 0 {",
+            "                    i := int(atomic.AddInt64(&next, 1))",
+            "                    if i >= len(ids) {",
+            "                        return",
+            "                    }",
+            "                    if errObj := one(i); errObj != nil {",
+            "                        atomic.StoreInt32(&failed, 1)",
+            "                        errMu.Lock()",
+            "                        if errIdx < 0 || i < errIdx {",
+            "                            errIdx, firstErr = i, errObj",
+            "                        }",
+            "                        errMu.Unlock()",
+            "                    }",
+            "                }",
+            "            }()",
+            "        }",
+            "        wg.Wait()",
+            "    }",
+            "    if firstErr != nil {",
+            "        if firstErr.Detail == nil {",
+            "            firstErr.Detail = map[string]any{}",
+            "        }",
+            '        firstErr.Detail["index"] = errIdx',
+            "        return nil, firstErr",
+            "    }",
+            "    return out, nil",
+            "}",
+            "",
+            "func lookupObj(id uint64, typeKey string) (*ObjEntry, *ErrorObj) {",
+            "    objMu.RLock()",
+            "    ent, ok := objByID[id]",
+            "    objMu.RUnlock()",
+            "    if !ok {",
+            '        return nil, &ErrorObj{Type: "ObjectNotFound", Message: "object not found", Detail: map[string]any{"id": id}}',
+            "    }",
+            "    if ent.Key != typeKey {",
+            '        return nil, &ErrorObj{Type: "ABIError", Message: "object type mismatch", Detail: map[string]any{"id": id, "type": typeKey}}',
+            "    }",
+            "    return ent, nil",
+            "}",
+            "",
+            "func callFunc(ctx context.Context, h Handler, args []any) (result any, errObj *ErrorObj) {",
+            "    defer func() {",
+            "        if r := recover(); r != nil {",
+            '            result, errObj = nil, &ErrorObj{Type: "GoPanicError", Message: "panic"}',
+            "        }",
+            "    }()",
+            "    return h(ctx, args)",
+            "}",
+            "",
+            "// callMethod invokes method on a registered object; the caller holds its lock.",
+            "func callMethod(ctx context.Context, pkg string, typeName string, ent *ObjEntry, method string, args []any) (result any, errObj *ErrorObj) {",
+            "    defer func() {",
+            "        if r := recover(); r != nil {",
+            '            result, errObj = nil, &ErrorObj{Type: "GoPanicError", Message: "panic"}',
+            "        }",
+            "    }()",
+            '    if mh := methodDispatch[ent.Key+":"+method]; mh != nil {',
+            "        return mh(ctx, ent.Obj, args)",
+            "    }",
+            "    // Unexported receiver types cannot be referenced from the bridge package, so we",
+            "    // fall back to reflection-based method invocation for them.",
+            "    if isExportedIdent(typeName) {",
+            '        return nil, &ErrorObj{Type: "MethodNotFound", Message: "method not found", Detail: map[string]any{"type": ent.Key, "method": method}}',
+            "    }",
+            "    return reflectCallMethod(ctx, pkg, typeName, ent.Obj, method, args)",
+            "}",
+            "",
+            "func asIndex(v any) (int, bool) {",
+            "    switch x := v.(type) {",
+            "    case int8:",
+            "        return int(x), true",
+            "    case int16:",
+            "        return int(x), true",
+            "    case int32:",
+            "        return int(x), true",
+            "    case int64:",
+            "        return int(x), true",
+            "    case uint8:",
+            "        return int(x), true",
+            "    case uint16:",
+            "        return int(x), true",
+            "    case uint32:",
+            "        return int(x), true",
+            "    case uint64:",
+            "        return int(x), true",
+            "    case int:",
+            "        return x, true",
+            "    }",
+            "    return 0, false",
+            "}",
+            "",
+            "// resolveRefs replaces pipeline ref markers in v with earlier step results.",
+            "func resolveRefs(v any, results []any) (any, *ErrorObj) {",
+            "    switch x := v.(type) {",
+            "    case map[string]any:",
+            '        if r, ok := x["$usegolib_ref"]; ok {',
+            "            i, ok := asIndex(r)",
+            "            if !ok || i < 0 || i >= len(results) {",
+            '                return nil, &ErrorObj{Type: "ABIError", Message: "invalid pipeline ref", Detail: map[string]any{"ref": r}}',
+            "            }",
+            "            out := results[i]",
+            '            if k, ok := x["index"]; ok {',
+            "                j, ok := asIndex(k)",
+            "                list, isList := out.([]any)",
+            "                if !ok || !isList || j < 0 || j >= len(list) {",
+            '                    return nil, &ErrorObj{Type: "ABIError", Message: "invalid pipeline ref index", Detail: map[string]any{"ref": r, "index": k}}',
+            "                }",
+            "                out = list[j]",
+            "            }",
+            "            return out, nil",
+            "        }",
+            "        m := make(map[string]any, len(x))",
+            "        for k, e := range x {",
+            "            rv, errObj := resolveRefs(e, results)",
+            "            if errObj != nil {",
+            "                return nil, errObj",
+            "            }",
+            "            m[k] = rv",
+            "        }",
+            "        return m, nil",
+            "    case []any:",
+            "        out := make([]any, len(x))",
+            "        for i, e := range x {",
+            "            rv, errObj := resolveRefs(e, results)",
+            "            if errObj != nil {",
+            "                return nil, errObj",
+            "            }",
+            "            out[i] = rv",
+            "        }",
+            "        return out, nil",
+            "    }",
+            "    return v, nil",
+            "}",
+            "",
+            "// runPipeline runs the steps of a pipeline request in order and returns the",
+            "// results of its output steps. Intermediate results stay Go-side; the object",
+            "// handles named by the req.Free refs are released afterwards.",
+            "func runPipeline(ctx context.Context, req *Request) (any, *ErrorObj) {",
+            "    results := make([]any, 0, len(req.Steps))",
+            "    defer func() {",
+            "        for _, ref := range req.Free {",
+            "            // Refs to steps that did not run (after an error) do not resolve.",
+            "            v, errObj := resolveRefs(ref, results)",
+            "            if id, ok := v.(uint64); ok && errObj == nil {",
+            "                objMu.Lock()",
+            "                delete(objByID, id)",
+            "                objMu.Unlock()",
+            "            }",
+            "        }",
+            "    }()",
+            "    for i, st := range req.Steps {",
+            "        result, errObj := runPipelineStep(ctx, req.Pkg, &st, results)",
+            "        errObj = contextError(ctx, errObj)",
+            "        if errObj != nil {",
+            "            if errObj.Detail == nil {",
+            "                errObj.Detail = map[string]any{}",
+            "            }",
+            '            errObj.Detail["step"] = i',
+            "            return nil, errObj",
+            "        }",
+            "        results = append(results, result)",
+            "    }",
+            "    outs := make([]any, len(req.Outputs))",
+            "    for j, i := range req.Outputs {",
+            "        if i < 0 || i >= len(results) {",
+            '            return nil, &ErrorObj{Type: "ABIError", Message: "invalid pipeline output", Detail: map[string]any{"output": i}}',
+            "        }",
+            "        outs[j] = results[i]",
+            "    }",
+            "    return outs, nil",
+            "}",
+            "",
+            "func runPipelineStep(ctx context.Context, pkg string, st *PipelineStep, results []any) (any, *ErrorObj) {",
+            "    rargs, errObj := resolveRefs(st.Args, results)",
+            "    if errObj != nil {",
+            "        return nil, errObj",
+            "    }",
+            "    args, _ := rargs.([]any)",
+            "    switch st.Op {",
+            '    case "call":',
+            '        key := pkg + ":" + st.Fn',
+            "        h := dispatch[key]",
+            "        if h == nil {",
+            '            return nil, &ErrorObj{Type: "SymbolNotFound", Message: "symbol not found", Detail: map[string]any{"pkg": pkg, "fn": st.Fn}}',
+            "        }",
+            "        done, errObj := admit(ctx, key)",
+            "        if errObj != nil {",
+            "            return nil, errObj",
+            "        }",
+            "        defer done()",
+            "        return callFunc(ctx, h, args)",
+            '    case "obj_call":',
+            "        target, errObj := resolveRefs(st.Target, results)",
+            "        if errObj != nil {",
+            "            return nil, errObj",
+            "        }",
+            "        id, ok := asIndex(target)",
+            "        if !ok || id <= 0 {",
+            '            return nil, &ErrorObj{Type: "ObjectNotFound", Message: "pipeline target is not an object", Detail: map[string]any{"type": st.Type}}',
+            "        }",
+            '        ent, errObj := lookupObj(uint64(id), pkg+"."+st.Type)',
+            "        if errObj != nil {",
+            "            return nil, errObj",
+            "        }",
+            '        done, errObj := admit(ctx, ent.Key+":"+st.Method)',
+            "        if errObj != nil {",
+            "            return nil, errObj",
+            "        }",
+            "        defer done()",
+            "        defer lockObj(ent, st.Method)()",
+            "        return callMethod(ctx, pkg, st.Type, ent, st.Method, args)",
+            "    }",
+            '    return nil, &ErrorObj{Type: "UnsupportedOperation", Message: "unsupported pipeline op", Detail: map[string]any{"op": st.Op}}',
+            "}",
+            "",
+            "func isExportedIdent(name string) bool {",
+            "    if name == \"\" {",
+            "        return false",
+            "    }",
+            "    r := rune(name[0])",
+            "    return r >= 'A' && r <= 'Z'",
+            "}",
+            "",
+            "var contextType = reflect.TypeOf((*context.Context)(nil)).Elem()",
+            "",
+            "func reflectCallMethod(ctx context.Context, pkg string, typeName string, obj any, method string, args []any) (any, *ErrorObj) {",
+            "    rv := reflect.ValueOf(obj)",
+            "    if !rv.IsValid() {",
+            '        return nil, &ErrorObj{Type: "ObjectNotFound", Message: "invalid object"}',
+            "    }",
+            "    mv := rv.MethodByName(method)",
+            "    if !mv.IsValid() {",
+            '        return nil, &ErrorObj{Type: "MethodNotFound", Message: "method not found"}',
+            "    }",
+            "    for _, a := range args {",
+            "        if p, isPin := pinOf(a); isPin && p == nil {",
+            "            return nil, pinNotFound()",
+            "        }",
             "    }",
             "    mt := mv.Type()",
             "    nin := mt.NumIn()",
             "    isVar := mt.IsVariadic()",
+            "    // A leading context.Context parameter is supplied by the bridge, not the caller.",
+            "    off := 0",
+            "    if nin > 0 && mt.In(0) == contextType {",
+            "        off = 1",
+            "    }",
+            "    nin -= off",
             "    if !isVar {",
             "        if len(args) != nin {",
             '            return nil, &ErrorObj{Type: "ABIError", Message: "wrong arity"}',
@@ -241,33 +2230,39 @@ def write_bridge(
             "    // Variadic calls are represented over the ABI as a single final argument: a slice.",
             "    // When len(args) == nin, the last arg is already packed and must be expanded with CallSlice.",
             "    if isVar && len(args) == nin {",
-            "        callArgs := make([]reflect.Value, 0, nin)",
+            "        callArgs := make([]reflect.Value, 0, nin+off)",
+            "        if off == 1 {",
+            "            callArgs = append(callArgs, reflect.ValueOf(ctx))",
+            "        }",
             "        for i := 0; i < nin-1; i++ {",
-            "            pt := mt.In(i)",
-            "            cv, ok := convertToType(args[i], pt)",
+            "            pt := mt.In(i + off)",
+            "            cv, ok := convertArg(args[i], pt)",
             "            if !ok {",
             '                return nil, &ErrorObj{Type: "UnsupportedTypeError", Message: "unsupported arg type"}',
             "            }",
             "            callArgs = append(callArgs, cv)",
             "        }",
-            "        pt := mt.In(nin - 1)",
-            "        cv, ok := convertToType(args[nin-1], pt)",
+            "        pt := mt.In(nin - 1 + off)",
+            "        cv, ok := convertArg(args[nin-1], pt)",
             "        if !ok {",
             '            return nil, &ErrorObj{Type: "UnsupportedTypeError", Message: "unsupported arg type"}',
             "        }",
             "        callArgs = append(callArgs, cv)",
             "        outs := mv.CallSlice(callArgs)",
-            "        return exportOutValues(pkg, typeName, outs)",
+            "        return exportOutValues(ctx, pkg, typeName, outs)",
             "    }",
             "",
-            "    callArgs := make([]reflect.Value, 0, len(args))",
+            "    callArgs := make([]reflect.Value, 0, len(args)+off)",
+            "    if off == 1 {",
+            "        callArgs = append(callArgs, reflect.ValueOf(ctx))",
+            "    }",
             "    for i := 0; i < nin; i++ {",
-            "        pt := mt.In(i)",
+            "        pt := mt.In(i + off)",
             "        if isVar && i == nin-1 {",
             "            // Expand remaining args into the variadic element type.",
             "            et := pt.Elem()",
             "            for j := i; j < len(args); j++ {",
-                "                cv, ok := convertToType(args[j], et)",
+                "                cv, ok := convertArg(args[j], et)",
                 "                if !ok {",
                 '                    return nil, &ErrorObj{Type: "UnsupportedTypeError", Message: "unsupported arg type"}',
                 "                }",
@@ -275,7 +2270,7 @@ def write_bridge(
             "            }",
             "            break",
             "        }",
-            "        cv, ok := convertToType(args[i], pt)",
+            "        cv, ok := convertArg(args[i], pt)",
             "        if !ok {",
             '            return nil, &ErrorObj{Type: "UnsupportedTypeError", Message: "unsupported arg type"}',
             "        }",
@@ -283,10 +2278,10 @@ def write_bridge(
             "    }",
             "",
             "    outs := mv.Call(callArgs)",
-            "    return exportOutValues(pkg, typeName, outs)",
+            "    return exportOutValues(ctx, pkg, typeName, outs)",
             "}",
             "",
-            "func exportOutValues(pkg string, typeName string, outs []reflect.Value) (any, *ErrorObj) {",
+            "func exportOutValues(ctx context.Context, pkg string, typeName string, outs []reflect.Value) (any, *ErrorObj) {",
             "    if len(outs) == 0 {",
             "        return nil, nil",
             "    }",
@@ -302,11 +2297,11 @@ def write_bridge(
             "        return nil, nil",
             "    }",
             "    if len(outs) == 1 {",
-            "        return exportResultAsAny(pkg, typeName, outs[0])",
+            "        return exportResultAsAny(ctx, pkg, typeName, outs[0])",
             "    }",
             "    out := make([]any, 0, len(outs))",
             "    for _, o := range outs {",
-            "        av, errObj := exportResultAsAny(pkg, typeName, o)",
+            "        av, errObj := exportResultAsAny(ctx, pkg, typeName, o)",
             "        if errObj != nil {",
             "            return nil, errObj",
             "        }",
@@ -315,7 +2310,7 @@ def write_bridge(
             "    return out, nil",
             "}",
             "",
-            "func exportResultAsAny(pkg string, typeName string, v reflect.Value) (any, *ErrorObj) {",
+            "func exportResultAsAny(ctx context.Context, pkg string, typeName string, v reflect.Value) (any, *ErrorObj) {",
             "    if !v.IsValid() {",
             "        return nil, nil",
             "    }",
@@ -338,7 +2333,7 @@ def write_bridge(
             "            }",
             "        }",
             "    }",
-            "    av, ok := exportAny(v)",
+            "    av, ok := exportResult(ctx, v)",
             "    if !ok {",
             '        return nil, &ErrorObj{Type: "UnsupportedTypeError", Message: "unsupported return type"}',
             "    }",
@@ -355,22 +2350,71 @@ def write_bridge(
             "    typeByKey = map[string]reflect.Type{",
             *type_lines,
             "    }",
+            "    objModeByType = map[string]uint8{",
+            *obj_mode_lines,
+            "    }",
+            "    objReadOnly = map[string]bool{",
+            *readonly_lines,
+            "    }",
             "}",
             "",
             "func main() {}",
             "",
             "//export usegolib_call",
             "func usegolib_call(reqPtr unsafe.Pointer, reqLen C.size_t, respPtr **C.uchar, respLen *C.size_t) C.int {",
-            "    reqBytes := C.GoBytes(reqPtr, C.int(reqLen))",
+            "    writeBytes(respPtr, respLen, handleRequest(C.GoBytes(reqPtr, C.int(reqLen))))",
+            "    return 0",
+            "}",
+            "",
+            "// usegolib_io_read and usegolib_io_write move bytes between an io handle and a",
+            "// caller-owned buffer without MessagePack. They return the byte count (-1 for",
+            "// EOF); on failure they return -2 and set the encoded error response.",
+            "//export usegolib_io_read",
+            "func usegolib_io_read(id C.ulonglong, buf unsafe.Pointer, n C.size_t, errPtr **C.uchar, errLen *C.size_t) C.longlong {",
+            "    k, errObj := ioRead(uint64(id), unsafe.Slice((*byte)(buf), int(n)))",
+            "    if errObj != nil {",
+            "        writeBytes(errPtr, errLen, encodeResp(&Response{Ok: false, Error: errObj}))",
+            "        return -2",
+            "    }",
+            "    return C.longlong(k)",
+            "}",
+            "",
+            "//export usegolib_io_write",
+            "func usegolib_io_write(id C.ulonglong, buf unsafe.Pointer, n C.size_t, errPtr **C.uchar, errLen *C.size_t) C.longlong {",
+            "    k, errObj := ioWrite(uint64(id), unsafe.Slice((*byte)(buf), int(n)))",
+            "    if errObj != nil {",
+            "        writeBytes(errPtr, errLen, encodeResp(&Response{Ok: false, Error: errObj}))",
+            "        return -2",
+            "    }",
+            "    return C.longlong(k)",
+            "}",
+            "",
+            "// usegolib_arrow_export exports a lazy slice of record structs through the",
+            "// Arrow C data interface into caller-allocated structs, which the caller then",
+            "// owns and releases. It returns 0, or -1 and sets the encoded error response.",
+            "//export usegolib_arrow_export",
+            "func usegolib_arrow_export(id C.ulonglong, schema *C.struct_ArrowSchema, array *C.struct_ArrowArray, errPtr **C.uchar, errLen *C.size_t) C.int {",
+            "    lv, errObj := lookupLazy(uint64(id))",
+            "    if errObj == nil {",
+            "        errObj = arrowExport(lv.v, schema, array)",
+            "    }",
+            "    if errObj != nil {",
+            "        writeBytes(errPtr, errLen, encodeResp(&Response{Ok: false, Error: errObj}))",
+            "        return -1",
+            "    }",
+            "    return 0",
+            "}",
             "",
+            "// handleRequest serves one encoded request and returns the encoded response.",
+            "// Responses are encoded in the return statements, before deferred object",
+            "// unlocks run, because results may alias object state.",
+            "func handleRequest(reqBytes []byte) []byte {",
             "    var req Request",
             "    if err := msgpack.Unmarshal(reqBytes, &req); err != nil {",
-            '        writeError(respPtr, respLen, "ABIDecodeError", err.Error(), nil)',
-            "        return 0",
+            '        return encodeError("ABIDecodeError", err.Error(), nil)',
             "    }",
             "    if req.ABI != 0 {",
-            '        writeError(respPtr, respLen, "UnsupportedABIVersion", "unsupported abi version", map[string]any{"abi": req.ABI})',
-            "        return 0",
+            '        return encodeError("UnsupportedABIVersion", "unsupported abi version", map[string]any{"abi": req.ABI})',
             "    }",
             "",
             "    switch req.Op {",
@@ -378,129 +2422,404 @@ def write_bridge(
             '        key := req.Pkg + ":" + req.Fn',
             "        h := dispatch[key]",
             "        if h == nil {",
-            '            writeError(respPtr, respLen, "SymbolNotFound", "symbol not found", map[string]any{"pkg": req.Pkg, "fn": req.Fn})',
-            "            return 0",
+            '            return encodeError("SymbolNotFound", "symbol not found", map[string]any{"pkg": req.Pkg, "fn": req.Fn})',
             "        }",
             "",
-            "        var result any",
-            "        var errObj *ErrorObj",
-            "        func() {",
-            "            defer func() {",
-            "                if r := recover(); r != nil {",
-            '                    errObj = &ErrorObj{Type: "GoPanicError", Message: "panic"}',
-            "                }",
-            "            }()",
-            "            result, errObj = h(req.Args)",
-            "        }()",
+            "        ctx, release, ctxErr := requestContext(&req)",
+            "        if ctxErr != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: ctxErr})",
+            "        }",
+            "        defer release()",
+            "        done, admitErr := admit(ctx, key)",
+            "        if admitErr != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: admitErr})",
+            "        }",
+            "        defer done()",
+            "",
+            "        result, errObj := callFunc(ctx, h, req.Args)",
+            "        errObj = contextError(ctx, errObj)",
+            "        if errObj == nil && req.Lazy {",
+            "            result, errObj = lazyResult(result)",
+            "        }",
+            "        if errObj == nil && req.Packed {",
+            "            result = packedResult(result)",
+            "        }",
             "",
             "        if errObj != nil {",
-            "            writeResp(respPtr, respLen, &Response{Ok: false, Error: errObj})",
-            "            return 0",
+            "            return encodeResp(&Response{Ok: false, Error: errObj})",
             "        }",
-            "        writeResp(respPtr, respLen, &Response{Ok: true, Result: result})",
-            "        return 0",
+            "        return encodeResp(&Response{Ok: true, Result: result})",
             '    case "obj_new":',
-            "        typeKey := req.Pkg + \".\" + req.Type",
-            "        rt, ok := typeByKey[typeKey]",
+            "        typeKey, rt, mode, errObj := objType(&req)",
+            "        if errObj != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: errObj})",
+            "        }",
+            "        obj, errObj := newObject(typeKey, rt, req.Init)",
+            "        if errObj != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: errObj})",
+            "        }",
+            "        id := storeObjMode(typeKey, obj, mode)",
+            "        return encodeResp(&Response{Ok: true, Result: id})",
+            '    case "obj_new_many":',
+            "        typeKey, rt, mode, errObj := objType(&req)",
+            "        if errObj != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: errObj})",
+            "        }",
+            "        ids := make([]uint64, 0, len(req.Inits))",
+            "        for i, init := range req.Inits {",
+            "            obj, errObj := newObject(typeKey, rt, init)",
+            "            if errObj != nil {",
+            "                freeObjects(ids)",
+            "                if errObj.Detail == nil {",
+            "                    errObj.Detail = map[string]any{}",
+            "                }",
+            '                errObj.Detail["index"] = i',
+            "                return encodeResp(&Response{Ok: false, Error: errObj})",
+            "            }",
+            "            ids = append(ids, storeObjMode(typeKey, obj, mode))",
+            "        }",
+            "        return encodeResp(&Response{Ok: true, Result: packIDs(ids)})",
+            '    case "obj_call_many":',
+            "        ids, ok := unpackIDs(req.IDs)",
+            "        if !ok {",
+            '            return encodeError("ABIError", "invalid ids", nil)',
+            "        }",
+            "        ctx, release, ctxErr := requestContext(&req)",
+            "        if ctxErr != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: ctxErr})",
+            "        }",
+            "        defer release()",
+            "        result, errObj := callMany(ctx, &req, ids)",
+            "        if errObj != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: errObj})",
+            "        }",
+            "        return encodeResp(&Response{Ok: true, Result: result})",
+            '    case "obj_free_many":',
+            "        ids, ok := unpackIDs(req.IDs)",
             "        if !ok {",
-            '            writeError(respPtr, respLen, "TypeNotFound", "type not found", map[string]any{"type": typeKey})',
-            "            return 0",
+            '            return encodeError("ABIError", "invalid ids", nil)',
+            "        }",
+            "        freeObjects(ids)",
+            "        return encodeResp(&Response{Ok: true, Result: nil})",
+            '    case "obj_call":',
+            "        ent, lookupErr := lookupObj(req.ID, req.Pkg+\".\"+req.Type)",
+            "        if lookupErr != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: lookupErr})",
+            "        }",
+            "        ctx, release, ctxErr := requestContext(&req)",
+            "        if ctxErr != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: ctxErr})",
+            "        }",
+            "        defer release()",
+            "        // Admission happens before taking the object lock so queued calls hold no locks.",
+            "        done, admitErr := admit(ctx, ent.Key+\":\"+req.Method)",
+            "        if admitErr != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: admitErr})",
+            "        }",
+            "        defer done()",
+            "        // Held until the response is encoded: results may alias object state.",
+            "        defer lockObj(ent, req.Method)()",
+            "        result, errObj := callMethod(ctx, req.Pkg, req.Type, ent, req.Method, req.Args)",
+            "        errObj = contextError(ctx, errObj)",
+            "        if errObj == nil && req.Lazy {",
+            "            result, errObj = lazyResult(result)",
+            "        }",
+            "        if errObj == nil && req.Packed {",
+            "            result = packedResult(result)",
+            "        }",
+            "        if errObj != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: errObj})",
+            "        }",
+            "        return encodeResp(&Response{Ok: true, Result: result})",
+            '    case "obj_get":',
+            "        ent, lookupErr := lookupObj(req.ID, req.Pkg+\".\"+req.Type)",
+            "        if lookupErr != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: lookupErr})",
             "        }",
-            "        if rt.Kind() != reflect.Struct {",
-            '            writeError(respPtr, respLen, "ABIError", "type is not a struct", map[string]any{"type": typeKey})',
-            "            return 0",
+            "        // Held until the response is encoded: field values may alias object state.",
+            "        defer lockObjAccess(ent, false)()",
+            "        v, index, errObj := objFields(ent, req.Fields)",
+            "        if errObj != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: errObj})",
             "        }",
-            "        sv := reflect.New(rt).Elem()",
-            "        if req.Init != nil {",
-            "            cv, ok := convertToType(req.Init, rt)",
+            "        out := make([]any, len(index))",
+            "        for i, fi := range index {",
+            "            av, ok := exportAny(v.Field(fi))",
             "            if !ok {",
-            '                writeError(respPtr, respLen, "UnsupportedTypeError", "invalid init", map[string]any{"type": typeKey})',
-            "                return 0",
+            '                return encodeError("UnsupportedTypeError", "unsupported field type", map[string]any{"field": req.Fields[i]})',
             "            }",
-            "            sv = cv",
+            "            out[i] = av",
             "        }",
-            "        pv := reflect.New(rt)",
-            "        pv.Elem().Set(sv)",
-            "        obj := pv.Interface()",
-            "",
-            "        id := storeObj(typeKey, obj)",
-            "        writeResp(respPtr, respLen, &Response{Ok: true, Result: id})",
-            "        return 0",
-            '    case "obj_call":',
-            "        typeKey := req.Pkg + \".\" + req.Type",
-            "        objMu.RLock()",
-            "        ent, ok := objByID[req.ID]",
-            "        objMu.RUnlock()",
+            "        return encodeResp(&Response{Ok: true, Result: out})",
+            '    case "obj_set":',
+            "        if len(req.Fields) != 1 {",
+            '            return encodeError("ABIError", "obj_set takes exactly one field", nil)',
+            "        }",
+            "        ent, lookupErr := lookupObj(req.ID, req.Pkg+\".\"+req.Type)",
+            "        if lookupErr != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: lookupErr})",
+            "        }",
+            "        defer lockObjAccess(ent, true)()",
+            "        v, index, errObj := objFields(ent, req.Fields)",
+            "        if errObj != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: errObj})",
+            "        }",
+            "        fv := v.Field(index[0])",
+            "        cv, ok := convertToType(req.Value, fv.Type())",
+            "        if !ok {",
+            '            return encodeError("UnsupportedTypeError", "invalid field value", map[string]any{"field": req.Fields[0]})',
+            "        }",
+            "        fv.Set(cv)",
+            "        return encodeResp(&Response{Ok: true, Result: nil})",
+            '    case "lazy_range":',
+            "        lv, errObj := lookupLazy(req.ID)",
+            "        if errObj != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: errObj})",
+            "        }",
+            "        out, errObj := lazyRange(lv, req.Start, req.Stop)",
+            "        if errObj != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: errObj})",
+            "        }",
+            "        return encodeResp(&Response{Ok: true, Result: out})",
+            '    case "lazy_get":',
+            "        lv, errObj := lookupLazy(req.ID)",
+            "        if errObj != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: errObj})",
+            "        }",
+            "        out, errObj := lazyGet(lv, req.Fields)",
+            "        if errObj != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: errObj})",
+            "        }",
+            "        return encodeResp(&Response{Ok: true, Result: out})",
+            '    case "lazy_free":',
+            "        lazyMu.Lock()",
+            "        delete(lazyByID, req.ID)",
+            "        lazyMu.Unlock()",
+            "        return encodeResp(&Response{Ok: true, Result: nil})",
+            '    case "io_read":',
+            "        if req.Chunk <= 0 {",
+            '            return encodeError("ABIError", "io_read: chunk must be positive", nil)',
+            "        }",
+            "        buf := make([]byte, req.Chunk)",
+            "        n, errObj := ioRead(req.ID, buf)",
+            "        if errObj != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: errObj})",
+            "        }",
+            "        if n < 0 {",
+            "            return encodeResp(&Response{Ok: true, Result: nil})",
+            "        }",
+            "        return encodeResp(&Response{Ok: true, Result: buf[:n]})",
+            '    case "io_write":',
+            "        data, _ := req.Value.([]byte)",
+            "        n, errObj := ioWrite(req.ID, data)",
+            "        if errObj != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: errObj})",
+            "        }",
+            "        return encodeResp(&Response{Ok: true, Result: n})",
+            '    case "io_info":',
+            "        ent, errObj := lookupIO(req.ID)",
+            "        if errObj != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: errObj})",
+            "        }",
+            "        _, r := ent.Obj.(io.Reader)",
+            "        _, w := ent.Obj.(io.Writer)",
+            "        _, c := ent.Obj.(io.Closer)",
+            '        return encodeResp(&Response{Ok: true, Result: map[string]any{"read": r, "write": w, "close": c}})',
+            '    case "io_close":',
+            "        ent, errObj := lookupIO(req.ID)",
+            "        if errObj != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: errObj})",
+            "        }",
+            "        ioPending.Delete(req.ID)",
+            "        c, ok := ent.Obj.(io.Closer)",
             "        if !ok {",
-            '            writeError(respPtr, respLen, "ObjectNotFound", "object not found", map[string]any{"id": req.ID})',
-            "            return 0",
-            "        }",
-            "        if ent.Key != typeKey {",
-            '            writeError(respPtr, respLen, "ABIError", "object type mismatch", map[string]any{"id": req.ID, "type": typeKey})',
-            "            return 0",
-            "        }",
-            "        mk := typeKey + \":\" + req.Method",
-            "        mh := methodDispatch[mk]",
-            "        if mh == nil {",
-            "            // Unexported receiver types cannot be referenced from the bridge package, so we",
-            "            // fall back to reflection-based method invocation for them.",
-            "            if isExportedIdent(req.Type) {",
-            '                writeError(respPtr, respLen, "MethodNotFound", "method not found", map[string]any{\"type\": typeKey, \"method\": req.Method})',
-            "                return 0",
+            "            return encodeResp(&Response{Ok: true, Result: nil})",
+            "        }",
+            "        unlock := lockObjAccess(ent, true)",
+            "        defer unlock()",
+            "        if err := c.Close(); err != nil {",
+            '            return encodeError("GoError", err.Error(), nil)',
+            "        }",
+            "        return encodeResp(&Response{Ok: true, Result: nil})",
+            '    case "reader_new":',
+            "        r := &readerArg{chunks: make(chan []byte), done: make(chan struct{})}",
+            "        if req.Fd != nil {",
+            '            r.file = os.NewFile(uintptr(*req.Fd), "fd")',
+            '        } else if req.Path != "" {',
+            "            f, err := os.Open(req.Path)",
+            "            if err != nil {",
+            '                return encodeError("GoError", err.Error(), map[string]any{"path": req.Path})',
             "            }",
-            "            var result any",
-            "            var errObj *ErrorObj",
-            "            func() {",
-            "                defer func() {",
-            "                    if r := recover(); r != nil {",
-            '                        errObj = &ErrorObj{Type: "GoPanicError", Message: "panic"}',
-            "                    }",
-            "                }()",
-            "                result, errObj = reflectCallMethod(req.Pkg, req.Type, ent.Obj, req.Method, req.Args)",
-            "            }()",
-            "            if errObj != nil {",
-            "                writeResp(respPtr, respLen, &Response{Ok: false, Error: errObj})",
-            "                return 0",
+            "            r.file = f",
+            "        }",
+            "        id := atomic.AddUint64(&readerIDNext, 1)",
+            "        readerMu.Lock()",
+            "        readerByID[id] = r",
+            "        readerMu.Unlock()",
+            "        return encodeResp(&Response{Ok: true, Result: id})",
+            '    case "reader_push":',
+            "        readerMu.Lock()",
+            "        r := readerByID[req.ID]",
+            "        readerMu.Unlock()",
+            "        if r == nil || r.file != nil {",
+            '            return encodeError("ObjectNotFound", "reader not found", map[string]any{"id": req.ID})',
+            "        }",
+            '        if req.EOF || req.Err != "" {',
+            '            if req.Err != "" {',
+            "                r.err = errors.New(req.Err)",
             "            }",
-            "            writeResp(respPtr, respLen, &Response{Ok: true, Result: result})",
-            "            return 0",
-            "        }",
-            "        var result any",
-            "        var errObj *ErrorObj",
-            "        func() {",
-            "            defer func() {",
-            "                if r := recover(); r != nil {",
-            '                    errObj = &ErrorObj{Type: "GoPanicError", Message: "panic"}',
-            "                }",
-            "            }()",
-            "            result, errObj = mh(ent.Obj, req.Args)",
-            "        }()",
+            "            r.eofOnce.Do(func() { close(r.chunks) })",
+            "            return encodeResp(&Response{Ok: true, Result: true})",
+            "        }",
+            "        data, _ := req.Value.([]byte)",
+            "        select {",
+            "        case r.chunks <- data:",
+            "            return encodeResp(&Response{Ok: true, Result: true})",
+            "        case <-r.done:",
+            "            // The call is over; the rest of the input is not needed.",
+            "            return encodeResp(&Response{Ok: true, Result: false})",
+            "        }",
+            '    case "reader_free":',
+            "        readerMu.Lock()",
+            "        r := readerByID[req.ID]",
+            "        delete(readerByID, req.ID)",
+            "        readerMu.Unlock()",
+            "        if r != nil {",
+            "            r.free()",
+            "        }",
+            "        return encodeResp(&Response{Ok: true, Result: nil})",
+            '    case "stream_next":',
+            "        streamMu.Lock()",
+            "        st := streamByID[req.ID]",
+            "        streamMu.Unlock()",
+            "        if st == nil {",
+            '            return encodeError("ObjectNotFound", "stream not found", map[string]any{"id": req.ID})',
+            "        }",
+            "        ctx, release, ctxErr := requestContext(&req)",
+            "        if ctxErr != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: ctxErr})",
+            "        }",
+            "        defer release()",
+            "        out, errObj := st.next(ctx, req.Chunk)",
             "        if errObj != nil {",
-            "            writeResp(respPtr, respLen, &Response{Ok: false, Error: errObj})",
-            "            return 0",
+            "            return encodeResp(&Response{Ok: false, Error: errObj})",
+            "        }",
+            "        return encodeResp(&Response{Ok: true, Result: out})",
+            '    case "stream_close":',
+            "        streamMu.Lock()",
+            "        st := streamByID[req.ID]",
+            "        delete(streamByID, req.ID)",
+            "        streamMu.Unlock()",
+            "        if st != nil {",
+            "            st.close()",
             "        }",
-            "        writeResp(respPtr, respLen, &Response{Ok: true, Result: result})",
-            "        return 0",
+            "        return encodeResp(&Response{Ok: true, Result: nil})",
             '    case "obj_free":',
             "        objMu.Lock()",
             "        delete(objByID, req.ID)",
             "        objMu.Unlock()",
-            "        writeResp(respPtr, respLen, &Response{Ok: true, Result: nil})",
-            "        return 0",
+            "        return encodeResp(&Response{Ok: true, Result: nil})",
+            '    case "cancel_new":',
+            "        ctx, cancel := context.WithCancel(context.Background())",
+            "        id := atomic.AddUint64(&cancelNext, 1)",
+            "        cancelMu.Lock()",
+            "        cancelByID[id] = &cancelToken{ctx: ctx, cancel: cancel}",
+            "        cancelMu.Unlock()",
+            "        return encodeResp(&Response{Ok: true, Result: id})",
+            '    case "cancel", "cancel_free":',
+            "        cancelMu.Lock()",
+            "        tok := cancelByID[req.ID]",
+            '        if req.Op == "cancel_free" {',
+            "            delete(cancelByID, req.ID)",
+            "        }",
+            "        cancelMu.Unlock()",
+            "        if tok != nil {",
+            "            tok.cancel()",
+            "        }",
+            "        return encodeResp(&Response{Ok: true, Result: nil})",
+            '    case "pin_new":',
+            "        id := atomic.AddUint64(&pinNext, 1)",
+            "        pinMu.Lock()",
+            "        pinByID[id] = &pinnedValue{raw: req.Value}",
+            "        pinMu.Unlock()",
+            "        return encodeResp(&Response{Ok: true, Result: id})",
+            '    case "pin_mem":',
+            "        mem, ok := memRefOf(req.Value)",
+            "        if !ok {",
+            '            return encodeResp(&Response{Ok: false, Error: &ErrorObj{Type: "ABIError", Message: "pin_mem: invalid memory reference"}})',
+            "        }",
+            "        id := atomic.AddUint64(&pinNext, 1)",
+            "        pinMu.Lock()",
+            "        pinByID[id] = &pinnedValue{mem: mem}",
+            "        pinMu.Unlock()",
+            "        return encodeResp(&Response{Ok: true, Result: id})",
+            '    case "pin_free":',
+            "        pinMu.Lock()",
+            "        delete(pinByID, req.ID)",
+            "        pinMu.Unlock()",
+            "        return encodeResp(&Response{Ok: true, Result: nil})",
+            '    case "pipeline":',
+            "        ctx, release, ctxErr := requestContext(&req)",
+            "        if ctxErr != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: ctxErr})",
+            "        }",
+            "        defer release()",
+            "        result, errObj := runPipeline(ctx, &req)",
+            "        if errObj != nil {",
+            "            return encodeResp(&Response{Ok: false, Error: errObj})",
+            "        }",
+            "        return encodeResp(&Response{Ok: true, Result: result})",
+            '    case "batch":',
+            "        // Coalesced requests from different callers: served concurrently, so one",
+            "        // slow or blocking request does not hold the others back Go-side.",
+            "        out := make([][]byte, len(req.Batch))",
+            "        var wg sync.WaitGroup",
+            "        for i, sub := range req.Batch {",
+            "            wg.Add(1)",
+            "            go func(i int, sub []byte) {",
+            "                defer wg.Done()",
+            "                out[i] = handleRequest(sub)",
+            "            }(i, sub)",
+            "        }",
+            "        wg.Wait()",
+            "        return encodeResp(&Response{Ok: true, Result: out})",
+            '    case "limits_set":',
+            "        spec := req.Limit",
+            "        if spec == nil || spec.Max < 0 || spec.Weight < 0 || spec.QueueTimeoutNs < 0 {",
+            '            return encodeError("ABIError", "invalid limit", map[string]any{"key": req.Key})',
+            "        }",
+            "        failFast := false",
+            "        switch spec.Policy {",
+            '        case "", "queue":',
+            '        case "fail":',
+            "            failFast = true",
+            "        default:",
+            '            return encodeError("ABIError", "invalid limit policy", map[string]any{"policy": spec.Policy})',
+            "        }",
+            "        setLimit(req.Key, spec.Max, spec.Weight, failFast, time.Duration(spec.QueueTimeoutNs))",
+            "        return encodeResp(&Response{Ok: true, Result: nil})",
+            '    case "limits_stats":',
+            "        return encodeResp(&Response{Ok: true, Result: limitStats()})",
             "    default:",
-            '        writeError(respPtr, respLen, "UnsupportedOperation", "unsupported op", map[string]any{"op": req.Op})',
-            "        return 0",
+            '        return encodeError("UnsupportedOperation", "unsupported op", map[string]any{"op": req.Op})',
             "    }",
             "}",
             "",
-            "func writeError(respPtr **C.uchar, respLen *C.size_t, typ string, msg string, detail map[string]any) {",
-            "    writeResp(respPtr, respLen, &Response{Ok: false, Error: &ErrorObj{Type: typ, Message: msg, Detail: detail}})",
+            "func encodeError(typ string, msg string, detail map[string]any) []byte {",
+            "    return encodeResp(&Response{Ok: false, Error: &ErrorObj{Type: typ, Message: msg, Detail: detail}})",
             "}",
             "",
-            "func writeResp(respPtr **C.uchar, respLen *C.size_t, resp *Response) {",
+            "func encodeResp(resp *Response) []byte {",
             "    out, err := msgpack.Marshal(resp)",
             "    if err != nil {",
             "        // Last resort: return an empty response (caller will error).",
+            "        return nil",
+            "    }",
+            "    return out",
+            "}",
+            "",
+            "func writeBytes(respPtr **C.uchar, respLen *C.size_t, out []byte) {",
+            "    if len(out) == 0 {",
             "        *respPtr = nil",
             "        *respLen = 0",
             "        return",
@@ -531,9 +2850,17 @@ def write_bridge(
         "",
         '    "github.com/vmihailenco/msgpack/v5"',
     ]
+    import_block.append('    "bytes"')
+    import_block.append('    "context"')
+    import_block.append('    "encoding/binary"')
+    import_block.append('    "errors"')
+    import_block.append('    "io"')
+    import_block.append('    "os"')
     import_block.append('    "sync"')
     import_block.append('    "sync/atomic"')
     import_block.append('    "reflect"')
+    import_block.append('    "sort"')
+    import_block.append('    "strconv"')
     import_block.append('    "strings"')
     import_block.append('    "time"')
     if "uuid.UUID" in adapter_types:
@@ -574,19 +2901,20 @@ def _write_wrapper(
 ) -> list[str]:
     # Only support a small set of v0 types.
     lines: list[str] = []
-    lines.append(f"func {wrap_name}(args []any) (any, *ErrorObj) {{")
-    lines.append(f"    if len(args) != {len(fn.params)} {{")
+    has_ctx, params = _split_context_param(fn.params)
+    lines.append(f"func {wrap_name}(ctx context.Context, args []any) (any, *ErrorObj) {{")
+    lines.append(f"    if len(args) != {len(params)} {{")
     lines.append(
         '        return nil, &ErrorObj{Type: "ABIError", Message: "wrong arity"}'
     )
     lines.append("    }")
 
     arg_names: list[str] = []
-    for i, t in enumerate(fn.params):
+    for i, t in enumerate(params):
         vn = f"a{i}"
         arg_names.append(vn)
         lines.extend(
-            _write_arg_convert(
+            _write_pinnable_arg_convert(
                 var_name=vn,
                 go_type=t,
                 value_expr=f"args[{i}]",
@@ -596,8 +2924,10 @@ def _write_wrapper(
         )
 
     call_args = list(arg_names)
-    if fn.params and fn.params[-1].strip().startswith("..."):
+    if params and params[-1].strip().startswith("..."):
         call_args[-1] = call_args[-1] + "..."
+    if has_ctx:
+        call_args.insert(0, "ctx")
     call = f"{alias}.{fn.name}({', '.join(call_args)})"
     if len(fn.results) == 0:
         lines.append(f"    {call}")
@@ -625,12 +2955,10 @@ def _write_wrapper(
             lines.append("    }")
             lines.append(f'    id := storeObj("{fn.pkg}.{opaque_ptr}", r0)')
             lines.append("    return id, nil")
-        elif _base_type(t0) == "any" or _base_type(t0) in struct_types or _base_type(t0) in {  # noqa: PLR1714
-            "time.Time",
-            "time.Duration",
-            "uuid.UUID",
-        }:
-            lines.append("    v0, ok := exportAny(reflect.ValueOf(r0))")
+        elif t0 in IO_TYPES:
+            lines.extend(_write_store_io(rvar="r0"))
+        elif _return_needs_export_any(t0, struct_types):
+            lines.append("    v0, ok := exportResult(ctx, reflect.ValueOf(r0))")
             lines.append("    if !ok {")
             lines.append(
                 '        return nil, &ErrorObj{Type: "UnsupportedTypeError", Message: "unsupported return type"}'
@@ -686,6 +3014,13 @@ def _write_wrapper(
     return lines
 
 
+def _split_context_param(params: list[str]) -> tuple[bool, list[str]]:
+    """Split a leading `context.Context` parameter (supplied by the bridge) from the ABI params."""
+    if params and params[0].strip() == "context.Context":
+        return True, list(params[1:])
+    return False, list(params)
+
+
 def _opaque_ptr_target_for_return(go_type: str, opaque_struct_types: set[str]) -> str | None:
     t0 = go_type.strip()
     if not t0.startswith("*"):
@@ -700,7 +3035,20 @@ def _opaque_ptr_target_for_return(go_type: str, opaque_struct_types: set[str]) -
     return None
 
 
+def _write_store_io(*, rvar: str) -> list[str]:
+    # io.Reader / io.Writer results become object handles read and written with io_* ops.
+    return [
+        f"    if {rvar} == nil {{",
+        "        return nil, nil",
+        "    }",
+        f'    return storeObj("io", {rvar}), nil',
+    ]
+
+
 def _return_needs_export_any(go_type: str, struct_types: set[str]) -> bool:
+    if stream_item_types(go_type) is not None:
+        # Streams are registered by exportResult (see storeStream).
+        return True
     base = _base_type(go_type)
     return base == "any" or base in struct_types or base in {"time.Time", "time.Duration", "uuid.UUID"}
 
@@ -726,8 +3074,14 @@ def _write_export_return_value(
         lines.append(f"        {vvar} = id")
         lines.append("    }")
         return lines
+    if go_type.strip() in IO_TYPES:
+        lines.append(f"    var {vvar} any")
+        lines.append(f"    if {rvar} != nil {{")
+        lines.append(f'        {vvar} = storeObj("io", {rvar})')
+        lines.append("    }")
+        return lines
     if _return_needs_export_any(go_type, struct_types):
-        lines.append(f"    {vvar}, ok := exportAny(reflect.ValueOf({rvar}))")
+        lines.append(f"    {vvar}, ok := exportResult(ctx, reflect.ValueOf({rvar}))")
         lines.append("    if !ok {")
         lines.append(
             '        return nil, &ErrorObj{Type: "UnsupportedTypeError", Message: "unsupported return type"}'
@@ -748,21 +3102,22 @@ def _write_method_wrapper(
 ) -> list[str]:
     lines: list[str] = []
     recv_go = f"*{alias}.{m.recv}"
-    lines.append(f"func {wrap_name}(obj any, args []any) (any, *ErrorObj) {{")
+    has_ctx, params = _split_context_param(m.params)
+    lines.append(f"func {wrap_name}(ctx context.Context, obj any, args []any) (any, *ErrorObj) {{")
     lines.append(f"    recv, ok := obj.({recv_go})")
     lines.append("    if !ok {")
     lines.append('        return nil, &ErrorObj{Type: "ABIError", Message: "wrong receiver type"}')
     lines.append("    }")
-    lines.append(f"    if len(args) != {len(m.params)} {{")
+    lines.append(f"    if len(args) != {len(params)} {{")
     lines.append('        return nil, &ErrorObj{Type: "ABIError", Message: "wrong arity"}')
     lines.append("    }")
 
     arg_names: list[str] = []
-    for i, t in enumerate(m.params):
+    for i, t in enumerate(params):
         vn = f"a{i}"
         arg_names.append(vn)
         lines.extend(
-            _write_arg_convert(
+            _write_pinnable_arg_convert(
                 var_name=vn,
                 go_type=t,
                 value_expr=f"args[{i}]",
@@ -772,8 +3127,10 @@ def _write_method_wrapper(
         )
 
     call_args = list(arg_names)
-    if m.params and m.params[-1].strip().startswith("..."):
+    if params and params[-1].strip().startswith("..."):
         call_args[-1] = call_args[-1] + "..."
+    if has_ctx:
+        call_args.insert(0, "ctx")
     call = f"recv.{m.name}({', '.join(call_args)})"
     if len(m.results) == 0:
         lines.append(f"    {call}")
@@ -801,12 +3158,10 @@ def _write_method_wrapper(
             lines.append("    }")
             lines.append(f'    id := storeObj("{m.pkg}.{opaque_ptr}", r0)')
             lines.append("    return id, nil")
-        elif _base_type(t0) == "any" or _base_type(t0) in struct_types or _base_type(t0) in {  # noqa: PLR1714
-            "time.Time",
-            "time.Duration",
-            "uuid.UUID",
-        }:
-            lines.append("    v0, ok := exportAny(reflect.ValueOf(r0))")
+        elif t0 in IO_TYPES:
+            lines.extend(_write_store_io(rvar="r0"))
+        elif _return_needs_export_any(t0, struct_types):
+            lines.append("    v0, ok := exportResult(ctx, reflect.ValueOf(r0))")
             lines.append("    if !ok {")
             lines.append(
                 '        return nil, &ErrorObj{Type: "UnsupportedTypeError", Message: "unsupported return type"}'
@@ -871,17 +3226,18 @@ def _write_generic_wrapper(
     opaque_struct_types: set[str],
 ) -> list[str]:
     lines: list[str] = []
-    lines.append(f"func {wrap_name}(args []any) (any, *ErrorObj) {{")
-    lines.append(f"    if len(args) != {len(gi.params)} {{")
+    has_ctx, params = _split_context_param(gi.params)
+    lines.append(f"func {wrap_name}(ctx context.Context, args []any) (any, *ErrorObj) {{")
+    lines.append(f"    if len(args) != {len(params)} {{")
     lines.append('        return nil, &ErrorObj{Type: "ABIError", Message: "wrong arity"}')
     lines.append("    }")
 
     arg_names: list[str] = []
-    for i, t in enumerate(gi.params):
+    for i, t in enumerate(params):
         vn = f"a{i}"
         arg_names.append(vn)
         lines.extend(
-            _write_arg_convert(
+            _write_pinnable_arg_convert(
                 var_name=vn,
                 go_type=t,
                 value_expr=f"args[{i}]",
@@ -894,8 +3250,10 @@ def _write_generic_wrapper(
         _qualify_type(t, pkg_alias=alias, struct_types=struct_types) for t in gi.type_args
     ]
     call_args = list(arg_names)
-    if gi.params and gi.params[-1].strip().startswith("..."):
+    if params and params[-1].strip().startswith("..."):
         call_args[-1] = call_args[-1] + "..."
+    if has_ctx:
+        call_args.insert(0, "ctx")
     call = f"{alias}.{gi.generic_name}[{', '.join(type_args_exprs)}]({', '.join(call_args)})"
     if len(gi.results) == 0:
         lines.append(f"    {call}")
@@ -923,12 +3281,10 @@ def _write_generic_wrapper(
             lines.append("    }")
             lines.append(f'    id := storeObj("{gi.pkg}.{opaque_ptr}", r0)')
             lines.append("    return id, nil")
-        elif _base_type(t0) == "any" or _base_type(t0) in struct_types or _base_type(t0) in {  # noqa: PLR1714
-            "time.Time",
-            "time.Duration",
-            "uuid.UUID",
-        }:
-            lines.append("    v0, ok := exportAny(reflect.ValueOf(r0))")
+        elif t0 in IO_TYPES:
+            lines.extend(_write_store_io(rvar="r0"))
+        elif _return_needs_export_any(t0, struct_types):
+            lines.append("    v0, ok := exportResult(ctx, reflect.ValueOf(r0))")
             lines.append("    if !ok {")
             lines.append(
                 '        return nil, &ErrorObj{Type: "UnsupportedTypeError", Message: "unsupported return type"}'
@@ -988,7 +3344,7 @@ def _write_var_get_wrapper(*, wrap_name: str, alias: str, v: ExportedVar) -> lis
     if base.startswith("*"):
         base = base[1:].strip()
     lines: list[str] = []
-    lines.append(f"func {wrap_name}(args []any) (any, *ErrorObj) {{")
+    lines.append(f"func {wrap_name}(ctx context.Context, args []any) (any, *ErrorObj) {{")
     lines.append("    if len(args) != 0 {")
     lines.append('        return nil, &ErrorObj{Type: "ABIError", Message: "wrong arity"}')
     lines.append("    }")
@@ -1046,6 +3402,66 @@ def _qualify_type(go_type: str, *, pkg_alias: str, struct_types: set[str]) -> st
     return t
 
 
+def _write_pinnable_arg_convert(
+    *,
+    var_name: str,
+    go_type: str,
+    value_expr: str,
+    pkg_alias: str,
+    struct_types: set[str],
+) -> list[str]:
+    """Like `_write_arg_convert`, but a pin marker argument uses the pinned value.
+
+    The converted value is cached on the pin per Go type, so repeated calls skip
+    the conversion entirely.
+    """
+    t = go_type.strip()
+    if t == "io.Reader":
+        # Readers are consumed by the call, so they are never pinned.
+        return [
+            f"    {var_name}, errObj{var_name} := readerOf({value_expr})",
+            f"    if errObj{var_name} != nil {{",
+            f"        return nil, errObj{var_name}",
+            "    }",
+        ]
+    if t.startswith("..."):
+        t = "[]" + t[3:].strip()
+    typ = _qualify_type(t, pkg_alias=pkg_alias, struct_types=struct_types)
+    pin, raw, conv = f"p_{var_name}", f"v_{var_name}", f"c_{var_name}"
+    lines = [
+        f"    var {var_name} {typ}",
+        f"    {pin}, isPin{var_name} := pinOf({value_expr})",
+        f"    if isPin{var_name} && {pin} == nil {{",
+        "        return nil, pinNotFound()",
+        "    }",
+        f"    if isPin{var_name} && {pin}.mem != nil {{",
+        f"        mv, ok := memValue({pin}.mem, reflect.TypeOf((*{typ})(nil)).Elem())",
+        "        if !ok {",
+        '            return nil, &ErrorObj{Type: "UnsupportedTypeError", Message: "unsupported arg type"}',
+        "        }",
+        f"        {var_name} = mv.Interface().({typ})",
+        f'    }} else if cv, ok := {pin}.converted("{typ}"); ok {{',
+        f"        {var_name} = cv.({typ})",
+        "    } else {",
+        f"        {raw} := {value_expr}",
+        f"        if {pin} != nil {{",
+        f"            {raw} = {pin}.raw",
+        "        }",
+    ]
+    for line in _write_arg_convert(
+        var_name=conv, go_type=go_type, value_expr=raw, pkg_alias=pkg_alias, struct_types=struct_types
+    ):
+        lines.append("    " + line)
+    lines.extend(
+        [
+            f"        {var_name} = {conv}",
+            f'        {pin}.store("{typ}", {var_name})',
+            "    }",
+        ]
+    )
+    return lines
+
+
 def _write_arg_convert(
     *,
     var_name: str,
@@ -1130,6 +3546,13 @@ def _write_arg_convert(
             lines.append("    }")
             return lines
 
+        if vt in {"uint64", "uint", "uint32", "uint16", "uint8"}:
+            lines.append(f"    {var_name}, ok := toGoValue[map[string]{vt}]({value_expr})")
+            lines.append("    if !ok {")
+            unsupported()
+            lines.append("    }")
+            return lines
+
         if vt == "float64":
             lines.append(f"    {var_name}, ok := toStringFloat64Map({value_expr})")
             lines.append("    if !ok {")
@@ -1234,6 +3657,15 @@ def _write_arg_convert(
         lines.append(f"    {var_name} := {cast}({tmp})")
         return lines
 
+    if go_type in {"uint64", "uint", "uint32", "uint16", "uint8"}:
+        tmp = f"t_{var_name}"
+        lines.append(f"    {tmp}, ok := toUint64({value_expr})")
+        lines.append("    if !ok {")
+        unsupported()
+        lines.append("    }")
+        lines.append(f"    {var_name} := {go_type}({tmp})")
+        return lines
+
     if go_type in {"float64", "float32"}:
         tmp = f"t_{var_name}"
         lines.append(f"    {tmp}, ok := toFloat64({value_expr})")
@@ -1336,6 +3768,14 @@ def _write_arg_convert(
         lines.append("    }")
         return lines
 
+    if numeric_array_type(go_type) is not None:
+        # Other numeric slices (`[]float32`, `[][]float64`, ...): lists or packed arrays.
+        lines.append(f"    {var_name}, ok := toGoValue[{go_type}]({value_expr})")
+        lines.append("    if !ok {")
+        unsupported()
+        lines.append("    }")
+        return lines
+
     # Unknown type (should not happen due to filtering).
     lines.append("    if true {")
     unsupported()
@@ -1401,6 +3841,27 @@ def _write_helpers(
         "    }",
         "}",
         "",
+        "func toUint64(v any) (uint64, bool) {",
+        "    switch t := v.(type) {",
+        "    case uint64:",
+        "        return t, true",
+        "    case uint32:",
+        "        return uint64(t), true",
+        "    case uint16:",
+        "        return uint64(t), true",
+        "    case uint8:",
+        "        return uint64(t), true",
+        "    case uint:",
+        "        return uint64(t), true",
+        "    default:",
+        "        n, ok := toInt64(v)",
+        "        if !ok || n < 0 {",
+        "            return 0, false",
+        "        }",
+        "        return uint64(n), true",
+        "    }",
+        "}",
+        "",
         "func toFloat64(v any) (float64, bool) {",
         "    switch t := v.(type) {",
         "    case float64:",
@@ -1417,6 +3878,13 @@ def _write_helpers(
         "}",
         "",
         "func toFloat64Slice(v any) ([]float64, bool) {",
+        "    if a, ok := ndOf(v); ok {",
+        "        out, ok := ndValue(a, reflect.TypeOf([]float64(nil)))",
+        "        if !ok {",
+        "            return nil, false",
+        "        }",
+        "        return out.Interface().([]float64), true",
+        "    }",
         "    xs, ok := toAnySlice(v)",
         "    if !ok {",
         "        return nil, false",
@@ -1433,6 +3901,13 @@ def _write_helpers(
         "}",
         "",
         "func toInt64Slice(v any) ([]int64, bool) {",
+        "    if a, ok := ndOf(v); ok {",
+        "        out, ok := ndValue(a, reflect.TypeOf([]int64(nil)))",
+        "        if !ok {",
+        "            return nil, false",
+        "        }",
+        "        return out.Interface().([]int64), true",
+        "    }",
         "    xs, ok := toAnySlice(v)",
         "    if !ok {",
         "        return nil, false",
@@ -1879,6 +4354,17 @@ def _write_helpers(
             "        }",
             "        out.SetInt(n)",
             "        return out, true",
+            "    case reflect.Uint, reflect.Uint8, reflect.Uint16, reflect.Uint32, reflect.Uint64:",
+            "        n, ok := toUint64(v)",
+            "        if !ok {",
+            "            return reflect.Value{}, false",
+            "        }",
+            "        out := reflect.New(t).Elem()",
+            "        if out.OverflowUint(n) {",
+            "            return reflect.Value{}, false",
+            "        }",
+            "        out.SetUint(n)",
+            "        return out, true",
             "    case reflect.Float32, reflect.Float64:",
             "        f, ok := toFloat64(v)",
             "        if !ok {",
@@ -1912,6 +4398,12 @@ def _write_helpers(
                 "            out.SetBytes(b)",
                 "            return out, true",
             "        }",
+            "        if a, ok := ndOf(v); ok {",
+            "            return ndValue(a, t)",
+            "        }",
+            "        if c, ok := colsOf(v); ok {",
+            "            return colsValue(c, t)",
+            "        }",
             "        xs, ok := toAnySlice(v)",
             "        if !ok {",
             "            return reflect.Value{}, false",
@@ -2033,7 +4525,8 @@ def _write_helpers(
             "        return id.String(), true",
             "    }",
             "    switch v.Kind() {",
-            "    case reflect.Bool, reflect.String, reflect.Int, reflect.Int8, reflect.Int16, reflect.Int32, reflect.Int64, reflect.Float32, reflect.Float64:",
+            "    case reflect.Bool, reflect.String, reflect.Int, reflect.Int8, reflect.Int16, reflect.Int32, reflect.Int64, reflect.Float32, reflect.Float64,",
+            "        reflect.Uint, reflect.Uint8, reflect.Uint16, reflect.Uint32, reflect.Uint64:",
             "        return v.Interface(), true",
             "    case reflect.Slice:",
             "        if v.Type().Elem().Kind() == reflect.Uint8 {",
@@ -2100,6 +4593,125 @@ def _write_helpers(
             "    }",
             "}",
             "",
+            "// selection is a parsed result projection (Request.Select): output field key ->",
+            "// nested selection, or nil for the whole field.",
+            "type selection map[string]selection",
+            "",
+            "type selectionKey struct{}",
+            "",
+            "func parseSelection(paths []string) selection {",
+            "    sel := selection{}",
+            "    for _, p := range paths {",
+            "        cur := sel",
+            "        parts := strings.Split(p, \".\")",
+            "        for i, part := range parts {",
+            "            next, seen := cur[part]",
+            "            if i == len(parts)-1 {",
+            "                // A whole field wins over narrower paths into it.",
+            "                cur[part] = nil",
+            "                break",
+            "            }",
+            "            if seen && next == nil {",
+            "                break",
+            "            }",
+            "            if next == nil {",
+            "                next = selection{}",
+            "                cur[part] = next",
+            "            }",
+            "            cur = next",
+            "        }",
+            "    }",
+            "    return sel",
+            "}",
+            "",
+            "// exportResult exports a call result, honoring the request's selection (if any).",
+            "func exportResult(ctx context.Context, v reflect.Value) (any, bool) {",
+            "    if v.IsValid() && (v.Kind() == reflect.Chan || v.Kind() == reflect.Func) {",
+            "        return storeStream(v)",
+            "    }",
+            "    if ctx.Value(lazyKey{}) != nil {",
+            "        return storeLazy(v)",
+            "    }",
+            "    if sel, ok := ctx.Value(selectionKey{}).(selection); ok {",
+            "        return exportSelected(v, sel)",
+            "    }",
+            "    return exportAny(v)",
+            "}",
+            "",
+            "// exportSelected is exportAny restricted to the selected fields of every record",
+            "// struct reached through pointers, slices and maps. Unselected fields are never",
+            "// visited.",
+            "func exportSelected(v reflect.Value, sel selection) (any, bool) {",
+            "    if sel == nil {",
+            "        return exportAny(v)",
+            "    }",
+            "    for v.Kind() == reflect.Ptr || v.Kind() == reflect.Interface {",
+            "        if v.IsNil() {",
+            "            return nil, true",
+            "        }",
+            "        v = v.Elem()",
+            "    }",
+            "    switch v.Kind() {",
+            "    case reflect.Slice:",
+            "        if v.Type().Elem().Kind() == reflect.Uint8 {",
+            "            return exportAny(v)",
+            "        }",
+            "        out := make([]any, 0, v.Len())",
+            "        for i := 0; i < v.Len(); i++ {",
+            "            item, ok := exportSelected(v.Index(i), sel)",
+            "            if !ok {",
+            "                return nil, false",
+            "            }",
+            "            out = append(out, item)",
+            "        }",
+            "        return out, true",
+            "    case reflect.Map:",
+            "        if v.Type().Key().Kind() != reflect.String {",
+            "            return nil, false",
+            "        }",
+            "        out := make(map[string]any, v.Len())",
+            "        for _, k := range v.MapKeys() {",
+            "            item, ok := exportSelected(v.MapIndex(k), sel)",
+            "            if !ok {",
+            "                return nil, false",
+            "            }",
+            "            out[k.Interface().(string)] = item",
+            "        }",
+            "        return out, true",
+            "    case reflect.Struct:",
+            "        if v.Type().PkgPath() == \"time\" && v.Type().Name() == \"Time\" {",
+            "            return exportAny(v)",
+            "        }",
+            "        if !isAllowedStructType(v.Type()) {",
+            "            return nil, false",
+            "        }",
+            "        out := make(map[string]any, len(sel))",
+            "        rt := v.Type()",
+            "        for i := 0; i < rt.NumField(); i++ {",
+            "            sf := rt.Field(i)",
+            "            if sf.PkgPath != \"\" || fieldIgnored(sf) {",
+            "                continue",
+            "            }",
+            "            k := fieldOutputKey(sf)",
+            "            sub, ok := sel[k]",
+            "            if !ok {",
+            "                continue",
+            "            }",
+            "            if fieldOmitEmpty(sf) && isEmptyValue(v.Field(i)) {",
+            "                continue",
+            "            }",
+            "            av, ok := exportSelected(v.Field(i), sub)",
+            "            if !ok {",
+            "                return nil, false",
+            "            }",
+            "            out[k] = av",
+            "        }",
+            "        return out, true",
+            "    default:",
+            "        return exportAny(v)",
+            "    }",
+            "}",
+            "",
             "func fieldOutputKey(sf reflect.StructField) string {",
             "    // Canonical key precedence: msgpack tag name, then json tag name, else field name.",
             "    if tagName(sf.Tag.Get(\"msgpack\")) != \"\" {",
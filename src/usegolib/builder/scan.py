@@ -882,6 +882,15 @@ func renderType(e ast.Expr, im map[string]string) string {
 			if path == "github.com/google/uuid" && t.Sel.Name == "UUID" {
 				return "uuid.UUID"
 			}
+			if path == "context" && t.Sel.Name == "Context" {
+				return "context.Context"
+			}
+			if path == "io" {
+				switch t.Sel.Name {
+				case "Reader", "ReadCloser", "Writer", "WriteCloser", "ReadWriteCloser":
+					return "io." + t.Sel.Name
+				}
+			}
 		}
 		return p + "." + t.Sel.Name
 	case *ast.StarExpr:
@@ -892,11 +901,53 @@ func renderType(e ast.Expr, im map[string]string) string {
 		return "*" + inner
 	case *ast.ParenExpr:
 		return renderType(t.X, im)
+	case *ast.ChanType:
+		// Channels are only accepted as stream results; send-only ones never.
+		if t.Dir == ast.SEND {
+			return ""
+		}
+		inner := renderType(t.Value, im)
+		if inner == "" {
+			return ""
+		}
+		if t.Dir == ast.RECV {
+			return "<-chan " + inner
+		}
+		return "chan " + inner
+	case *ast.IndexExpr:
+		if !isIterType(t.X, im, "Seq") {
+			return ""
+		}
+		inner := renderType(t.Index, im)
+		if inner == "" {
+			return ""
+		}
+		return "iter.Seq[" + inner + "]"
+	case *ast.IndexListExpr:
+		if !isIterType(t.X, im, "Seq2") || len(t.Indices) != 2 {
+			return ""
+		}
+		k := renderType(t.Indices[0], im)
+		v := renderType(t.Indices[1], im)
+		if k == "" || v == "" {
+			return ""
+		}
+		return "iter.Seq2[" + k + ", " + v + "]"
 	default:
 		return ""
 	}
 }
 
+// isIterType reports whether e names the standard library's iter.<name>.
+func isIterType(e ast.Expr, im map[string]string, name string) bool {
+	sel, ok := e.(*ast.SelectorExpr)
+	if !ok || sel.Sel.Name != name {
+		return false
+	}
+	p, ok := sel.X.(*ast.Ident)
+	return ok && im[p.Name] == "iter"
+}
+
 func fileImports(af *ast.File) map[string]string {
 	out := map[string]string{}
 	if af == nil {
@@ -0,0 +1,345 @@
+"""In-process result caching and call deduplication for Go functions."""
+
+from __future__ import annotations
+
+import copy
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable
+
+from .paths import default_result_cache_dir
+
+# Returned by `ResultCache.get` on a miss (`None` is a valid cached result).
+MISS = object()
+
+_IMMUTABLE = (type(None), bool, int, float, complex, str, bytes)
+
+
+def _private(value: Any) -> Any:
+    """A copy of `value` that no other caller shares; immutable scalars are returned as they are."""
+    return value if isinstance(value, _IMMUTABLE) else copy.deepcopy(value)
+
+
+class ResultCache:
+    """Thread-safe LRU cache keyed by packed argument bytes.
+
+    Entries are bounded by count (`maxsize`) and, optionally, by total size
+    (`maxbytes`, counting key bytes plus the encoded response size). With `ttl`
+    (seconds) entries expire after they were stored. Mutable values are copied
+    on the way in and out, so callers may modify the results they get.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 1024,
+        maxbytes: int | None = None,
+        ttl: float | None = None,
+        disk: "DiskCache | None" = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if isinstance(maxsize, bool) or not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+        if maxbytes is not None and (isinstance(maxbytes, bool) or not isinstance(maxbytes, int) or maxbytes < 1):
+            raise ValueError("maxbytes must be a positive integer or None")
+        if ttl is not None and (isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl <= 0):
+            raise ValueError("ttl must be a positive number of seconds or None")
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.ttl = ttl
+        # Optional persistent second tier, consulted by the handle on memory misses.
+        self.disk = disk
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (value, size, expires_at | None)
+        self._entries: OrderedDict[bytes, tuple[Any, int, float | None]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: bytes) -> Any:
+        """Return the cached value for `key`, or `MISS`."""
+        with self._lock:
+            ent = self._entries.get(key)
+            if ent is not None and ent[2] is not None and ent[2] <= self._clock():
+                self._drop(key)
+                ent = None
+            if ent is None:
+                self._misses += 1
+                return MISS
+            self._entries.move_to_end(key)
+            self._hits += 1
+            value = ent[0]
+        return _private(value)
+
+    def put(self, key: bytes, value: Any, *, size: int) -> None:
+        size += len(key)
+        if self.maxbytes is not None and size > self.maxbytes:
+            return
+        expires = None if self.ttl is None else self._clock() + self.ttl
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (_private(value), size, expires)
+            self._bytes += size
+            while len(self._entries) > self.maxsize or (
+                self.maxbytes is not None and self._bytes > self.maxbytes
+            ):
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            out = {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "maxsize": self.maxsize,
+                "maxbytes": self.maxbytes,
+                "ttl": self.ttl,
+            }
+        if self.disk is not None:
+            out["disk"] = self.disk.stats()
+        return out
+
+    def _drop(self, key: bytes) -> None:
+        _value, size, _expires = self._entries.pop(key)
+        self._bytes -= size
+
+
+class SingleFlight:
+    """Collapse concurrent calls with the same key into one execution.
+
+    The first caller for a key runs `fn`; callers arriving while it is in flight
+    wait for and share its outcome (result or exception). Nothing is kept once
+    the call completes.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._inflight: dict[bytes, Future] = {}
+        self._calls = 0
+        self._shared = 0
+
+    def do(self, key: bytes, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            fut = self._inflight.get(key)
+            leader = fut is None
+            if leader:
+                fut = Future()
+                self._inflight[key] = fut
+                self._calls += 1
+            else:
+                self._shared += 1
+        if not leader:
+            return fut.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            fut.set_exception(e)
+            raise
+        with self._lock:
+            del self._inflight[key]
+        fut.set_result(result)
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"calls": self._calls, "shared": self._shared, "in_flight": len(self._inflight)}
+
+
+_DISK_CACHE_NAME = "results.sqlite3"
+_DEFAULT_DISK_MAXBYTES = 1 << 30
+
+_DISK_CACHES_LOCK = threading.Lock()
+_DISK_CACHES: dict[Path, "DiskCache"] = {}
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def disk_cache_enabled() -> bool:
+    """Whether pure-annotated functions use the disk tier by default (`USEGOLIB_DISK_CACHE=1`)."""
+    return _env_flag("USEGOLIB_DISK_CACHE")
+
+
+def get_disk_cache(directory: Path | None = None) -> "DiskCache":
+    """Return the process-wide disk cache for `directory` (default: the usegolib cache dir).
+
+    The size budget defaults to 1 GiB; override with `USEGOLIB_DISK_CACHE_MAX_BYTES`.
+    """
+    path = (Path(directory) if directory is not None else default_result_cache_dir()) / _DISK_CACHE_NAME
+    with _DISK_CACHES_LOCK:
+        dc = _DISK_CACHES.get(path)
+        if dc is None:
+            raw = os.environ.get("USEGOLIB_DISK_CACHE_MAX_BYTES", "").strip()
+            maxbytes = int(raw) if raw.isdigit() and int(raw) > 0 else _DEFAULT_DISK_MAXBYTES
+            dc = DiskCache(path, maxbytes=maxbytes)
+            _DISK_CACHES[path] = dc
+        return dc
+
+
+class DiskCache:
+    """SQLite-backed response cache shared by every process on the machine.
+
+    Rows are keyed by the artifact's `library.sha256` plus the encoded request, so
+    a rebuilt artifact never sees stale results; rows of old artifacts are no
+    longer read and age out under LRU eviction once `maxbytes` is exceeded.
+    Storage errors are treated as misses: the cache never fails a call.
+    """
+
+    def __init__(self, path: Path, *, maxbytes: int = _DEFAULT_DISK_MAXBYTES) -> None:
+        self.path = Path(path)
+        self.maxbytes = maxbytes
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid = 0
+        self._hits = 0
+        self._misses = 0
+        self._errors = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        # Called with `_lock` held. Connections are not shared with forked children.
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "lib TEXT NOT NULL, key BLOB NOT NULL, value BLOB NOT NULL, "
+                "size INTEGER NOT NULL, ctime REAL NOT NULL, atime REAL NOT NULL, "
+                "PRIMARY KEY (lib, key))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS results_atime ON results (atime)")
+            # The total size is kept in a meta row by triggers, so a put need not sum the table.
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            conn.execute(
+                "INSERT OR IGNORE INTO meta (name, value) "
+                "SELECT 'bytes', COALESCE(SUM(size), 0) FROM results"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS results_size_insert AFTER INSERT ON results BEGIN "
+                "UPDATE meta SET value = value + NEW.size WHERE name = 'bytes'; END"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS results_size_delete AFTER DELETE ON results BEGIN "
+                "UPDATE meta SET value = value - OLD.size WHERE name = 'bytes'; END"
+            )
+            conn.execute(
+                "CREATE TRIGGER IF NOT EXISTS results_size_update AFTER UPDATE OF size ON results BEGIN "
+                "UPDATE meta SET value = value + NEW.size - OLD.size WHERE name = 'bytes'; END"
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            conn.close()
+            raise
+        conn.execute("COMMIT")
+        self._conn = conn
+        self._pid = os.getpid()
+        return conn
+
+    def get(self, lib: str, key: bytes, *, ttl: float | None = None) -> bytes | None:
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT value, ctime FROM results WHERE lib = ? AND key = ?", (lib, key)
+                ).fetchone()
+                if row is not None and ttl is not None and row[1] + ttl <= now:
+                    conn.execute("DELETE FROM results WHERE lib = ? AND key = ?", (lib, key))
+                    row = None
+                if row is None:
+                    self._misses += 1
+                    return None
+                conn.execute("UPDATE results SET atime = ? WHERE lib = ? AND key = ?", (now, lib, key))
+            except (sqlite3.Error, OSError):
+                self._errors += 1
+                self._misses += 1
+                return None
+            self._hits += 1
+            return bytes(row[0])
+
+    def put(self, lib: str, key: bytes, value: bytes) -> None:
+        size = len(key) + len(value)
+        if size > self.maxbytes:
+            return
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    # An upsert (not INSERT OR REPLACE) so the size triggers see the overwrite.
+                    conn.execute(
+                        "INSERT INTO results (lib, key, value, size, ctime, atime) VALUES (?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT (lib, key) DO UPDATE SET value = excluded.value, size = excluded.size, "
+                        "ctime = excluded.ctime, atime = excluded.atime",
+                        (lib, key, value, size, now, now),
+                    )
+                    self._evict(conn)
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+                conn.execute("COMMIT")
+            except (sqlite3.Error, OSError):
+                self._errors += 1
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        (total,) = conn.execute("SELECT value FROM meta WHERE name = 'bytes'").fetchone()
+        excess = total - self.maxbytes
+        if excess <= 0:
+            return
+        victims: list[int] = []
+        for rowid, size in conn.execute("SELECT rowid, size FROM results ORDER BY atime"):
+            victims.append(rowid)
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM results WHERE rowid = ?", [(r,) for r in victims])
+
+    def clear(self) -> None:
+        with self._lock:
+            try:
+                self._connect().execute("DELETE FROM results")
+            except (sqlite3.Error, OSError):
+                self._errors += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            out: dict[str, Any] = {
+                "hits": self._hits,
+                "misses": self._misses,
+                "errors": self._errors,
+                "maxbytes": self.maxbytes,
+                "path": str(self.path),
+            }
+            try:
+                entries, total = self._connect().execute(
+                    "SELECT (SELECT COUNT(*) FROM results), (SELECT value FROM meta WHERE name = 'bytes')"
+                ).fetchone()
+                out["entries"] = entries
+                out["bytes"] = total
+            except (sqlite3.Error, OSError):
+                self._errors += 1
+            return out
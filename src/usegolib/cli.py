@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import argparse
 import hashlib
-import importlib.metadata
 from pathlib import Path
 
 
@@ -33,9 +32,18 @@ def main() -> None:
     p_build.add_argument(
         "--module",
         required=True,
-        help="Go module directory path OR Go module/package import path (v0).",
+        action="append",
+        help=(
+            "Go module directory path OR Go module/package import path (v0). "
+            "Repeat to build a bundle artifact (several modules, one shared library)."
+        ),
     )
     p_build.add_argument("--out", required=True, help="Output artifact directory.")
+    p_build.add_argument(
+        "--bundle-name",
+        default=None,
+        help="Build a bundle artifact with this name (default: 'bundle' when --module is repeated).",
+    )
     p_build.add_argument("--force", action="store_true", help="Force rebuild even if artifact exists.")
     p_build.add_argument(
         "--gomodcache",
@@ -52,6 +60,11 @@ def main() -> None:
         default=None,
         help="Path to generics instantiation config JSON (optional).",
     )
+    p_build.add_argument(
+        "--annotations",
+        default=None,
+        help="Path to annotations JSON (object concurrency modes, read-only methods; optional).",
+    )
 
     p_pkg = sub.add_parser(
         "package",
@@ -112,6 +125,33 @@ def main() -> None:
         help="Delete any existing matching artifacts before rebuilding.",
     )
 
+    p_warm = sub.add_parser(
+        "warm",
+        help="Precompute index, verification and schema caches for an artifact root (deployment images).",
+    )
+    warm_target = p_warm.add_mutually_exclusive_group()
+    warm_target.add_argument(
+        "--artifact-dir",
+        default=None,
+        help="Artifact root directory (default: USEGOLIB_ARTIFACT_DIR or OS cache).",
+    )
+    warm_target.add_argument(
+        "--python-package",
+        default=None,
+        help="Installed package generated by `usegolib package`; warms its embedded artifacts.",
+    )
+    p_warm.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of artifacts to verify in parallel (default: min(8, CPU count)).",
+    )
+    p_warm.add_argument(
+        "--smoke",
+        action="store_true",
+        help="Also dlopen each shared library to catch missing system dependencies early.",
+    )
+
     p_gen = sub.add_parser(
         "gen",
         help="Generate a static Python bindings module from an artifact manifest schema.",
@@ -126,17 +166,15 @@ def main() -> None:
 
     args = parser.parse_args()
     if args.cmd == "version":
-        try:
-            print(importlib.metadata.version("usegolib"))
-        except Exception:
-            # Best-effort fallback for editable/local-only contexts.
-            print("0.0.0")
+        from . import __version__
+
+        print(__version__)
         return
 
     if args.cmd == "build":
-        from .builder.build import build_artifact
+        from .builder.build import build_artifact, build_bundle_artifact
 
-        module, version = _split_target_and_version(args.module)
+        targets = [_split_target_and_version(m) for m in args.module]
         gomodcache = Path(args.gomodcache) if args.gomodcache else None
         clean_gomodcache = False
         force = bool(args.force)
@@ -145,9 +183,24 @@ def main() -> None:
             clean_gomodcache = True
             if gomodcache is None:
                 # Use a deterministic isolated cache directory under the output root.
-                h = hashlib.sha256(f"{module}@{version or '@latest'}".encode("utf-8")).hexdigest()
+                key = ",".join(f"{m}@{v or '@latest'}" for m, v in targets)
+                h = hashlib.sha256(key.encode("utf-8")).hexdigest()
                 gomodcache = Path(args.out) / ".usegolib-gomodcache" / h
 
+        if len(targets) > 1 or args.bundle_name:
+            build_bundle_artifact(
+                modules=targets,
+                out_dir=Path(args.out),
+                name=args.bundle_name or "bundle",
+                force=force,
+                generics=Path(args.generics) if args.generics else None,
+                gomodcache_dir=gomodcache,
+                clean_gomodcache=clean_gomodcache,
+                annotations=Path(args.annotations) if args.annotations else None,
+            )
+            return
+
+        module, version = targets[0]
         build_artifact(
             module=module,
             out_dir=Path(args.out),
@@ -156,6 +209,7 @@ def main() -> None:
             generics=Path(args.generics) if args.generics else None,
             gomodcache_dir=gomodcache,
             clean_gomodcache=clean_gomodcache,
+            annotations=Path(args.annotations) if args.annotations else None,
         )
         return
 
@@ -267,6 +321,32 @@ def main() -> None:
             print(str(manifest_path))
             return
 
+    if args.cmd == "warm":
+        from .paths import default_artifact_root
+        from .warm import package_artifact_root, warm_artifact_root
+
+        if args.python_package:
+            artifact_root = package_artifact_root(args.python_package)
+        elif args.artifact_dir:
+            artifact_root = Path(args.artifact_dir)
+        else:
+            artifact_root = default_artifact_root()
+
+        results = warm_artifact_root(artifact_root, jobs=args.jobs, smoke=bool(args.smoke))
+        failed = False
+        for r in results:
+            label = f"{r.module}@{r.version}" if r.module else "?"
+            line = f"{r.status}: {r.manifest_dir} ({label})"
+            if r.detail:
+                line += f": {r.detail}"
+            print(line)
+            failed = failed or r.status == "error"
+        if not results:
+            print(f"no artifacts found under {artifact_root}")
+        if failed:
+            raise SystemExit(1)
+        return
+
     if args.cmd == "gen":
         from .artifact import resolve_manifest
         from .bindgen import BindgenOptions, generate_python_bindings
@@ -0,0 +1,116 @@
+"""Columnar arguments: `[]Struct` parameters sent one column per field."""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+from .errors import UnsupportedTypeError
+from .ndarray import _pack_numpy
+from .schema import Schema, StructSchema, numeric_array_type, record_slice_struct
+
+COLUMNS_KEY = "$usegolib_columns"
+
+
+def _table_columns(a: Any) -> dict[str, Any] | None:
+    """The columns of a dict, pandas DataFrame or pyarrow Table/RecordBatch, else None."""
+    if isinstance(a, dict):
+        return a
+    pd = sys.modules.get("pandas")
+    if pd is not None and isinstance(a, pd.DataFrame):
+        return {str(k): a[k].to_numpy() for k in a.columns}
+    pa = sys.modules.get("pyarrow")
+    if pa is not None and isinstance(a, (pa.Table, pa.RecordBatch)):
+        return {name: a.column(name) for name in a.column_names}
+    return None
+
+
+def _column(col: Any, *, schema: Schema, pkg: str, go_type: str, n: int, where: str) -> Any:
+    np = sys.modules.get("numpy")
+    pa = sys.modules.get("pyarrow")
+    nd = numeric_array_type("[]" + go_type)
+    if pa is not None and isinstance(col, (pa.Array, pa.ChunkedArray)):
+        if isinstance(col, pa.ChunkedArray):
+            col = col.combine_chunks()
+        if pa.types.is_struct(col.type) and col.null_count == 0:
+            fields = {col.type.field(i).name: col.field(i) for i in range(col.type.num_fields)}
+            return _pack_struct(fields, schema=schema, pkg=pkg, t="[]" + go_type, n=n, where=where)
+        if (nd is not None or pa.types.is_timestamp(col.type)) and col.null_count == 0:
+            col = col.to_numpy(zero_copy_only=False)
+        else:
+            return col.to_pylist()
+    if isinstance(col, dict):
+        return _pack_struct(col, schema=schema, pkg=pkg, t="[]" + go_type, n=n, where=where)
+    if np is None or not isinstance(col, np.ndarray):
+        return col if isinstance(col, list) else list(col)
+    if col.ndim != 1:
+        raise UnsupportedTypeError(f"{where}: expected a 1-D column, got {col.ndim}-D")
+    if isinstance(col, np.ma.MaskedArray):
+        return col.tolist()  # masked values become None
+    if nd is not None:
+        return _pack_numpy(np, col, dtype=nd[0], ndim=1, where=where)
+    if col.dtype.kind == "M":
+        # time.Time values cross as RFC 3339 strings.
+        out = np.datetime_as_string(col, unit="ns", timezone="UTC").tolist()
+        return [None if s == "NaT" else s for s in out]
+    return col.tolist()
+
+
+def _pack_struct(
+    columns: dict[str, Any], *, schema: Schema, pkg: str, t: str, n: int | None, where: str
+) -> dict[str, Any]:
+    st = record_slice_struct(schema=schema, pkg=pkg, t=t)
+    if st is None:
+        raise UnsupportedTypeError(f"{where}: columns need a slice of record structs")
+    return _pack(columns, st=st, schema=schema, pkg=pkg, n=n, where=where)
+
+
+def _pack(
+    columns: dict[str, Any], *, st: StructSchema, schema: Schema, pkg: str, n: int | None, where: str
+) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    for name, col in columns.items():
+        field = st.fields_by_name.get(st.key_to_name.get(name, ""))
+        if field is None:
+            raise UnsupportedTypeError(f"{where}: unknown field {name!r}")
+        try:
+            size = len(col)
+        except TypeError:
+            raise UnsupportedTypeError(f"{where}: column {name!r} is not a sequence") from None
+        if n is None:
+            n = size
+        elif size != n:
+            raise UnsupportedTypeError(f"{where}: column {name!r} has {size} rows, expected {n}")
+        out[field.key] = _column(col, schema=schema, pkg=pkg, go_type=field.type, n=n, where=f"{where}.{field.key}")
+    missing = sorted(name for name, f in st.fields_by_name.items() if f.required and f.key not in out)
+    if missing:
+        raise UnsupportedTypeError(f"{where}: missing required column(s): {', '.join(missing)}")
+    return {COLUMNS_KEY: n or 0, "columns": out}
+
+
+def pack_columns(
+    *, schema: Schema, pkg: str, params: list[str] | None, args: list[Any]
+) -> tuple[list[Any], frozenset[int]]:
+    """Send column-oriented args of `[]Struct` params as columns; return the args and their positions.
+
+    A column-oriented arg is a dict of equal-length columns keyed by field, a
+    pandas DataFrame or a pyarrow Table. Numeric NumPy columns are packed like
+    `[]float64` args; other columns are sent as lists. Lists of rows are sent as usual.
+    """
+    if params is None:
+        return args, frozenset()
+    positions: set[int] = set()
+    out = args
+    for i, (t, a) in enumerate(zip(params, args)):
+        st = record_slice_struct(schema=schema, pkg=pkg, t=t)
+        if st is None:
+            continue
+        columns = _table_columns(a)
+        if columns is None:
+            continue
+        packed = _pack(columns, st=st, schema=schema, pkg=pkg, n=None, where=f"arg{i} ({t.strip()})")
+        if out is args:
+            out = list(args)
+        out[i] = packed
+        positions.add(i)
+    return out, frozenset(positions)
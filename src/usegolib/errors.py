@@ -39,6 +39,18 @@ class GoError(UseGoLibError):
     """Raised when Go returns an error payload."""
 
 
+class CancelledError(GoError):
+    """Raised when a Go call returns after its cancel token was cancelled."""
+
+
+class DeadlineExceededError(GoError):
+    """Raised when a Go call returns after its `timeout=` deadline passed."""
+
+
+class BusyError(UseGoLibError):
+    """Raised when a Go-side admission limit rejects a call (fail-fast or queue timeout)."""
+
+
 class GoPanicError(UseGoLibError):
     """Raised when Go panics and the bridge reports it."""
 
@@ -49,3 +61,7 @@ class UnsupportedTypeError(UseGoLibError):
 
 class UnsupportedSignatureError(UseGoLibError):
     """Raised when a Go symbol signature is not supported by the bridge."""
+
+
+class WorkerCrashedError(UseGoLibError):
+    """Raised when a process-pool worker dies while handling a call."""
@@ -0,0 +1,139 @@
+"""Go `io.Reader` / `io.Writer` handles as Python raw binary streams."""
+
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING, Any
+
+from . import abi
+from .errors import ABIDecodeError
+
+if TYPE_CHECKING:
+    from .handle import GoObject
+
+DEFAULT_CHUNK = 1 << 20
+
+
+class GoRawIO(io.RawIOBase):
+    """A Go `io.Reader` and/or `io.Writer` handle as an `io.RawIOBase`.
+
+    `readinto` lets Go fill the caller's buffer in place and `write` hands Go the
+    caller's buffer, so no intermediate `bytes` objects are made. `chunk` is the
+    request size of `read()` / `readall()` and the buffer size of `buffered()`.
+    `close()` calls Go's `Close` (for an `io.Closer`) and, for owned handles, frees
+    the Go value.
+    """
+
+    def __init__(
+        self, obj: "GoObject", *, readable: bool, writable: bool, chunk: int = DEFAULT_CHUNK, own: bool = True
+    ) -> None:
+        if isinstance(chunk, bool) or not isinstance(chunk, int) or chunk < 1:
+            raise ValueError("chunk must be a positive integer")
+        super().__init__()
+        self._obj = obj
+        self._readable = readable
+        self._writable = writable
+        self._own = own
+        self.chunk = chunk
+
+    @property
+    def handle(self) -> "GoObject":
+        return self._obj
+
+    def __repr__(self) -> str:
+        return f"GoRawIO(id={self._obj.id}, readable={self._readable}, writable={self._writable})"
+
+    def readable(self) -> bool:
+        return self._readable
+
+    def writable(self) -> bool:
+        return self._writable
+
+    def readinto(self, b: Any) -> int:
+        self._check("read", self._readable)
+        mv = memoryview(b).cast("B")
+        if not len(mv):
+            return 0
+        client = self._obj._pkg._client  # noqa: SLF001 - internal linkage
+        direct = getattr(client, "io_transfer", None)
+        out = direct("read", self._obj.id, mv) if direct is not None else None
+        if out is None:
+            # Libraries without the direct entry point: one `io_read` request.
+            data = self._request(abi.encode_io_request(op="io_read", obj_id=self._obj.id, chunk=len(mv)))
+            if data is None:
+                return 0
+            if not isinstance(data, (bytes, bytearray)) or len(data) > len(mv):
+                raise ABIDecodeError("io_read: expected at most the requested bytes")
+            mv[: len(data)] = data
+            return len(data)
+        n, err = out
+        if err is not None:
+            self._raise(err)
+        return 0 if n < 0 else n
+
+    def readall(self) -> bytes:
+        out = bytearray()
+        buf = bytearray(self.chunk)
+        while True:
+            n = self.readinto(buf)
+            if not n:
+                return bytes(out)
+            out += memoryview(buf)[:n]
+
+    def write(self, b: Any) -> int:
+        self._check("write", self._writable)
+        client = self._obj._pkg._client  # noqa: SLF001 - internal linkage
+        direct = getattr(client, "io_transfer", None)
+        out = direct("write", self._obj.id, b) if direct is not None else None
+        if out is None:
+            data = b if isinstance(b, bytes) else memoryview(b).tobytes()
+            n = self._request(abi.encode_io_request(op="io_write", obj_id=self._obj.id, value=data))
+            if not isinstance(n, int):
+                raise ABIDecodeError("io_write: expected a byte count")
+            return n
+        n, err = out
+        if err is not None:
+            self._raise(err)
+        return n
+
+    def buffered(self) -> io.BufferedReader | io.BufferedWriter:
+        """Wrap in a `BufferedReader` (or `BufferedWriter`) of `chunk` bytes."""
+        if self._readable:
+            return io.BufferedReader(self, buffer_size=self.chunk)
+        return io.BufferedWriter(self, buffer_size=self.chunk)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            super().close()
+            self._request(abi.encode_io_request(op="io_close", obj_id=self._obj.id))
+        finally:
+            if self._own:
+                self._obj.close()
+
+    def _check(self, what: str, allowed: bool) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on closed Go stream")
+        if not allowed:
+            raise io.UnsupportedOperation(what)
+
+    def _request(self, req: bytes) -> Any:
+        client = self._obj._pkg._client  # noqa: SLF001 - internal linkage
+        resp = abi.decode_response(client.call(req))
+        if not resp.ok:
+            from .handle import _raise_call_error
+
+            _raise_call_error(resp.error)
+        return resp.result
+
+    def _raise(self, err: bytes) -> None:
+        from .handle import _raise_call_error
+
+        _raise_call_error(abi.decode_response(err).error)
+
+
+def io_result(*, obj: "GoObject", go_type: str) -> GoRawIO:
+    """Wrap an `io.Reader` / `io.Writer` result handle (`go_type` is its declared type)."""
+    t = go_type.strip()
+    return GoRawIO(obj, readable="Read" in t, writable="Write" in t)
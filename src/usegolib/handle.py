@@ -2,16 +2,30 @@
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
+import os
 import re
+import threading
+from concurrent.futures import Future
 from dataclasses import dataclass, field
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
 from . import abi
-from .artifact import ArtifactManifest
+from .artifact import (
+    ArtifactManifest,
+    library_stamp,
+    read_schema_sidecar,
+    read_verified_sha256,
+    write_schema_sidecar,
+    write_verified_sha256,
+)
 from .errors import (
     ABIDecodeError,
     ABIEncodeError,
+    BusyError,
+    CancelledError,
+    DeadlineExceededError,
     GoError,
     GoPanicError,
     LoadError,
@@ -20,18 +34,36 @@ from .errors import (
     UseGoLibError,
     VersionConflictError,
 )
+from .cache import MISS, ResultCache, SingleFlight, disk_cache_enabled, get_disk_cache
+from .lazy import DEFAULT_CHUNK, lazy_result
+from .columns import pack_columns
+from .ndarray import array_result_type, decode_array, pack_arrays
+from .goio import DEFAULT_CHUNK as DEFAULT_IO_CHUNK
+from .goio import GoRawIO, io_result
+from .reader import close_readers, substitute_readers
+from .stream import STREAM_KEY, GoStream, stream_result
 from .runtime.cbridge import SharedLibClient
 from .schema import (
+    IO_TYPES,
+    OBJECT_MODES,
     Schema,
+    select_result_fields,
+    stream_item_types,
     success_result_types,
     validate_call_args,
     validate_call_result,
     validate_method_args,
     validate_method_result,
     validate_struct_value,
+    validate_value,
 )
 from .runtime.platform import host_goarch, host_goos
 
+if TYPE_CHECKING:
+    from .handle_array import HandleArray
+    from .mapped import MappedFile
+    from .pipeline import Pipeline
+
 
 @dataclass(frozen=True)
 class _Runtime:
@@ -41,7 +73,32 @@ class _Runtime:
     client: SharedLibClient
 
 
+@dataclass(frozen=True)
+class _PendingRuntime:
+    version: str
+    future: Future
+
+
+# Loader registry. `_RUNTIMES_LOCK` guards both dicts; a module is either loaded,
+# being loaded by exactly one thread (pending), or absent.
+_RUNTIMES_LOCK = threading.Lock()
 _LOADED_RUNTIMES: dict[str, _Runtime] = {}
+_PENDING_RUNTIMES: dict[str, _PendingRuntime] = {}
+
+# Guards `GoObject._closed` transitions (shared; closing is rare and cheap).
+_CLOSE_LOCK = threading.Lock()
+
+# Bridge error types reported when a call returns after its context ended.
+_CONTEXT_ERRORS: dict[str, type[GoError]] = {
+    "Cancelled": CancelledError,
+    "DeadlineExceeded": DeadlineExceededError,
+}
+
+# Admission-limit policies: wait in a FIFO queue, or reject immediately with `BusyError`.
+_LIMIT_POLICIES = ("queue", "fail")
+
+# Marker key replacing a `Pin` argument on the wire; the bridge substitutes the pinned value.
+PIN_KEY = "$usegolib_pin"
 
 
 def _loaded_version_for_package(pkg: str) -> str | None:
@@ -49,16 +106,84 @@ def _loaded_version_for_package(pkg: str) -> str | None:
 
     This allows `import_(..., version=None)` for subpackages to follow the already
     loaded module version in the current process, avoiding ambiguity when multiple
-    artifact versions exist on disk.
+    artifact versions exist on disk. Modules that are still being loaded by
+    another thread count as loaded.
     """
+    with _RUNTIMES_LOCK:
+        versions = {mod: rt.version for mod, rt in _LOADED_RUNTIMES.items()}
+        for mod, pending in _PENDING_RUNTIMES.items():
+            versions.setdefault(mod, pending.version)
     best_key = None
-    for mod in _LOADED_RUNTIMES.keys():
+    for mod in versions.keys():
         if pkg == mod or pkg.startswith(mod + "/"):
             if best_key is None or len(mod) > len(best_key):
                 best_key = mod
     if best_key is None:
         return None
-    return _LOADED_RUNTIMES[best_key].version
+    return versions[best_key]
+
+
+def _check_runtime_version(runtime_module: str, loaded: str, wanted: str) -> None:
+    if loaded != wanted:
+        raise VersionConflictError(
+            f"module {runtime_module} already loaded as {loaded}, cannot load {wanted}"
+        )
+
+
+def _acquire_runtime(
+    manifest: ArtifactManifest, *, package: str, dlopen: bool = False
+) -> _Runtime:
+    """Return the process runtime for the module providing `package`, loading it at most once.
+
+    Concurrent callers for the same module join the in-flight load instead of
+    hashing and loading the library again. For bundle artifacts, the load also
+    registers every member module that is not already loaded, so all of them
+    share the bundle's single Go runtime. With `dlopen=True` the shared library
+    is loaded eagerly rather than on the first call.
+    """
+    module, version = manifest.member_for_package(package)
+    with _RUNTIMES_LOCK:
+        existing = _LOADED_RUNTIMES.get(module)
+        pending = _PENDING_RUNTIMES.get(module)
+        if existing is None and pending is None:
+            fut: Future = Future()
+            claimed: dict[str, str] = {module: version}
+            for m, v in manifest.members():
+                if m not in _LOADED_RUNTIMES and m not in _PENDING_RUNTIMES:
+                    claimed.setdefault(m, v)
+            for m, v in claimed.items():
+                _PENDING_RUNTIMES[m] = _PendingRuntime(version=v, future=fut)
+
+    if existing is not None:
+        _check_runtime_version(module, existing.version, version)
+        return existing
+    if pending is not None:
+        _check_runtime_version(module, pending.version, version)
+        return pending.future.result()[module]
+
+    try:
+        _verify_library_sha256(manifest)
+        client = SharedLibClient(manifest.library_path)
+        if dlopen:
+            client._load()  # noqa: SLF001 - internal linkage
+        runtimes = {
+            m: _Runtime(module=m, version=v, abi_version=manifest.abi_version, client=client)
+            for m, v in claimed.items()
+        }
+    except BaseException as e:
+        # Joiners see the same failure; later imports retry from scratch.
+        with _RUNTIMES_LOCK:
+            for m in claimed:
+                _PENDING_RUNTIMES.pop(m, None)
+        fut.set_exception(e)
+        raise
+
+    with _RUNTIMES_LOCK:
+        for m, rt in runtimes.items():
+            _LOADED_RUNTIMES[m] = rt
+            _PENDING_RUNTIMES.pop(m, None)
+    fut.set_result(runtimes)
+    return runtimes[module]
 
 
 def _pack_variadic_args(*, params: list[str], args: list[Any]) -> list[Any]:
@@ -103,14 +228,16 @@ def _decode_success_result(
         return raw
 
     def _one(go_type: str, v: Any) -> Any:
-        type_name = _opaque_ptr_target(schema=schema, pkg=pkg, go_type=go_type)
+        is_io = go_type.strip() in IO_TYPES
+        type_name = "io" if is_io else _opaque_ptr_target(schema=schema, pkg=pkg, go_type=go_type)
         if type_name is None:
             return v
         if v is None:
             return None
         if not isinstance(v, int) or isinstance(v, bool):
             raise ABIDecodeError(f"expected integer object id for opaque pointer result {go_type}")
-        return GoObject(_pkg=pkg_handle, _type=type_name, _id=v)
+        obj = GoObject(_pkg=pkg_handle, _type=type_name, _id=v)
+        return io_result(obj=obj, go_type=go_type) if is_io else obj
 
     if len(value_results) == 1:
         return _one(value_results[0], raw)
@@ -185,28 +312,23 @@ class PackageHandle:
     package: str
     _client: SharedLibClient
     _schema: Schema | None = None
+    # `library.sha256` of the artifact; keys the persistent result cache.
+    _library_sha256: str | None = None
     _var_cache: dict[str, "GoObject"] = field(default_factory=dict, repr=False)
+    _var_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    # fn -> result cache; None marks caching disabled (or impossible) for a pure function.
+    _caches: dict[str, ResultCache | None] = field(default_factory=dict, repr=False, compare=False)
+    _cache_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    # fn -> in-flight call group for functions in single-flight mode (guarded by `_cache_lock`).
+    _flights: dict[str, SingleFlight] = field(default_factory=dict, repr=False, compare=False)
 
     @classmethod
-    def from_manifest(cls, manifest: ArtifactManifest, *, package: str) -> "PackageHandle":
-        existing = _LOADED_RUNTIMES.get(manifest.module)
-        if existing is not None and existing.version != manifest.version:
-            raise VersionConflictError(
-                f"module {manifest.module} already loaded as {existing.version}, "
-                f"cannot load {manifest.version}"
-            )
-
-        if existing is None:
-            _verify_library_sha256(manifest)
-            existing = _Runtime(
-                module=manifest.module,
-                version=manifest.version,
-                abi_version=manifest.abi_version,
-                client=SharedLibClient(manifest.library_path),
-            )
-            _LOADED_RUNTIMES[manifest.module] = existing
+    def from_manifest(
+        cls, manifest: ArtifactManifest, *, package: str, dlopen: bool = False
+    ) -> "PackageHandle":
+        existing = _acquire_runtime(manifest, package=package, dlopen=dlopen)
 
-        schema = Schema.from_manifest(manifest.schema)
+        schema = _load_schema(manifest)
         return cls(
             module=existing.module,
             version=existing.version,
@@ -214,8 +336,39 @@ class PackageHandle:
             package=package,
             _client=existing.client,
             _schema=schema,
+            _library_sha256=manifest.library_sha256,
         )
 
+    def _getvar(self, name: str, vt: str) -> "GoObject":
+        # Called with `_var_lock` held so concurrent first accesses share one handle.
+        existing = self._var_cache.get(name)
+        if existing is not None:
+            return existing
+
+        fn = f"__usegolib_getvar_{name}"
+        try:
+            req = abi.encode_call_request(pkg=self.package, fn=fn, args=[])
+        except Exception as e:  # noqa: BLE001 - encode boundary
+            raise ABIEncodeError(str(e)) from e
+
+        resp_bytes = self._client.call(req)
+        resp = abi.decode_response(resp_bytes)
+        if resp.ok:
+            if not isinstance(resp.result, int) or isinstance(resp.result, bool):
+                raise ABIDecodeError("getvar: expected integer object id")
+            obj = GoObject(_pkg=self, _type=vt, _id=resp.result)
+            self._var_cache[name] = obj
+            return obj
+
+        err = resp.error
+        if err is None:
+            raise ABIDecodeError("missing error object in failed response")
+        if err.type == "GoError":
+            raise GoError(err.message)
+        if err.type == "GoPanicError":
+            raise GoPanicError(err.message)
+        raise UseGoLibError(f"{err.type}: {err.message}")
+
     def __getattr__(self, name: str) -> Callable[..., Any]:
         # Exported package variables can be used as namespace singletons (e.g. isr.DL.Of()).
         # When schema declares a var, resolve it to an object handle so methods can be called.
@@ -225,37 +378,29 @@ class PackageHandle:
                 existing = self._var_cache.get(name)
                 if existing is not None:
                     return existing
-
-                fn = f"__usegolib_getvar_{name}"
-                try:
-                    req = abi.encode_call_request(pkg=self.package, fn=fn, args=[])
-                except Exception as e:  # noqa: BLE001 - encode boundary
-                    raise ABIEncodeError(str(e)) from e
-
-                resp_bytes = self._client.call(req)
-                resp = abi.decode_response(resp_bytes)
-                if resp.ok:
-                    if not isinstance(resp.result, int) or isinstance(resp.result, bool):
-                        raise ABIDecodeError("getvar: expected integer object id")
-                    obj = GoObject(_pkg=self, _type=vt, _id=resp.result)
-                    self._var_cache[name] = obj
-                    return obj
-
-                err = resp.error
-                if err is None:
-                    raise ABIDecodeError("missing error object in failed response")
-                if err.type == "GoError":
-                    raise GoError(err.message)
-                if err.type == "GoPanicError":
-                    raise GoPanicError(err.message)
-                raise UseGoLibError(f"{err.type}: {err.message}")
+                with self._var_lock:
+                    return self._getvar(name, vt)
 
         # Treat any missing attribute as a Go function call.
-        def _call(*args: Any) -> Any:
+        def _invoke(
+            args: tuple[Any, ...],
+            *,
+            timeout: float | None,
+            cancel: "CancelToken | None",
+            select: list[str] | None = None,
+            lazy: int | None = None,
+            packed: tuple[str, int] | None = None,
+        ) -> Any:
+            timeout_ns, cancel_id = _call_options(self._client, timeout=timeout, cancel=cancel)
             args_list = list(args)
             sig_results: list[str] | None = None
+            cache: ResultCache | None = None
+            cache_key: bytes | None = None
+            pinned: frozenset[int] = frozenset()
+            readers: list[Any] = []
             if self._schema is not None:
                 sig = self._schema.symbols_by_pkg.get(self.package, {}).get(name)
+                params: list[str] | None = None
                 if sig is not None:
                     params, _results = sig
                     args_list = _pack_variadic_args(params=params, args=args_list)
@@ -267,46 +412,154 @@ class PackageHandle:
                 args_list = [
                     encode_value(schema=self._schema, pkg=self.package, v=a) for a in args_list
                 ]
-                validate_call_args(schema=self._schema, pkg=self.package, fn=name, args=args_list)
+                args_list, pinned = _substitute_pins(client=self._client, params=params, args=args_list)
+                args_list, reader_args, readers = substitute_readers(
+                    client=self._client, params=params, args=args_list
+                )
+                args_list, array_args = pack_arrays(params=params, args=args_list)
+                args_list, column_args = pack_columns(
+                    schema=self._schema, pkg=self.package, params=params, args=args_list
+                )
+                # Projections, lazy/packed results, streams and reader inputs are not cached: the key does not cover
+                # them. Nor are pinned args: pin ids are local to one Go runtime, but the disk tier is shared.
+                plain = (
+                    select is None
+                    and lazy is None
+                    and packed is None
+                    and _stream_items(sig_results) is None
+                    and not reader_args
+                    and not pinned
+                )
+                cache = self._result_cache(name) if plain else None
+                if cache is not None:
+                    try:
+                        cache_key = abi.pack_args(args_list)
+                    except Exception as e:  # noqa: BLE001 - encode boundary
+                        raise ABIEncodeError(str(e)) from e
+                    hit = cache.get(cache_key)
+                    if hit is not MISS:
+                        return hit
+                validate_call_args(
+                    schema=self._schema,
+                    pkg=self.package,
+                    fn=name,
+                    args=args_list,
+                    skip=pinned | reader_args | array_args | column_args,
+                )
+            else:
+                args_list, pinned = _substitute_pins(client=self._client, params=None, args=args_list)
             try:
-                req = abi.encode_call_request(pkg=self.package, fn=name, args=args_list)
+                req = abi.encode_call_request(
+                    pkg=self.package,
+                    fn=name,
+                    args=args_list,
+                    timeout_ns=timeout_ns,
+                    cancel=cancel_id,
+                    select=select,
+                    lazy=lazy is not None,
+                    packed=packed is not None,
+                )
             except Exception as e:  # noqa: BLE001 - encode boundary
                 raise ABIEncodeError(str(e)) from e
 
-            resp_bytes = self._client.call(req)
+            streaming = _stream_items(sig_results) is not None
+            resp_bytes: bytes | None = None
+            disk_key: bytes | None = None
+            if cache is not None and cache.disk is not None and cache_key is not None:
+                disk_key = f"{self.package}:{name}".encode() + b"\0" + cache_key
+                resp_bytes = cache.disk.get(self._library_sha256 or "", disk_key, ttl=cache.ttl)
+            from_disk = resp_bytes is not None
+            if resp_bytes is None:
+                # Lazy results, streams and reader inputs belong to one caller, so they are never shared.
+                owned = lazy is not None or streaming or readers
+                flight = self._flights.get(name) if not owned else None
+                try:
+                    with _pins_in_use(args):
+                        if flight is not None:
+                            # Share the raw response; every waiter decodes its own result objects.
+                            resp_bytes = flight.do(req, lambda: self._client.call(req))
+                        else:
+                            resp_bytes = self._client.call(req)
+                finally:
+                    close_readers(readers)
             resp = abi.decode_response(resp_bytes)
             if resp.ok:
+                if lazy is not None:
+                    return _lazy_result(pkg_handle=self, sig=sig_results, raw=resp.result, chunk=lazy)
+                if packed is not None:
+                    return decode_array(resp.result, dtype=packed[0], ndim=packed[1])
+                if streaming or _is_stream_ref(resp.result):
+                    return _stream_result(pkg_handle=self, sig=sig_results, raw=resp.result)
+                result = resp.result
                 if self._schema is not None:
                     validate_call_result(
                         schema=self._schema,
                         pkg=self.package,
                         fn=name,
                         result=resp.result,
+                        partial=select is not None,
                     )
                     if sig_results is not None:
-                        return _decode_success_result(
+                        result = _decode_success_result(
                             schema=self._schema,
                             pkg=self.package,
                             results=sig_results,
                             raw=resp.result,
                             pkg_handle=self,
                         )
-                return resp.result
-
-            err = resp.error
-            if err is None:
-                raise ABIDecodeError("missing error object in failed response")
+                if cache is not None and cache_key is not None:
+                    cache.put(cache_key, result, size=len(resp_bytes))
+                    if disk_key is not None and not from_disk:
+                        cache.disk.put(self._library_sha256 or "", disk_key, resp_bytes)
+                return result
 
-            if err.type == "GoError":
-                raise GoError(err.message)
-            if err.type == "GoPanicError":
-                raise GoPanicError(err.message)
-            if err.type == "UnsupportedTypeError":
-                raise UnsupportedTypeError(err.message)
-            if err.type == "UnsupportedSignatureError":
-                raise UnsupportedSignatureError(err.message)
-
-            raise UseGoLibError(f"{err.type}: {err.message}")
+            _raise_call_error(resp.error)
+
+        def _call(*args: Any, timeout: float | None = None, cancel: "CancelToken | None" = None) -> Any:
+            return _invoke(args, timeout=timeout, cancel=cancel, select=None)
+
+        def _select(*paths: str) -> Callable[..., Any]:
+            """Return this function with Go encoding only the given result fields (e.g. "Meta.Tag")."""
+            sig = self._schema.symbols_by_pkg.get(self.package, {}).get(name) if self._schema is not None else None
+            keys = _select_keys(schema=self._schema, pkg=self.package, sig=sig, paths=paths)
+
+            def _projected(*args: Any, timeout: float | None = None, cancel: "CancelToken | None" = None) -> Any:
+                return _invoke(args, timeout=timeout, cancel=cancel, select=keys)
+
+            _projected.__doc__ = _call.__doc__
+            return _projected
+
+        def _lazy(
+            *args: Any, chunk: int = DEFAULT_CHUNK, timeout: float | None = None, cancel: "CancelToken | None" = None
+        ) -> Any:
+            """Call the function but keep its slice/map result Go-side; return a GoSequence/GoMapping."""
+            sig = self._schema.symbols_by_pkg.get(self.package, {}).get(name) if self._schema is not None else None
+            _lazy_element_type(schema=self._schema, pkg=self.package, sig=sig, chunk=chunk)
+            return _invoke(args, timeout=timeout, cancel=cancel, lazy=chunk)
+
+        def _numpy(*args: Any, timeout: float | None = None, cancel: "CancelToken | None" = None) -> Any:
+            """Call the function and return its numeric slice result as a NumPy array."""
+            sig = self._schema.symbols_by_pkg.get(self.package, {}).get(name) if self._schema is not None else None
+            nd = array_result_type(sig[1] if sig is not None else None)
+            return _invoke(args, timeout=timeout, cancel=cancel, packed=nd)
+
+        def _arrow(*args: Any, timeout: float | None = None, cancel: "CancelToken | None" = None) -> Any:
+            """Call the function and return its record slice result as a `pyarrow.RecordBatch`."""
+            sig = self._schema.symbols_by_pkg.get(self.package, {}).get(name) if self._schema is not None else None
+            _record_slice_type(schema=self._schema, pkg=self.package, sig=sig)
+            return _export_records(_invoke(args, timeout=timeout, cancel=cancel, lazy=DEFAULT_CHUNK), columns=False)
+
+        def _columns(*args: Any, timeout: float | None = None, cancel: "CancelToken | None" = None) -> Any:
+            """Call the function and return its record slice result as a dict of NumPy columns."""
+            sig = self._schema.symbols_by_pkg.get(self.package, {}).get(name) if self._schema is not None else None
+            _record_slice_type(schema=self._schema, pkg=self.package, sig=sig)
+            return _export_records(_invoke(args, timeout=timeout, cancel=cancel, lazy=DEFAULT_CHUNK), columns=True)
+
+        _call.select = _select  # type: ignore[attr-defined]
+        _call.lazy = _lazy  # type: ignore[attr-defined]
+        _call.numpy = _numpy  # type: ignore[attr-defined]
+        _call.arrow = _arrow  # type: ignore[attr-defined]
+        _call.columns = _columns  # type: ignore[attr-defined]
 
         if self._schema is not None:
             doc = self._schema.symbol_docs_by_pkg.get(self.package, {}).get(name)
@@ -326,6 +579,290 @@ class PackageHandle:
     def typed(self) -> "TypedPackageHandle":
         return TypedPackageHandle(self)
 
+    def pipeline(self) -> "Pipeline":
+        """Start a pipeline: dependent calls that run Go-side in one request.
+
+        Steps return symbolic `Ref`s that later steps can use as arguments or
+        method targets; `run()` executes the whole chain and returns only the
+        requested results (intermediate object handles are released Go-side).
+        """
+        if self._schema is None:
+            raise UseGoLibError("pipeline() requires manifest schema")
+        from .pipeline import Pipeline
+
+        return Pipeline(self)
+
+    def cancel_token(self) -> "CancelToken":
+        """Create a token that cancels the `context.Context` of calls passed `cancel=token`.
+
+        `token.cancel()` may be called from any thread, including while a call using
+        it is running. Tokens belong to this handle's Go runtime.
+        """
+        try:
+            req = abi.encode_cancel_request(op="cancel_new")
+        except Exception as e:  # noqa: BLE001 - encode boundary
+            raise ABIEncodeError(str(e)) from e
+        resp = abi.decode_response(self._client.call(req))
+        if not resp.ok:
+            err = resp.error
+            if err is None:
+                raise ABIDecodeError("missing error object in failed response")
+            raise UseGoLibError(f"{err.type}: {err.message}")
+        if not isinstance(resp.result, int) or isinstance(resp.result, bool):
+            raise ABIDecodeError("cancel_new: expected integer token id")
+        return CancelToken(_client=self._client, _id=resp.result)
+
+    def pin(self, value: Any, *, go_type: str | None = None) -> "Pin":
+        """Upload `value` once; pass the returned `Pin` in its place to skip re-encoding.
+
+        The bridge converts the pinned value at most once per parameter type and
+        reuses the Go value for every call, so Go code must not modify it. With
+        `go_type` the value is validated against the schema when pinned, and calls
+        passing the pin to a parameter of another type are rejected. Pins can be
+        passed as whole arguments (not nested inside other values); release them
+        with `pin.close()`, `h.unpin(pin)` or a `with` block.
+        """
+        if self._schema is not None:
+            from .typed import encode_value
+
+            value = encode_value(schema=self._schema, pkg=self.package, v=value)
+            if go_type is not None:
+                validate_value(schema=self._schema, pkg=self.package, go_type=go_type, value=value)
+        try:
+            req = abi.encode_pin_request(op="pin_new", value=value)
+        except Exception as e:  # noqa: BLE001 - encode boundary
+            raise ABIEncodeError(str(e)) from e
+        resp = abi.decode_response(self._client.call(req))
+        if not resp.ok:
+            _raise_call_error(resp.error)
+        if not isinstance(resp.result, int) or isinstance(resp.result, bool):
+            raise ABIDecodeError("pin_new: expected integer pin id")
+        return Pin(_client=self._client, _id=resp.result, go_type=go_type)
+
+    def unpin(self, pin: "Pin") -> None:
+        """Release a pinned value (same as `pin.close()`)."""
+        pin.close()
+
+    def map_file(self, path: str | os.PathLike[str], dtype: Any | None = None) -> "MappedFile":
+        """Memory-map a file and pin it as a `[]T` argument that Go reads in place.
+
+        `path` is a `.npy` file (little-endian numbers, C order; its dtype is used)
+        or a raw little-endian array of `dtype` (`"float64"`, `"int32"`, `"byte"`, ...).
+        The result is passed like a `Pin` to parameters of that slice type; worker
+        processes mapping the same file share its pages. See `MappedFile` for the
+        lifetime rules.
+        """
+        from .mapped import MappedFile
+
+        if not isinstance(self._client, SharedLibClient):
+            # The address is only meaningful inside this process.
+            raise UnsupportedTypeError("map_file needs the in-process library client")
+        return MappedFile(self._client, path, dtype)
+
+    def cache(
+        self,
+        name: str,
+        *,
+        maxsize: int = 1024,
+        maxbytes: int | None = None,
+        ttl: float | None = None,
+        disk: bool = False,
+    ) -> ResultCache | None:
+        """Cache successful results of the pure Go function `name` on this handle.
+
+        Calls with byte-identical packed arguments are answered from an LRU cache
+        without crossing into Go; cached values are shared between hits, so treat
+        them as read-only. `maxbytes` bounds the total key and response size, and
+        `ttl` (seconds) expires entries. `maxsize=0` disables caching, including
+        for functions annotated pure at build time. Functions returning object
+        handles cannot be cached.
+
+        With `disk=True`, memory misses fall back to a persistent SQLite cache
+        shared by all processes (keyed by the artifact's `library.sha256`, so a
+        rebuilt artifact starts cold). Set `USEGOLIB_DISK_CACHE=1` to enable it
+        for pure-annotated functions.
+        """
+        if self._schema is None:
+            raise UseGoLibError("cache() requires manifest schema")
+        if name not in self._schema.symbols_by_pkg.get(self.package, {}):
+            raise UseGoLibError(f"symbol not found: {self.package}.{name}")
+        if maxsize == 0:
+            with self._cache_lock:
+                self._caches[name] = None
+            return None
+        if self._returns_handles(name):
+            raise UseGoLibError(f"cannot cache {self.package}.{name}: it returns object handles")
+        if disk and not self._library_sha256:
+            raise UseGoLibError("disk cache requires an artifact with library.sha256")
+        cache = ResultCache(maxsize=maxsize, maxbytes=maxbytes, ttl=ttl, disk=get_disk_cache() if disk else None)
+        with self._cache_lock:
+            self._caches[name] = cache
+        return cache
+
+    def cache_stats(self) -> dict[str, dict[str, Any]]:
+        """Return hit/miss/eviction stats for every active result cache, by function name."""
+        with self._cache_lock:
+            caches = dict(self._caches)
+        return {name: c.stats() for name, c in caches.items() if c is not None}
+
+    def single_flight(self, name: str, enabled: bool = True) -> None:
+        """Deduplicate concurrent identical calls of the Go function `name`.
+
+        While a call is in flight, other threads making a call with byte-identical
+        encoded request (same arguments, `timeout=` and `cancel=`) wait for it and
+        receive its outcome instead of entering Go themselves. Functions returning
+        object handles are not supported (each caller must own its handle).
+        """
+        if self._schema is not None:
+            if name not in self._schema.symbols_by_pkg.get(self.package, {}):
+                raise UseGoLibError(f"symbol not found: {self.package}.{name}")
+            if enabled and self._returns_handles(name):
+                raise UseGoLibError(f"cannot single-flight {self.package}.{name}: it returns object handles")
+        with self._cache_lock:
+            if not enabled:
+                self._flights.pop(name, None)
+            elif name not in self._flights:
+                self._flights[name] = SingleFlight()
+
+    def single_flight_stats(self) -> dict[str, dict[str, Any]]:
+        """Return executed (`calls`) and deduplicated (`shared`) call counts by function name."""
+        with self._cache_lock:
+            flights = dict(self._flights)
+        return {name: f.stats() for name, f in flights.items()}
+
+    def _result_cache(self, name: str) -> ResultCache | None:
+        try:
+            return self._caches[name]
+        except KeyError:
+            pass
+        schema = self._schema
+        if schema is None or name not in schema.pure_symbols_by_pkg.get(self.package, set()):
+            return None
+        with self._cache_lock:
+            if name not in self._caches:
+                if self._returns_handles(name):
+                    self._caches[name] = None
+                else:
+                    disk = get_disk_cache() if self._library_sha256 and disk_cache_enabled() else None
+                    self._caches[name] = ResultCache(disk=disk)
+            return self._caches[name]
+
+    def _returns_handles(self, name: str) -> bool:
+        schema = self._schema
+        assert schema is not None
+        sig = schema.symbols_by_pkg.get(self.package, {}).get(name)
+        if sig is None:
+            return False
+        return any(
+            _opaque_ptr_target(schema=schema, pkg=self.package, go_type=t) is not None
+            for t in success_result_types(sig[1])
+        )
+
+    def coalesce(self, *, enabled: bool = True, max_delay: float = 0.0002, max_batch: int = 32) -> None:
+        """Coalesce concurrent calls from many threads into batched Go crossings.
+
+        Applies to every request of this handle's Go runtime. Under load, a call
+        waits up to `max_delay` seconds for up to `max_batch` calls in total and
+        they enter Go as one batch; when Go is idle calls are sent immediately.
+        Calls of a batch return together, so keep long-running calls out of hot
+        paths that use coalescing.
+        """
+        self._client.set_coalescing(enabled=enabled, max_delay=max_delay, max_batch=max_batch)
+
+    def coalesce_stats(self) -> dict[str, Any] | None:
+        """Return batch metrics (`batches`, `requests`, `mean_batch_size`, `batch_sizes`, ...), or None when off."""
+        return self._client.coalescing_stats()
+
+    def set_limit(
+        self,
+        symbol: str | None = None,
+        *,
+        max_concurrency: int | None = None,
+        weight: int = 1,
+        policy: str = "queue",
+        queue_timeout: float | None = None,
+    ) -> None:
+        """Configure a Go-side admission limit for this handle's Go runtime.
+
+        With `symbol=None` the limit is global; otherwise it applies to the function
+        `"Fn"` or method `"Type.Method"` of this package. `max_concurrency=None`
+        removes the limit. `weight` is how many global slots each call of `symbol`
+        takes. When a limit is reached, `policy="queue"` waits (up to `queue_timeout`
+        seconds, or the call's own `timeout=`/`cancel=`) and `policy="fail"` raises
+        `BusyError` immediately.
+        """
+        if policy not in _LIMIT_POLICIES:
+            raise ValueError(f"invalid limit policy {policy!r} (expected one of {', '.join(_LIMIT_POLICIES)})")
+        if max_concurrency is not None and (
+            isinstance(max_concurrency, bool) or not isinstance(max_concurrency, int) or max_concurrency < 1
+        ):
+            raise ValueError("max_concurrency must be a positive integer or None")
+        if isinstance(weight, bool) or not isinstance(weight, int) or weight < 1:
+            raise ValueError("weight must be a positive integer")
+        if symbol is None and weight != 1:
+            raise ValueError("weight applies to symbol limits only")
+        if queue_timeout is not None and (
+            isinstance(queue_timeout, bool) or not isinstance(queue_timeout, (int, float)) or queue_timeout <= 0
+        ):
+            raise ValueError("queue_timeout must be a positive number of seconds or None")
+        key = None if symbol is None else self._limit_key(symbol)
+        limit = {
+            "max": max_concurrency or 0,
+            "weight": weight,
+            "policy": policy,
+            "queue_timeout_ns": 0 if queue_timeout is None else max(1, int(queue_timeout * 1_000_000_000)),
+        }
+        self._limits_op(abi.encode_limits_request(op="limits_set", key=key, limit=limit))
+
+    def limit_stats(self) -> dict[str, Any]:
+        """Return admission metrics: `{"global": stats | None, "symbols": {name: stats}}`.
+
+        Symbol names follow `set_limit()` and are limited to this package. Each stats
+        dict holds the configuration plus `in_use`, `waiting` (current queue depth),
+        `max_waiting`, `admitted`, `rejected`, `timed_out`, `wait_ns_total` and
+        `wait_ns_max`.
+        """
+        raw = self._limits_op(abi.encode_limits_request(op="limits_stats"))
+        if not isinstance(raw, dict):
+            raise ABIDecodeError("limits_stats: expected map result")
+        symbols: dict[str, Any] = {}
+        for key, st in (raw.get("symbols") or {}).items():
+            name = self._limit_name(key)
+            if name is not None:
+                symbols[name] = st
+        return {"global": raw.get("global"), "symbols": symbols}
+
+    def _limit_key(self, symbol: str) -> str:
+        if not isinstance(symbol, str) or not symbol:
+            raise ValueError("symbol must be a non-empty string")
+        recv, sep, method = symbol.partition(".")
+        schema = self._schema
+        if sep:
+            if schema is not None and method not in schema.methods_by_pkg.get(self.package, {}).get(recv, {}):
+                raise UseGoLibError(f"method not found: {self.package}.{symbol}")
+            return f"{self.package}.{recv}:{method}"
+        if schema is not None and symbol not in schema.symbols_by_pkg.get(self.package, {}):
+            raise UseGoLibError(f"symbol not found: {self.package}.{symbol}")
+        return f"{self.package}:{symbol}"
+
+    def _limit_name(self, key: str) -> str | None:
+        if key.startswith(self.package + ":"):
+            return key[len(self.package) + 1 :]
+        if key.startswith(self.package + "."):
+            recv, sep, method = key[len(self.package) + 1 :].partition(":")
+            if sep and "/" not in recv and "." not in recv:
+                return f"{recv}.{method}"
+        return None
+
+    def _limits_op(self, req: bytes) -> Any:
+        resp = abi.decode_response(self._client.call(req))
+        if resp.ok:
+            return resp.result
+        err = resp.error
+        if err is None:
+            raise ABIDecodeError("missing error object in failed response")
+        raise UseGoLibError(f"{err.type}: {err.message}")
+
     def generic(self, name: str, type_args: list[str]) -> Callable[..., Any]:
         if self._schema is None:
             raise UseGoLibError("generic() requires manifest schema")
@@ -338,14 +875,23 @@ class PackageHandle:
             raise UseGoLibError(f"generic instantiation not found: {self.package}.{name}{type_args!r}")
         return getattr(self, sym)
 
-    def object(self, type_name: str, init: Any | None = None) -> "GoObject":
+    def object(self, type_name: str, init: Any | None = None, *, mode: str | None = None) -> "GoObject":
+        """Create a Go object handle of `type_name`.
+
+        `mode` selects how concurrent method calls on this handle are synchronized
+        Go-side: "exclusive" (one call at a time), "rwlock" (methods declared
+        read-only run concurrently, others exclusively) or "unsafe" (no locking).
+        By default the type's build-time annotation applies, else "unsafe".
+        """
+        if mode is not None and mode not in OBJECT_MODES:
+            raise ValueError(f"invalid object mode {mode!r} (expected one of {', '.join(OBJECT_MODES)})")
         if self._schema is not None and init is not None:
             from .typed import encode_value
 
             init = encode_value(schema=self._schema, pkg=self.package, v=init)
             validate_struct_value(schema=self._schema, pkg=self.package, struct=type_name, value=init)
         try:
-            req = abi.encode_obj_new_request(pkg=self.package, type_name=type_name, init=init)
+            req = abi.encode_obj_new_request(pkg=self.package, type_name=type_name, init=init, mode=mode)
         except Exception as e:  # noqa: BLE001 - encode boundary
             raise ABIEncodeError(str(e)) from e
 
@@ -369,6 +915,319 @@ class PackageHandle:
             raise UnsupportedSignatureError(err.message)
         raise UseGoLibError(f"{err.type}: {err.message}")
 
+    def objects(self, type_name: str, inits: Any, *, mode: str | None = None) -> "HandleArray":
+        """Create many objects of `type_name` in one request.
+
+        `inits` is a count (zero-valued objects) or an iterable of init values
+        (`None` for a zero value). Returns a `HandleArray`.
+        """
+        from .handle_array import HandleArray, ids_from_bytes
+
+        if mode is not None and mode not in OBJECT_MODES:
+            raise ValueError(f"invalid object mode {mode!r} (expected one of {', '.join(OBJECT_MODES)})")
+        if isinstance(inits, int) and not isinstance(inits, bool):
+            if inits < 0:
+                raise ValueError("object count must be non-negative")
+            init_list: list[Any] = [None] * inits
+        else:
+            init_list = list(inits)
+        if self._schema is not None:
+            from .typed import encode_value
+
+            for i, init in enumerate(init_list):
+                if init is None:
+                    continue
+                init = encode_value(schema=self._schema, pkg=self.package, v=init)
+                validate_struct_value(schema=self._schema, pkg=self.package, struct=type_name, value=init)
+                init_list[i] = init
+        try:
+            req = abi.encode_obj_new_many_request(pkg=self.package, type_name=type_name, inits=init_list, mode=mode)
+        except Exception as e:  # noqa: BLE001 - encode boundary
+            raise ABIEncodeError(str(e)) from e
+        resp = abi.decode_response(self._client.call(req))
+        if not resp.ok:
+            _raise_call_error(resp.error)
+        if not isinstance(resp.result, bytes):
+            raise ABIDecodeError("obj_new_many: expected packed object ids")
+        ids = ids_from_bytes(resp.result)
+        if len(ids) != len(init_list):
+            raise ABIDecodeError("obj_new_many: wrong number of object ids")
+        return HandleArray(self, type_name, ids)
+
+
+def _select_keys(
+    *, schema: Schema | None, pkg: str, sig: tuple[list[str], list[str]] | None, paths: tuple[str, ...]
+) -> list[str]:
+    """Validate `.select()` field paths against the schema (when known)."""
+    if schema is None or sig is None:
+        if not paths or not all(isinstance(p, str) and p for p in paths):
+            raise UnsupportedTypeError("select: expected one or more field paths")
+        return list(dict.fromkeys(paths))
+    _params, results = sig
+    return select_result_fields(schema=schema, pkg=pkg, results=results, paths=paths)
+
+
+def _lazy_element_type(
+    *, schema: Schema | None, pkg: str, sig: tuple[list[str], list[str]] | None, chunk: int
+) -> str | None:
+    """Check that a `.lazy()` call returns one slice or `map[string]T`; return the element type."""
+    if isinstance(chunk, bool) or not isinstance(chunk, int) or chunk < 1:
+        raise ValueError("chunk must be a positive integer")
+    if schema is None or sig is None:
+        return None
+    value_results = success_result_types(sig[1])
+    t = value_results[0].strip() if len(value_results) == 1 else ""
+    if t.startswith("[]") and t != "[]byte":
+        elem = t[2:].strip()
+    elif t.startswith("map[string]"):
+        elem = t[len("map[string]") :].strip()
+    else:
+        raise UnsupportedTypeError(f"lazy: results {sig[1]!r} are not a single slice or map[string]T")
+    if _opaque_ptr_target(schema=schema, pkg=pkg, go_type=elem) is not None:
+        raise UnsupportedTypeError(f"lazy: elements of type {elem} are object handles")
+    return elem
+
+
+def _record_slice_type(*, schema: Schema | None, pkg: str, sig: tuple[list[str], list[str]] | None) -> None:
+    """Check that an `.arrow()` / `.columns()` call returns one slice of record structs."""
+    elem = _lazy_element_type(schema=schema, pkg=pkg, sig=sig, chunk=DEFAULT_CHUNK)
+    if elem is None or schema is None or sig is None:
+        return
+    st = schema.structs_by_pkg.get(pkg, {}).get(elem.removeprefix("*").strip())
+    if not success_result_types(sig[1])[0].strip().startswith("[]") or st is None or not st.fields_by_name:
+        raise UnsupportedTypeError(f"arrow: results {sig[1]!r} are not a single slice of record structs")
+
+
+def _export_records(value: Any, *, columns: bool) -> Any:
+    """Export a lazy record slice (then free it) as a RecordBatch or a dict of columns."""
+    if value is None:
+        return None
+    from .arrow import to_columns, to_pyarrow
+
+    try:
+        return to_columns(value) if columns else to_pyarrow(value)
+    finally:
+        value.close()
+
+
+def _lazy_result(*, pkg_handle: "PackageHandle", sig: list[str] | None, raw: Any, chunk: int) -> Any:
+    schema = pkg_handle._schema  # noqa: SLF001 - internal linkage
+    elem = None
+    if schema is not None and sig is not None:
+        elem = _lazy_element_type(schema=schema, pkg=pkg_handle.package, sig=([], sig), chunk=chunk)
+
+    def _decode(v: Any) -> Any:
+        if elem is not None:
+            validate_value(schema=schema, pkg=pkg_handle.package, go_type=elem, value=v)
+        return v
+
+    return lazy_result(pkg=pkg_handle, raw=raw, chunk=chunk, decode=_decode)
+
+
+def _stream_items(sig_results: list[str] | None) -> list[str] | None:
+    """Item types when the (single) value result is a channel or iterator."""
+    if sig_results is None:
+        return None
+    value_results = success_result_types(sig_results)
+    return stream_item_types(value_results[0]) if len(value_results) == 1 else None
+
+
+def _is_stream_ref(raw: Any) -> bool:
+    return isinstance(raw, dict) and len(raw) == 1 and isinstance(raw.get(STREAM_KEY), int)
+
+
+def _stream_result(*, pkg_handle: "PackageHandle", sig: list[str] | None, raw: Any) -> GoStream | None:
+    schema = pkg_handle._schema  # noqa: SLF001 - internal linkage
+    items = _stream_items(sig)
+
+    def _decode(v: Any) -> Any:
+        if items is None:
+            return v
+        pair = len(items) == 2
+        if pair and (not isinstance(v, list) or len(v) != 2):
+            raise ABIDecodeError("stream_next: expected [key, value] pairs")
+        values = v if pair else [v]
+        if schema is not None:
+            for t, x in zip(items, values, strict=True):
+                validate_value(schema=schema, pkg=pkg_handle.package, go_type=t, value=x)
+        return tuple(values) if pair else v
+
+    return stream_result(pkg=pkg_handle, raw=raw, decode=_decode)
+
+
+def _raise_call_error(err: abi.ABIError | None) -> None:
+    """Raise the Python exception for a failed call/obj_call/pipeline response."""
+    if err is None:
+        raise ABIDecodeError("missing error object in failed response")
+    if err.type in _CONTEXT_ERRORS:
+        raise _CONTEXT_ERRORS[err.type](err.message)
+    if err.type == "Busy":
+        raise BusyError(err.message)
+    if err.type == "GoError":
+        raise GoError(err.message)
+    if err.type == "GoPanicError":
+        raise GoPanicError(err.message)
+    if err.type == "UnsupportedTypeError":
+        raise UnsupportedTypeError(err.message)
+    if err.type == "UnsupportedSignatureError":
+        raise UnsupportedSignatureError(err.message)
+    raise UseGoLibError(f"{err.type}: {err.message}")
+
+
+def _call_options(
+    client: SharedLibClient, *, timeout: float | None, cancel: "CancelToken | None"
+) -> tuple[int | None, int | None]:
+    """Validate per-call `timeout=`/`cancel=` options and convert them to ABI fields."""
+    timeout_ns: int | None = None
+    if timeout is not None:
+        if isinstance(timeout, bool) or not isinstance(timeout, (int, float)):
+            raise TypeError("timeout must be a number of seconds")
+        # Zero/negative timeouts mean "already expired"; 0 would mean "no timeout" on the wire.
+        timeout_ns = max(1, int(timeout * 1_000_000_000))
+    cancel_id: int | None = None
+    if cancel is not None:
+        if not isinstance(cancel, CancelToken):
+            raise TypeError("cancel must be a CancelToken")
+        if cancel._closed:  # noqa: SLF001 - internal linkage
+            raise UseGoLibError("cancel token is closed")
+        if cancel._client is not client:  # noqa: SLF001 - internal linkage
+            raise UseGoLibError("cancel token belongs to a different Go runtime")
+        cancel_id = cancel.id
+    return timeout_ns, cancel_id
+
+
+@dataclass
+class CancelToken:
+    """Go-side cancellation source for calls to functions taking `context.Context`."""
+
+    _client: SharedLibClient
+    _id: int
+    _closed: bool = False
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    def cancel(self) -> None:
+        """Cancel every current and future call made with this token."""
+        if self._closed:
+            return
+        self._client.call(abi.encode_cancel_request(op="cancel", token_id=self._id))
+
+    def close(self) -> None:
+        """Cancel and release the token."""
+        with _CLOSE_LOCK:
+            if self._closed:
+                return
+            self._closed = True
+        try:
+            self._client.call(abi.encode_cancel_request(op="cancel_free", token_id=self._id))
+        except Exception:
+            return
+
+    def __enter__(self) -> "CancelToken":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        self.close()
+
+    def __del__(self) -> None:
+        # Best-effort cleanup; ignore errors at interpreter shutdown.
+        try:
+            self.close()
+        except Exception:
+            return
+
+
+@dataclass
+class Pin:
+    """Argument value stored Go-side by `PackageHandle.pin()`."""
+
+    _client: SharedLibClient
+    _id: int
+    go_type: str | None = None
+    _closed: bool = False
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    def close(self) -> None:
+        """Release the pinned value; later calls passing this pin fail."""
+        with _CLOSE_LOCK:
+            if self._closed:
+                return
+            self._closed = True
+        try:
+            self._client.call(abi.encode_pin_request(op="pin_free", pin_id=self._id))
+        except Exception:
+            return
+
+    def _accepts(self, go_type: str) -> bool:
+        return self.go_type is None or _param_type(self.go_type) == _param_type(go_type)
+
+    def _acquire(self) -> None:
+        """Mark the pin as used by a running call (see `_pins_in_use`)."""
+
+    def _release(self) -> None:
+        """End a use started by `_acquire`."""
+
+    def __enter__(self) -> "Pin":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        self.close()
+
+    def __del__(self) -> None:
+        # Best-effort cleanup; ignore errors at interpreter shutdown.
+        try:
+            self.close()
+        except Exception:
+            return
+
+
+def _param_type(t: str) -> str:
+    t = t.strip()
+    return "[]" + t[3:].strip() if t.startswith("...") else t
+
+
+def _substitute_pins(
+    *, client: SharedLibClient, params: list[str] | None, args: list[Any]
+) -> tuple[list[Any], frozenset[int]]:
+    """Replace `Pin` arguments with pin markers; return the args and the pinned positions."""
+    pinned: set[int] = set()
+    out = args
+    for i, a in enumerate(args):
+        if not isinstance(a, Pin):
+            continue
+        if a._closed:  # noqa: SLF001 - internal linkage
+            raise UseGoLibError("pinned value is closed")
+        if a._client is not client:  # noqa: SLF001 - internal linkage
+            raise UseGoLibError("pinned value belongs to a different Go runtime")
+        if params is not None and i < len(params):
+            if not a._accepts(params[i]):  # noqa: SLF001 - internal linkage
+                raise UnsupportedTypeError(f"pinned {a.go_type} value passed for arg{i} ({params[i]})")
+        if out is args:
+            out = list(args)
+        out[i] = {PIN_KEY: a.id}
+        pinned.add(i)
+    return out, frozenset(pinned)
+
+
+@contextlib.contextmanager
+def _pins_in_use(args: tuple[Any, ...]) -> Iterator[None]:
+    """Hold the pins in `args` for the duration of a call (mapped files stay mapped)."""
+    held: list[Pin] = []
+    try:
+        for a in args:
+            if isinstance(a, Pin):
+                a._acquire()  # noqa: SLF001 - internal linkage
+                held.append(a)
+        yield
+    finally:
+        for a in held:
+            a._release()  # noqa: SLF001 - internal linkage
+
 
 _SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
 
@@ -381,7 +1240,17 @@ def _sha256_file(path) -> str:
     return h.hexdigest()
 
 
-def _verify_library_sha256(manifest: ArtifactManifest) -> None:
+def _verify_cache_enabled() -> bool:
+    return os.environ.get("USEGOLIB_VERIFY_CACHE", "1").strip().lower() not in {"0", "false", "no", "off"}
+
+
+def _verify_library_sha256(manifest: ArtifactManifest, *, use_cache: bool = True) -> None:
+    """Verify the shared library against `library.sha256` from the manifest.
+
+    With `use_cache=True`, a matching verification cache entry (see
+    `usegolib warm`) skips re-hashing, and a successful hash is recorded
+    best-effort. Set `USEGOLIB_VERIFY_CACHE=0` to always hash.
+    """
     goos = host_goos()
     goarch = host_goarch()
     if manifest.goos != goos or manifest.goarch != goarch:
@@ -398,9 +1267,35 @@ def _verify_library_sha256(manifest: ArtifactManifest) -> None:
     lib_path = manifest.library_path
     if not lib_path.exists():
         raise LoadError(f"shared library not found at {lib_path}")
+    use_cache = use_cache and _verify_cache_enabled()
+    if use_cache and read_verified_sha256(lib_path) == want:
+        return
+    stamp = library_stamp(lib_path)
     got = _sha256_file(lib_path)
     if got != want:
         raise LoadError(f"shared library sha256 mismatch: expected {want}, got {got}")
+    if use_cache:
+        try:
+            write_verified_sha256(lib_path, got, stamp=stamp)
+        except OSError:
+            # Read-only artifact roots are fine; we just hash again next time.
+            pass
+
+
+def _load_schema(manifest: ArtifactManifest) -> Schema | None:
+    """Return the compiled manifest schema, preferring a precompiled sidecar."""
+    if manifest.schema is None:
+        return None
+    schema = read_schema_sidecar(manifest)
+    if schema is not None:
+        return schema
+    schema = Schema.from_manifest(manifest.schema)
+    if schema is not None:
+        try:
+            write_schema_sidecar(manifest, schema)
+        except OSError:
+            pass
+    return schema
 
 
 @dataclass(frozen=True)
@@ -432,32 +1327,35 @@ class TypedPackageHandle:
         schema = self._base._schema  # noqa: SLF001 - internal linkage
         assert schema is not None
 
-        def _call(*args: Any) -> Any:
-            result = fn(*args)
+        def _call(*args: Any, **kwargs: Any) -> Any:
             sig = schema.symbols_by_pkg.get(self._base.package, {}).get(name)
-            if sig is None:
-                return result
-            _params, results = sig
-            value_results = success_result_types(results)
-            if not value_results:
-                return result
-            from .typed import decode_value
+            return _decode_typed_results(types=self._types, sig=sig, result=fn(*args, **kwargs))
 
-            if len(value_results) == 1:
-                return decode_value(types=self._types, go_type=value_results[0], v=result)
-            if not isinstance(result, (list, tuple)):
-                return result
-            return tuple(
-                decode_value(types=self._types, go_type=t, v=v)
-                for t, v in zip(value_results, result, strict=True)
-            )
+        def _select(*paths: str) -> Callable[..., Any]:
+            projected = fn.select(*paths)
+
+            def _projected(*args: Any, **kwargs: Any) -> Any:
+                sig = schema.symbols_by_pkg.get(self._base.package, {}).get(name)
+                return _decode_typed_results(
+                    types=self._types, sig=sig, result=projected(*args, **kwargs), partial=True
+                )
+
+            _projected.__doc__ = getattr(fn, "__doc__", None)
+            return _projected
 
         # Preserve docstrings from the base callable (GoDoc/signature).
         _call.__doc__ = getattr(fn, "__doc__", None)
+        _call.select = _select  # type: ignore[attr-defined]
+        _call.lazy = _typed_lazy(  # type: ignore[attr-defined]
+            fn, types=self._types, sig=schema.symbols_by_pkg.get(self._base.package, {}).get(name)
+        )
+        _call.numpy = fn.numpy  # type: ignore[attr-defined]
+        _call.arrow = fn.arrow  # type: ignore[attr-defined]
+        _call.columns = fn.columns  # type: ignore[attr-defined]
         return _call
 
-    def object(self, type_name: str, init: Any | None = None) -> "TypedGoObject":
-        obj = self._base.object(type_name, init=init)
+    def object(self, type_name: str, init: Any | None = None, *, mode: str | None = None) -> "TypedGoObject":
+        obj = self._base.object(type_name, init=init, mode=mode)
         schema = self._base._schema  # noqa: SLF001 - internal linkage
         assert schema is not None
         return TypedGoObject(_base=obj, _types=self._types, _schema=schema, _pkg=self._base.package)
@@ -470,8 +1368,8 @@ class TypedPackageHandle:
             raise UseGoLibError(f"generic instantiation not found: {self._base.package}.{name}{type_args!r}")
         fn = getattr(self._base, sym)
 
-        def _call(*args: Any) -> Any:
-            result = fn(*args)
+        def _call(*args: Any, **kwargs: Any) -> Any:
+            result = fn(*args, **kwargs)
             sig = schema.symbols_by_pkg.get(self._base.package, {}).get(sym)
             if sig is None:
                 return result
@@ -500,6 +1398,8 @@ class GoObject:
     _type: str
     _id: int
     _closed: bool = False
+    # Set for views into a `HandleArray`: the array owns (and frees) the Go handle.
+    _owner: Any = field(default=None, repr=False)
 
     @property
     def id(self) -> int:
@@ -510,9 +1410,14 @@ class GoObject:
         return self._type
 
     def close(self) -> None:
-        if self._closed:
+        # Test-and-set under a lock: without the GIL two threads could both see
+        # `_closed == False` and free the same Go handle twice.
+        with _CLOSE_LOCK:
+            if self._closed:
+                return
+            self._closed = True
+        if self._owner is not None:
             return
-        self._closed = True
         try:
             req = abi.encode_obj_free_request(obj_id=self._id)
         except Exception:
@@ -535,19 +1440,116 @@ class GoObject:
         except Exception:
             return
 
+    def get(self, field_name: str) -> Any:
+        """Read one exported field of the Go struct behind this handle."""
+        return self.get_many([field_name])[field_name]
+
+    def get_many(self, field_names: list[str]) -> dict[str, Any]:
+        """Read several exported fields in one call; keys are the names as given."""
+        if self._closed:
+            raise UseGoLibError("object is closed")
+        names = list(field_names)
+        resolved = [self._field(n) for n in names]
+        try:
+            req = abi.encode_obj_get_request(
+                pkg=self._pkg.package, type_name=self._type, obj_id=self._id, fields=[k for k, _t in resolved]
+            )
+        except Exception as e:  # noqa: BLE001 - encode boundary
+            raise ABIEncodeError(str(e)) from e
+        resp = abi.decode_response(self._pkg._client.call(req))  # noqa: SLF001 - internal linkage
+        if not resp.ok:
+            _raise_call_error(resp.error)
+        raw = resp.result
+        if not isinstance(raw, list) or len(raw) != len(names):
+            raise ABIDecodeError("obj_get: expected one value per field")
+        schema = self._pkg._schema  # noqa: SLF001 - internal linkage
+        out: dict[str, Any] = {}
+        for name, (_key, go_type), v in zip(names, resolved, raw, strict=True):
+            if schema is not None and go_type is not None:
+                validate_value(schema=schema, pkg=self._pkg.package, go_type=go_type, value=v)
+            out[name] = v
+        return out
+
+    def set(self, field_name: str, value: Any) -> None:
+        """Assign one exported field of the Go struct behind this handle."""
+        if self._closed:
+            raise UseGoLibError("object is closed")
+        key, go_type = self._field(field_name)
+        schema = self._pkg._schema  # noqa: SLF001 - internal linkage
+        if schema is not None:
+            from .typed import encode_value
+
+            value = encode_value(schema=schema, pkg=self._pkg.package, v=value)
+            if go_type is not None:
+                validate_value(schema=schema, pkg=self._pkg.package, go_type=go_type, value=value)
+        try:
+            req = abi.encode_obj_set_request(
+                pkg=self._pkg.package, type_name=self._type, obj_id=self._id, field=key, value=value
+            )
+        except Exception as e:  # noqa: BLE001 - encode boundary
+            raise ABIEncodeError(str(e)) from e
+        resp = abi.decode_response(self._pkg._client.call(req))  # noqa: SLF001 - internal linkage
+        if not resp.ok:
+            _raise_call_error(resp.error)
+
+    def io(self, *, chunk: int = DEFAULT_IO_CHUNK) -> GoRawIO:
+        """View the Go value as a raw binary stream if it is an `io.Reader` and/or `io.Writer`.
+
+        Closing the stream calls Go's `Close` (for an `io.Closer`) but keeps this handle.
+        """
+        if self._closed:
+            raise UseGoLibError("object is closed")
+        resp = abi.decode_response(
+            self._pkg._client.call(abi.encode_io_request(op="io_info", obj_id=self._id))  # noqa: SLF001
+        )
+        if not resp.ok:
+            _raise_call_error(resp.error)
+        info = resp.result if isinstance(resp.result, dict) else {}
+        if not info.get("read") and not info.get("write"):
+            raise UnsupportedTypeError(f"{self._type} is neither an io.Reader nor an io.Writer")
+        return GoRawIO(self, readable=bool(info["read"]), writable=bool(info["write"]), chunk=chunk, own=False)
+
+    def _field(self, name: str) -> tuple[str, str | None]:
+        """Resolve a field name/alias to (canonical key, Go type); unchecked without a schema."""
+        if not isinstance(name, str) or not name:
+            raise TypeError("field name must be a non-empty string")
+        schema = self._pkg._schema  # noqa: SLF001 - internal linkage
+        st = schema.structs_by_pkg.get(self._pkg.package, {}).get(self._type) if schema is not None else None
+        if st is None:
+            return name, None
+        go_name = st.key_to_name.get(name)
+        if go_name is None:
+            raise UnsupportedTypeError(f"schema: {self._type}: unknown field {name}")
+        fs = st.fields_by_name[go_name]
+        return fs.key, fs.type
+
     def __getattr__(self, name: str) -> Callable[..., Any]:
-        def _call(*args: Any) -> Any:
+        def _invoke(
+            args: tuple[Any, ...],
+            *,
+            timeout: float | None,
+            cancel: "CancelToken | None",
+            select: list[str] | None = None,
+            lazy: int | None = None,
+            packed: tuple[str, int] | None = None,
+        ) -> Any:
             if self._closed:
                 raise UseGoLibError("object is closed")
+            timeout_ns, cancel_id = _call_options(
+                self._pkg._client, timeout=timeout, cancel=cancel  # noqa: SLF001 - internal linkage
+            )
             args_list = list(args)
             schema = self._pkg._schema  # noqa: SLF001 - internal linkage
             sig_results: list[str] | None = None
+            client = self._pkg._client  # noqa: SLF001 - internal linkage
+            readers: list[Any] = []
             if schema is not None:
                 sig = (
                     schema.methods_by_pkg.get(self._pkg.package, {})
                     .get(self._type, {})
                     .get(name)
                 )
+                params: list[str] | None = None
                 if sig is not None:
                     params, _results = sig
                     args_list = _pack_variadic_args(params=params, args=args_list)
@@ -556,13 +1558,22 @@ class GoObject:
                 from .typed import encode_value
 
                 args_list = [encode_value(schema=schema, pkg=self._pkg.package, v=a) for a in args_list]
+                args_list, pinned = _substitute_pins(client=client, params=params, args=args_list)
+                args_list, reader_args, readers = substitute_readers(client=client, params=params, args=args_list)
+                args_list, array_args = pack_arrays(params=params, args=args_list)
+                args_list, column_args = pack_columns(
+                    schema=schema, pkg=self._pkg.package, params=params, args=args_list
+                )
                 validate_method_args(
                     schema=schema,
                     pkg=self._pkg.package,
                     recv=self._type,
                     method=name,
                     args=args_list,
+                    skip=pinned | reader_args | array_args | column_args,
                 )
+            else:
+                args_list, _pinned = _substitute_pins(client=client, params=None, args=args_list)
             try:
                 req = abi.encode_obj_call_request(
                     pkg=self._pkg.package,
@@ -570,13 +1581,28 @@ class GoObject:
                     obj_id=self._id,
                     method=name,
                     args=args_list,
+                    timeout_ns=timeout_ns,
+                    cancel=cancel_id,
+                    select=select,
+                    lazy=lazy is not None,
+                    packed=packed is not None,
                 )
             except Exception as e:  # noqa: BLE001 - encode boundary
                 raise ABIEncodeError(str(e)) from e
 
-            resp_bytes = self._pkg._client.call(req)  # noqa: SLF001 - internal linkage
+            try:
+                with _pins_in_use(args):
+                    resp_bytes = self._pkg._client.call(req)  # noqa: SLF001 - internal linkage
+            finally:
+                close_readers(readers)
             resp = abi.decode_response(resp_bytes)
             if resp.ok:
+                if lazy is not None:
+                    return _lazy_result(pkg_handle=self._pkg, sig=sig_results, raw=resp.result, chunk=lazy)
+                if packed is not None:
+                    return decode_array(resp.result, dtype=packed[0], ndim=packed[1])
+                if _stream_items(sig_results) is not None or _is_stream_ref(resp.result):
+                    return _stream_result(pkg_handle=self._pkg, sig=sig_results, raw=resp.result)
                 if schema is not None:
                     validate_method_result(
                         schema=schema,
@@ -584,6 +1610,7 @@ class GoObject:
                         recv=self._type,
                         method=name,
                         result=resp.result,
+                        partial=select is not None,
                     )
                     if sig_results is not None:
                         return _decode_success_result(
@@ -595,18 +1622,68 @@ class GoObject:
                         )
                 return resp.result
 
-            err = resp.error
-            if err is None:
-                raise ABIDecodeError("missing error object in failed response")
-            if err.type == "GoError":
-                raise GoError(err.message)
-            if err.type == "GoPanicError":
-                raise GoPanicError(err.message)
-            if err.type == "UnsupportedTypeError":
-                raise UnsupportedTypeError(err.message)
-            if err.type == "UnsupportedSignatureError":
-                raise UnsupportedSignatureError(err.message)
-            raise UseGoLibError(f"{err.type}: {err.message}")
+            _raise_call_error(resp.error)
+
+        def _call(*args: Any, timeout: float | None = None, cancel: "CancelToken | None" = None) -> Any:
+            return _invoke(args, timeout=timeout, cancel=cancel, select=None)
+
+        def _select(*paths: str) -> Callable[..., Any]:
+            """Return this method with Go encoding only the given result fields (e.g. "Meta.Tag")."""
+            schema = self._pkg._schema  # noqa: SLF001 - internal linkage
+            sig = None
+            if schema is not None:
+                sig = schema.methods_by_pkg.get(self._pkg.package, {}).get(self._type, {}).get(name)
+            keys = _select_keys(schema=schema, pkg=self._pkg.package, sig=sig, paths=paths)
+
+            def _projected(*args: Any, timeout: float | None = None, cancel: "CancelToken | None" = None) -> Any:
+                return _invoke(args, timeout=timeout, cancel=cancel, select=keys)
+
+            _projected.__doc__ = _call.__doc__
+            return _projected
+
+        def _lazy(
+            *args: Any, chunk: int = DEFAULT_CHUNK, timeout: float | None = None, cancel: "CancelToken | None" = None
+        ) -> Any:
+            """Call the method but keep its slice/map result Go-side; return a GoSequence/GoMapping."""
+            schema = self._pkg._schema  # noqa: SLF001 - internal linkage
+            sig = None
+            if schema is not None:
+                sig = schema.methods_by_pkg.get(self._pkg.package, {}).get(self._type, {}).get(name)
+            _lazy_element_type(schema=schema, pkg=self._pkg.package, sig=sig, chunk=chunk)
+            return _invoke(args, timeout=timeout, cancel=cancel, lazy=chunk)
+
+        def _numpy(*args: Any, timeout: float | None = None, cancel: "CancelToken | None" = None) -> Any:
+            """Call the method and return its numeric slice result as a NumPy array."""
+            schema = self._pkg._schema  # noqa: SLF001 - internal linkage
+            sig = None
+            if schema is not None:
+                sig = schema.methods_by_pkg.get(self._pkg.package, {}).get(self._type, {}).get(name)
+            nd = array_result_type(sig[1] if sig is not None else None)
+            return _invoke(args, timeout=timeout, cancel=cancel, packed=nd)
+
+        def _method_sig() -> tuple[Schema | None, tuple[list[str], list[str]] | None]:
+            schema = self._pkg._schema  # noqa: SLF001 - internal linkage
+            if schema is None:
+                return None, None
+            return schema, schema.methods_by_pkg.get(self._pkg.package, {}).get(self._type, {}).get(name)
+
+        def _arrow(*args: Any, timeout: float | None = None, cancel: "CancelToken | None" = None) -> Any:
+            """Call the method and return its record slice result as a `pyarrow.RecordBatch`."""
+            schema, sig = _method_sig()
+            _record_slice_type(schema=schema, pkg=self._pkg.package, sig=sig)
+            return _export_records(_invoke(args, timeout=timeout, cancel=cancel, lazy=DEFAULT_CHUNK), columns=False)
+
+        def _columns(*args: Any, timeout: float | None = None, cancel: "CancelToken | None" = None) -> Any:
+            """Call the method and return its record slice result as a dict of NumPy columns."""
+            schema, sig = _method_sig()
+            _record_slice_type(schema=schema, pkg=self._pkg.package, sig=sig)
+            return _export_records(_invoke(args, timeout=timeout, cancel=cancel, lazy=DEFAULT_CHUNK), columns=True)
+
+        _call.select = _select  # type: ignore[attr-defined]
+        _call.lazy = _lazy  # type: ignore[attr-defined]
+        _call.numpy = _numpy  # type: ignore[attr-defined]
+        _call.arrow = _arrow  # type: ignore[attr-defined]
+        _call.columns = _columns  # type: ignore[attr-defined]
 
         schema = self._pkg._schema  # noqa: SLF001 - internal linkage
         if schema is not None:
@@ -655,28 +1732,96 @@ class TypedGoObject:
     def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
         self.close()
 
+    def get(self, field_name: str) -> Any:
+        return self.get_many([field_name])[field_name]
+
+    def get_many(self, field_names: list[str]) -> dict[str, Any]:
+        from .typed import decode_value
+
+        out: dict[str, Any] = {}
+        for name, v in self._base.get_many(field_names).items():
+            _key, go_type = self._base._field(name)  # noqa: SLF001 - internal linkage
+            out[name] = v if go_type is None else decode_value(types=self._types, go_type=go_type, v=v)
+        return out
+
+    def set(self, field_name: str, value: Any) -> None:
+        self._base.set(field_name, value)
+
     def __getattr__(self, name: str) -> Callable[..., Any]:
         fn = getattr(self._base, name)
 
-        def _call(*args: Any) -> Any:
-            result = fn(*args)
-            sig = self._schema.methods_by_pkg.get(self._pkg, {}).get(self._base.type_name, {}).get(name)
-            if sig is None:
-                return result
-            _params, results = sig
-            value_results = success_result_types(results)
-            if not value_results:
-                return result
-            from .typed import decode_value
+        sig = self._schema.methods_by_pkg.get(self._pkg, {}).get(self._base.type_name, {}).get(name)
 
-            if len(value_results) == 1:
-                return decode_value(types=self._types, go_type=value_results[0], v=result)
-            if not isinstance(result, (list, tuple)):
-                return result
-            return tuple(
-                decode_value(types=self._types, go_type=t, v=v)
-                for t, v in zip(value_results, result, strict=True)
-            )
+        def _call(*args: Any, **kwargs: Any) -> Any:
+            return _decode_typed_results(types=self._types, sig=sig, result=fn(*args, **kwargs))
+
+        def _select(*paths: str) -> Callable[..., Any]:
+            projected = fn.select(*paths)
+
+            def _projected(*args: Any, **kwargs: Any) -> Any:
+                return _decode_typed_results(
+                    types=self._types, sig=sig, result=projected(*args, **kwargs), partial=True
+                )
+
+            _projected.__doc__ = getattr(fn, "__doc__", None)
+            return _projected
 
         _call.__doc__ = getattr(fn, "__doc__", None)
+        _call.select = _select  # type: ignore[attr-defined]
+        _call.lazy = _typed_lazy(fn, types=self._types, sig=sig)  # type: ignore[attr-defined]
+        _call.numpy = fn.numpy  # type: ignore[attr-defined]
+        _call.arrow = fn.arrow  # type: ignore[attr-defined]
+        _call.columns = fn.columns  # type: ignore[attr-defined]
         return _call
+
+
+def _typed_lazy(fn: Any, *, types: Any, sig: tuple[list[str], list[str]] | None) -> Callable[..., Any]:
+    """`.lazy()` for typed callables: elements are decoded into dataclasses as they are fetched."""
+
+    def _lazy(*args: Any, **kwargs: Any) -> Any:
+        value = fn.lazy(*args, **kwargs)
+        if value is None or sig is None:
+            return value
+        from .typed import decode_value
+
+        elem = _lazy_element_type(schema=types.schema, pkg=types.pkg, sig=sig, chunk=DEFAULT_CHUNK)
+        base = value._decode  # noqa: SLF001 - internal linkage
+        value._decode = lambda v: decode_value(types=types, go_type=elem, v=base(v))  # noqa: SLF001
+        return value
+
+    _lazy.__doc__ = getattr(fn, "__doc__", None)
+    return _lazy
+
+
+def _decode_typed_results(
+    *, types: Any, sig: tuple[list[str], list[str]] | None, result: Any, partial: bool = False
+) -> Any:
+    """Decode record-struct results into dataclasses; `partial` leaves unselected fields as None."""
+    if sig is None:
+        return result
+    _params, results = sig
+    value_results = success_result_types(results)
+    if not value_results:
+        return result
+    from .typed import decode_value
+
+    if isinstance(result, GoStream):
+        items = _stream_items(results)
+        if items is not None:
+            base = result._decode  # noqa: SLF001 - internal linkage
+            if len(items) == 2:
+                result._decode = lambda v: tuple(  # noqa: SLF001
+                    decode_value(types=types, go_type=t, v=x) for t, x in zip(items, base(v), strict=True)
+                )
+            else:
+                result._decode = lambda v: decode_value(types=types, go_type=items[0], v=base(v))  # noqa: SLF001
+        return result
+
+    if len(value_results) == 1:
+        return decode_value(types=types, go_type=value_results[0], v=result, partial=partial)
+    if not isinstance(result, (list, tuple)):
+        return result
+    return tuple(
+        decode_value(types=types, go_type=t, v=v, partial=partial)
+        for t, v in zip(value_results, result, strict=True)
+    )
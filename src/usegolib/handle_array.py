@@ -0,0 +1,188 @@
+"""Handle arrays: many Go objects of one type behind a single Python object."""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import TYPE_CHECKING, Any, Iterator
+
+from . import abi
+from .errors import ABIDecodeError, ABIEncodeError, UseGoLibError
+
+if TYPE_CHECKING:
+    from .handle import CancelToken, GoObject, PackageHandle
+
+
+def ids_to_bytes(ids: array) -> bytes:
+    """Pack object ids as little-endian uint64s (the ABI's id-array encoding)."""
+    if sys.byteorder == "little":
+        return ids.tobytes()
+    swapped = array("Q", ids)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def ids_from_bytes(data: bytes) -> array:
+    if len(data) % 8:
+        raise ABIDecodeError("object id array: length is not a multiple of 8")
+    ids = array("Q")
+    ids.frombytes(data)
+    if sys.byteorder != "little":
+        ids.byteswap()
+    return ids
+
+
+class HandleArray:
+    """Go objects of one struct type, held as a compact `array('Q')` of ids.
+
+    Created by `PackageHandle.objects()`. `call()` runs a method on every object
+    in one request; `close()` frees them all. `arr[i]` returns a `GoObject` view
+    that does not own its handle.
+    """
+
+    __slots__ = ("_pkg", "_type", "_ids", "_closed", "__weakref__")
+
+    def __init__(self, pkg: "PackageHandle", type_name: str, ids: array) -> None:
+        self._pkg = pkg
+        self._type = type_name
+        self._ids = ids
+        self._closed = False
+
+    @property
+    def type_name(self) -> str:
+        return self._type
+
+    @property
+    def ids(self) -> array:
+        return self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __getitem__(self, index: int) -> "GoObject":
+        from .handle import GoObject
+
+        if not isinstance(index, int):
+            raise TypeError("HandleArray indices must be integers")
+        self._check_open()
+        return GoObject(_pkg=self._pkg, _type=self._type, _id=self._ids[index], _owner=self)
+
+    def __iter__(self) -> Iterator["GoObject"]:
+        for i in range(len(self._ids)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"HandleArray(type={self._type!r}, len={len(self._ids)})"
+
+    def call(
+        self,
+        method: str,
+        *args: Any,
+        parallel: int | None = None,
+        timeout: float | None = None,
+        cancel: "CancelToken | None" = None,
+    ) -> list[Any]:
+        """Call `method` with the same `args` on every object; return the results in order.
+
+        With `parallel=n` the bridge spreads the calls over `n` goroutines. The first
+        failing object stops the run; its error carries `detail["index"]`.
+        """
+        from .handle import (
+            _call_options,
+            _decode_success_result,
+            _pack_variadic_args,
+            _pins_in_use,
+            _raise_call_error,
+            _substitute_pins,
+        )
+        from .schema import validate_method_args, validate_method_result
+
+        self._check_open()
+        if parallel is not None and (isinstance(parallel, bool) or not isinstance(parallel, int) or parallel < 1):
+            raise ValueError("parallel must be a positive integer or None")
+        pkg = self._pkg
+        client = pkg._client  # noqa: SLF001 - internal linkage
+        timeout_ns, cancel_id = _call_options(client, timeout=timeout, cancel=cancel)
+        args_list = list(args)
+        schema = pkg._schema  # noqa: SLF001 - internal linkage
+        sig_results: list[str] | None = None
+        if schema is not None:
+            sig = schema.methods_by_pkg.get(pkg.package, {}).get(self._type, {}).get(method)
+            params: list[str] | None = None
+            if sig is not None:
+                params, sig_results = sig
+                args_list = _pack_variadic_args(params=params, args=args_list)
+
+            from .typed import encode_value
+
+            args_list = [encode_value(schema=schema, pkg=pkg.package, v=a) for a in args_list]
+            args_list, pinned = _substitute_pins(client=client, params=params, args=args_list)
+            validate_method_args(
+                schema=schema, pkg=pkg.package, recv=self._type, method=method, args=args_list, skip=pinned
+            )
+        else:
+            args_list, _pinned = _substitute_pins(client=client, params=None, args=args_list)
+        try:
+            req = abi.encode_obj_call_many_request(
+                pkg=pkg.package,
+                type_name=self._type,
+                ids=ids_to_bytes(self._ids),
+                method=method,
+                args=args_list,
+                parallel=parallel or 0,
+                timeout_ns=timeout_ns,
+                cancel=cancel_id,
+            )
+        except Exception as e:  # noqa: BLE001 - encode boundary
+            raise ABIEncodeError(str(e)) from e
+
+        with _pins_in_use(args):
+            resp_bytes = client.call(req)
+        resp = abi.decode_response(resp_bytes)
+        if not resp.ok:
+            _raise_call_error(resp.error)
+        raw = resp.result
+        if not isinstance(raw, list) or len(raw) != len(self._ids):
+            raise ABIDecodeError("obj_call_many: expected one result per object")
+        if schema is None or sig_results is None:
+            return raw
+        out = []
+        for r in raw:
+            validate_method_result(schema=schema, pkg=pkg.package, recv=self._type, method=method, result=r)
+            out.append(
+                _decode_success_result(schema=schema, pkg=pkg.package, results=sig_results, raw=r, pkg_handle=pkg)
+            )
+        return out
+
+    def close(self) -> None:
+        """Free every object of the array."""
+        from .handle import _CLOSE_LOCK
+
+        with _CLOSE_LOCK:
+            if self._closed:
+                return
+            self._closed = True
+        if not self._ids:
+            return
+        try:
+            req = abi.encode_obj_free_many_request(ids=ids_to_bytes(self._ids))
+            self._pkg._client.call(req)  # noqa: SLF001 - internal linkage
+        except Exception:
+            return
+
+    def __enter__(self) -> "HandleArray":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        self.close()
+
+    def __del__(self) -> None:
+        # Best-effort cleanup; ignore errors at interpreter shutdown.
+        try:
+            self.close()
+        except Exception:
+            return
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise UseGoLibError("handle array is closed")
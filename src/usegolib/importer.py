@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable
 
 from .errors import ArtifactNotFoundError
 
@@ -22,9 +24,85 @@ def import_(
     - True: build missing artifacts into the selected artifact root.
     - False: never build; missing artifacts raise ArtifactNotFoundError.
     - None (auto): build only when `artifact_dir` is omitted.
+
+    If another thread is already loading the same module (for example via
+    `preload`), this call waits for that load instead of starting another one.
     """
-    from .artifact import resolve_manifest
+    return _import(module, version, artifact_dir=artifact_dir, build_if_missing=build_if_missing)
+
+
+def preload(
+    modules: Iterable[str | tuple[str, str | None]],
+    *,
+    artifact_dir: str | Path | None = None,
+    build_if_missing: bool | None = None,
+    max_workers: int | None = None,
+) -> list[Future]:
+    """Resolve, verify and `dlopen` several Go modules concurrently in background threads.
+
+    Each entry is a module (same values as `import_`) or a `(module, version)`
+    tuple. Returns one `Future` per entry, resolving to the `PackageHandle` that
+    `import_` would return. Later `import_` calls for the same modules join the
+    in-flight loads, so application startup can overlap Go library loading with
+    other initialization.
+    """
+    targets: list[tuple[str, str | None]] = []
+    for m in modules:
+        if isinstance(m, tuple):
+            module, version = m
+            targets.append((module, version))
+        else:
+            targets.append((m, None))
+    if not targets:
+        return []
+
+    workers = max_workers if max_workers is not None else len(targets)
+    ex = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="usegolib-preload")
+    try:
+        return [
+            ex.submit(
+                _import,
+                module,
+                version,
+                artifact_dir=artifact_dir,
+                build_if_missing=build_if_missing,
+                dlopen=True,
+            )
+            for module, version in targets
+        ]
+    finally:
+        # Workers finish the submitted loads; callers wait on the futures.
+        ex.shutdown(wait=False)
+
+
+def _import(
+    module: str,
+    version: str | None,
+    *,
+    artifact_dir: str | Path | None,
+    build_if_missing: bool | None,
+    dlopen: bool = False,
+):
     from .handle import PackageHandle
+
+    manifest, runtime_pkg = _resolve_import(
+        module, version, artifact_dir=artifact_dir, build_if_missing=build_if_missing
+    )
+    return PackageHandle.from_manifest(manifest, package=runtime_pkg, dlopen=dlopen)
+
+
+def _resolve_import(
+    module: str,
+    version: str | None,
+    *,
+    artifact_dir: str | Path | None,
+    build_if_missing: bool | None,
+):
+    """Resolve (and build if allowed) the artifact manifest for `module`.
+
+    Returns `(manifest, runtime_pkg)` without loading the shared library.
+    """
+    from .artifact import resolve_manifest
     from .paths import default_artifact_root
 
     auto_root = artifact_dir is None
@@ -75,4 +153,4 @@ def import_(
         build_artifact(module=build_target, out_dir=artifact_root, version=version)
         manifest = resolve_manifest(artifact_root, package=runtime_pkg, version=version)
 
-    return PackageHandle.from_manifest(manifest, package=runtime_pkg)
+    return manifest, runtime_pkg
@@ -0,0 +1,240 @@
+"""Lazy results: Go slices and maps kept Go-side and read in windows."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable
+
+from . import abi
+from .errors import ABIDecodeError, UseGoLibError
+
+if TYPE_CHECKING:
+    from .handle import PackageHandle
+
+LAZY_KEY = "$usegolib_lazy"
+DEFAULT_CHUNK = 1024
+
+
+class _LazyValue:
+    __slots__ = ("_pkg", "_id", "_len", "_chunk", "_decode", "_closed", "__weakref__")
+
+    def __init__(
+        self, pkg: "PackageHandle", lazy_id: int, length: int, *, chunk: int, decode: Callable[[Any], Any]
+    ) -> None:
+        self._pkg = pkg
+        self._id = lazy_id
+        self._len = length
+        self._chunk = chunk
+        self._decode = decode
+        self._closed = False
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    def __len__(self) -> int:
+        return self._len
+
+    def close(self) -> None:
+        """Release the Go value."""
+        from .handle import _CLOSE_LOCK
+
+        with _CLOSE_LOCK:
+            if self._closed:
+                return
+            self._closed = True
+        try:
+            self._pkg._client.call(abi.encode_lazy_request(op="lazy_free", lazy_id=self._id))  # noqa: SLF001
+        except Exception:
+            return
+
+    def __enter__(self):  # noqa: ANN204
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        self.close()
+
+    def __del__(self) -> None:
+        # Best-effort cleanup; ignore errors at interpreter shutdown.
+        try:
+            self.close()
+        except Exception:
+            return
+
+    def _request(self, req: bytes) -> Any:
+        from .handle import _raise_call_error
+
+        if self._closed:
+            raise UseGoLibError("lazy value is closed")
+        resp = abi.decode_response(self._pkg._client.call(req))  # noqa: SLF001 - internal linkage
+        if not resp.ok:
+            _raise_call_error(resp.error)
+        return resp.result
+
+    def _range(self, start: int, stop: int) -> list[Any]:
+        raw = self._request(abi.encode_lazy_request(op="lazy_range", lazy_id=self._id, start=start, stop=stop))
+        if not isinstance(raw, list) or len(raw) != stop - start:
+            raise ABIDecodeError("lazy_range: expected one element per index")
+        return raw
+
+    def _windows(self, fetch: Callable[[int, int], Any]) -> Iterator[Any]:
+        """Yield `fetch(start, stop)` chunk by chunk, fetching the next chunk ahead.
+
+        Prefetches run on one helper thread per iteration (the Go call releases the GIL).
+        """
+        n, step = self._len, self._chunk
+        if n == 0:
+            return
+        cur = fetch(0, min(step, n))
+        if step >= n:
+            yield cur
+            return
+        ex = ThreadPoolExecutor(max_workers=1, thread_name_prefix="usegolib-lazy-prefetch")
+        try:
+            start = 0
+            while True:
+                stop = min(start + step, n)
+                nxt = ex.submit(fetch, stop, min(stop + step, n)) if stop < n else None
+                yield cur
+                if nxt is None:
+                    return
+                cur = nxt.result()
+                start = stop
+        finally:
+            ex.shutdown(wait=False)
+
+
+class GoSequence(_LazyValue, Sequence):
+    """A Go slice kept Go-side: `len`, indexing and slicing fetch only what they touch.
+
+    Iteration reads `chunk` elements per request and fetches the next chunk in the
+    background. `materialize()` returns a list of everything.
+    """
+
+    __slots__ = ("_window",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._window: tuple[int, list[Any]] = (0, [])
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            idx = range(self._len)[index]
+            if not idx:
+                return []
+            lo, hi = min(idx), max(idx) + 1
+            values = self._fetch(lo, hi)
+            return values[idx.start - lo :: idx.step]
+        if not isinstance(index, int):
+            raise TypeError("GoSequence indices must be integers or slices")
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("GoSequence index out of range")
+        start, values = self._window
+        if not start <= index < start + len(values):
+            start = index - index % self._chunk
+            values = self._fetch(start, min(start + self._chunk, self._len))
+            self._window = (start, values)
+        return values[index - start]
+
+    def __iter__(self) -> Iterator[Any]:
+        for values in self._windows(self._fetch):
+            yield from values
+
+    def __repr__(self) -> str:
+        return f"GoSequence(len={self._len})"
+
+    def materialize(self) -> list[Any]:
+        """Fetch every element into a Python list."""
+        return list(self)
+
+    def arrow(self) -> Any:
+        """Export a slice of record structs as a `pyarrow.RecordBatch` (Arrow C data interface)."""
+        from .arrow import to_pyarrow
+
+        return to_pyarrow(self)
+
+    def columns(self) -> dict[str, Any]:
+        """Export a slice of record structs as a dict of NumPy arrays, one per field."""
+        from .arrow import to_columns
+
+        return to_columns(self)
+
+    def _fetch(self, start: int, stop: int) -> list[Any]:
+        out: list[Any] = []
+        for lo in range(start, stop, self._chunk):
+            out.extend(self._decode(v) for v in self._range(lo, min(lo + self._chunk, stop)))
+        return out
+
+
+class GoMapping(_LazyValue, Mapping):
+    """A Go `map[string]T` kept Go-side: lookups and iteration fetch only what they touch.
+
+    Keys iterate in sorted order, `chunk` per request, with the next chunk fetched
+    in the background. `materialize()` returns a dict of everything.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key: Any) -> Any:
+        if not isinstance(key, str):
+            raise KeyError(key)
+        found = self._get([key])
+        if key not in found:
+            raise KeyError(key)
+        return found[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for keys in self._windows(self._range):
+            yield from keys
+
+    def items(self):  # noqa: ANN201
+        return _ItemsView(self)
+
+    def __repr__(self) -> str:
+        return f"GoMapping(len={self._len})"
+
+    def materialize(self) -> dict[str, Any]:
+        """Fetch every entry into a Python dict."""
+        return dict(self.items())
+
+    def _get(self, keys: list[str]) -> dict[str, Any]:
+        raw = self._request(abi.encode_lazy_request(op="lazy_get", lazy_id=self._id, keys=keys))
+        if not isinstance(raw, dict):
+            raise ABIDecodeError("lazy_get: expected a map")
+        return {k: self._decode(v) for k, v in raw.items()}
+
+    def _item_window(self, start: int, stop: int) -> list[tuple[str, Any]]:
+        keys = self._range(start, stop)
+        values = self._get(keys)
+        return [(k, values[k]) for k in keys if k in values]
+
+
+class _ItemsView:
+    """`GoMapping.items()`: one `lazy_range` plus one `lazy_get` per chunk."""
+
+    def __init__(self, mapping: GoMapping) -> None:
+        self._mapping = mapping
+
+    def __len__(self) -> int:
+        return len(self._mapping)
+
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        for window in self._mapping._windows(self._mapping._item_window):  # noqa: SLF001
+            yield from window
+
+
+def lazy_result(
+    *, pkg: "PackageHandle", raw: Any, chunk: int, decode: Callable[[Any], Any]
+) -> GoSequence | GoMapping | None:
+    """Wrap the `{"$usegolib_lazy": id, "kind": ..., "len": n}` marker of a lazy call."""
+    if raw is None:
+        return None
+    if not isinstance(raw, dict) or not isinstance(raw.get(LAZY_KEY), int) or not isinstance(raw.get("len"), int):
+        raise ABIDecodeError("lazy call: expected a lazy value reference")
+    cls = {"slice": GoSequence, "map": GoMapping}.get(raw.get("kind"))
+    if cls is None:
+        raise ABIDecodeError(f"lazy call: unknown kind {raw.get('kind')!r}")
+    return cls(pkg, raw[LAZY_KEY], raw["len"], chunk=chunk, decode=decode)
@@ -0,0 +1,184 @@
+"""Memory-mapped files passed to Go as slices backed by the same pages."""
+
+from __future__ import annotations
+
+import ast
+import contextlib
+import ctypes
+import math
+import mmap
+import os
+import struct
+import threading
+from typing import TYPE_CHECKING, Any
+
+from . import abi
+from .errors import ABIDecodeError, UnsupportedTypeError, UseGoLibError
+from .handle import Pin, _raise_call_error
+from .schema import numeric_array_type
+
+if TYPE_CHECKING:
+    from .runtime.cbridge import SharedLibClient
+
+# dtype names (NumPy style) -> (code, Go element type).
+_DTYPES = {
+    "float64": ("f8", "float64"),
+    "float32": ("f4", "float32"),
+    "int64": ("i8", "int64"),
+    "int32": ("i4", "int32"),
+    "int16": ("i2", "int16"),
+    "int8": ("i1", "int8"),
+    "uint64": ("u8", "uint64"),
+    "uint32": ("u4", "uint32"),
+    "uint16": ("u2", "uint16"),
+    "uint8": ("u1", "byte"),
+    "byte": ("u1", "byte"),
+}
+_CODES = {code: name for name, (code, _go) in _DTYPES.items() if name != "byte"}
+_NPY_MAGIC = b"\x93NUMPY"
+
+
+def _dtype_code(dtype: Any) -> str:
+    # Accepts names ("float64", "byte"), codes ("f8", "<f8") and NumPy dtypes or scalar types.
+    name = (getattr(dtype, "__name__", None) or str(dtype)).strip().lstrip("<|")
+    if name in _CODES:
+        return name
+    if name in _DTYPES:
+        return _DTYPES[name][0]
+    raise UnsupportedTypeError(f"map_file: unsupported dtype {dtype!r}")
+
+
+def _npy_header(mm: mmap.mmap) -> tuple[str, tuple[int, ...], int]:
+    """Parse a `.npy` header; return the dtype code, the shape and the data offset."""
+    try:
+        major = mm[6]
+        if major == 1:
+            (hlen,) = struct.unpack_from("<H", mm, 8)
+            start = 10
+        else:
+            (hlen,) = struct.unpack_from("<I", mm, 8)
+            start = 12
+        header = ast.literal_eval(mm[start : start + hlen].decode("latin1"))
+        descr, fortran, shape = header["descr"], header["fortran_order"], tuple(header["shape"])
+    except (IndexError, KeyError, SyntaxError, TypeError, ValueError, struct.error) as e:
+        raise UnsupportedTypeError(f"map_file: invalid .npy header: {e}") from None
+    if not isinstance(descr, str) or descr[:1] not in "<|" or descr[1:] not in _CODES:
+        raise UnsupportedTypeError(f"map_file: unsupported .npy dtype {descr!r} (need little-endian numbers)")
+    if fortran and len(shape) > 1:
+        raise UnsupportedTypeError("map_file: Fortran-ordered .npy arrays are not supported")
+    return descr[1:], shape, start + hlen
+
+
+class MappedFile(Pin):
+    """A read-only file mapping that Go sees as a `[]T` backed by the same pages.
+
+    Created (and pinned) by `PackageHandle.map_file()`. Pass it as the argument
+    of a `[]T` parameter of the mapped element type; no bytes are copied. The
+    mapping stays valid while the handle is open and while calls that pass it
+    are running: `close()` unpins it and unmaps it once the last such call
+    returns (and NumPy views from `array()` are gone). Go code must not modify
+    the slice or keep it after the call returns.
+    """
+
+    def __init__(self, client: "SharedLibClient", path: str | os.PathLike[str], dtype: Any | None = None) -> None:
+        self.path = os.fspath(path)
+        self._lock = threading.Lock()
+        self._users = 0
+        self._released = False
+        self._buf: Any = None
+        with open(self.path, "rb") as f:
+            try:
+                # A private mapping: pages are shared with other processes (and
+                # the page cache) and stray writes never reach the file.
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            except ValueError as e:  # empty file
+                raise UnsupportedTypeError(f"map_file: cannot map {self.path}: {e}") from None
+        try:
+            offset = 0
+            if self._mmap[: len(_NPY_MAGIC)] == _NPY_MAGIC:
+                code, shape, offset = _npy_header(self._mmap)
+                if dtype is not None and _dtype_code(dtype) != code:
+                    raise UnsupportedTypeError(f"map_file: {self.path} holds {_CODES[code]}, not {dtype}")
+            else:
+                if dtype is None:
+                    raise UnsupportedTypeError("map_file: raw files need a dtype")
+                code, shape = _dtype_code(dtype), ()
+            size = int(code[1])
+            nbytes = len(self._mmap) - offset
+            if nbytes < 0 or nbytes % size or (shape and math.prod(shape) * size != nbytes):
+                raise UnsupportedTypeError(f"map_file: {nbytes} data bytes do not match the {code} data")
+            self.dtype: str = _CODES[code]
+            self.shape: tuple[int, ...] = shape or (nbytes // size,)
+            self._code = code
+            self._len = nbytes // size
+            self._buf = (ctypes.c_char * nbytes).from_buffer(self._mmap, offset)
+            pin_id = _pin(client, {"dtype": code, "addr": ctypes.addressof(self._buf), "len": self._len})
+        except BaseException:
+            self._released = True
+            self._unmap()
+            raise
+        super().__init__(_client=client, _id=pin_id, go_type="[]" + _DTYPES[self.dtype][1])
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __repr__(self) -> str:
+        return f"MappedFile({self.path!r}, dtype={self.dtype!r}, shape={self.shape})"
+
+    def array(self) -> Any:
+        """A read-only NumPy view of the mapped data (shaped like the `.npy` array)."""
+        import numpy as np
+
+        if self._buf is None:
+            raise UseGoLibError("mapped file is closed")
+        a = np.frombuffer(self._buf, dtype="<" + self._code).reshape(self.shape)
+        a.flags.writeable = False
+        return a
+
+    def close(self) -> None:
+        """Unpin and unmap now, or once the calls still using the mapping return."""
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+            busy = self._users > 0
+        if not busy:
+            self._free()
+
+    def _accepts(self, go_type: str) -> bool:
+        t = go_type.strip()
+        if self._code == "u1":
+            return t == "[]byte"
+        return not t.startswith("...") and numeric_array_type(t) == (self._code, 1)
+
+    def _acquire(self) -> None:
+        with self._lock:
+            if self._released:
+                raise UseGoLibError("mapped file is closed")
+            self._users += 1
+
+    def _release(self) -> None:
+        with self._lock:
+            self._users -= 1
+            free = self._released and self._users == 0
+        if free:
+            self._free()
+
+    def _free(self) -> None:
+        super().close()
+        self._unmap()
+
+    def _unmap(self) -> None:
+        self._buf = None
+        with contextlib.suppress(BufferError):
+            # NumPy views still export the buffer; the mapping then closes with them.
+            self._mmap.close()
+
+
+def _pin(client: "SharedLibClient", ref: dict[str, Any]) -> int:
+    resp = abi.decode_response(client.call(abi.encode_pin_request(op="pin_mem", value=ref)))
+    if not resp.ok:
+        _raise_call_error(resp.error)
+    if not isinstance(resp.result, int) or isinstance(resp.result, bool):
+        raise ABIDecodeError("pin_mem: expected integer pin id")
+    return resp.result
@@ -0,0 +1,139 @@
+"""Packed numeric arrays: NumPy / `array.array` values sent as one buffer per slice."""
+
+from __future__ import annotations
+
+import array
+import sys
+from typing import Any
+
+from .errors import ABIDecodeError, UnsupportedTypeError
+from .schema import numeric_array_type
+
+ND_KEY = "$usegolib_nd"
+
+# `array.array` typecodes by (kind, itemsize); kinds follow NumPy ("f" float, "i" signed
+# int, "u" unsigned int).
+_ARRAY_KINDS = {
+    "f": "f",
+    "d": "f",
+    "b": "i",
+    "h": "i",
+    "i": "i",
+    "l": "i",
+    "q": "i",
+    "B": "u",
+    "H": "u",
+    "I": "u",
+    "L": "u",
+    "Q": "u",
+}
+_TYPECODES: dict[str, str] = {}
+for _code in "dfqlihbQLIHB":
+    _TYPECODES.setdefault(f"{_ARRAY_KINDS[_code]}{array.array(_code).itemsize}", _code)
+
+
+def _numpy() -> Any | None:
+    # NumPy is optional: only values that are already NumPy arrays need it.
+    return sys.modules.get("numpy")
+
+
+def _ndref(dtype: str, shape: list[int], data: Any) -> dict[str, Any]:
+    return {ND_KEY: dtype, "shape": shape, "data": data}
+
+
+def _pack_numpy(np: Any, v: Any, *, dtype: str, ndim: int, where: str) -> dict[str, Any]:
+    if v.ndim != ndim:
+        raise UnsupportedTypeError(f"{where}: expected a {ndim}-D array, got {v.ndim}-D")
+    target = np.dtype("<" + dtype)
+    # Floats may be narrowed (like Go conversions); integers only widened.
+    casting = "same_kind" if dtype[0] == "f" else "safe"
+    if not np.can_cast(v.dtype, target, casting=casting):
+        raise UnsupportedTypeError(f"{where}: cannot pass a {v.dtype} array as {target.name}")
+    a = np.ascontiguousarray(v, dtype=target)
+    return _ndref(dtype, list(a.shape), memoryview(a.reshape(-1)).cast("B"))
+
+
+def _pack_array(v: array.array, *, dtype: str, where: str) -> dict[str, Any]:
+    kind = _ARRAY_KINDS.get(v.typecode)
+    if kind is None or (kind == "f" and dtype[0] != "f"):
+        raise UnsupportedTypeError(f"{where}: cannot pass array('{v.typecode}') as {dtype}")
+    if f"{kind}{v.itemsize}" != dtype:
+        try:
+            v = array.array(_TYPECODES[dtype], v)
+        except OverflowError as e:
+            raise UnsupportedTypeError(f"{where}: {e}") from None
+    if sys.byteorder != "little":
+        v = array.array(v.typecode, v)
+        v.byteswap()
+    return _ndref(dtype, [len(v)], memoryview(v).cast("B"))
+
+
+def pack_arrays(*, params: list[str] | None, args: list[Any]) -> tuple[list[Any], frozenset[int]]:
+    """Pack NumPy arrays and `array.array` args of numeric slice params; return the args and their positions.
+
+    Other values (lists included) are sent as usual.
+    """
+    if params is None:
+        return args, frozenset()
+    np = _numpy()
+    positions: set[int] = set()
+    out = args
+    for i, (t, a) in enumerate(zip(params, args)):
+        if isinstance(a, array.array):
+            is_np = False
+        elif np is not None and isinstance(a, np.ndarray):
+            is_np = True
+        else:
+            continue
+        nd = numeric_array_type(t)
+        if nd is None:
+            continue
+        dtype, ndim = nd
+        where = f"arg{i} ({t.strip()})"
+        if is_np:
+            packed = _pack_numpy(np, a, dtype=dtype, ndim=ndim, where=where)
+        elif ndim == 1:
+            packed = _pack_array(a, dtype=dtype, where=where)
+        else:
+            raise UnsupportedTypeError(f"{where}: array.array is 1-D; pass a NumPy array")
+        if out is args:
+            out = list(args)
+        out[i] = packed
+        positions.add(i)
+    return out, frozenset(positions)
+
+
+def array_result_type(results: list[str] | None) -> tuple[str, int]:
+    """Check that a `.numpy()` call returns one numeric slice; return its `(dtype, ndim)`."""
+    values = [t for t in (results or []) if t.strip() != "error"]
+    nd = numeric_array_type(values[0]) if len(values) == 1 else None
+    if nd is None:
+        raise UnsupportedTypeError(f"numpy: results {results!r} are not a single numeric slice")
+    return nd
+
+
+def decode_array(raw: Any, *, dtype: str, ndim: int) -> Any:
+    """Decode a packed result into a read-only NumPy array (a list of arrays for ragged rows)."""
+    try:
+        import numpy as np
+    except ImportError as e:  # pragma: no cover - depends on the environment
+        raise UnsupportedTypeError("numpy results need NumPy installed") from e
+    if raw is None:
+        return None
+    if isinstance(raw, dict) and ND_KEY in raw:
+        try:
+            a = np.frombuffer(raw["data"], dtype="<" + raw[ND_KEY])
+            return a.reshape(raw["shape"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise ABIDecodeError(f"numpy: invalid packed array: {e}") from e
+    if not isinstance(raw, list):
+        raise ABIDecodeError("numpy: expected a packed array")
+    if ndim == 2 and any(isinstance(r, dict) or r is None for r in raw):
+        # Rows of different lengths are packed one by one.
+        return [decode_array(r, dtype=dtype, ndim=1) for r in raw]
+    # Libraries built before packed arrays return plain lists.
+    try:
+        a = np.asarray(raw, dtype="<" + dtype)
+    except ValueError:
+        return [np.asarray(r, dtype="<" + dtype) for r in raw]
+    return a.reshape(0, 0) if a.ndim < ndim else a
@@ -18,3 +18,18 @@ def default_artifact_root() -> Path:
         return Path(base) / "usegolib" / "artifacts"
     return Path(os.path.expanduser("~/.cache/usegolib/artifacts"))
 
+
+
+def default_result_cache_dir() -> Path:
+    """Return the directory of the persistent result cache.
+
+    Override with `USEGOLIB_DISK_CACHE_DIR`.
+    """
+    override = os.environ.get("USEGOLIB_DISK_CACHE_DIR")
+    if override:
+        return Path(override)
+
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        return Path(base) / "usegolib" / "results"
+    return Path(os.path.expanduser("~/.cache/usegolib/results"))
@@ -0,0 +1,252 @@
+"""Pipelines: chains of dependent Go calls executed in one ABI request."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable
+
+from . import abi
+from .errors import ABIDecodeError, ABIEncodeError, UseGoLibError
+from .schema import success_result_types, validate_call_args, validate_method_args
+
+if TYPE_CHECKING:
+    from .handle import CancelToken, PackageHandle, Pin
+
+REF_KEY = "$usegolib_ref"
+
+
+@dataclass(frozen=True)
+class Ref:
+    """Symbolic result of a pipeline step (or one value of a multi-result step)."""
+
+    _pipeline: "Pipeline" = field(repr=False)
+    step: int
+    index: int | None = None
+
+    def __getitem__(self, index: int) -> "Ref":
+        if self.index is not None:
+            raise UseGoLibError("pipeline ref is already indexed")
+        n = len(self._pipeline._types[self.step])  # noqa: SLF001 - internal linkage
+        if not isinstance(index, int) or not 0 <= index < n:
+            raise IndexError(f"pipeline step {self.step} has {n} result(s)")
+        return Ref(self._pipeline, self.step, index)
+
+    def _marker(self) -> dict[str, int]:
+        if self.index is None:
+            return {REF_KEY: self.step}
+        return {REF_KEY: self.step, "index": self.index}
+
+    def _go_type(self) -> str | None:
+        types = self._pipeline._types[self.step]  # noqa: SLF001 - internal linkage
+        if self.index is not None:
+            return types[self.index]
+        return types[0] if len(types) == 1 else None
+
+
+class Pipeline:
+    """Builder for a chain of Go calls that run in a single crossing.
+
+    `p.Fn(*args)` adds a function call and `p.call(target, "Method", *args)` a
+    method call on a `Ref` or `GoObject`; both return a `Ref`. Arguments may
+    contain refs anywhere (including inside lists/dicts). `run(*refs)` executes
+    every step in order and returns the values of `refs` (default: the last
+    step); object handles that are not returned are freed Go-side.
+    """
+
+    def __init__(self, pkg: "PackageHandle") -> None:
+        self._pkg = pkg
+        self._steps: list[dict[str, Any]] = []
+        # Per step: value result types (trailing error removed).
+        self._types: list[list[str]] = []
+        # Pins passed to steps, held while the pipeline runs.
+        self._pins: list["Pin"] = []
+
+    def __getattr__(self, name: str) -> Callable[..., Ref]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def _add(*args: Any) -> Ref:
+            schema = self._schema()
+            sig = schema.symbols_by_pkg.get(self._pkg.package, {}).get(name)
+            if sig is None:
+                raise UseGoLibError(f"symbol not found: {self._pkg.package}.{name}")
+            params, results = sig
+            args_list, pinned = self._encode_args(params, list(args))
+            # Positions holding refs are only known Go-side; validate the rest.
+            validate_call_args(
+                schema=schema,
+                pkg=self._pkg.package,
+                fn=name,
+                args=args_list,
+                skip=pinned | _ref_positions(args_list),
+            )
+            return self._add_step({"op": "call", "fn": name, "args": _to_wire(args_list)}, results)
+
+        return _add
+
+    def call(self, target: Any, method: str, *args: Any) -> Ref:
+        """Add a call of `method` on `target` (a `Ref` to an object handle or a `GoObject`)."""
+        from .handle import GoObject
+
+        schema = self._schema()
+        if isinstance(target, Ref):
+            self._check_ref(target)
+            type_name = self._handle_type(target._go_type())  # noqa: SLF001 - internal linkage
+            if type_name is None:
+                raise UseGoLibError(f"pipeline step {target.step} does not return an object handle")
+            wire_target: Any = target._marker()  # noqa: SLF001 - internal linkage
+        elif isinstance(target, GoObject):
+            if target._closed:  # noqa: SLF001 - internal linkage
+                raise UseGoLibError("object is closed")
+            if target._pkg._client is not self._pkg._client:  # noqa: SLF001 - internal linkage
+                raise UseGoLibError("object belongs to a different Go runtime")
+            type_name = target.type_name
+            wire_target = target.id
+        else:
+            raise TypeError("pipeline call target must be a Ref or GoObject")
+
+        sig = schema.methods_by_pkg.get(self._pkg.package, {}).get(type_name, {}).get(method)
+        if sig is None:
+            raise UseGoLibError(f"method not found: {self._pkg.package}.{type_name}.{method}")
+        params, results = sig
+        args_list, pinned = self._encode_args(params, list(args))
+        validate_method_args(
+            schema=schema,
+            pkg=self._pkg.package,
+            recv=type_name,
+            method=method,
+            args=args_list,
+            skip=pinned | _ref_positions(args_list),
+        )
+        step = {
+            "op": "obj_call",
+            "type": type_name,
+            "target": wire_target,
+            "method": method,
+            "args": _to_wire(args_list),
+        }
+        return self._add_step(step, results)
+
+    def run(self, *outputs: Ref, timeout: float | None = None, cancel: "CancelToken | None" = None) -> Any:
+        """Execute the pipeline; return one value per output ref (a tuple for several)."""
+        from .handle import _call_options, _decode_success_result, _pins_in_use, _raise_call_error
+
+        if not self._steps:
+            raise UseGoLibError("pipeline has no steps")
+        if not outputs:
+            last = len(self._steps) - 1
+            outputs = (Ref(self, last),) if self._types[last] else ()
+        for ref in outputs:
+            if not isinstance(ref, Ref):
+                raise TypeError("pipeline outputs must be Refs")
+            self._check_ref(ref)
+
+        returned = {(r.step, r.index) for r in outputs}
+        free: list[dict[str, int]] = []
+        for i, types in enumerate(self._types):
+            if (i, None) in returned:
+                continue
+            for k, t in enumerate(types):
+                if self._handle_type(t) is not None and (i, k) not in returned:
+                    free.append({REF_KEY: i} if len(types) == 1 else {REF_KEY: i, "index": k})
+
+        timeout_ns, cancel_id = _call_options(self._pkg._client, timeout=timeout, cancel=cancel)  # noqa: SLF001
+        try:
+            req = abi.encode_pipeline_request(
+                pkg=self._pkg.package,
+                steps=self._steps,
+                outputs=[r.step for r in outputs],
+                free=free,
+                timeout_ns=timeout_ns,
+                cancel=cancel_id,
+            )
+        except Exception as e:  # noqa: BLE001 - encode boundary
+            raise ABIEncodeError(str(e)) from e
+
+        with _pins_in_use(tuple(self._pins)):
+            resp_bytes = self._pkg._client.call(req)  # noqa: SLF001 - internal linkage
+        resp = abi.decode_response(resp_bytes)
+        if not resp.ok:
+            _raise_call_error(resp.error)
+        raw = resp.result
+        if not isinstance(raw, list) or len(raw) != len(outputs):
+            raise ABIDecodeError("pipeline: expected one result per output")
+
+        schema = self._schema()
+        values = []
+        for ref, v in zip(outputs, raw, strict=True):
+            types = self._types[ref.step]
+            if ref.index is not None:
+                if not isinstance(v, list) or len(v) != len(types):
+                    raise ABIDecodeError(f"pipeline: step {ref.step} returned a malformed result")
+                types, v = [types[ref.index]], v[ref.index]
+            values.append(
+                _decode_success_result(
+                    schema=schema, pkg=self._pkg.package, results=types, raw=v, pkg_handle=self._pkg
+                )
+            )
+        if len(values) == 1:
+            return values[0]
+        return tuple(values)
+
+    def _schema(self):  # noqa: ANN202
+        schema = self._pkg._schema  # noqa: SLF001 - internal linkage
+        assert schema is not None
+        return schema
+
+    def _add_step(self, step: dict[str, Any], results: list[str]) -> Ref:
+        self._steps.append(step)
+        self._types.append(success_result_types(results))
+        return Ref(self, len(self._steps) - 1)
+
+    def _check_ref(self, ref: Ref) -> None:
+        if ref._pipeline is not self:  # noqa: SLF001 - internal linkage
+            raise UseGoLibError("ref belongs to a different pipeline")
+
+    def _encode_args(self, params: list[str], args: list[Any]) -> tuple[list[Any], frozenset[int]]:
+        from .handle import Pin, _pack_variadic_args, _substitute_pins
+        from .typed import encode_value
+
+        for a in _iter_refs(args):
+            self._check_ref(a)
+        args = _pack_variadic_args(params=params, args=args)
+        args = [encode_value(schema=self._schema(), pkg=self._pkg.package, v=a) for a in args]
+        out, pinned = _substitute_pins(client=self._pkg._client, params=params, args=args)  # noqa: SLF001
+        self._pins.extend(args[i] for i in pinned if isinstance(args[i], Pin))
+        return out, pinned
+
+    def _handle_type(self, go_type: str | None) -> str | None:
+        from .handle import _opaque_ptr_target
+
+        if go_type is None:
+            return None
+        return _opaque_ptr_target(schema=self._schema(), pkg=self._pkg.package, go_type=go_type)
+
+
+def _iter_refs(v: Any):  # noqa: ANN202
+    if isinstance(v, Ref):
+        yield v
+    elif isinstance(v, (list, tuple)):
+        for x in v:
+            yield from _iter_refs(x)
+    elif isinstance(v, dict):
+        for x in v.values():
+            yield from _iter_refs(x)
+
+
+def _contains_ref(v: Any) -> bool:
+    return next(_iter_refs(v), None) is not None
+
+
+def _ref_positions(args: list[Any]) -> frozenset[int]:
+    return frozenset(i for i, a in enumerate(args) if _contains_ref(a))
+
+
+def _to_wire(v: Any) -> Any:
+    if isinstance(v, Ref):
+        return v._marker()  # noqa: SLF001 - internal linkage
+    if isinstance(v, (list, tuple)):
+        return [_to_wire(x) for x in v]
+    if isinstance(v, dict):
+        return {k: _to_wire(x) for k, x in v.items()}
+    return v
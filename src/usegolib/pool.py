@@ -0,0 +1,634 @@
+"""Process-pool execution of Go calls.
+
+A Go runtime lives in exactly one process and does not survive `fork`, so CPU
+heavy Go work is scaled across processes by loading the artifact once per
+worker (started with `spawn` or `forkserver`). Large `bytes`-like and
+`array.array` arguments and `bytes` results travel through
+`multiprocessing.shared_memory` instead of the pipe.
+"""
+
+from __future__ import annotations
+
+import array
+import collections
+import functools
+import itertools
+import multiprocessing
+import os
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from .errors import UseGoLibError, WorkerCrashedError
+
+
+_DEFAULT_SHM_THRESHOLD = 1 << 20
+
+
+@dataclass(frozen=True)
+class _ShmBytes:
+    name: str
+    size: int
+
+
+@dataclass(frozen=True)
+class _ShmArray:
+    name: str
+    size: int
+    typecode: str
+
+
+@dataclass(frozen=True)
+class _RemoteObject:
+    type_name: str
+    id: int
+
+
+def _attach_shm(name: str):
+    from multiprocessing import resource_tracker, shared_memory
+
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    # Before 3.13, attaching also registers the segment with the resource
+    # tracker, which would unlink it (with a warning) when this process exits.
+    try:
+        resource_tracker.unregister(shm._name, "shared_memory")  # noqa: SLF001 - stdlib workaround
+    except Exception:
+        pass
+    return shm
+
+
+def _read_shm(name: str, size: int) -> bytes:
+    shm = _attach_shm(name)
+    try:
+        return bytes(shm.buf[:size])
+    finally:
+        shm.close()
+
+
+def _take_shm(name: str, size: int) -> bytes:
+    """Copy out and unlink a segment whose ownership was handed to this process."""
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        return bytes(shm.buf[:size])
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _to_shm(data: memoryview, created: list, *, handoff: bool = False) -> str:
+    from multiprocessing import resource_tracker, shared_memory
+
+    shm = shared_memory.SharedMemory(create=True, size=max(1, data.nbytes))
+    created.append(shm)
+    shm.buf[: data.nbytes] = data.cast("B")
+    if handoff:
+        # The receiving process unlinks the segment; stop tracking it here.
+        try:
+            resource_tracker.unregister(shm._name, "shared_memory")  # noqa: SLF001 - stdlib workaround
+        except Exception:
+            pass
+    return shm.name
+
+
+def _pack_value(v: Any, *, threshold: int, created: list) -> Any:
+    """Replace large binary values with shared-memory references and pool objects with their ids."""
+    if isinstance(v, PoolObject):
+        return _RemoteObject(type_name=v.type_name, id=v.id)
+    if isinstance(v, (bytes, bytearray, memoryview)):
+        mv = memoryview(v)
+        if mv.nbytes >= threshold:
+            return _ShmBytes(name=_to_shm(mv, created), size=mv.nbytes)
+        return bytes(mv) if isinstance(v, memoryview) else v
+    if isinstance(v, array.array):
+        mv = memoryview(v)
+        if mv.nbytes >= threshold:
+            return _ShmArray(name=_to_shm(mv, created), size=mv.nbytes, typecode=v.typecode)
+        return v.tolist()
+    if isinstance(v, list):
+        return [_pack_value(x, threshold=threshold, created=created) for x in v]
+    if isinstance(v, tuple):
+        return tuple(_pack_value(x, threshold=threshold, created=created) for x in v)
+    if isinstance(v, dict):
+        return {k: _pack_value(x, threshold=threshold, created=created) for k, x in v.items()}
+    return v
+
+
+def _unpack_value(v: Any, objects: dict[int, Any]) -> Any:
+    if isinstance(v, _ShmBytes):
+        return _read_shm(v.name, v.size)
+    if isinstance(v, _ShmArray):
+        out = array.array(v.typecode)
+        out.frombytes(_read_shm(v.name, v.size))
+        return out.tolist()
+    if isinstance(v, _RemoteObject):
+        return _lookup_object(objects, v.id)
+    if isinstance(v, list):
+        return [_unpack_value(x, objects) for x in v]
+    if isinstance(v, tuple):
+        return tuple(_unpack_value(x, objects) for x in v)
+    if isinstance(v, dict):
+        return {k: _unpack_value(x, objects) for k, x in v.items()}
+    return v
+
+
+def _lookup_object(objects: dict[int, Any], obj_id: int) -> Any:
+    obj = objects.get(obj_id)
+    if obj is None:
+        raise UseGoLibError(f"ObjectNotFound: object {obj_id} does not live in this worker")
+    return obj
+
+
+def _release_shm(created: list) -> None:
+    for shm in created:
+        try:
+            shm.close()
+            shm.unlink()
+        except Exception:
+            pass
+
+
+def _picklable_error(e: BaseException) -> BaseException:
+    import pickle
+
+    try:
+        pickle.loads(pickle.dumps(e))
+        return e
+    except Exception:
+        return UseGoLibError(f"{type(e).__name__}: {e}")
+
+
+# ---------------------------------------------------------------------------
+# Worker process
+
+
+def _load_handle(manifest_path: str, package: str):
+    from .artifact import read_manifest
+    from .handle import PackageHandle
+
+    return PackageHandle.from_manifest(read_manifest(Path(manifest_path)), package=package, dlopen=True)
+
+
+def _worker_export(v: Any, objects: dict[int, Any], *, threshold: int, created: list) -> Any:
+    from .handle import GoObject, TypedGoObject
+
+    if isinstance(v, (GoObject, TypedGoObject)):
+        objects[v.id] = v
+        return _RemoteObject(type_name=v.type_name, id=v.id)
+    if isinstance(v, list):
+        return [_worker_export(x, objects, threshold=threshold, created=created) for x in v]
+    if isinstance(v, tuple):
+        return tuple(_worker_export(x, objects, threshold=threshold, created=created) for x in v)
+    if isinstance(v, dict):
+        return {k: _worker_export(x, objects, threshold=threshold, created=created) for k, x in v.items()}
+    if isinstance(v, (bytes, bytearray)) and len(v) >= threshold:
+        return _ShmBytes(name=_to_shm(memoryview(v), created, handoff=True), size=len(v))
+    return v
+
+
+def _worker_dispatch(handle: Any, objects: dict[int, Any], msg: tuple) -> Any:
+    op = msg[0]
+    if op == "call":
+        _, name, args = msg
+        return getattr(handle, name)(*_unpack_value(args, objects))
+    if op == "generic":
+        _, name, type_args, args = msg
+        return handle.generic(name, list(type_args))(*_unpack_value(args, objects))
+    if op == "obj_new":
+        _, type_name, init, mode = msg
+        if mode is None:
+            return handle.object(type_name, _unpack_value(init, objects))
+        return handle.object(type_name, _unpack_value(init, objects), mode=mode)
+    if op == "var_call":
+        _, var, method, args = msg
+        return getattr(getattr(handle, var), method)(*_unpack_value(args, objects))
+    if op == "obj_call":
+        _, obj_id, method, args = msg
+        obj = _lookup_object(objects, obj_id)
+        return getattr(obj, method)(*_unpack_value(args, objects))
+    if op == "obj_free":
+        _, obj_id = msg
+        obj = objects.pop(obj_id, None)
+        if obj is not None:
+            obj.close()
+        return None
+    if op == "pid":
+        return os.getpid()
+    raise UseGoLibError(f"unsupported pool op: {op!r}")
+
+
+def _worker_main(conn, loader: Callable[[], Any], threshold: int) -> None:
+    try:
+        handle = loader()
+    except BaseException as e:  # noqa: BLE001 - reported to the parent
+        conn.send(("err", _picklable_error(e)))
+        return
+    conn.send(("ok", None))
+
+    objects: dict[int, Any] = {}
+    # The parent unlinks result segments after copying them out; the worker keeps
+    # its own mapping until the next request arrives.
+    created: list = []
+    while True:
+        try:
+            msg = conn.recv()
+        except (EOFError, OSError):
+            break
+        for shm in created:
+            shm.close()
+        created = []
+        if msg[0] == "stop":
+            break
+        try:
+            result = _worker_dispatch(handle, objects, msg)
+            conn.send(("ok", _worker_export(result, objects, threshold=threshold, created=created)))
+        except BaseException as e:  # noqa: BLE001 - reported to the parent
+            conn.send(("err", _picklable_error(e)))
+    for shm in created:
+        shm.close()
+
+
+# ---------------------------------------------------------------------------
+# Parent side
+
+
+class _Worker:
+    def __init__(self, pool: "ProcessPool", index: int):
+        self.pool = pool
+        self.index = index
+        self.lock = threading.Lock()
+        self.generation = 0
+        self.proc = None
+        self.conn = None
+        # (object id, generation) pairs released by finalizers, freed on the next request.
+        self.pending_frees: collections.deque[tuple[int, int]] = collections.deque()
+
+    def start(self) -> None:
+        ctx = self.pool._ctx  # noqa: SLF001 - internal linkage
+        parent_conn, child_conn = ctx.Pipe(duplex=True)
+        proc = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self.pool._loader, self.pool._shm_threshold),  # noqa: SLF001
+            name=f"usegolib-pool-{self.index}",
+            daemon=True,
+        )
+        proc.start()
+        child_conn.close()
+        self.proc = proc
+        self.conn = parent_conn
+        self.generation += 1
+        try:
+            status, payload = parent_conn.recv()
+        except (EOFError, OSError) as e:
+            self._reap()
+            raise WorkerCrashedError(f"pool worker {self.index} exited during startup") from e
+        if status != "ok":
+            self._reap()
+            raise payload
+
+    def _reap(self) -> None:
+        if self.conn is not None:
+            try:
+                self.conn.close()
+            except OSError:
+                pass
+        if self.proc is not None:
+            self.proc.join(timeout=5)
+            if self.proc.is_alive():
+                self.proc.kill()
+                self.proc.join(timeout=5)
+        self.conn = None
+        self.proc = None
+
+    def request(self, msg: tuple, *, generation: int | None = None) -> Any:
+        """Send one request; the caller must hold `self.lock`."""
+        if generation is not None and generation != self.generation:
+            raise WorkerCrashedError(
+                f"pool worker {self.index} was restarted; objects created before the restart are gone"
+            )
+        created: list = []
+        try:
+            packed = _pack_value(msg, threshold=self.pool._shm_threshold, created=created)  # noqa: SLF001
+            try:
+                assert self.conn is not None
+                self.conn.send(packed)
+                status, payload = self.conn.recv()
+            except (EOFError, OSError) as e:
+                self._restart_after_crash()
+                raise WorkerCrashedError(
+                    f"pool worker {self.index} crashed while handling {msg[0]!r}; it has been restarted"
+                ) from e
+        finally:
+            _release_shm(created)
+        if status != "ok":
+            raise payload
+        return payload
+
+    def drain_frees(self) -> None:
+        """Free objects queued by `PoolObject.__del__`; the caller must hold `self.lock`."""
+        while self.pending_frees:
+            obj_id, generation = self.pending_frees.popleft()
+            if generation != self.generation:
+                continue
+            try:
+                self.request(("obj_free", obj_id))
+            except Exception:
+                continue
+
+    def _restart_after_crash(self) -> None:
+        self._reap()
+        if not self.pool._closed:  # noqa: SLF001 - internal linkage
+            self.start()
+
+    def stop(self) -> None:
+        if self.conn is not None:
+            try:
+                self.conn.send(("stop",))
+            except OSError:
+                pass
+        self._reap()
+
+
+class ProcessPool:
+    """Run Go calls for one module across `workers` processes.
+
+    The call surface mirrors `PackageHandle`: `pool.Fn(*args)`, `pool.object(...)`,
+    `pool.generic(...)` and package variables. Each call is routed to an idle
+    worker; methods on objects returned by a worker are always routed back to
+    that worker (sticky routing). A worker that dies is restarted and the
+    in-flight call raises `WorkerCrashedError`; handles to objects that lived in
+    it become invalid.
+
+    `start_method` must be `"spawn"` or `"forkserver"` (a Go runtime cannot be
+    forked). Binary arguments/results of at least `shm_threshold` bytes are
+    passed through shared memory.
+    """
+
+    def __init__(
+        self,
+        module: str,
+        version: str | None = None,
+        *,
+        artifact_dir: str | Path | None = None,
+        build_if_missing: bool | None = None,
+        workers: int | None = None,
+        start_method: str = "spawn",
+        shm_threshold: int = _DEFAULT_SHM_THRESHOLD,
+    ) -> None:
+        from .handle import _load_schema
+        from .importer import _resolve_import
+
+        manifest, runtime_pkg = _resolve_import(
+            module, version, artifact_dir=artifact_dir, build_if_missing=build_if_missing
+        )
+        assert manifest.manifest_path is not None
+        self._init(
+            loader=functools.partial(_load_handle, str(manifest.manifest_path), runtime_pkg),
+            package=runtime_pkg,
+            schema=_load_schema(manifest),
+            workers=workers,
+            start_method=start_method,
+            shm_threshold=shm_threshold,
+        )
+
+    @classmethod
+    def _with_loader(
+        cls,
+        loader: Callable[[], Any],
+        *,
+        package: str = "",
+        schema: Any = None,
+        workers: int | None = None,
+        start_method: str = "spawn",
+        shm_threshold: int = _DEFAULT_SHM_THRESHOLD,
+    ) -> "ProcessPool":
+        """Build a pool whose workers obtain their handle from `loader` (must be picklable)."""
+        self = cls.__new__(cls)
+        self._init(
+            loader=loader,
+            package=package,
+            schema=schema,
+            workers=workers,
+            start_method=start_method,
+            shm_threshold=shm_threshold,
+        )
+        return self
+
+    def _init(
+        self,
+        *,
+        loader: Callable[[], Any],
+        package: str,
+        schema: Any,
+        workers: int | None,
+        start_method: str,
+        shm_threshold: int,
+    ) -> None:
+        if start_method not in {"spawn", "forkserver"}:
+            raise ValueError("start_method must be 'spawn' or 'forkserver' (Go runtimes do not survive fork)")
+        self.package = package
+        self._schema = schema
+        self._loader = loader
+        self._shm_threshold = max(1, int(shm_threshold))
+        self._ctx = multiprocessing.get_context(start_method)
+        self._closed = False
+        self._rr = itertools.count()
+        n = workers if workers is not None else (os.cpu_count() or 1)
+        self._workers = [_Worker(self, i) for i in range(max(1, n))]
+        try:
+            for w in self._workers:
+                w.start()
+        except BaseException:
+            self.close()
+            raise
+
+    @property
+    def schema(self):
+        return self._schema
+
+    @property
+    def workers(self) -> int:
+        return len(self._workers)
+
+    def _submit(self, msg: tuple, *, worker: _Worker | None = None, generation: int | None = None) -> Any:
+        if self._closed:
+            raise UseGoLibError("process pool is closed")
+        for obj in _pool_objects(msg):
+            # An object argument pins the call to the worker it lives in.
+            if obj._closed:  # noqa: SLF001 - internal linkage
+                raise UseGoLibError("object is closed")
+            if obj._pool is not self:  # noqa: SLF001
+                raise UseGoLibError("object belongs to a different process pool")
+            if worker is None:
+                worker, generation = obj._worker, obj._generation  # noqa: SLF001
+            elif obj._worker is not worker or obj._generation != generation:  # noqa: SLF001
+                raise UseGoLibError(
+                    f"objects passed to one call must live in the same pool worker "
+                    f"({obj.type_name} {obj.id} lives in worker {obj.worker_index})"
+                )
+        if worker is None:
+            # Prefer an idle worker, starting from a rotating offset.
+            start = next(self._rr)
+            n = len(self._workers)
+            for k in range(n):
+                w = self._workers[(start + k) % n]
+                if w.lock.acquire(blocking=False):
+                    try:
+                        w.drain_frees()
+                        return self._wrap(w, w.request(msg))
+                    finally:
+                        w.lock.release()
+            worker = self._workers[start % n]
+        with worker.lock:
+            worker.drain_frees()
+            return self._wrap(worker, worker.request(msg, generation=generation))
+
+    def _wrap(self, worker: _Worker, v: Any) -> Any:
+        if isinstance(v, _RemoteObject):
+            return PoolObject(_pool=self, _worker=worker, _generation=worker.generation, _type=v.type_name, _id=v.id)
+        if isinstance(v, list):
+            return [self._wrap(worker, x) for x in v]
+        if isinstance(v, tuple):
+            return tuple(self._wrap(worker, x) for x in v)
+        if isinstance(v, dict):
+            return {k: self._wrap(worker, x) for k, x in v.items()}
+        if isinstance(v, _ShmBytes):
+            return _take_shm(v.name, v.size)
+        return v
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        schema = self.__dict__.get("_schema")
+        if schema is not None and name in schema.vars_by_pkg.get(self.package, {}):
+            return _PoolVar(_pool=self, _name=name)
+
+        def _call(*args: Any) -> Any:
+            return self._submit(("call", name, args))
+
+        _call.__name__ = name
+        return _call
+
+    def generic(self, name: str, type_args: list[str]) -> Callable[..., Any]:
+        def _call(*args: Any) -> Any:
+            return self._submit(("generic", name, tuple(type_args), args))
+
+        return _call
+
+    def object(self, type_name: str, init: Any | None = None, *, mode: str | None = None) -> "PoolObject":
+        return self._submit(("obj_new", type_name, init, mode))
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        for w in self._workers:
+            with w.lock:
+                w.stop()
+
+    def __enter__(self) -> "ProcessPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        self.close()
+
+
+def _pool_objects(v: Any):
+    if isinstance(v, PoolObject):
+        yield v
+    elif isinstance(v, (list, tuple)):
+        for x in v:
+            yield from _pool_objects(x)
+    elif isinstance(v, dict):
+        for x in v.values():
+            yield from _pool_objects(x)
+
+
+@dataclass
+class _PoolVar:
+    """A package variable; each worker holds its own copy, so calls go to any worker."""
+
+    _pool: ProcessPool
+    _name: str
+
+    def __getattr__(self, method: str) -> Callable[..., Any]:
+        if method.startswith("_"):
+            raise AttributeError(method)
+
+        def _call(*args: Any) -> Any:
+            return self._pool._submit(("var_call", self._name, method, args))  # noqa: SLF001
+
+        return _call
+
+
+@dataclass
+class PoolObject:
+    """A Go object living in one pool worker; method calls are routed to that worker."""
+
+    _pool: ProcessPool
+    _worker: _Worker
+    _generation: int
+    _type: str
+    _id: int
+    _closed: bool = False
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    @property
+    def type_name(self) -> str:
+        return self._type
+
+    @property
+    def worker_index(self) -> int:
+        return self._worker.index
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._pool._closed or self._generation != self._worker.generation:  # noqa: SLF001
+            return
+        try:
+            self._pool._submit(("obj_free", self._id), worker=self._worker, generation=self._generation)  # noqa: SLF001
+        except Exception:
+            return
+
+    def __enter__(self) -> "PoolObject":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        self.close()
+
+    def __del__(self) -> None:
+        # A finalizer may run on a thread that already holds the worker lock (GC can
+        # trigger inside a request), so queue the free instead of taking the lock.
+        try:
+            if self._closed:
+                return
+            self._closed = True
+            if not self._pool._closed and self._generation == self._worker.generation:  # noqa: SLF001
+                self._worker.pending_frees.append((self._id, self._generation))
+        except Exception:
+            return
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def _call(*args: Any) -> Any:
+            if self._closed:
+                raise UseGoLibError("object is closed")
+            return self._pool._submit(  # noqa: SLF001 - internal linkage
+                ("obj_call", self._id, name, args),
+                worker=self._worker,
+                generation=self._generation,
+            )
+
+        return _call
@@ -0,0 +1,172 @@
+"""Reader arguments: Python input streamed into Go `io.Reader` parameters."""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterator
+
+from . import abi
+from .errors import UnsupportedTypeError
+
+if TYPE_CHECKING:
+    from .runtime.cbridge import SharedLibClient
+
+READER_KEY = "$usegolib_reader"
+DEFAULT_CHUNK = 1 << 20
+
+
+@dataclass(frozen=True)
+class GoFile:
+    """An `io.Reader` argument that Go opens and reads itself; no data passes through Python.
+
+    Give a `path`, or an OS file descriptor `fd`. The descriptor is duplicated for
+    the call, so the caller keeps it; reads advance its shared file offset.
+    """
+
+    path: str | os.PathLike[str] | None = None
+    fd: int | None = None
+
+    def __post_init__(self) -> None:
+        if (self.path is None) == (self.fd is None):
+            raise ValueError("GoFile needs exactly one of path or fd")
+
+
+def _send(client: "SharedLibClient", request: bytes) -> bytes:
+    # Reader ops bypass call coalescing: a push batched with the call reading it
+    # would only return once that call, which waits for the next push, returned.
+    send = getattr(client, "_call", None) or client.call  # noqa: SLF001 - internal linkage
+    return send(request)
+
+
+class _Reader:
+    """A reader registered Go-side for one call, fed from Python by a helper thread if needed."""
+
+    def __init__(self, client: "SharedLibClient", source: Any, *, chunk: int) -> None:
+        from .handle import _raise_call_error
+
+        self._client = client
+        self._source = source
+        self._chunk = chunk
+        self._error: BaseException | None = None
+        self._thread: threading.Thread | None = None
+        fd: int | None = None
+        path: str | None = None
+        if isinstance(source, GoFile):
+            if source.fd is not None:
+                if sys.platform == "win32":
+                    raise UnsupportedTypeError("GoFile(fd=...) is not supported on Windows; pass path=")
+                fd = os.dup(source.fd)
+            else:
+                path = os.fspath(source.path)
+        try:
+            resp = abi.decode_response(_send(client, abi.encode_reader_request(op="reader_new", path=path, fd=fd)))
+        except BaseException:
+            if fd is not None:
+                os.close(fd)
+            raise
+        if not resp.ok:
+            if fd is not None:
+                os.close(fd)
+            _raise_call_error(resp.error)
+        # From here on the Go reader owns the duplicated descriptor.
+        self.id: int = resp.result
+        if not isinstance(source, GoFile):
+            self._thread = threading.Thread(target=self._feed, name="usegolib-reader", daemon=True)
+            self._thread.start()
+
+    def _chunks(self) -> Iterator[Any]:
+        src = self._source
+        read = getattr(src, "read", None)
+        if read is not None:
+            while True:
+                data = read(self._chunk)
+                if not data:
+                    return
+                if isinstance(data, str):
+                    raise TypeError("io.Reader source returned str; open it in binary mode")
+                yield data
+        for data in src:
+            if not isinstance(data, (bytes, bytearray, memoryview)):
+                raise TypeError(f"io.Reader source yielded {type(data).__name__}, expected bytes")
+            if data:
+                yield data
+
+    def _push(self, **kwargs: Any) -> bool:
+        resp = abi.decode_response(
+            _send(self._client, abi.encode_reader_request(op="reader_push", reader_id=self.id, **kwargs))
+        )
+        return bool(resp.ok and resp.result)
+
+    def _feed(self) -> None:
+        try:
+            for data in self._chunks():
+                if not self._push(value=data):
+                    return  # the Go function stopped reading
+            self._push(eof=True)
+        except BaseException as e:  # noqa: BLE001 - re-raised by close()
+            self._error = e
+            try:
+                self._push(err=f"{type(e).__name__}: {e}")
+            except Exception:
+                return
+
+    def close(self) -> None:
+        """Release the Go reader (ending a blocked push); re-raise a source error."""
+        try:
+            _send(self._client, abi.encode_reader_request(op="reader_free", reader_id=self.id))
+        finally:
+            if self._thread is not None:
+                self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+
+def substitute_readers(
+    *, client: "SharedLibClient", params: list[str] | None, args: list[Any], chunk: int = DEFAULT_CHUNK
+) -> tuple[list[Any], frozenset[int], list[_Reader]]:
+    """Replace `io.Reader` arguments; return the args, their positions and the readers to close.
+
+    Bytes are sent inline. File objects (anything with `read`) and iterables of
+    bytes are streamed `chunk` bytes at a time, and a `GoFile` is read by Go.
+    """
+    if params is None:
+        return args, frozenset(), []
+    positions: set[int] = set()
+    readers: list[_Reader] = []
+    out = args
+    try:
+        for i, t in enumerate(params):
+            if t.strip() != "io.Reader" or i >= len(args):
+                continue
+            a = args[i]
+            positions.add(i)
+            if a is None or isinstance(a, (bytes, bytearray, memoryview)):
+                continue
+            if isinstance(a, (str, dict)) or not (
+                isinstance(a, GoFile) or hasattr(a, "read") or hasattr(a, "__iter__")
+            ):
+                raise UnsupportedTypeError(f"arg{i} (io.Reader): expected bytes, a file object or GoFile")
+            r = _Reader(client, a, chunk=chunk)
+            readers.append(r)
+            if out is args:
+                out = list(args)
+            out[i] = {READER_KEY: r.id}
+    except BaseException:
+        close_readers(readers)
+        raise
+    return out, frozenset(positions), readers
+
+
+def close_readers(readers: list[_Reader]) -> None:
+    """Close every reader; raise the first source error after all are closed."""
+    error: BaseException | None = None
+    for r in readers:
+        try:
+            r.close()
+        except BaseException as e:  # noqa: BLE001 - raised below
+            error = error or e
+    if error is not None:
+        raise error
@@ -4,19 +4,32 @@ from __future__ import annotations
 
 import ctypes
 import os
+import threading
+import time
+from concurrent.futures import Future
 from pathlib import Path
+from typing import Any, Callable
 
-from ..errors import LoadError
+from .. import abi
+from ..errors import ABIDecodeError, LoadError, UnsupportedTypeError
 
 
 class SharedLibClient:
     def __init__(self, path: Path):
         self._path = Path(path)
         self._lib = None
+        self._load_lock = threading.Lock()
+        self._coalescer: _Coalescer | None = None
 
     def _load(self) -> None:
         if self._lib is not None:
             return
+        with self._load_lock:
+            if self._lib is not None:
+                return
+            self._load_locked()
+
+    def _load_locked(self) -> None:
         if not self._path.exists():
             raise LoadError(f"shared library not found: {self._path}")
 
@@ -40,9 +53,117 @@ class SharedLibClient:
         lib.usegolib_free.argtypes = [ctypes.c_void_p]
         lib.usegolib_free.restype = None
 
+        # long long usegolib_io_{read,write}(uint64_t id, void* buf, size_t n, uint8_t** err, size_t* err_len)
+        # (absent from libraries built before io handles existed).
+        for name in ("usegolib_io_read", "usegolib_io_write"):
+            fn = getattr(lib, name, None)
+            if fn is not None:
+                fn.argtypes = [
+                    ctypes.c_ulonglong,
+                    ctypes.c_void_p,
+                    ctypes.c_size_t,
+                    ctypes.POINTER(ctypes.c_void_p),
+                    ctypes.POINTER(ctypes.c_size_t),
+                ]
+                fn.restype = ctypes.c_longlong
+
+        # int usegolib_arrow_export(uint64_t id, struct ArrowSchema*, struct ArrowArray*, uint8_t** err, size_t* err_len)
+        fn = getattr(lib, "usegolib_arrow_export", None)
+        if fn is not None:
+            fn.argtypes = [
+                ctypes.c_ulonglong,
+                ctypes.c_void_p,
+                ctypes.c_void_p,
+                ctypes.POINTER(ctypes.c_void_p),
+                ctypes.POINTER(ctypes.c_size_t),
+            ]
+            fn.restype = ctypes.c_int
+
         self._lib = lib
 
+    def set_coalescing(self, *, enabled: bool = True, max_delay: float = 0.0002, max_batch: int = 32) -> None:
+        """Enable (or disable) coalescing of concurrent requests into `batch` requests.
+
+        While other requests are running in Go, a new `call`/`obj_call` request
+        waits up to `max_delay` seconds for up to `max_batch - 1` more from other
+        threads and enters Go together with them. A request arriving while Go is
+        idle is sent immediately, so single-threaded latency is unchanged. Other
+        ops (frees, cancels, pins, stream and reader ops) are always sent directly.
+        """
+        if not enabled:
+            self._coalescer = None
+            return
+        if isinstance(max_delay, bool) or not isinstance(max_delay, (int, float)) or max_delay < 0:
+            raise ValueError("max_delay must be a non-negative number of seconds")
+        if isinstance(max_batch, bool) or not isinstance(max_batch, int) or max_batch < 1:
+            raise ValueError("max_batch must be a positive integer")
+        self._coalescer = _Coalescer(self._call, max_delay=max_delay, max_batch=max_batch)
+
+    def coalescing_stats(self) -> dict[str, Any] | None:
+        """Return batch metrics while coalescing is enabled, else None."""
+        co = self._coalescer
+        return None if co is None else co.stats()
+
     def call(self, request: bytes) -> bytes:
+        co = self._coalescer
+        if co is not None and abi.request_op(request) in _COALESCED_OPS:
+            return co.call(request)
+        return self._call(request)
+
+    def io_transfer(self, op: str, obj_id: int, buf: Any) -> tuple[int, bytes | None] | None:
+        """Have Go read into (`op="read"`) or write from `buf` in place, without MessagePack.
+
+        Returns `(count, None)`, with count -1 at EOF, or `(-2, encoded error response)`.
+        Returns None when the library has no direct io entry points.
+        """
+        self._load()
+        fn = getattr(self._lib, f"usegolib_io_{op}", None)
+        if fn is None:
+            return None
+        if isinstance(buf, bytes):
+            ptr: Any = buf
+            n = len(buf)
+        else:
+            mv = memoryview(buf).cast("B")
+            n = len(mv)
+            if mv.readonly:
+                if op == "read":
+                    raise TypeError("readinto needs a writable buffer")
+                ptr = mv.tobytes()
+            else:
+                ptr = (ctypes.c_char * n).from_buffer(mv)
+        err_ptr = ctypes.c_void_p()
+        err_len = ctypes.c_size_t()
+        rc = fn(obj_id, ptr, n, ctypes.byref(err_ptr), ctypes.byref(err_len))
+        if rc >= -1:
+            return rc, None
+        try:
+            return rc, ctypes.string_at(err_ptr, err_len.value)
+        finally:
+            if err_ptr.value:
+                self._lib.usegolib_free(err_ptr)
+
+    def arrow_export(self, lazy_id: int, schema_addr: int, array_addr: int) -> bytes | None:
+        """Export a lazy slice into the Arrow C structs at the given addresses.
+
+        Returns None on success (the caller then owns the structs and must release
+        them), or the encoded error response.
+        """
+        self._load()
+        fn = getattr(self._lib, "usegolib_arrow_export", None)
+        if fn is None:
+            raise UnsupportedTypeError("arrow: this library predates Arrow export; rebuild it")
+        err_ptr = ctypes.c_void_p()
+        err_len = ctypes.c_size_t()
+        if fn(lazy_id, schema_addr, array_addr, ctypes.byref(err_ptr), ctypes.byref(err_len)) == 0:
+            return None
+        try:
+            return ctypes.string_at(err_ptr, err_len.value)
+        finally:
+            if err_ptr.value:
+                self._lib.usegolib_free(err_ptr)
+
+    def _call(self, request: bytes) -> bytes:
         self._load()
         assert self._lib is not None
 
@@ -65,3 +186,113 @@ class SharedLibClient:
             if resp_ptr.value:
                 self._lib.usegolib_free(resp_ptr)
 
+
+# Only calls are batched: control ops must not wait for the slowest call of a
+# batch, and some (reader pushes, cancels) are what a call in the batch waits for.
+_COALESCED_OPS = frozenset({"call", "obj_call"})
+
+
+class _Pending:
+    __slots__ = ("request", "future", "taken")
+
+    def __init__(self, request: bytes) -> None:
+        self.request = request
+        self.future: Future = Future()
+        self.taken = False
+
+
+class _Coalescer:
+    """Gathers concurrent requests into batches (see `SharedLibClient.set_coalescing`).
+
+    There is no background thread: the first waiting caller collects a batch,
+    sends it on its own thread and routes each response to its caller. Callers
+    left over from a full batch elect the next collector.
+    """
+
+    def __init__(self, send: Callable[[bytes], bytes], *, max_delay: float, max_batch: int) -> None:
+        self._send = send
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self._cond = threading.Condition()
+        self._pending: list[_Pending] = []
+        self._collecting = False
+        self._active = 0  # sends currently inside Go
+        self._batches = 0
+        self._requests = 0
+        self._max_size = 0
+        self._sizes: dict[int, int] = {}
+
+    def call(self, request: bytes) -> bytes:
+        entry = _Pending(request)
+        batch: list[_Pending] | None = None
+        with self._cond:
+            self._pending.append(entry)
+            while not entry.taken:
+                if not self._collecting:
+                    batch = self._collect()
+                    break
+                if len(self._pending) >= self.max_batch:
+                    self._cond.notify_all()
+                self._cond.wait()
+        if batch is not None:
+            self._run(batch)
+        return entry.future.result()
+
+    def _collect(self) -> list[_Pending]:
+        # Called with `_cond` held. Waiting only pays off while Go is busy: an idle
+        # runtime would serve the request right away.
+        self._collecting = True
+        if self._active and self.max_delay > 0:
+            deadline = time.monotonic() + self.max_delay
+            while len(self._pending) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+        batch = self._pending[: self.max_batch]
+        del self._pending[: self.max_batch]
+        for e in batch:
+            e.taken = True
+        self._collecting = False
+        self._active += 1
+        n = len(batch)
+        self._batches += 1
+        self._requests += n
+        self._max_size = max(self._max_size, n)
+        self._sizes[n] = self._sizes.get(n, 0) + 1
+        # Wake batch members (now taken) and any leftovers, which elect a new collector.
+        self._cond.notify_all()
+        return batch
+
+    def _run(self, batch: list[_Pending]) -> None:
+        try:
+            if len(batch) == 1:
+                responses = [self._send(batch[0].request)]
+            else:
+                resp = abi.decode_response(self._send(abi.encode_batch_request([e.request for e in batch])))
+                if not resp.ok or not isinstance(resp.result, list) or len(resp.result) != len(batch):
+                    msg = resp.error.message if resp.error is not None else "malformed batch response"
+                    raise ABIDecodeError(f"batch: {msg}")
+                responses = resp.result
+        except BaseException as e:  # noqa: BLE001 - delivered to every caller
+            for entry in batch:
+                entry.future.set_exception(e)
+            return
+        finally:
+            with self._cond:
+                self._active -= 1
+        for entry, out in zip(batch, responses, strict=True):
+            entry.future.set_result(bytes(out) if out is not None else b"")
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "max_delay": self.max_delay,
+                "max_batch": self.max_batch,
+                "batches": self._batches,
+                "requests": self._requests,
+                "mean_batch_size": self._requests / self._batches if self._batches else 0.0,
+                "max_batch_size": self._max_size,
+                "batch_sizes": dict(sorted(self._sizes.items())),
+                "in_flight": self._active,
+            }
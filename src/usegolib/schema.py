@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from .errors import UnsupportedTypeError
@@ -13,6 +13,33 @@ _INT_RANGES = {
     "int64": (-(2**63), 2**63 - 1),
     # Treat `int` as 64-bit (CI targets include amd64; this matches our ABI intents for v0).
     "int": (-(2**63), 2**63 - 1),
+    "uint8": (0, 2**8 - 1),
+    "uint16": (0, 2**16 - 1),
+    "uint32": (0, 2**32 - 1),
+    "uint64": (0, 2**64 - 1),
+    "uint": (0, 2**64 - 1),
+}
+
+# Per-handle concurrency modes for Go objects (see `PackageHandle.object`).
+OBJECT_MODES = ("exclusive", "rwlock", "unsafe")
+
+# Interface results returned as object handles and wrapped in `usegolib.goio.GoRawIO`.
+IO_TYPES = frozenset({"io.Reader", "io.ReadCloser", "io.Writer", "io.WriteCloser", "io.ReadWriteCloser"})
+
+# Packed array element types (NumPy dtype codes, little-endian); `int` and `uint` are
+# 64-bit as above. `[]uint8` is `[]byte`, which travels as bytes.
+NUMERIC_DTYPES = {
+    "float64": "f8",
+    "float32": "f4",
+    "int64": "i8",
+    "int": "i8",
+    "int32": "i4",
+    "int16": "i2",
+    "int8": "i1",
+    "uint64": "u8",
+    "uint": "u8",
+    "uint32": "u4",
+    "uint16": "u2",
 }
 
 
@@ -41,6 +68,58 @@ def success_result_types(results: list[str]) -> list[str]:
     return rs
 
 
+def stream_item_types(t: str) -> list[str] | None:
+    """Item types of a stream result type, else None.
+
+    `<-chan T` / `chan T` / `iter.Seq[T]` stream `[T]`; `iter.Seq2[K, V]` streams
+    `[K, V]` pairs.
+    """
+    t = t.strip()
+    for prefix in ("<-chan ", "chan "):
+        if t.startswith(prefix):
+            inner = t[len(prefix) :].strip()
+            return [inner] if inner and not inner.startswith("<-") else None
+    if t.startswith("iter.Seq[") and t.endswith("]"):
+        inner = t[len("iter.Seq[") : -1].strip()
+        return [inner] if inner else None
+    if t.startswith("iter.Seq2[") and t.endswith("]"):
+        inner = t[len("iter.Seq2[") : -1]
+        depth = 0
+        for i, c in enumerate(inner):
+            if c == "[":
+                depth += 1
+            elif c == "]":
+                depth -= 1
+            elif c == "," and depth == 0:
+                k, v = inner[:i].strip(), inner[i + 1 :].strip()
+                return [k, v] if k and v else None
+    return None
+
+
+def numeric_array_type(t: str) -> tuple[str, int] | None:
+    """`(dtype, ndim)` of a `[]T` / `[][]T` (or `...T`) of a numeric `T`, else None."""
+    t = t.strip()
+    if t.startswith("..."):
+        t = "[]" + t[3:].strip()
+    ndim = 0
+    while t.startswith("[]") and ndim < 3:
+        t = t[2:].strip()
+        ndim += 1
+    dtype = NUMERIC_DTYPES.get(t)
+    if dtype is None or ndim not in (1, 2):
+        return None
+    return dtype, ndim
+
+
+def record_slice_struct(*, schema: Schema, pkg: str, t: str) -> StructSchema | None:
+    """The record struct of a `[]T` / `[]*T` type, else None."""
+    base, ops = _parse_type(t)
+    if ops not in (["[]"], ["[]", "*"]):
+        return None
+    st = schema.structs_by_pkg.get(pkg, {}).get(base)
+    return st if st is not None and st.fields_by_name else None
+
+
 def _split_prefix(t: str) -> tuple[str, str]:
     t = t.strip()
     if t.startswith("*"):
@@ -96,6 +175,14 @@ class Schema:
     generic_docs_by_pkg: dict[str, dict[str, str]]
     vars_by_pkg: dict[str, dict[str, str]]
     var_docs_by_pkg: dict[str, dict[str, str]]
+    # pkg -> typeName -> default concurrency mode (from build-time annotations)
+    concurrency_by_pkg: dict[str, dict[str, str]] = field(default_factory=dict)
+    # pkg -> typeName -> read-only method names
+    readonly_methods_by_pkg: dict[str, dict[str, frozenset[str]]] = field(default_factory=dict)
+    # pkg -> symbol names whose Go function takes a leading context.Context
+    context_symbols_by_pkg: dict[str, set[str]] = field(default_factory=dict)
+    # pkg -> function names annotated pure (results may be cached)
+    pure_symbols_by_pkg: dict[str, set[str]] = field(default_factory=dict)
 
     @classmethod
     def from_manifest(cls, manifest_schema: dict[str, Any] | None) -> "Schema | None":
@@ -166,6 +253,7 @@ class Schema:
 
         symbols_by_pkg: dict[str, dict[str, tuple[list[str], list[str]]]] = {}
         symbol_docs_by_pkg: dict[str, dict[str, str]] = {}
+        context_symbols_by_pkg: dict[str, set[str]] = {}
         raw_symbols = manifest_schema.get("symbols")
         if isinstance(raw_symbols, list):
             for s in raw_symbols:
@@ -187,6 +275,8 @@ class Schema:
                 symbols_by_pkg.setdefault(pkg, {})[name] = (list(params), list(results))
                 if isinstance(doc, str) and doc.strip():
                     symbol_docs_by_pkg.setdefault(pkg, {})[name] = doc.strip()
+                if s.get("context") is True:
+                    context_symbols_by_pkg.setdefault(pkg, set()).add(name)
 
         methods_by_pkg: dict[str, dict[str, dict[str, tuple[list[str], list[str]]]]] = {}
         method_docs_by_pkg: dict[str, dict[str, dict[str, str]]] = {}
@@ -259,6 +349,37 @@ class Schema:
                 if isinstance(doc, str) and doc.strip():
                     var_docs_by_pkg.setdefault(pkg, {})[name] = doc.strip()
 
+        concurrency_by_pkg: dict[str, dict[str, str]] = {}
+        readonly_methods_by_pkg: dict[str, dict[str, frozenset[str]]] = {}
+        raw_types = manifest_schema.get("types")
+        if isinstance(raw_types, list):
+            for t in raw_types:
+                if not isinstance(t, dict):
+                    continue
+                pkg = t.get("pkg")
+                name = t.get("name")
+                if not (isinstance(pkg, str) and isinstance(name, str)):
+                    continue
+                mode = t.get("concurrency")
+                if isinstance(mode, str) and mode in OBJECT_MODES:
+                    concurrency_by_pkg.setdefault(pkg, {})[name] = mode
+                readonly = t.get("readonly")
+                if isinstance(readonly, list):
+                    readonly_methods_by_pkg.setdefault(pkg, {})[name] = frozenset(
+                        m for m in readonly if isinstance(m, str)
+                    )
+
+        pure_symbols_by_pkg: dict[str, set[str]] = {}
+        raw_functions = manifest_schema.get("functions")
+        if isinstance(raw_functions, list):
+            for f in raw_functions:
+                if not isinstance(f, dict):
+                    continue
+                pkg = f.get("pkg")
+                name = f.get("name")
+                if isinstance(pkg, str) and isinstance(name, str) and f.get("pure") is True:
+                    pure_symbols_by_pkg.setdefault(pkg, set()).add(name)
+
         return cls(
             structs_by_pkg=structs,
             symbols_by_pkg=symbols_by_pkg,
@@ -269,6 +390,86 @@ class Schema:
             generic_docs_by_pkg=generic_docs_by_pkg,
             vars_by_pkg=vars_by_pkg,
             var_docs_by_pkg=var_docs_by_pkg,
+            concurrency_by_pkg=concurrency_by_pkg,
+            readonly_methods_by_pkg=readonly_methods_by_pkg,
+            context_symbols_by_pkg=context_symbols_by_pkg,
+            pure_symbols_by_pkg=pure_symbols_by_pkg,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain data (str/bool/list/dict only) that `from_dict` turns back into this schema."""
+        return {
+            "structs": {
+                pkg: {
+                    name: [
+                        s.key_to_name,
+                        {fn: [f.type, f.required, f.key, f.omitempty] for fn, f in s.fields_by_name.items()},
+                    ]
+                    for name, s in by_name.items()
+                }
+                for pkg, by_name in self.structs_by_pkg.items()
+            },
+            "symbols": self.symbols_by_pkg,
+            "symbol_docs": self.symbol_docs_by_pkg,
+            "methods": self.methods_by_pkg,
+            "method_docs": self.method_docs_by_pkg,
+            "generics": {
+                pkg: {name: [[list(k), sym] for k, sym in by_args.items()] for name, by_args in by_name.items()}
+                for pkg, by_name in self.generics_by_pkg.items()
+            },
+            "generic_docs": self.generic_docs_by_pkg,
+            "vars": self.vars_by_pkg,
+            "var_docs": self.var_docs_by_pkg,
+            "concurrency": self.concurrency_by_pkg,
+            "readonly": {
+                pkg: {name: sorted(ms) for name, ms in by_name.items()}
+                for pkg, by_name in self.readonly_methods_by_pkg.items()
+            },
+            "context": {pkg: sorted(names) for pkg, names in self.context_symbols_by_pkg.items()},
+            "pure": {pkg: sorted(names) for pkg, names in self.pure_symbols_by_pkg.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> "Schema":
+        """Inverse of `to_dict`; malformed input raises (KeyError, TypeError, ValueError)."""
+
+        def sigs(by_name: dict[str, Any]) -> dict[str, tuple[list[str], list[str]]]:
+            return {name: (list(params), list(results)) for name, (params, results) in by_name.items()}
+
+        return cls(
+            structs_by_pkg={
+                pkg: {
+                    name: StructSchema(
+                        key_to_name=dict(key_to_name),
+                        fields_by_name={
+                            fn: FieldSchema(type=t, required=r, key=k, omitempty=o)
+                            for fn, (t, r, k, o) in fields.items()
+                        },
+                    )
+                    for name, (key_to_name, fields) in by_name.items()
+                }
+                for pkg, by_name in d["structs"].items()
+            },
+            symbols_by_pkg={pkg: sigs(by_name) for pkg, by_name in d["symbols"].items()},
+            symbol_docs_by_pkg=d["symbol_docs"],
+            methods_by_pkg={
+                pkg: {recv: sigs(by_name) for recv, by_name in by_recv.items()}
+                for pkg, by_recv in d["methods"].items()
+            },
+            method_docs_by_pkg=d["method_docs"],
+            generics_by_pkg={
+                pkg: {name: {tuple(k): sym for k, sym in pairs} for name, pairs in by_name.items()}
+                for pkg, by_name in d["generics"].items()
+            },
+            generic_docs_by_pkg=d["generic_docs"],
+            vars_by_pkg=d["vars"],
+            var_docs_by_pkg=d["var_docs"],
+            concurrency_by_pkg=d["concurrency"],
+            readonly_methods_by_pkg={
+                pkg: {name: frozenset(ms) for name, ms in by_name.items()} for pkg, by_name in d["readonly"].items()
+            },
+            context_symbols_by_pkg={pkg: set(names) for pkg, names in d["context"].items()},
+            pure_symbols_by_pkg={pkg: set(names) for pkg, names in d["pure"].items()},
         )
 
 
@@ -279,7 +480,10 @@ def validate_struct_value(*, schema: Schema, pkg: str, struct: str, value: Any)
         raise UnsupportedTypeError(f"schema: {struct}: {e}") from None
 
 
-def validate_call_args(*, schema: Schema, pkg: str, fn: str, args: list[Any]) -> None:
+def validate_call_args(
+    *, schema: Schema, pkg: str, fn: str, args: list[Any], skip: frozenset[int] = frozenset()
+) -> None:
+    """Validate call arguments; positions in `skip` are not checked (pin and reader markers, pipeline refs)."""
     sig = schema.symbols_by_pkg.get(pkg, {}).get(fn)
     if sig is None:
         return
@@ -287,13 +491,23 @@ def validate_call_args(*, schema: Schema, pkg: str, fn: str, args: list[Any]) ->
     if len(args) != len(params):
         raise UnsupportedTypeError(f"schema: wrong arity (expected {len(params)}, got {len(args)})")
     for i, (t, v) in enumerate(zip(params, args, strict=True)):
+        if i in skip:
+            continue
         try:
             _validate_value(schema=schema, pkg=pkg, t=t, v=v)
         except UnsupportedTypeError as e:
             raise UnsupportedTypeError(f"schema: arg{i} ({t}): {e}") from None
 
 
-def validate_call_result(*, schema: Schema, pkg: str, fn: str, result: Any) -> None:
+def validate_value(*, schema: Schema, pkg: str, go_type: str, value: Any) -> None:
+    """Validate one value against a Go type from the manifest schema."""
+    try:
+        _validate_value(schema=schema, pkg=pkg, t=go_type, v=value)
+    except UnsupportedTypeError as e:
+        raise UnsupportedTypeError(f"schema: {go_type}: {e}") from None
+
+
+def validate_call_result(*, schema: Schema, pkg: str, fn: str, result: Any, partial: bool = False) -> None:
     sig = schema.symbols_by_pkg.get(pkg, {}).get(fn)
     if sig is None:
         return
@@ -306,7 +520,7 @@ def validate_call_result(*, schema: Schema, pkg: str, fn: str, result: Any) -> N
     if len(value_results) == 1:
         t0 = value_results[0]
         try:
-            _validate_value(schema=schema, pkg=pkg, t=t0, v=result)
+            _validate_value(schema=schema, pkg=pkg, t=t0, v=result, partial=partial)
         except UnsupportedTypeError as e:
             raise UnsupportedTypeError(f"schema: result ({t0}): {e}") from None
         return
@@ -321,13 +535,59 @@ def validate_call_result(*, schema: Schema, pkg: str, fn: str, result: Any) -> N
         )
     for i, (t, v) in enumerate(zip(value_results, result, strict=True)):
         try:
-            _validate_value(schema=schema, pkg=pkg, t=t, v=v)
+            _validate_value(schema=schema, pkg=pkg, t=t, v=v, partial=partial)
         except UnsupportedTypeError as e:
             raise UnsupportedTypeError(f"schema: result{i} ({t}): {e}") from None
 
 
+def select_result_fields(*, schema: Schema, pkg: str, results: list[str], paths: tuple[str, ...]) -> list[str]:
+    """Validate a result projection; return the paths with canonical field keys.
+
+    Each path is a dot-separated chain of field keys (or Go field names/aliases)
+    starting at the record struct returned by the signature (also through
+    pointers, slices and maps). Every record result must have the path.
+    """
+    roots = []
+    for t in success_result_types(results):
+        base, _ops = _parse_type(t)
+        st = schema.structs_by_pkg.get(pkg, {}).get(base)
+        if st is not None and st.fields_by_name:
+            roots.append(base)
+    if not roots:
+        raise UnsupportedTypeError(f"schema: select: results {results!r} have no record struct")
+    if not paths:
+        raise UnsupportedTypeError("schema: select: no fields given")
+
+    out: list[str] = []
+    for path in paths:
+        if not isinstance(path, str) or not path or any(not p for p in path.split(".")):
+            raise UnsupportedTypeError(f"schema: select: invalid field path {path!r}")
+        canonical: str | None = None
+        for root in roots:
+            keys: list[str] = []
+            st: StructSchema | None = schema.structs_by_pkg[pkg][root]
+            for part in path.split("."):
+                if st is None or not st.fields_by_name:
+                    raise UnsupportedTypeError(f"schema: select: {path!r}: {'.'.join(keys)} is not a record struct")
+                name = st.key_to_name.get(part)
+                if name is None:
+                    raise UnsupportedTypeError(f"schema: select: {path!r}: unknown field {part}")
+                fs = st.fields_by_name[name]
+                keys.append(fs.key)
+                base, _ops = _parse_type(fs.type)
+                st = schema.structs_by_pkg.get(pkg, {}).get(base)
+            joined = ".".join(keys)
+            if canonical is not None and joined != canonical:
+                raise UnsupportedTypeError(f"schema: select: {path!r} names different fields in the results")
+            canonical = joined
+        assert canonical is not None
+        if canonical not in out:
+            out.append(canonical)
+    return out
+
+
 def validate_method_args(
-    *, schema: Schema, pkg: str, recv: str, method: str, args: list[Any]
+    *, schema: Schema, pkg: str, recv: str, method: str, args: list[Any], skip: frozenset[int] = frozenset()
 ) -> None:
     sig = schema.methods_by_pkg.get(pkg, {}).get(recv, {}).get(method)
     if sig is None:
@@ -336,6 +596,8 @@ def validate_method_args(
     if len(args) != len(params):
         raise UnsupportedTypeError(f"schema: wrong arity (expected {len(params)}, got {len(args)})")
     for i, (t, v) in enumerate(zip(params, args, strict=True)):
+        if i in skip:
+            continue
         try:
             _validate_value(schema=schema, pkg=pkg, t=t, v=v)
         except UnsupportedTypeError as e:
@@ -343,7 +605,7 @@ def validate_method_args(
 
 
 def validate_method_result(
-    *, schema: Schema, pkg: str, recv: str, method: str, result: Any
+    *, schema: Schema, pkg: str, recv: str, method: str, result: Any, partial: bool = False
 ) -> None:
     sig = schema.methods_by_pkg.get(pkg, {}).get(recv, {}).get(method)
     if sig is None:
@@ -357,7 +619,7 @@ def validate_method_result(
     if len(value_results) == 1:
         t0 = value_results[0]
         try:
-            _validate_value(schema=schema, pkg=pkg, t=t0, v=result)
+            _validate_value(schema=schema, pkg=pkg, t=t0, v=result, partial=partial)
         except UnsupportedTypeError as e:
             raise UnsupportedTypeError(f"schema: result ({t0}): {e}") from None
         return
@@ -372,12 +634,13 @@ def validate_method_result(
         )
     for i, (t, v) in enumerate(zip(value_results, result, strict=True)):
         try:
-            _validate_value(schema=schema, pkg=pkg, t=t, v=v)
+            _validate_value(schema=schema, pkg=pkg, t=t, v=v, partial=partial)
         except UnsupportedTypeError as e:
             raise UnsupportedTypeError(f"schema: result{i} ({t}): {e}") from None
 
 
-def _validate_value(*, schema: Schema, pkg: str, t: str, v: Any) -> None:
+def _validate_value(*, schema: Schema, pkg: str, t: str, v: Any, partial: bool = False) -> None:
+    """Validate `v` against Go type `t`; `partial` accepts records with missing fields (projections)."""
     t = t.strip()
 
     if t == "any":
@@ -409,6 +672,11 @@ def _validate_value(*, schema: Schema, pkg: str, t: str, v: Any) -> None:
         if not isinstance(v, str):
             raise UnsupportedTypeError("expected UUID string")
         return
+    if t in IO_TYPES:
+        # I/O results are object handles.
+        if v is not None and (not isinstance(v, int) or isinstance(v, bool)):
+            raise UnsupportedTypeError("expected object id")
+        return
 
     if t.startswith("*"):
         if v is None:
@@ -420,7 +688,7 @@ def _validate_value(*, schema: Schema, pkg: str, t: str, v: Any) -> None:
         if st is not None and not st.fields_by_name:
             if isinstance(v, int) and not isinstance(v, bool):
                 return
-        _validate_value(schema=schema, pkg=pkg, t=inner, v=v)
+        _validate_value(schema=schema, pkg=pkg, t=inner, v=v, partial=partial)
         return
 
     if t.startswith("..."):
@@ -428,7 +696,7 @@ def _validate_value(*, schema: Schema, pkg: str, t: str, v: Any) -> None:
             raise UnsupportedTypeError("expected list")
         inner = t[3:].strip()
         for item in v:
-            _validate_value(schema=schema, pkg=pkg, t=inner, v=item)
+            _validate_value(schema=schema, pkg=pkg, t=inner, v=item, partial=partial)
         return
 
     if t.startswith("[]"):
@@ -436,7 +704,7 @@ def _validate_value(*, schema: Schema, pkg: str, t: str, v: Any) -> None:
             raise UnsupportedTypeError("expected list")
         inner = t[2:].strip()
         for item in v:
-            _validate_value(schema=schema, pkg=pkg, t=inner, v=item)
+            _validate_value(schema=schema, pkg=pkg, t=inner, v=item, partial=partial)
         return
 
     if t.startswith("map[string]"):
@@ -446,7 +714,7 @@ def _validate_value(*, schema: Schema, pkg: str, t: str, v: Any) -> None:
             raise UnsupportedTypeError("expected dict with str keys")
         inner = t[len("map[string]") :].strip()
         for vv in v.values():
-            _validate_value(schema=schema, pkg=pkg, t=inner, v=vv)
+            _validate_value(schema=schema, pkg=pkg, t=inner, v=vv, partial=partial)
         return
 
     # Scalars
@@ -491,10 +759,12 @@ def _validate_value(*, schema: Schema, pkg: str, t: str, v: Any) -> None:
             raise UnsupportedTypeError(f"duplicate field {field_name}")
         seen_fields.add(field_name)
         try:
-            _validate_value(schema=schema, pkg=pkg, t=field_type, v=vv)
+            _validate_value(schema=schema, pkg=pkg, t=field_type, v=vv, partial=partial)
         except UnsupportedTypeError as e:
             raise UnsupportedTypeError(f"field {k} ({field_type}): {e}") from None
 
+    if partial:
+        return
     missing = sorted(
         name for name, fs in st.fields_by_name.items() if fs.required and name not in seen_fields
     )
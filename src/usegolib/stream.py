@@ -0,0 +1,138 @@
+"""Streams: Go channels and iterators consumed as Python (async) iterators."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable
+
+from . import abi
+from .errors import ABIDecodeError, UseGoLibError
+
+if TYPE_CHECKING:
+    from .handle import CancelToken, PackageHandle
+
+STREAM_KEY = "$usegolib_stream"
+DEFAULT_CHUNK = 256
+
+
+class GoStream:
+    """Items of a Go `<-chan T`, `iter.Seq[T]` or `iter.Seq2[K, V]` result.
+
+    Iterate with `for` or `async for`; each `stream_next` request takes up to
+    `chunk` items that are ready Go-side (waiting for the first one). The Go
+    producer blocks once its buffer is full, so a slow consumer holds it back.
+    `iter.Seq2` items are `(key, value)` tuples. The stream closes itself at the
+    end; `close()` stops it early (the Go iterator's `yield` returns false).
+    """
+
+    __slots__ = ("_pkg", "_id", "_decode", "_buf", "_done", "_closed", "chunk", "__weakref__")
+
+    def __init__(
+        self, pkg: "PackageHandle", stream_id: int, *, chunk: int = DEFAULT_CHUNK, decode: Callable[[Any], Any]
+    ) -> None:
+        self._pkg = pkg
+        self._id = stream_id
+        self._decode = decode
+        self._buf: deque[Any] = deque()
+        self._done = False
+        self._closed = False
+        self.chunk = chunk
+
+    @property
+    def id(self) -> int:
+        return self._id
+
+    def __repr__(self) -> str:
+        return f"GoStream(id={self._id}, done={self._done})"
+
+    def next_chunk(self, *, timeout: float | None = None, cancel: "CancelToken | None" = None) -> list[Any]:
+        """Return the next items (at least one), or `[]` once the stream is exhausted.
+
+        `timeout`/`cancel` bound the wait for the first item; a deadline leaves the
+        stream open.
+        """
+        from .handle import _call_options, _raise_call_error
+
+        if self._buf:
+            out = list(self._buf)
+            self._buf.clear()
+            return out
+        if self._done:
+            return []
+        if self._closed:
+            raise UseGoLibError("stream is closed")
+        client = self._pkg._client  # noqa: SLF001 - internal linkage
+        timeout_ns, cancel_id = _call_options(client, timeout=timeout, cancel=cancel)
+        req = abi.encode_stream_request(
+            op="stream_next", stream_id=self._id, chunk=self.chunk, timeout_ns=timeout_ns, cancel=cancel_id
+        )
+        resp = abi.decode_response(client.call(req))
+        if not resp.ok:
+            if resp.error is None or resp.error.type not in ("DeadlineExceeded", "Cancelled"):
+                self.close()
+            _raise_call_error(resp.error)
+        raw = resp.result
+        if not isinstance(raw, dict) or not isinstance(raw.get("items"), list):
+            raise ABIDecodeError("stream_next: expected items")
+        if raw.get("done"):
+            self._done = True
+            self.close()
+        return [self._decode(v) for v in raw["items"]]
+
+    def __iter__(self) -> "GoStream":
+        return self
+
+    def __next__(self) -> Any:
+        if not self._buf:
+            self._buf.extend(self.next_chunk())
+            if not self._buf:
+                raise StopIteration
+        return self._buf.popleft()
+
+    def __aiter__(self) -> "GoStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        if not self._buf:
+            # The Go call releases the GIL; wait for it off the event loop.
+            self._buf.extend(await asyncio.to_thread(self.next_chunk))
+            if not self._buf:
+                raise StopAsyncIteration
+        return self._buf.popleft()
+
+    def close(self) -> None:
+        """Stop the stream and release it Go-side."""
+        from .handle import _CLOSE_LOCK
+
+        with _CLOSE_LOCK:
+            if self._closed:
+                return
+            self._closed = True
+        self._buf.clear()
+        try:
+            self._pkg._client.call(abi.encode_stream_request(op="stream_close", stream_id=self._id))  # noqa: SLF001
+        except Exception:
+            return
+
+    def __enter__(self) -> "GoStream":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:  # noqa: ANN001
+        self.close()
+
+    def __del__(self) -> None:
+        # Best-effort cleanup; ignore errors at interpreter shutdown.
+        try:
+            self.close()
+        except Exception:
+            return
+
+
+def stream_result(*, pkg: "PackageHandle", raw: Any, decode: Callable[[Any], Any]) -> GoStream | None:
+    """Wrap the `{"$usegolib_stream": id}` marker returned for a stream result."""
+    if raw is None:
+        return None
+    if not isinstance(raw, dict) or not isinstance(raw.get(STREAM_KEY), int):
+        raise ABIDecodeError("stream call: expected a stream reference")
+    return GoStream(pkg, raw[STREAM_KEY], decode=decode)
@@ -27,7 +27,7 @@ def _py_type_for_go(schema: Schema, pkg: str, go_type: str) -> Any:
         ty = str
     elif base in {"float32", "float64"}:
         ty = float
-    elif base in {"int", "int8", "int16", "int32", "int64"}:
+    elif base in {"int", "int8", "int16", "int32", "int64", "uint", "uint8", "uint16", "uint32", "uint64"}:
         ty = int
     elif base in schema.structs_by_pkg.get(pkg, {}):
         # Forward reference to struct dataclass name.
@@ -142,8 +142,11 @@ def encode_value(*, schema: Schema, pkg: str, v: Any) -> Any:
     return v
 
 
-def decode_value(*, types: PackageTypes, go_type: str, v: Any) -> Any:
-    """Decode record-struct values into generated dataclasses (recursively)."""
+def decode_value(*, types: PackageTypes, go_type: str, v: Any, partial: bool = False) -> Any:
+    """Decode record-struct values into generated dataclasses (recursively).
+
+    With `partial` (projected results) missing fields are set to None, required or not.
+    """
     schema = types.schema
     pkg = types.pkg
     base, ops = _parse_type(go_type)
@@ -152,17 +155,17 @@ def decode_value(*, types: PackageTypes, go_type: str, v: Any) -> Any:
     if ops and ops[0] == "*":
         if v is None:
             return None
-        return decode_value(types=types, go_type=go_type[1:].strip(), v=v)
+        return decode_value(types=types, go_type=go_type[1:].strip(), v=v, partial=partial)
     if ops and ops[0] in {"[]", "..."}:
         inner = go_type[2:].strip() if ops[0] == "[]" else go_type[3:].strip()
         if not isinstance(v, list):
             return v
-        return [decode_value(types=types, go_type=inner, v=item) for item in v]
+        return [decode_value(types=types, go_type=inner, v=item, partial=partial) for item in v]
     if ops and ops[0] == "map[string]":
         inner = go_type[len("map[string]") :].strip()
         if not isinstance(v, dict):
             return v
-        return {k: decode_value(types=types, go_type=inner, v=vv) for k, vv in v.items()}
+        return {k: decode_value(types=types, go_type=inner, v=vv, partial=partial) for k, vv in v.items()}
 
     # Scalar adapters or plain scalars: return as-is.
     if base in {
@@ -173,6 +176,11 @@ def decode_value(*, types: PackageTypes, go_type: str, v: Any) -> Any:
         "int16",
         "int32",
         "int64",
+        "uint",
+        "uint8",
+        "uint16",
+        "uint32",
+        "uint64",
         "float32",
         "float64",
         "[]byte",
@@ -197,12 +205,12 @@ def decode_value(*, types: PackageTypes, go_type: str, v: Any) -> Any:
         fs = st.fields_by_name.get(go_field_name)
         if fs is None:
             continue
-        values_by_name[go_field_name] = decode_value(types=types, go_type=fs.type, v=vv)
+        values_by_name[go_field_name] = decode_value(types=types, go_type=fs.type, v=vv, partial=partial)
 
     # Fill missing optional fields with None.
     for go_field_name, fs in st.fields_by_name.items():
         if go_field_name not in values_by_name:
-            if fs.required:
+            if fs.required and not partial:
                 raise ValueError(f"missing required field {go_field_name}")
             values_by_name[go_field_name] = None
 
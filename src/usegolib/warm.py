@@ -0,0 +1,117 @@
+"""Ahead-of-time warming of artifact roots (index, verification and schema caches).
+
+`usegolib warm` runs this at image build time so the first `import_` in each
+process does not have to scan the artifact root, hash shared libraries, or
+compile manifest schemas.
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from .artifact import (
+    _build_index,
+    _scan_manifest_dirs,
+    _write_index_atomic,
+    library_stamp,
+    read_manifest,
+    write_schema_sidecar,
+    write_verified_sha256,
+)
+from .errors import ArtifactNotFoundError, UseGoLibError
+from .runtime.platform import host_goarch, host_goos
+
+
+@dataclass(frozen=True)
+class WarmResult:
+    manifest_dir: Path
+    status: str  # "ok" | "skipped" | "error"
+    module: str | None = None
+    version: str | None = None
+    detail: str = ""
+
+
+def package_artifact_root(python_package: str) -> Path:
+    """Return the embedded artifact root of a package generated by `usegolib package`."""
+    import importlib.util
+
+    spec = importlib.util.find_spec(python_package)
+    if spec is None or not spec.submodule_search_locations:
+        raise ArtifactNotFoundError(f"python package not found: {python_package}")
+    for loc in spec.submodule_search_locations:
+        root = Path(loc) / "_usegolib_artifacts"
+        if root.is_dir():
+            return root
+    raise ArtifactNotFoundError(f"python package {python_package} has no _usegolib_artifacts directory")
+
+
+def warm_artifact_root(
+    artifact_root: str | Path,
+    *,
+    jobs: int | None = None,
+    smoke: bool = False,
+) -> list[WarmResult]:
+    """Precompute first-load caches for every artifact under `artifact_root`.
+
+    - rebuilds the artifact index
+    - hashes each host-platform library and records it in the verification cache
+    - writes the compiled schema sidecar next to each manifest
+    - with `smoke=True`, also `dlopen`s each library in this process
+
+    Artifacts are processed in parallel using `jobs` threads.
+    """
+    root = Path(artifact_root)
+    if not root.is_dir():
+        raise ArtifactNotFoundError(f"artifact root not found: {root}")
+
+    _write_index_atomic(root, _build_index(root))
+
+    dirs = sorted(_scan_manifest_dirs(root))
+    if not dirs:
+        return []
+    workers = jobs if jobs is not None else min(8, os.cpu_count() or 1)
+    workers = max(1, min(workers, len(dirs)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="usegolib-warm") as ex:
+        return list(ex.map(lambda d: _warm_one(d, smoke=smoke), dirs))
+
+
+def _warm_one(manifest_dir: Path, *, smoke: bool) -> WarmResult:
+    from .handle import _verify_library_sha256
+    from .runtime.cbridge import SharedLibClient
+    from .schema import Schema
+
+    try:
+        m = read_manifest(manifest_dir)
+    except UseGoLibError as e:
+        return WarmResult(manifest_dir=manifest_dir, status="error", detail=str(e))
+
+    if m.goos != host_goos() or m.goarch != host_goarch():
+        return WarmResult(
+            manifest_dir=manifest_dir,
+            status="skipped",
+            module=m.module,
+            version=m.version,
+            detail=f"platform {m.goos}/{m.goarch}",
+        )
+
+    try:
+        stamp = library_stamp(m.library_path)
+        _verify_library_sha256(m, use_cache=False)
+        write_verified_sha256(m.library_path, m.library_sha256, stamp=stamp)
+        schema = Schema.from_manifest(m.schema)
+        if schema is not None:
+            write_schema_sidecar(m, schema)
+        if smoke:
+            SharedLibClient(m.library_path)._load()  # noqa: SLF001 - internal linkage
+    except (UseGoLibError, OSError) as e:
+        return WarmResult(
+            manifest_dir=manifest_dir,
+            status="error",
+            module=m.module,
+            version=m.version,
+            detail=str(e),
+        )
+    return WarmResult(manifest_dir=manifest_dir, status="ok", module=m.module, version=m.version)
@@ -1,11 +1,66 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import msgpack
 import pytest
 
 
+class FakeClient:
+    """Stands in for a Go runtime client: records each decoded request and answers it.
+
+    Queued responses (full `{"ok": ..., ...}` maps) are served first, in order;
+    after that every request gets `respond(request)`, which answers with `result`.
+    Subclasses override `respond` to serve particular ops.
+    """
+
+    def __init__(self, *responses: dict[str, Any], result: Any = None) -> None:
+        self.result = result
+        self.reqs: list[dict[str, Any]] = []
+        self._responses = list(responses)
+        self._lock = threading.Lock()
+
+    def call(self, req: bytes) -> bytes:
+        r = msgpack.unpackb(req, raw=False)
+        with self._lock:
+            self.reqs.append(r)
+            queued = self._responses.pop(0) if self._responses else None
+        return msgpack.packb(queued or self.respond(r), use_bin_type=True)
+
+    def respond(self, req: dict[str, Any]) -> dict[str, Any]:
+        return {"ok": True, "result": self.result}
+
+    def ops(self, name: str) -> list[dict[str, Any]]:
+        return [r for r in self.reqs if r["op"] == name]
+
+
+@pytest.fixture
+def make_handle():
+    """Build a `PackageHandle` for `example.com/p` over a fake client and an optional manifest."""
+    from usegolib.handle import PackageHandle
+    from usegolib.schema import Schema
+
+    def _make(client: Any, manifest: dict[str, Any] | None = None) -> PackageHandle:
+        return PackageHandle(
+            module="example.com/p",
+            version="v1.0.0",
+            abi_version=0,
+            package="example.com/p",
+            _client=client,
+            _schema=None if manifest is None else Schema.from_manifest(manifest),
+        )
+
+    return _make
+
+
 @pytest.fixture(autouse=True)
 def _reset_usegolib_loaded_modules():
     # Tests run in one Python process; clear process-global cache between tests.
     import usegolib.handle
 
     usegolib.handle._LOADED_RUNTIMES.clear()
+    usegolib.handle._PENDING_RUNTIMES.clear()
     yield
     usegolib.handle._LOADED_RUNTIMES.clear()
+    usegolib.handle._PENDING_RUNTIMES.clear()
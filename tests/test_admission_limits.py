@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pytest
+
+from conftest import FakeClient
+
+
+def test_set_limit_encodes_symbol_keys(make_handle) -> None:  # noqa: ANN001
+    client = FakeClient()
+    h = make_handle(client)
+
+    h.set_limit(max_concurrency=8)
+    h.set_limit("Resize", max_concurrency=2, weight=4, policy="fail")
+    h.set_limit("Store.Get", max_concurrency=1, queue_timeout=0.5)
+    h.set_limit("Resize")
+
+    assert [r["op"] for r in client.reqs] == ["limits_set"] * 4
+    assert "key" not in client.reqs[0]
+    assert client.reqs[0]["limit"] == {"max": 8, "weight": 1, "policy": "queue", "queue_timeout_ns": 0}
+    assert client.reqs[1]["key"] == "example.com/p:Resize"
+    assert client.reqs[1]["limit"]["weight"] == 4
+    assert client.reqs[1]["limit"]["policy"] == "fail"
+    assert client.reqs[2]["key"] == "example.com/p.Store:Get"
+    assert client.reqs[2]["limit"]["queue_timeout_ns"] == 500_000_000
+    assert client.reqs[3]["limit"]["max"] == 0
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_concurrency": 0},
+        {"max_concurrency": 2, "policy": "drop"},
+        {"max_concurrency": 2, "weight": 0},
+        {"max_concurrency": 2, "weight": 2},
+        {"max_concurrency": 2, "queue_timeout": 0},
+    ],
+)
+def test_set_limit_validates_options(kwargs: dict, make_handle) -> None:  # noqa: ANN001
+    client = FakeClient()
+    with pytest.raises(ValueError):
+        make_handle(client).set_limit(**kwargs)
+    assert client.reqs == []
+
+
+def test_limit_stats_are_scoped_to_the_package(make_handle) -> None:  # noqa: ANN001
+    stats = {"max": 1, "in_use": 0, "waiting": 0}
+    client = FakeClient(
+        {
+            "ok": True,
+            "result": {
+                "global": None,
+                "symbols": {
+                    "example.com/p:Resize": stats,
+                    "example.com/p.Store:Get": stats,
+                    "example.com/p/sub:Other": stats,
+                },
+            },
+        }
+    )
+    out = make_handle(client).limit_stats()
+    assert client.reqs[0]["op"] == "limits_stats"
+    assert out == {"global": None, "symbols": {"Resize": stats, "Store.Get": stats}}
+
+
+def test_busy_errors_raise_busy_error(make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import BusyError, GoError
+
+    client = FakeClient(
+        {"ok": False, "error": {"type": "Busy", "message": "admission limit: limit reached"}},
+        {"ok": True, "result": 1},
+        {"ok": False, "error": {"type": "Busy", "message": "admission limit: queue timeout"}},
+    )
+    h = make_handle(client)
+    with pytest.raises(BusyError) as ei:
+        h.Resize(1)
+    assert not isinstance(ei.value, GoError)
+    obj = h.object("Store")
+    with pytest.raises(BusyError, match="queue timeout"):
+        obj.Get("k")
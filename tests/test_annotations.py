@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from conftest import FakeClient
+
+
+def _methods():
+    from usegolib.builder.symbols import ExportedMethod
+
+    return [
+        ExportedMethod(pkg="example.com/p", recv="Store", name="Get", params=["string"], results=["string"]),
+        ExportedMethod(pkg="example.com/p", recv="Store", name="Put", params=["string", "string"], results=[]),
+    ]
+
+
+def _load(tmp_path: Path, obj: dict):
+    from usegolib.builder.annotations import load_annotations
+    from usegolib.builder.symbols import ExportedFunc
+
+    path = tmp_path / "annotations.json"
+    path.write_text(json.dumps(obj), encoding="utf-8")
+    return load_annotations(
+        annotations=path,
+        methods=_methods(),
+        struct_types_by_pkg={"example.com/p": {"Store"}},
+        functions=[ExportedFunc(pkg="example.com/p", name="Parse", params=["string"], results=["int64"])],
+    )
+
+
+def test_annotations_round_trip_into_schema(tmp_path: Path) -> None:
+    from usegolib.schema import Schema
+
+    ann = _load(
+        tmp_path,
+        {"types": [{"pkg": "example.com/p", "name": "Store", "concurrency": "rwlock", "readonly": ["Get"]}]},
+    )
+    schema = Schema.from_manifest({"structs": {"example.com/p": {"Store": []}}, "types": ann.schema_types()})
+    assert schema is not None
+    assert schema.concurrency_by_pkg == {"example.com/p": {"Store": "rwlock"}}
+    assert schema.readonly_methods_by_pkg == {"example.com/p": {"Store": frozenset({"Get"})}}
+
+
+@pytest.mark.parametrize(
+    ("entry", "match"),
+    [
+        ({"pkg": "example.com/p", "name": "Nope"}, "struct type not found"),
+        ({"pkg": "example.com/p", "name": "Store", "concurrency": "shared"}, "invalid concurrency"),
+        ({"pkg": "example.com/p", "name": "Store", "readonly": ["Missing"]}, "method not found"),
+    ],
+)
+def test_annotations_are_validated(tmp_path: Path, entry: dict, match: str) -> None:
+    from usegolib.errors import BuildError
+
+    with pytest.raises(BuildError, match=match):
+        _load(tmp_path, {"types": [entry]})
+
+
+def test_pure_function_annotations(tmp_path: Path) -> None:
+    from usegolib.errors import BuildError
+    from usegolib.schema import Schema
+
+    ann = _load(tmp_path, {"functions": [{"pkg": "example.com/p", "name": "Parse", "pure": True}]})
+    schema = Schema.from_manifest({"structs": {}, "functions": ann.schema_functions()})
+    assert schema is not None
+    assert schema.pure_symbols_by_pkg == {"example.com/p": {"Parse"}}
+
+    with pytest.raises(BuildError, match="function not found"):
+        _load(tmp_path, {"functions": [{"pkg": "example.com/p", "name": "Nope", "pure": True}]})
+
+
+def test_object_mode_is_sent_with_obj_new(make_handle) -> None:  # noqa: ANN001
+    client = FakeClient(result=1)
+    h = make_handle(client)
+    h.object("Store", mode="rwlock")
+    h.object("Store")
+    assert client.reqs[0]["mode"] == "rwlock"
+    assert "mode" not in client.reqs[1]
+    with pytest.raises(ValueError, match="invalid object mode"):
+        h.object("Store", mode="shared")
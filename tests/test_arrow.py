@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import pytest
+
+from conftest import FakeClient
+
+
+class _FakeLazyClient(FakeClient):
+    """Answers calls with a lazy result; has no Arrow export entry point."""
+
+    def respond(self, req: dict) -> dict:
+        result = {"$usegolib_lazy": 7, "kind": "slice", "len": 2} if req["op"] == "call" else None
+        return {"ok": True, "result": result}
+
+
+_MANIFEST = {
+    "structs": {
+        "example.com/p": {
+            "Row": [{"name": "ID", "type": "int64"}],
+            "Store": [],
+        }
+    },
+    "symbols": [
+        {"pkg": "example.com/p", "name": "Rows", "params": [], "results": ["[]*Row", "error"]},
+        {"pkg": "example.com/p", "name": "ByID", "params": [], "results": ["map[string]Row"]},
+        {"pkg": "example.com/p", "name": "IDs", "params": [], "results": ["[]int64"]},
+        {"pkg": "example.com/p", "name": "Stores", "params": [], "results": ["[]Store"]},
+    ],
+}
+
+
+def test_arrow_calls_need_a_record_slice_result(make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import UnsupportedTypeError
+
+    h = make_handle(_FakeLazyClient(), _MANIFEST)
+    for fn in (h.ByID, h.IDs, h.Stores):
+        with pytest.raises(UnsupportedTypeError, match="slice of record structs"):
+            fn.arrow()
+        with pytest.raises(UnsupportedTypeError, match="slice of record structs"):
+            fn.columns()
+
+
+def test_arrow_export_needs_the_library_client_and_frees_the_lazy_value(make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import UnsupportedTypeError
+
+    client = _FakeLazyClient()
+    h = make_handle(client, _MANIFEST)
+    with pytest.raises(UnsupportedTypeError, match="in-process library client"):
+        h.Rows.columns()
+    assert [r["op"] for r in client.reqs] == ["call", "lazy_free"]
+    assert client.reqs[0]["lazy"] is True
+
+
+def test_arrow_structs_match_the_c_data_interface() -> None:
+    import ctypes
+
+    from usegolib.arrow import ArrowArray, ArrowSchema
+
+    if ctypes.sizeof(ctypes.c_void_p) != 8:
+        pytest.skip("layout checked on 64-bit platforms")
+    assert ctypes.sizeof(ArrowSchema) == 72
+    assert ctypes.sizeof(ArrowArray) == 80
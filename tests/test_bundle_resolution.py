@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+
+import pytest
+
+from usegolib.runtime.platform import host_goarch, host_goos
+
+
+def _write_manifest(leaf: Path, *, module: str, version: str, packages: list[str], bundle=None) -> Path:
+    leaf.mkdir(parents=True, exist_ok=True)
+    lib_bytes = f"{module}@{version}".encode("utf-8")
+    (leaf / "libusegolib.so").write_bytes(lib_bytes)
+    obj = {
+        "manifest_version": 1,
+        "abi_version": 0,
+        "module": module,
+        "version": version,
+        "goos": host_goos(),
+        "goarch": host_goarch(),
+        "packages": packages,
+        "symbols": [],
+        "library": {"path": "libusegolib.so", "sha256": hashlib.sha256(lib_bytes).hexdigest()},
+    }
+    if bundle is not None:
+        obj["bundle"] = bundle
+    (leaf / "manifest.json").write_text(json.dumps(obj), encoding="utf-8")
+    return leaf
+
+
+def _write_bundle(root: Path) -> Path:
+    return _write_manifest(
+        root / "app@bundle-0123456789ab" / f"{host_goos()}-{host_goarch()}",
+        module="app",
+        version="bundle-0123456789ab",
+        packages=["example.com/a", "example.com/b", "example.com/b/sub"],
+        bundle={
+            "name": "app",
+            "modules": [
+                {"module": "example.com/a", "version": "v1.0.0", "packages": ["example.com/a"]},
+                {"module": "example.com/b", "version": "v2.0.0", "packages": ["example.com/b", "example.com/b/sub"]},
+            ],
+        },
+    )
+
+
+def test_resolve_matches_bundle_member_version_and_prefers_bundle(tmp_path: Path) -> None:
+    from usegolib.artifact import resolve_manifest
+
+    bundle_leaf = _write_bundle(tmp_path)
+    _write_manifest(
+        tmp_path / "example.com" / "a@v1.0.0" / f"{host_goos()}-{host_goarch()}",
+        module="example.com/a",
+        version="v1.0.0",
+        packages=["example.com/a"],
+    )
+
+    m = resolve_manifest(tmp_path, package="example.com/a", version=None)
+    assert m.manifest_path == bundle_leaf / "manifest.json"
+    assert m.member_for_package("example.com/a") == ("example.com/a", "v1.0.0")
+
+    # Second lookup is served from the index, which matches member versions too.
+    m = resolve_manifest(tmp_path, package="example.com/b/sub", version="v2.0.0")
+    assert m.member_for_package("example.com/b/sub") == ("example.com/b", "v2.0.0")
+
+    from usegolib.errors import ArtifactNotFoundError
+
+    with pytest.raises(ArtifactNotFoundError):
+        resolve_manifest(tmp_path, package="example.com/b", version="bundle-0123456789ab")
+
+
+def test_bundle_load_registers_all_members_with_one_client(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import usegolib
+    import usegolib.handle
+
+    class DummyClient:
+        def __init__(self, path: Path):
+            self.path = path
+
+    monkeypatch.setattr(usegolib.handle, "SharedLibClient", DummyClient)
+    _write_bundle(tmp_path)
+
+    b = usegolib.import_("example.com/b/sub", artifact_dir=tmp_path)
+    assert (b.module, b.version, b.package) == ("example.com/b", "v2.0.0", "example.com/b/sub")
+    assert set(usegolib.handle._LOADED_RUNTIMES) == {"example.com/a", "example.com/b"}
+
+    a = usegolib.import_("example.com/a", artifact_dir=tmp_path)
+    assert (a.module, a.version) == ("example.com/a", "v1.0.0")
+    assert a._client is b._client  # noqa: SLF001 - test introspection
+
+
+def test_bundle_member_conflicts_with_loaded_module_version(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import usegolib
+    import usegolib.handle
+
+    class DummyClient:
+        def __init__(self, path: Path):
+            self.path = path
+
+    monkeypatch.setattr(usegolib.handle, "SharedLibClient", DummyClient)
+    standalone = _write_manifest(
+        tmp_path / "standalone",
+        module="example.com/a",
+        version="v0.9.0",
+        packages=["example.com/a"],
+    )
+    bundle_leaf = _write_bundle(tmp_path / "bundles")
+
+    usegolib.load_artifact(standalone)
+    with pytest.raises(usegolib.errors.VersionConflictError):
+        usegolib.load_artifact(bundle_leaf)
+
+    # Other members of the bundle can still be loaded; the loaded module keeps its runtime.
+    b = usegolib.import_("example.com/b", artifact_dir=tmp_path / "bundles")
+    assert b.version == "v2.0.0"
+    assert usegolib.handle._LOADED_RUNTIMES["example.com/a"].version == "v0.9.0"
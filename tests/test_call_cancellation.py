@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+
+from conftest import FakeClient
+
+
+def test_timeout_and_cancel_token_are_sent_with_calls(make_handle) -> None:  # noqa: ANN001
+    client = FakeClient({"ok": True, "result": 5}, {"ok": True, "result": 1}, {"ok": True, "result": 1})
+    h = make_handle(client)
+
+    tok = h.cancel_token()
+    assert tok.id == 5
+    h.Slow(1, timeout=0.25, cancel=tok)
+    obj = h.object("Worker")
+    obj.Run(timeout=0)
+
+    assert client.reqs[0]["op"] == "cancel_new"
+    assert client.reqs[1]["timeout_ns"] == 250_000_000
+    assert client.reqs[1]["cancel"] == 5
+    assert client.reqs[3]["op"] == "obj_call"
+    assert client.reqs[3]["timeout_ns"] == 1  # already expired, not "no timeout"
+
+    tok.cancel()
+    tok.close()
+    assert [r["op"] for r in client.reqs[-2:]] == ["cancel", "cancel_free"]
+    with pytest.raises(Exception, match="closed"):
+        h.Slow(1, cancel=tok)
+
+
+@pytest.mark.parametrize(
+    ("err_type", "exc_name"),
+    [("DeadlineExceeded", "DeadlineExceededError"), ("Cancelled", "CancelledError")],
+)
+def test_context_errors_map_to_go_error_subclasses(err_type: str, exc_name: str, make_handle) -> None:  # noqa: ANN001
+    import usegolib.errors
+
+    client = FakeClient({"ok": False, "error": {"type": err_type, "message": "context ended"}})
+    h = make_handle(client)
+    exc = getattr(usegolib.errors, exc_name)
+    with pytest.raises(exc) as ei:
+        h.Slow(1, timeout=1)
+    assert isinstance(ei.value, usegolib.errors.GoError)
+
+
+def test_cancel_token_from_another_runtime_is_rejected(make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import UseGoLibError
+
+    h1 = make_handle(FakeClient({"ok": True, "result": 1}))
+    h2 = make_handle(FakeClient())
+    tok = h1.cancel_token()
+    with pytest.raises(UseGoLibError, match="different Go runtime"):
+        h2.Slow(1, cancel=tok)
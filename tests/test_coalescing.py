@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import msgpack
+import pytest
+
+
+class _FakeLib:
+    """Stands in for `SharedLibClient._call`: echoes `args[0]`, unpacks batches."""
+
+    def __init__(self) -> None:
+        self.sent: list[dict] = []
+        self.release = threading.Event()
+        self.fail_batches = False
+        self._lock = threading.Lock()
+
+    def send(self, req: bytes) -> bytes:
+        obj = msgpack.unpackb(req, raw=False)
+        with self._lock:
+            self.sent.append(obj)
+        if obj["op"] == "batch":
+            if self.fail_batches:
+                return msgpack.packb({"ok": False, "error": {"type": "ABIError", "message": "nope"}}, use_bin_type=True)
+            out = [self.send(sub) for sub in obj["batch"]]
+            return msgpack.packb({"ok": True, "result": out}, use_bin_type=True)
+        if obj.get("fn") == "Slow":
+            self.release.wait(5)
+        return msgpack.packb({"ok": True, "result": obj.get("args", [None])[0]}, use_bin_type=True)
+
+
+def _client(lib: _FakeLib, **kwargs):  # noqa: ANN003
+    from usegolib.runtime.cbridge import SharedLibClient
+
+    client = SharedLibClient(Path("unused.so"))
+    client._call = lib.send  # type: ignore[method-assign]  # noqa: SLF001
+    client.set_coalescing(**kwargs)
+    return client
+
+
+def _req(fn: str, arg: int) -> bytes:
+    from usegolib import abi
+
+    return abi.encode_call_request(pkg="example.com/p", fn=fn, args=[arg])
+
+
+def _wait_for(cond, timeout: float = 5) -> None:  # noqa: ANN001
+    deadline = time.monotonic() + timeout
+    while not cond() and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def test_idle_requests_are_sent_immediately() -> None:
+    lib = _FakeLib()
+    client = _client(lib, max_delay=10)
+    start = time.monotonic()
+    assert msgpack.unpackb(client.call(_req("Echo", 1)))["result"] == 1
+    assert time.monotonic() - start < 1
+    assert lib.sent[0]["op"] == "call"
+    assert client.coalescing_stats()["batch_sizes"] == {1: 1}
+
+
+def test_concurrent_requests_are_batched_while_go_is_busy() -> None:
+    lib = _FakeLib()
+    client = _client(lib, max_delay=0.2, max_batch=4)
+
+    slow = threading.Thread(target=client.call, args=(_req("Slow", 0),))
+    slow.start()
+    _wait_for(lambda: client.coalescing_stats()["in_flight"] == 1)
+
+    out: list = [None] * 5
+
+    def _worker(i: int) -> None:
+        out[i] = msgpack.unpackb(client.call(_req("Echo", i)))["result"]
+
+    ts = [threading.Thread(target=_worker, args=(i,)) for i in range(5)]
+    for t in ts:
+        t.start()
+    for t in ts:
+        t.join()
+    lib.release.set()
+    slow.join()
+
+    assert out == [0, 1, 2, 3, 4]  # every caller gets its own response
+    stats = client.coalescing_stats()
+    assert stats["requests"] == 6
+    assert stats["max_batch_size"] == 4
+    assert stats["batch_sizes"] == {1: 2, 4: 1}
+    assert stats["in_flight"] == 0
+    assert [o["op"] for o in lib.sent].count("batch") == 1
+
+
+def test_only_calls_are_coalesced() -> None:
+    from usegolib import abi
+
+    assert abi.request_op(_req("Echo", 1)) == "call"
+    assert abi.request_op(abi.encode_obj_free_request(obj_id=1)) == "obj_free"
+    assert abi.request_op(abi.encode_pin_request(op="pin_new", value=b"x" * 1000)) == "pin_new"
+    assert abi.request_op(b"\x01") is None
+
+    lib = _FakeLib()
+    client = _client(lib, max_delay=10)
+    slow = threading.Thread(target=client.call, args=(_req("Slow", 0),))
+    slow.start()
+    _wait_for(lambda: client.coalescing_stats()["in_flight"] == 1)
+
+    start = time.monotonic()
+    client.call(abi.encode_obj_free_request(obj_id=1))
+    client.call(abi.encode_cancel_request(op="cancel", token_id=2))
+    assert time.monotonic() - start < 1  # not held back to gather a batch
+    lib.release.set()
+    slow.join()
+    assert client.coalescing_stats()["requests"] == 1
+    assert [o["op"] for o in lib.sent] == ["call", "obj_free", "cancel"]
+
+
+def test_batch_failures_reach_every_caller_and_disable() -> None:
+    from usegolib.errors import ABIDecodeError
+
+    lib = _FakeLib()
+    lib.fail_batches = True
+    client = _client(lib, max_delay=1, max_batch=2)
+    slow = threading.Thread(target=client.call, args=(_req("Slow", 0),))
+    slow.start()
+    _wait_for(lambda: client.coalescing_stats()["in_flight"] == 1)
+
+    errors: list[BaseException] = []
+
+    def _worker(i: int) -> None:
+        try:
+            client.call(_req("Echo", i))
+        except ABIDecodeError as e:
+            errors.append(e)
+
+    ts = [threading.Thread(target=_worker, args=(i,)) for i in range(2)]
+    for t in ts:
+        t.start()
+    for t in ts:
+        t.join()
+    lib.release.set()
+    slow.join()
+    assert len(errors) == 2 and "nope" in str(errors[0])
+
+    client.set_coalescing(enabled=False)
+    assert client.coalescing_stats() is None
+    with pytest.raises(ValueError, match="max_batch"):
+        client.set_coalescing(max_batch=0)
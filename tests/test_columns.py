@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import pytest
+
+from conftest import FakeClient
+
+
+_MANIFEST = {
+    "structs": {
+        "example.com/p": {
+            "Point": [
+                {"name": "X", "type": "float64", "key": "x"},
+                {"name": "Y", "type": "float64", "key": "y"},
+            ],
+            "Row": [
+                {"name": "ID", "type": "int64", "key": "id"},
+                {"name": "Name", "type": "string", "key": "name", "required": False},
+                {"name": "Weight", "type": "*float64", "key": "weight"},
+                {"name": "At", "type": "time.Time", "key": "at", "required": False},
+                {"name": "Pos", "type": "*Point", "key": "pos"},
+            ],
+        }
+    },
+    "symbols": [
+        {"pkg": "example.com/p", "name": "Load", "params": ["[]*Row"], "results": ["int"]},
+    ],
+}
+
+
+def test_column_args_are_sent_as_columns(make_handle) -> None:  # noqa: ANN001
+    np = pytest.importorskip("numpy")
+
+    client = FakeClient(result=0)
+    h = make_handle(client, _MANIFEST)
+    h.Load(
+        {
+            "ID": np.arange(2, dtype=np.int32),
+            "name": np.array(["a", "b"]),
+            "weight": np.ma.masked_array([1.0, 2.0], mask=[True, False]),
+            "at": np.array(["2024-01-02", "NaT"], dtype="datetime64[s]"),
+            "pos": {"x": [1.0, 2.0], "Y": np.zeros(2)},
+        }
+    )
+    arg = client.reqs[-1]["args"][0]
+    assert arg["$usegolib_columns"] == 2
+    cols = arg["columns"]
+    assert cols["id"] == {"$usegolib_nd": "i8", "shape": [2], "data": np.arange(2, dtype="<i8").tobytes()}
+    assert cols["name"] == ["a", "b"]
+    assert cols["weight"] == [None, 2.0]
+    assert cols["at"] == ["2024-01-02T00:00:00.000000000Z", None]
+    assert cols["pos"] == {
+        "$usegolib_columns": 2,
+        "columns": {"x": [1.0, 2.0], "y": {"$usegolib_nd": "f8", "shape": [2], "data": bytes(16)}},
+    }
+
+    h.Load([{"id": 1, "weight": None, "pos": None}])
+    assert client.reqs[-1]["args"][0] == [{"id": 1, "weight": None, "pos": None}]
+
+
+def test_column_args_are_checked(make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import UnsupportedTypeError
+
+    h = make_handle(FakeClient(result=0), _MANIFEST)
+    cols = {"id": [1, 2], "weight": [None, None], "pos": [None, None]}
+    with pytest.raises(UnsupportedTypeError, match="unknown field 'nope'"):
+        h.Load({**cols, "nope": [1, 2]})
+    with pytest.raises(UnsupportedTypeError, match="has 1 rows, expected 2"):
+        h.Load({**cols, "name": ["a"]})
+    with pytest.raises(UnsupportedTypeError, match=r"missing required column\(s\): ID"):
+        h.Load({"weight": [None]})
+    with pytest.raises(UnsupportedTypeError, match="not a sequence"):
+        h.Load({**cols, "name": 3})
+
+
+def test_pyarrow_tables_and_dataframes_are_columns(make_handle) -> None:  # noqa: ANN001
+    pa = pytest.importorskip("pyarrow")
+
+    client = FakeClient(result=0)
+    h = make_handle(client, _MANIFEST)
+    h.Load(
+        pa.table(
+            {
+                "id": pa.chunked_array([[1], [2]]),
+                "weight": [None, 1.5],
+                "pos": [{"x": 1.0, "y": 2.0}, None],
+            }
+        )
+    )
+    cols = client.reqs[-1]["args"][0]["columns"]
+    assert cols["id"]["$usegolib_nd"] == "i8"
+    assert cols["weight"] == [None, 1.5]
+    assert cols["pos"] == [{"x": 1.0, "y": 2.0}, None]
+
+    pd = pytest.importorskip("pandas")
+    h.Load(pd.DataFrame({"id": [1], "weight": [0.5], "pos": [None]}))
+    cols = client.reqs[-1]["args"][0]["columns"]
+    assert cols["id"]["$usegolib_nd"] == "i8"
+    assert cols["weight"] == [0.5]
+    assert cols["pos"] == [None]
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from conftest import FakeClient
+
+
+class _SlowClient(FakeClient):
+    """Fake client that widens race windows so unsynchronized state would misbehave."""
+
+    def __init__(self) -> None:
+        super().__init__(result=7)
+
+    def respond(self, req: dict) -> dict:
+        time.sleep(0.01)
+        return super().respond(req)
+
+
+def _run_threads(n: int, target) -> list:
+    barrier = threading.Barrier(n)
+    out: list = []
+
+    def _worker() -> None:
+        barrier.wait()
+        out.append(target())
+
+    threads = [threading.Thread(target=_worker) for _ in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return out
+
+
+_MANIFEST = {
+    "structs": {"example.com/p": {"dl": []}},
+    "vars": [{"pkg": "example.com/p", "name": "DL", "type": "dl"}],
+}
+
+
+def test_concurrent_var_access_fetches_one_handle(make_handle) -> None:  # noqa: ANN001
+    client = _SlowClient()
+    h = make_handle(client, _MANIFEST)
+
+    objs = _run_threads(8, lambda: h.DL)  # type: ignore[attr-defined]
+    assert all(o is objs[0] for o in objs)
+    assert [c["fn"] for c in client.reqs] == ["__usegolib_getvar_DL"]
+
+
+def test_concurrent_close_frees_object_once(make_handle) -> None:  # noqa: ANN001
+    from usegolib.handle import GoObject
+
+    client = _SlowClient()
+    obj = GoObject(_pkg=make_handle(client, _MANIFEST), _type="dl", _id=7)
+
+    _run_threads(8, obj.close)
+    assert [c["op"] for c in client.reqs] == ["obj_free"]
+
+
+def test_shared_library_is_loaded_once(tmp_path, monkeypatch) -> None:
+    import usegolib.runtime.cbridge as cbridge
+
+    lib = tmp_path / "libusegolib.so"
+    lib.write_bytes(b"")
+    opened: list[str] = []
+
+    class _FakeLib:
+        class _Fn:
+            argtypes = None
+            restype = None
+
+        def __init__(self) -> None:
+            self.usegolib_call = self._Fn()
+            self.usegolib_free = self._Fn()
+
+    def _cdll(path: str):
+        opened.append(path)
+        time.sleep(0.01)
+        return _FakeLib()
+
+    monkeypatch.setattr(cbridge.ctypes, "CDLL", _cdll)
+    monkeypatch.setattr(cbridge.ctypes, "WinDLL", _cdll, raising=False)
+    client = cbridge.SharedLibClient(lib)
+
+    _run_threads(8, client._load)  # noqa: SLF001 - internal linkage
+    assert opened == [str(lib)]
+
+
+class _BusyClient(FakeClient):
+    """Fake client that holds the calling thread with pure-Python work, like encode/decode does."""
+
+    def __init__(self) -> None:
+        super().__init__(result=7)
+
+    def respond(self, req: dict) -> dict:
+        sum(i * i for i in range(100_000))
+        return super().respond(req)
+
+
+@pytest.mark.skipif(
+    getattr(sys, "_is_gil_enabled", lambda: True)() or (os.cpu_count() or 1) < 2,
+    reason="needs a free-threaded build with the GIL disabled and at least 2 CPUs",
+)
+def test_calls_run_in_parallel_without_the_gil(make_handle) -> None:  # noqa: ANN001
+    manifest = {"symbols": [{"pkg": "example.com/p", "name": "Work", "params": [], "results": ["int64"]}]}
+    h = make_handle(_BusyClient(), manifest)
+    calls = 20
+
+    def _timed(threads: int) -> float:
+        start = time.perf_counter()
+        _run_threads(threads, lambda: [h.Work() for _ in range(calls // threads)])  # type: ignore[attr-defined]
+        return time.perf_counter() - start
+
+    h.Work()  # type: ignore[attr-defined]
+    # Best of three damps noise from shared CI runners; a GIL would keep the ratio near 1.
+    serial = min(_timed(1) for _ in range(3))
+    parallel = min(_timed(2) for _ in range(3))
+    assert parallel < 0.8 * serial, f"2 threads took {parallel:.3f}s vs {serial:.3f}s on 1"
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import io
+
+import msgpack
+import pytest
+
+from conftest import FakeClient
+
+
+class _FakeIOClient(FakeClient):
+    """Serves io_* ops over in-memory buffers; has no direct `io_transfer` entry point."""
+
+    def __init__(self, data: bytes) -> None:
+        super().__init__()
+        self.data = data
+        self.written = bytearray()
+
+    def respond(self, req: dict) -> dict:
+        op = req["op"]
+        if op in ("call", "obj_new"):
+            result = 7
+        elif op == "io_read":
+            out, self.data = self.data[: req["chunk"]], self.data[req["chunk"] :]
+            result = out or None
+        elif op == "io_write":
+            self.written += req["value"]
+            result = len(req["value"])
+        elif op == "io_info":
+            result = {"read": False, "write": True, "close": True}
+        else:
+            result = None
+        return {"ok": True, "result": result}
+
+
+_MANIFEST = {
+    "structs": {"example.com/p": {"Sink": []}},
+    "symbols": [
+        {"pkg": "example.com/p", "name": "Open", "params": ["string"], "results": ["io.ReadCloser", "error"]},
+        {"pkg": "example.com/p", "name": "Create", "params": [], "results": ["io.Writer"]},
+    ],
+}
+
+
+def test_io_results_are_accepted_at_build_time() -> None:
+    from usegolib.builder.build import _are_supported_results
+
+    assert _are_supported_results(["io.ReadCloser", "error"])
+    assert _are_supported_results(["io.Writer"])
+    assert _are_supported_results(["io.Reader", "int64"])
+    assert not _are_supported_results(["[]io.Reader"])
+
+
+def test_reader_result_reads_into_caller_buffers(make_handle) -> None:  # noqa: ANN001
+    client = _FakeIOClient(b"hello world")
+    h = make_handle(client, _MANIFEST)
+
+    with h.Open("x") as r:
+        assert isinstance(r, io.RawIOBase) and r.readable() and not r.writable()
+        buf = bytearray(5)
+        assert r.readinto(buf) == 5 and buf == b"hello"
+        r.chunk = 4
+        assert r.readall() == b" world"
+        assert [q["chunk"] for q in client.ops("io_read")] == [5, 4, 4, 4]
+        with pytest.raises(io.UnsupportedOperation):
+            r.write(b"x")
+    assert len(client.ops("io_close")) == 1
+    assert client.ops("obj_free")[0]["id"] == 7
+    with pytest.raises(ValueError, match="closed"):
+        r.read(1)
+
+
+def test_writer_results_and_object_views(make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import UnsupportedTypeError
+    from usegolib.handle import GoObject
+
+    client = _FakeIOClient(b"")
+    h = make_handle(client, _MANIFEST)
+
+    with h.Create().buffered() as w:
+        w.write(b"ab")
+        w.write(memoryview(b"cd"))
+    assert client.written == b"abcd"
+
+    obj = GoObject(_pkg=h, _type="Sink", _id=9)
+    with obj.io(chunk=2) as raw:
+        assert raw.writable() and raw.write(b"xy") == 2
+    assert not obj._closed  # the view does not own the handle
+    assert client.ops("io_close")[-1]["id"] == 9
+
+    client.call = lambda req, _call=client.call: (  # type: ignore[method-assign]
+        msgpack.packb({"ok": True, "result": {"read": False, "write": False, "close": False}})
+        if msgpack.unpackb(req)["op"] == "io_info"
+        else _call(req)
+    )
+    with pytest.raises(UnsupportedTypeError, match="io.Reader"):
+        obj.io()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import struct
+
+import pytest
+
+from conftest import FakeClient
+
+
+def _ids(*ids: int) -> bytes:
+    return struct.pack(f"<{len(ids)}Q", *ids)
+
+
+_MANIFEST = {
+    "structs": {
+        "example.com/p": {
+            "Counter": [{"name": "N", "type": "int64", "key": "N", "required": False}],
+            "Node": [],
+        }
+    },
+    "symbols": [],
+    "methods": [
+        {"pkg": "example.com/p", "recv": "Counter", "name": "Add", "params": ["int64"], "results": ["int64"]},
+        {"pkg": "example.com/p", "recv": "Counter", "name": "Child", "params": [], "results": ["*Node"]},
+    ],
+}
+
+
+def test_objects_create_call_and_free_in_bulk(make_handle) -> None:  # noqa: ANN001
+    from usegolib.handle import GoObject
+
+    client = FakeClient(
+        {"ok": True, "result": _ids(7, 8, 9)},
+        {"ok": True, "result": [2, 3, 4]},
+        {"ok": True, "result": [11, 12, None]},
+    )
+    h = make_handle(client, _MANIFEST)
+
+    arr = h.objects("Counter", [None, {"N": 1}, {"N": 2}], mode="unsafe")
+    assert len(arr) == 3 and list(arr.ids) == [7, 8, 9]
+    assert client.reqs[0] == {
+        "abi": 0,
+        "op": "obj_new_many",
+        "pkg": "example.com/p",
+        "type": "Counter",
+        "inits": [None, {"N": 1}, {"N": 2}],
+        "mode": "unsafe",
+    }
+
+    assert arr.call("Add", 2, parallel=4, timeout=1) == [2, 3, 4]
+    req = client.reqs[1]
+    assert req["op"] == "obj_call_many" and req["ids"] == _ids(7, 8, 9)
+    assert req["args"] == [2] and req["parallel"] == 4 and req["timeout_ns"] == 1_000_000_000
+
+    children = arr.call("Child")
+    assert [c.id if c is not None else None for c in children] == [11, 12, None]
+    assert "parallel" not in client.reqs[2]
+
+    view = arr[1]
+    assert isinstance(view, GoObject) and view.id == 8
+    view.close()  # views do not own the handle
+    assert len(client.reqs) == 3
+
+    with arr:
+        pass
+    assert client.reqs[-1] == {"abi": 0, "op": "obj_free_many", "ids": _ids(7, 8, 9)}
+    with pytest.raises(Exception, match="closed"):
+        arr.call("Add", 1)
+
+
+def test_objects_count_validation_and_errors(make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import GoError, UnsupportedTypeError
+
+    client = FakeClient(
+        {"ok": True, "result": _ids(1, 2)},
+        {"ok": False, "error": {"type": "GoError", "message": "boom", "detail": {"index": 1}}},
+    )
+    h = make_handle(client, _MANIFEST)
+    arr = h.objects("Counter", 2)
+    assert client.reqs[0]["inits"] == [None, None]
+    with pytest.raises(GoError, match="boom"):
+        arr.call("Add", 1)
+    with pytest.raises(UnsupportedTypeError):
+        arr.call("Add", "x")
+    with pytest.raises(ValueError, match="parallel"):
+        arr.call("Add", 1, parallel=0)
+    with pytest.raises(UnsupportedTypeError):
+        h.objects("Counter", [{"N": "x"}])
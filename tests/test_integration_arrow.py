@@ -0,0 +1,199 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_test_module(mod_dir: Path) -> None:
+    (mod_dir / "go.mod").write_text(
+        "\n".join(
+            [
+                "module example.com/arrowmod",
+                "",
+                "go 1.21",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (mod_dir / "arrowmod.go").write_text(
+        "\n".join(
+            [
+                "package arrowmod",
+                "",
+                'import "time"',
+                "",
+                "type Point struct {",
+                '    X float64 `json:"x"`',
+                '    Y float64 `json:"y"`',
+                "}",
+                "",
+                "type Row struct {",
+                '    ID     int64         `json:"id"`',
+                '    Name   string        `json:"name"`',
+                '    Score  *float64      `json:"score"`',
+                '    Ok     bool          `json:"ok"`',
+                '    At     time.Time     `json:"at"`',
+                '    Took   time.Duration `json:"took"`',
+                '    Level  int32         `json:"level"`',
+                '    At2    Point         `json:"pos"`',
+                '    Tags   []int64       `json:"tags"`',
+                '    Blob   []byte        `json:"blob"`',
+                '    Flags  uint8         `json:"flags"`',
+                '    Port   uint16        `json:"port"`',
+                '    Count  uint32        `json:"count"`',
+                '    Hash   uint64        `json:"hash"`',
+                "}",
+                "",
+                "type Bad struct {",
+                '    Meta map[string]int `json:"meta"`',
+                "}",
+                "",
+                "func Rows(n int) []Row {",
+                "    out := make([]Row, n)",
+                "    base := time.Date(2024, 1, 2, 3, 4, 5, 0, time.UTC)",
+                "    for i := range out {",
+                "        out[i] = Row{",
+                "            ID:    int64(i),",
+                "            Name:  string(rune(97 + i%26)),",
+                "            Ok:    i%2 == 0,",
+                "            At:    base.Add(time.Duration(i) * time.Second),",
+                "            Took:  time.Duration(i) * time.Millisecond,",
+                "            Level: int32(-i),",
+                "            At2:   Point{X: float64(i), Y: -float64(i)},",
+                "            Tags:  make([]int64, i%3),",
+                "            Blob:  []byte{byte(i)},",
+                "            Flags: uint8(200 + i%50),",
+                "            Port:  uint16(60000 + i),",
+                "            Count: uint32(4000000000 + i),",
+                "            Hash:  uint64(1)<<63 + uint64(i),",
+                "        }",
+                "        if i%3 != 1 {",
+                "            s := float64(i) / 2",
+                "            out[i].Score = &s",
+                "        }",
+                "    }",
+                "    return out",
+                "}",
+                "",
+                "func Pointers() []*Point { return []*Point{{X: 1, Y: 2}, {X: 3, Y: 4}} }",
+                "",
+                "func NilRow() []*Point { return []*Point{{X: 1}, nil} }",
+                "",
+                "func Bads() []Bad { return []Bad{{}} }",
+                "",
+                "type Store struct{ rows []Row }",
+                "",
+                "func NewStore() *Store { return &Store{rows: Rows(3)} }",
+                "",
+                "func (s *Store) All() []Row { return s.rows }",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_record_slices_export_through_arrow(tmp_path: Path):
+    np = pytest.importorskip("numpy")
+    pa = pytest.importorskip("pyarrow")
+    import usegolib
+    from usegolib.errors import GoError, UnsupportedTypeError
+
+    mod_dir = tmp_path / "gomod"
+    mod_dir.mkdir()
+    _write_go_test_module(mod_dir)
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(mod_dir),
+            "--out",
+            str(out_dir),
+        ]
+    )
+
+    h = usegolib.import_("example.com/arrowmod", artifact_dir=out_dir)
+
+    batch = h.Rows.arrow(1000)
+    assert isinstance(batch, pa.RecordBatch) and batch.num_rows == 1000
+    assert batch.column_names == [
+        "id",
+        "name",
+        "score",
+        "ok",
+        "at",
+        "took",
+        "level",
+        "pos",
+        "tags",
+        "blob",
+        "flags",
+        "port",
+        "count",
+        "hash",
+    ]
+    rows = batch.to_pylist()
+    assert {k: rows[1][k] for k in ("id", "name", "score", "ok", "level", "pos", "tags", "blob")} == {
+        "id": 1,
+        "name": "b",
+        "score": None,
+        "ok": False,
+        "level": -1,
+        "pos": {"x": 1.0, "y": -1.0},
+        "tags": [0],
+        "blob": bytes([1]),
+    }
+    assert (rows[1]["at"] - rows[0]["at"]).total_seconds() == 1
+    assert str(batch.schema.field("at").type) == "timestamp[ns, tz=UTC]"
+    assert batch.column("took").to_pylist()[2].total_seconds() == 0.002
+    assert batch.column("score").null_count == 333
+    assert [str(batch.schema.field(k).type) for k in ("flags", "port", "count", "hash")] == [
+        "uint8",
+        "uint16",
+        "uint32",
+        "uint64",
+    ]
+    assert {k: rows[1][k] for k in ("flags", "port", "count", "hash")} == {
+        "flags": 201,
+        "port": 60001,
+        "count": 4000000001,
+        "hash": 2**63 + 1,
+    }
+
+    cols = h.Rows.columns(5)
+    assert cols["id"].dtype == np.int64 and cols["id"].tolist() == [0, 1, 2, 3, 4]
+    assert cols["level"].dtype == np.int32
+    assert cols["score"].mask.tolist() == [False, True, False, False, True]
+    assert cols["ok"].tolist() == [True, False, True, False, True]
+    assert cols["name"].tolist() == ["a", "b", "c", "d", "e"]
+    assert cols["at"][1] - cols["at"][0] == np.timedelta64(1, "s")
+    assert cols["pos"]["y"].tolist() == [0.0, -1.0, -2.0, -3.0, -4.0]
+    assert [t.tolist() for t in cols["tags"]] == [[], [0], [0, 0], [], [0]]
+    assert cols["blob"][3] == bytes([3])
+    assert cols["port"].dtype == np.uint16 and cols["port"].tolist() == [60000, 60001, 60002, 60003, 60004]
+    assert cols["hash"].dtype == np.uint64 and int(cols["hash"][4]) == 2**63 + 4
+
+    assert h.Pointers.columns()["x"].tolist() == [1.0, 3.0]
+    assert h.Rows.arrow(0).num_rows == 0
+    assert h.NewStore().All.arrow().num_rows == 3
+
+    seq = h.Rows.lazy(10)
+    assert seq.arrow().num_rows == 10 and len(seq.columns()["id"]) == 10
+    seq.close()
+
+    with pytest.raises(UnsupportedTypeError, match="nil row"):
+        h.NilRow.arrow()
+    with pytest.raises(UnsupportedTypeError, match="meta"):
+        h.Bads.columns()
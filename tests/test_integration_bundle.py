@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_module(mod_dir: Path, *, module: str, body: list[str]) -> None:
+    mod_dir.mkdir()
+    (mod_dir / "go.mod").write_text(
+        "\n".join([f"module {module}", "", "go 1.22", ""]),
+        encoding="utf-8",
+    )
+    (mod_dir / "lib.go").write_text("\n".join(["package lib", "", *body, ""]), encoding="utf-8")
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_integration_bundle_shares_one_library(tmp_path: Path):
+    import usegolib
+
+    a_dir = tmp_path / "a"
+    b_dir = tmp_path / "b"
+    _write_go_module(
+        a_dir,
+        module="example.com/a",
+        body=["func AddA(x int64, y int64) int64 {", "    return x + y", "}"],
+    )
+    _write_go_module(
+        b_dir,
+        module="example.com/b",
+        body=[
+            "type Counter struct {",
+            "    N int64",
+            "}",
+            "",
+            "func (c *Counter) Inc(d int64) int64 {",
+            "    c.N += d",
+            "    return c.N",
+            "}",
+            "",
+            "func Hello(name string) string {",
+            '    return "hi " + name',
+            "}",
+        ],
+    )
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(a_dir),
+            "--module",
+            str(b_dir),
+            "--bundle-name",
+            "app",
+            "--out",
+            str(out_dir),
+        ]
+    )
+    manifests = list(out_dir.rglob("manifest.json"))
+    assert len(manifests) == 1
+
+    a = usegolib.import_("example.com/a", artifact_dir=out_dir)
+    b = usegolib.import_("example.com/b", artifact_dir=out_dir)
+    assert a._client is b._client  # noqa: SLF001 - one library, one Go runtime
+    assert (a.module, a.version) == ("example.com/a", "local")
+    assert (b.module, b.version) == ("example.com/b", "local")
+
+    assert a.AddA(1, 2) == 3
+    assert b.Hello("go") == "hi go"
+    with b.object("Counter", {"N": 1}) as c:
+        assert c.Inc(2) == 3
@@ -0,0 +1,103 @@
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_test_module(mod_dir: Path) -> None:
+    (mod_dir / "go.mod").write_text(
+        "\n".join(
+            [
+                "module example.com/coalmod",
+                "",
+                "go 1.21",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (mod_dir / "coalmod.go").write_text(
+        "\n".join(
+            [
+                "package coalmod",
+                "",
+                "import (",
+                '    "errors"',
+                '    "time"',
+                ")",
+                "",
+                "func Square(x int64) (int64, error) {",
+                "    if x < 0 {",
+                '        return 0, errors.New("negative")',
+                "    }",
+                "    time.Sleep(time.Millisecond)",
+                "    return x * x, nil",
+                "}",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_concurrent_calls_are_coalesced_into_batches(tmp_path: Path):
+    import usegolib
+    from usegolib.errors import GoError
+
+    mod_dir = tmp_path / "gomod"
+    mod_dir.mkdir()
+    _write_go_test_module(mod_dir)
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(mod_dir),
+            "--out",
+            str(out_dir),
+        ]
+    )
+
+    h = usegolib.import_("example.com/coalmod", artifact_dir=out_dir)
+    h.coalesce(max_delay=0.002, max_batch=16)
+    try:
+        results: dict[int, object] = {}
+
+        def _worker(t: int) -> None:
+            for i in range(20):
+                x = t * 100 + i
+                try:
+                    results[x] = h.Square(x if i % 7 else -x - 1)
+                except GoError as e:
+                    results[x] = str(e)
+
+        ts = [threading.Thread(target=_worker, args=(t,)) for t in range(8)]
+        for t in ts:
+            t.start()
+        for t in ts:
+            t.join()
+
+        for x, v in results.items():
+            if x % 100 % 7:
+                assert v == x * x
+            else:
+                assert "negative" in v
+        stats = h.coalesce_stats()
+        assert stats is not None
+        assert stats["requests"] == 160
+        assert stats["max_batch_size"] > 1
+    finally:
+        h.coalesce(enabled=False)
+    assert h.coalesce_stats() is None
+    assert h.Square(3) == 9
@@ -0,0 +1,159 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_test_module(mod_dir: Path) -> None:
+    (mod_dir / "go.mod").write_text(
+        "\n".join(
+            [
+                "module example.com/colmod",
+                "",
+                "go 1.21",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (mod_dir / "colmod.go").write_text(
+        "\n".join(
+            [
+                "package colmod",
+                "",
+                "import (",
+                '    "fmt"',
+                '    "time"',
+                ")",
+                "",
+                "type Point struct {",
+                '    X float64 `json:"x"`',
+                '    Y float64 `json:"y"`',
+                "}",
+                "",
+                "type Row struct {",
+                '    ID     int64     `json:"id"`',
+                '    Name   string    `json:"name,omitempty"`',
+                '    Score  float64   `json:"score"`',
+                '    Weight *float64  `json:"weight"`',
+                '    Ok     bool      `json:"ok,omitempty"`',
+                '    At     time.Time `json:"at,omitempty"`',
+                '    Level  int32     `json:"level,omitempty"`',
+                '    Pos    Point     `json:"pos,omitempty"`',
+                "}",
+                "",
+                "func Total(rows []Row) float64 {",
+                "    t := 0.0",
+                "    for _, r := range rows {",
+                "        t += r.Score * float64(r.ID)",
+                "        if r.Weight != nil {",
+                "            t += *r.Weight",
+                "        }",
+                "    }",
+                "    return t",
+                "}",
+                "",
+                "func Describe(rows []*Row) []string {",
+                "    out := make([]string, len(rows))",
+                "    for i, r := range rows {",
+                '        w := "nil"',
+                "        if r.Weight != nil {",
+                "            w = fmt.Sprint(*r.Weight)",
+                "        }",
+                '        out[i] = fmt.Sprintf("%d:%s:%v:%s:%t:%s:%d:%v,%v", r.ID, r.Name, r.Score, w, r.Ok, r.At.UTC().Format(time.RFC3339Nano), r.Level, r.Pos.X, r.Pos.Y)',
+                "    }",
+                "    return out",
+                "}",
+                "",
+                "type Store struct{ n int }",
+                "",
+                "func NewStore() *Store { return &Store{} }",
+                "",
+                "func (s *Store) Load(rows []Row) int {",
+                "    s.n += len(rows)",
+                "    return s.n",
+                "}",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_struct_slices_accept_columns(tmp_path: Path):
+    np = pytest.importorskip("numpy")
+    import usegolib
+    from usegolib.errors import UnsupportedTypeError
+
+    mod_dir = tmp_path / "gomod"
+    mod_dir.mkdir()
+    _write_go_test_module(mod_dir)
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(mod_dir),
+            "--out",
+            str(out_dir),
+        ]
+    )
+
+    h = usegolib.import_("example.com/colmod", artifact_dir=out_dir)
+
+    n = 100_000
+    ids = np.arange(n)
+    scores = np.full(n, 0.5, dtype=np.float32)
+    assert h.Total({"id": ids, "score": scores}) == pytest.approx((ids * 0.5).sum())
+    assert h.Total({"id": [], "score": []}) == 0.0
+
+    cols = {
+        "ID": [1, 2],
+        "name": np.array(["a", "b"]),
+        "score": [1.5, 2.5],
+        "weight": np.ma.masked_array([3.0, 0.0], mask=[False, True]),
+        "ok": np.array([True, False]),
+        "at": np.array(["2024-01-02T03:04:05.5", "2024-01-03"], dtype="datetime64[ns]"),
+        "level": np.array([7, -7], dtype=np.int8),
+        "pos": {"x": np.array([1.0, 2.0]), "y": [3.0, 4.0]},
+    }
+    expected = [
+        "1:a:1.5:3:true:2024-01-02T03:04:05.5Z:7:1,3",
+        "2:b:2.5:nil:false:2024-01-03T00:00:00Z:-7:2,4",
+    ]
+    assert h.Describe(cols) == expected
+    assert h.NewStore().Load({"id": ids, "score": scores}) == n
+
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame({"id": [1, 2], "name": ["a", "b"], "score": [1.5, 2.5]})
+    assert h.Describe(df)[1].startswith("2:b:2.5:nil")
+
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table(
+        {
+            "id": [1, 2],
+            "score": [0.0, 0.0],
+            "weight": pa.array([None, 4.0]),
+            "pos": pa.array([{"x": 1.0, "y": 2.0}, {"x": 3.0, "y": 4.0}]),
+        }
+    )
+    assert h.Describe(table) == ["1::0:nil:false:0001-01-01T00:00:00Z:0:1,2", "2::0:4:false:0001-01-01T00:00:00Z:0:3,4"]
+
+    with pytest.raises(UnsupportedTypeError, match="unknown field 'nope'"):
+        h.Total({"id": [1], "nope": [2]})
+    with pytest.raises(UnsupportedTypeError, match="missing required column"):
+        h.Total({"id": [1]})
+    with pytest.raises(UnsupportedTypeError, match="has 1 rows, expected 2"):
+        h.Total({"id": [1, 2], "score": [1.0]})
+    with pytest.raises(UnsupportedTypeError, match="cannot pass a float64 array as int32"):
+        h.Describe({"level": np.array([1.5])})
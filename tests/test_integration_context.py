@@ -0,0 +1,119 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_test_module(mod_dir: Path) -> None:
+    (mod_dir / "go.mod").write_text(
+        "\n".join(
+            [
+                "module example.com/ctxmod",
+                "",
+                "go 1.22",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (mod_dir / "ctxmod.go").write_text(
+        "\n".join(
+            [
+                "package ctxmod",
+                "",
+                "import (",
+                '    "context"',
+                '    "time"',
+                ")",
+                "",
+                "// Wait sleeps for ms milliseconds unless ctx ends first.",
+                "func Wait(ctx context.Context, ms int64) (int64, error) {",
+                "    select {",
+                "    case <-time.After(time.Duration(ms) * time.Millisecond):",
+                "        return ms, nil",
+                "    case <-ctx.Done():",
+                "        return 0, ctx.Err()",
+                "    }",
+                "}",
+                "",
+                "type Sleeper struct {",
+                "    N int64 `json:\"n\"`",
+                "}",
+                "",
+                "func (s *Sleeper) Wait(ctx context.Context, ms int64) (int64, error) {",
+                "    return Wait(ctx, ms)",
+                "}",
+                "",
+                "type hidden struct{}",
+                "",
+                "func NewHidden() *hidden {",
+                "    return &hidden{}",
+                "}",
+                "",
+                "func (h *hidden) Wait(ctx context.Context, ms int64) (int64, error) {",
+                "    return Wait(ctx, ms)",
+                "}",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_context_timeout_and_cancellation(tmp_path: Path):
+    import usegolib
+    from usegolib.errors import CancelledError, DeadlineExceededError
+
+    mod_dir = tmp_path / "gomod"
+    mod_dir.mkdir()
+    _write_go_test_module(mod_dir)
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(mod_dir),
+            "--out",
+            str(out_dir),
+        ]
+    )
+
+    h = usegolib.import_("example.com/ctxmod", artifact_dir=out_dir)
+    assert h.schema.symbols_by_pkg["example.com/ctxmod"]["Wait"] == (["int64"], ["int64", "error"])
+
+    assert h.Wait(1) == 1
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        h.Wait(10_000, timeout=0.05)
+    assert time.monotonic() - start < 5
+
+    with h.object("Sleeper") as s:
+        assert s.Wait(1, timeout=5) == 1
+        with pytest.raises(DeadlineExceededError):
+            s.Wait(10_000, timeout=0.05)
+
+    hidden = h.NewHidden()
+    with pytest.raises(DeadlineExceededError):
+        hidden.Wait(10_000, timeout=0.05)
+
+    # Cancellation from another thread while the call is running.
+    with h.cancel_token() as tok:
+        timer = threading.Timer(0.1, tok.cancel)
+        timer.start()
+        start = time.monotonic()
+        with pytest.raises(CancelledError):
+            h.Wait(10_000, cancel=tok)
+        assert time.monotonic() - start < 5
+        timer.join()
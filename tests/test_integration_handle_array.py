@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_test_module(mod_dir: Path) -> None:
+    (mod_dir / "go.mod").write_text(
+        "\n".join(
+            [
+                "module example.com/arrmod",
+                "",
+                "go 1.21",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (mod_dir / "arrmod.go").write_text(
+        "\n".join(
+            [
+                "package arrmod",
+                "",
+                'import "errors"',
+                "",
+                "type Counter struct {",
+                "    N int64",
+                "}",
+                "",
+                "func (c *Counter) Add(d int64) (int64, error) {",
+                "    if c.N+d < 0 {",
+                '        return 0, errors.New("negative")',
+                "    }",
+                "    c.N += d",
+                "    return c.N, nil",
+                "}",
+                "",
+                "func (c *Counter) Get() int64 {",
+                "    return c.N",
+                "}",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_handle_array_bulk_create_call_free(tmp_path: Path):
+    import usegolib
+    from usegolib.errors import GoError, UseGoLibError
+
+    mod_dir = tmp_path / "gomod"
+    mod_dir.mkdir()
+    _write_go_test_module(mod_dir)
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(mod_dir),
+            "--out",
+            str(out_dir),
+        ]
+    )
+
+    h = usegolib.import_("example.com/arrmod", artifact_dir=out_dir)
+
+    arr = h.objects("Counter", [{"N": i} for i in range(10_000)])
+    assert len(arr) == 10_000
+    assert arr.call("Add", 1)[:3] == [1, 2, 3]
+    assert arr.call("Add", 1, parallel=8)[-1] == 10_001
+    assert arr[5].Get() == 7
+
+    with pytest.raises(GoError, match="negative"):
+        arr.call("Add", -3)
+    # The first object fails (2 - 3 < 0); a sequential run stops there.
+    assert arr[3].Get() == 5
+
+    view = arr[0]
+    arr.close()
+    with pytest.raises(UseGoLibError, match="ObjectNotFound"):
+        view.Get()
+
+    with h.objects("Counter", 3) as zeros:
+        assert zeros.call("Get", parallel=2) == [0, 0, 0]
@@ -0,0 +1,136 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_test_module(mod_dir: Path) -> None:
+    (mod_dir / "go.mod").write_text(
+        "\n".join(
+            [
+                "module example.com/iomod",
+                "",
+                "go 1.21",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (mod_dir / "iomod.go").write_text(
+        "\n".join(
+            [
+                "package iomod",
+                "",
+                "import (",
+                '    "bytes"',
+                '    "compress/gzip"',
+                '    "errors"',
+                '    "io"',
+                '    "strings"',
+                '    "testing/iotest"',
+                ")",
+                "",
+                "func Repeat(s string, n int64) io.Reader {",
+                "    return strings.NewReader(strings.Repeat(s, int(n)))",
+                "}",
+                "",
+                "func Gzip(data []byte) (io.ReadCloser, error) {",
+                "    var b bytes.Buffer",
+                "    w := gzip.NewWriter(&b)",
+                "    w.Write(data)",
+                "    w.Close()",
+                "    return io.NopCloser(&b), nil",
+                "}",
+                "",
+                "func Broken() io.Reader {",
+                '    return iotest.ErrReader(errors.New("bad input"))',
+                "}",
+                "",
+                "type Sink struct {",
+                "    buf    bytes.Buffer",
+                "    closed bool",
+                "}",
+                "",
+                "func NewSink() *Sink { return &Sink{} }",
+                "",
+                "func (s *Sink) Write(p []byte) (int, error) { return s.buf.Write(p) }",
+                "",
+                "func (s *Sink) Close() error {",
+                "    s.closed = true",
+                "    return nil",
+                "}",
+                "",
+                "func (s *Sink) Bytes() []byte { return s.buf.Bytes() }",
+                "",
+                "func (s *Sink) Closed() bool { return s.closed }",
+                "",
+                "func (s *Sink) Gzip() io.WriteCloser { return gzip.NewWriter(s) }",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_io_results_are_raw_streams(tmp_path: Path):
+    import gzip
+    import io
+    import shutil
+
+    import usegolib
+    from usegolib.errors import GoError
+
+    mod_dir = tmp_path / "gomod"
+    mod_dir.mkdir()
+    _write_go_test_module(mod_dir)
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(mod_dir),
+            "--out",
+            str(out_dir),
+        ]
+    )
+
+    h = usegolib.import_("example.com/iomod", artifact_dir=out_dir)
+
+    r = h.Repeat("ab", 3)
+    assert isinstance(r, io.RawIOBase) and r.readable() and not r.writable()
+    buf = bytearray(4)
+    assert r.readinto(buf) == 4 and buf == b"abab"
+    assert r.read() == b"ab"
+    assert r.read(10) == b""
+    r.close()
+
+    out = io.BytesIO()
+    with h.Repeat("xyz", 1_000_000) as src:
+        src.chunk = 64 * 1024
+        shutil.copyfileobj(src.buffered(), out)
+    assert out.getvalue() == b"xyz" * 1_000_000
+
+    payload = b"hello " * 10_000
+    assert gzip.decompress(h.Gzip(payload).readall()) == payload
+
+    with pytest.raises(GoError, match="bad input"):
+        h.Broken().read(10)
+
+    sink = h.NewSink()
+    with sink.Gzip() as w:
+        assert w.writable() and w.write(memoryview(payload)) == len(payload)
+    assert gzip.decompress(sink.Bytes()) == payload  # Close flushed the gzip stream
+
+    with sink.io() as raw:
+        raw.write(b"!")
+    assert sink.Closed() and sink.Bytes().endswith(b"!")  # the handle outlives the view
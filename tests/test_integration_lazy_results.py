@@ -0,0 +1,125 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_test_module(mod_dir: Path) -> None:
+    (mod_dir / "go.mod").write_text(
+        "\n".join(
+            [
+                "module example.com/lazymod",
+                "",
+                "go 1.21",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (mod_dir / "lazymod.go").write_text(
+        "\n".join(
+            [
+                "package lazymod",
+                "",
+                'import "fmt"',
+                "",
+                "type Row struct {",
+                "    ID   int64",
+                "    Name string",
+                "}",
+                "",
+                "func Range(n int64) []int64 {",
+                "    out := make([]int64, n)",
+                "    for i := range out {",
+                "        out[i] = int64(i)",
+                "    }",
+                "    return out",
+                "}",
+                "",
+                "func Rows(n int64) ([]Row, error) {",
+                "    out := make([]Row, n)",
+                "    for i := range out {",
+                '        out[i] = Row{ID: int64(i), Name: fmt.Sprint("r", i)}',
+                "    }",
+                "    return out, nil",
+                "}",
+                "",
+                "func Index(n int64) map[string]Row {",
+                "    out := make(map[string]Row, n)",
+                "    for i := int64(0); i < n; i++ {",
+                '        out[fmt.Sprintf("k%06d", i)] = Row{ID: i}',
+                "    }",
+                "    return out",
+                "}",
+                "",
+                "type Table struct {",
+                "    rows []Row",
+                "}",
+                "",
+                "func (t *Table) Names() []string {",
+                '    return []string{"a", "b", "c"}',
+                "}",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_lazy_results_stay_go_side(tmp_path: Path):
+    import usegolib
+    from usegolib.errors import UseGoLibError
+
+    mod_dir = tmp_path / "gomod"
+    mod_dir.mkdir()
+    _write_go_test_module(mod_dir)
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(mod_dir),
+            "--out",
+            str(out_dir),
+        ]
+    )
+
+    h = usegolib.import_("example.com/lazymod", artifact_dir=out_dir)
+
+    nums = h.Range.lazy(1_000_000, chunk=50_000)
+    assert len(nums) == 1_000_000
+    assert nums[999_999] == 999_999
+    assert nums[10:13] == [10, 11, 12]
+    assert sum(nums) == sum(range(1_000_000))
+
+    rows = h.Rows.lazy(1000)
+    assert rows[500] == {"ID": 500, "Name": "r500"}
+    assert len(rows.materialize()) == 1000
+
+    index = h.Index.lazy(5000, chunk=512)
+    assert index["k004999"] == {"ID": 4999, "Name": ""}
+    assert "missing" not in index
+    keys = list(index)
+    assert keys[0] == "k000000" and keys == sorted(keys) and len(keys) == 5000
+    assert sum(r["ID"] for r in index.values()) == sum(range(5000))
+    assert len(index.materialize()) == 5000
+
+    with h.object("Table") as t:
+        assert list(t.Names.lazy()) == ["a", "b", "c"]
+
+    typed = h.typed().Rows.lazy(3)
+    assert typed[2].Name == "r2"
+
+    nums.close()
+    with pytest.raises(UseGoLibError, match="closed"):
+        nums[0]
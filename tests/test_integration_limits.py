@@ -0,0 +1,140 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_test_module(mod_dir: Path) -> None:
+    (mod_dir / "go.mod").write_text(
+        "\n".join(
+            [
+                "module example.com/limitmod",
+                "",
+                "go 1.22",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (mod_dir / "limitmod.go").write_text(
+        "\n".join(
+            [
+                "package limitmod",
+                "",
+                'import "time"',
+                "",
+                "func Sleep(ms int64) int64 {",
+                "    time.Sleep(time.Duration(ms) * time.Millisecond)",
+                "    return ms",
+                "}",
+                "",
+                "func Heavy(ms int64) int64 {",
+                "    return Sleep(ms)",
+                "}",
+                "",
+                "type Box struct {",
+                "    N int64 `json:\"n\"`",
+                "}",
+                "",
+                "func (b *Box) Sleep(ms int64) int64 {",
+                "    return Sleep(ms)",
+                "}",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+def _run_concurrently(*calls):
+    results: list = [None] * len(calls)
+
+    def _worker(i: int, fn) -> None:  # noqa: ANN001
+        try:
+            results[i] = fn()
+        except Exception as e:  # noqa: BLE001
+            results[i] = e
+
+    ts = []
+    for i, fn in enumerate(calls):
+        t = threading.Thread(target=_worker, args=(i, fn))
+        t.start()
+        ts.append(t)
+        time.sleep(0.05)  # deterministic arrival order
+    for t in ts:
+        t.join()
+    return results
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_admission_limits(tmp_path: Path):
+    import usegolib
+    from usegolib.errors import BusyError, DeadlineExceededError
+
+    mod_dir = tmp_path / "gomod"
+    mod_dir.mkdir()
+    _write_go_test_module(mod_dir)
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(mod_dir),
+            "--out",
+            str(out_dir),
+        ]
+    )
+
+    h = usegolib.import_("example.com/limitmod", artifact_dir=out_dir)
+
+    # Fail fast.
+    h.set_limit("Sleep", max_concurrency=1, policy="fail")
+    r = _run_concurrently(lambda: h.Sleep(300), lambda: h.Sleep(1))
+    assert r[0] == 300
+    assert isinstance(r[1], BusyError)
+    assert h.limit_stats()["symbols"]["Sleep"]["rejected"] == 1
+
+    # Queue with timeout.
+    h.set_limit("Sleep", max_concurrency=1, queue_timeout=0.05)
+    r = _run_concurrently(lambda: h.Sleep(300), lambda: h.Sleep(1))
+    assert isinstance(r[1], BusyError)
+    assert h.limit_stats()["symbols"]["Sleep"]["timed_out"] == 1
+
+    # Unbounded queue: both run, one after the other; the call's own timeout still applies.
+    h.set_limit("Sleep", max_concurrency=1)
+    r = _run_concurrently(lambda: h.Sleep(200), lambda: h.Sleep(1))
+    assert r == [200, 1]
+    st = h.limit_stats()["symbols"]["Sleep"]
+    assert st["max_waiting"] == 1
+    assert st["wait_ns_max"] > 50_000_000
+    assert st["in_use"] == 0 and st["waiting"] == 0
+    r = _run_concurrently(lambda: h.Sleep(300), lambda: h.Sleep(1, timeout=0.05))
+    assert isinstance(r[1], DeadlineExceededError)
+    h.set_limit("Sleep")
+    assert "Sleep" not in h.limit_stats()["symbols"]
+
+    # Global weighted limit: Heavy takes both global slots.
+    h.set_limit(max_concurrency=2, policy="fail")
+    h.set_limit("Heavy", weight=2)
+    r = _run_concurrently(lambda: h.Sleep(300), lambda: h.Sleep(300), lambda: h.Sleep(1))
+    assert isinstance(r[2], BusyError)
+    r = _run_concurrently(lambda: h.Heavy(300), lambda: h.Sleep(1))
+    assert isinstance(r[1], BusyError)
+    with h.object("Box") as b:
+        r = _run_concurrently(lambda: h.Heavy(300), lambda: b.Sleep(1))
+        assert isinstance(r[1], BusyError)
+    assert h.limit_stats()["global"]["rejected"] == 3
+    h.set_limit()
+    assert h.limit_stats()["global"] is None
+    assert h.Heavy(1) == 1
@@ -0,0 +1,171 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_test_module(mod_dir: Path) -> None:
+    (mod_dir / "go.mod").write_text(
+        "\n".join(
+            [
+                "module example.com/mapmod",
+                "",
+                "go 1.21",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (mod_dir / "mapmod.go").write_text(
+        "\n".join(
+            [
+                "package mapmod",
+                "",
+                "import (",
+                '    "time"',
+                '    "unsafe"',
+                ")",
+                "",
+                "func Sum(xs []float64) float64 {",
+                "    s := 0.0",
+                "    for _, x := range xs {",
+                "        s += x",
+                "    }",
+                "    return s",
+                "}",
+                "",
+                "func Addr(xs []float64) int64 { return int64(uintptr(unsafe.Pointer(&xs[0]))) }",
+                "",
+                "func SlowSum(xs []float64) float64 {",
+                "    time.Sleep(300 * time.Millisecond)",
+                "    return Sum(xs)",
+                "}",
+                "",
+                "func Count(data []byte, c int) int {",
+                "    n := 0",
+                "    for _, b := range data {",
+                "        if int(b) == c {",
+                "            n++",
+                "        }",
+                "    }",
+                "    return n",
+                "}",
+                "",
+                "func Total32(xs []int32) int64 {",
+                "    t := int64(0)",
+                "    for _, x := range xs {",
+                "        t += int64(x)",
+                "    }",
+                "    return t",
+                "}",
+                "",
+                "func TotalU16(xs []uint16) uint64 {",
+                "    var t uint64",
+                "    for _, x := range xs {",
+                "        t += uint64(x)",
+                "    }",
+                "    return t",
+                "}",
+                "",
+                "func Total(xs []int) int {",
+                "    t := 0",
+                "    for _, x := range xs {",
+                "        t += x",
+                "    }",
+                "    return t",
+                "}",
+                "",
+                "type Index struct{ n int }",
+                "",
+                "func NewIndex() *Index { return &Index{} }",
+                "",
+                "func (ix *Index) Load(xs []float64) int {",
+                "    ix.n += len(xs)",
+                "    return ix.n",
+                "}",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_mapped_files_are_go_slices(tmp_path: Path):
+    import threading
+
+    np = pytest.importorskip("numpy")
+    import usegolib
+    from usegolib.errors import UnsupportedTypeError, UseGoLibError
+
+    mod_dir = tmp_path / "gomod"
+    mod_dir.mkdir()
+    _write_go_test_module(mod_dir)
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(mod_dir),
+            "--out",
+            str(out_dir),
+        ]
+    )
+
+    h = usegolib.import_("example.com/mapmod", artifact_dir=out_dir)
+
+    xs = np.linspace(0.0, 1.0, 1_000_001)
+    np.save(tmp_path / "xs.npy", xs)
+    m = h.map_file(tmp_path / "xs.npy")
+    assert (m.dtype, m.shape, len(m)) == ("float64", (1_000_001,), 1_000_001)
+    assert h.Sum(m) == pytest.approx(xs.sum())
+    view = m.array()
+    assert h.Addr(m) == view.ctypes.data  # Go reads the mapped pages
+    assert h.NewIndex().Load(m) == 1_000_001
+    with pytest.raises(UnsupportedTypeError, match="pinned"):
+        h.Total32(m)
+    p = h.pipeline()
+    p.Sum(m)
+    assert p.run() == pytest.approx(xs.sum())
+    # Only map_file pins are read as memory; a look-alike value is just a map.
+    with h.pin({"dtype": "f8", "addr": 8, "len": 1}) as forged:
+        with pytest.raises(UnsupportedTypeError):
+            h.Sum(forged)
+
+    (tmp_path / "data.bin").write_bytes(b"abcabca")
+    with h.map_file(tmp_path / "data.bin", "byte") as b:
+        assert h.Count(b, ord("a")) == 3
+    np.arange(10, dtype="<i4").tofile(tmp_path / "i32.bin")
+    assert h.Total32(h.map_file(tmp_path / "i32.bin", np.int32)) == 45
+    np.arange(10, dtype="<i8").tofile(tmp_path / "i64.bin")
+    assert h.Total(h.map_file(tmp_path / "i64.bin", "int64")) == 45
+    np.full(4, 65535, dtype="<u2").tofile(tmp_path / "u16.bin")
+    assert h.TotalU16(h.map_file(tmp_path / "u16.bin", np.uint16)) == 4 * 65535
+
+    # Closing during a call unmaps only after the call returns.
+    slow = h.map_file(tmp_path / "xs.npy")
+    out: list[float] = []
+    t = threading.Thread(target=lambda: out.append(h.SlowSum(slow)))
+    t.start()
+    while slow._users == 0:  # noqa: SLF001 - test waits for the call to start
+        pass
+    slow.close()
+    assert not slow._mmap.closed  # noqa: SLF001
+    t.join()
+    assert out == [pytest.approx(xs.sum())]
+    assert slow._mmap.closed  # noqa: SLF001
+    with pytest.raises(UseGoLibError, match="closed"):
+        h.Sum(slow)
+
+    # NumPy views keep the mapping alive after close.
+    m.close()
+    assert view[-1] == 1.0
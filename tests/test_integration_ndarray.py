@@ -0,0 +1,169 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_test_module(mod_dir: Path) -> None:
+    (mod_dir / "go.mod").write_text(
+        "\n".join(
+            [
+                "module example.com/ndmod",
+                "",
+                "go 1.21",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (mod_dir / "ndmod.go").write_text(
+        "\n".join(
+            [
+                "package ndmod",
+                "",
+                "func Sum(xs []float64) float64 {",
+                "    s := 0.0",
+                "    for _, x := range xs {",
+                "        s += x",
+                "    }",
+                "    return s",
+                "}",
+                "",
+                "func Scale(xs []float32, k float32) []float32 {",
+                "    out := make([]float32, len(xs))",
+                "    for i, x := range xs {",
+                "        out[i] = x * k",
+                "    }",
+                "    return out",
+                "}",
+                "",
+                "func Total(xs []int) int {",
+                "    t := 0",
+                "    for _, x := range xs {",
+                "        t += x",
+                "    }",
+                "    return t",
+                "}",
+                "",
+                "func Transpose(m [][]float64) ([][]float64, error) {",
+                "    if len(m) == 0 {",
+                "        return nil, nil",
+                "    }",
+                "    out := make([][]float64, len(m[0]))",
+                "    for j := range out {",
+                "        out[j] = make([]float64, len(m))",
+                "        for i := range m {",
+                "            out[j][i] = m[i][j]",
+                "        }",
+                "    }",
+                "    return out, nil",
+                "}",
+                "",
+                "func Ragged() [][]int32 { return [][]int32{{1}, {2, 3}} }",
+                "",
+                "func Widen(xs []uint16, shift uint) []uint64 {",
+                "    out := make([]uint64, len(xs))",
+                "    for i, x := range xs {",
+                "        out[i] = uint64(x) << shift",
+                "    }",
+                "    return out",
+                "}",
+                "",
+                "func MaxU32(xs []uint32) uint32 {",
+                "    var m uint32",
+                "    for _, x := range xs {",
+                "        if x > m {",
+                "            m = x",
+                "        }",
+                "    }",
+                "    return m",
+                "}",
+                "",
+                "func Hits(m map[string]uint8) int64 {",
+                "    var t int64",
+                "    for _, v := range m {",
+                "        t += int64(v)",
+                "    }",
+                "    return t",
+                "}",
+                "",
+                "type Acc struct{ xs []float64 }",
+                "",
+                "func NewAcc() *Acc { return &Acc{} }",
+                "",
+                "func (a *Acc) Add(xs []float64) int64 {",
+                "    a.xs = append(a.xs, xs...)",
+                "    return int64(len(a.xs))",
+                "}",
+                "",
+                "func (a *Acc) Values() []float64 { return a.xs }",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_packed_numeric_arrays(tmp_path: Path):
+    import array
+
+    np = pytest.importorskip("numpy")
+    import usegolib
+
+    mod_dir = tmp_path / "gomod"
+    mod_dir.mkdir()
+    _write_go_test_module(mod_dir)
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(mod_dir),
+            "--out",
+            str(out_dir),
+        ]
+    )
+
+    h = usegolib.import_("example.com/ndmod", artifact_dir=out_dir)
+
+    xs = np.linspace(0.0, 1.0, 100_001)
+    assert h.Sum(xs) == pytest.approx(xs.sum())
+    assert h.Sum(array.array("d", [1.5, 2.5])) == 4.0
+    assert h.Sum([1.0, 2.0]) == 3.0
+    assert h.Total(np.arange(10)) == 45
+    assert h.Total(array.array("i", [1, 2, 3])) == 6
+
+    scaled = h.Scale.numpy(np.array([1, 2, 3], dtype=np.float32), 2.0)
+    assert scaled.dtype == np.float32 and scaled.tolist() == [2.0, 4.0, 6.0]
+    assert h.Scale([1.0], 3.0) == [3.0]
+
+    m = np.arange(6, dtype=np.float64).reshape(2, 3)
+    t = h.Transpose.numpy(m)
+    assert t.shape == (3, 2) and (t == m.T).all()
+    assert h.Transpose([[1.0, 2.0]]) == [[1.0], [2.0]]
+    assert h.Transpose.numpy(np.zeros((0, 0))) is None
+
+    rows = h.Ragged.numpy()
+    assert [r.tolist() for r in rows] == [[1], [2, 3]]
+
+    wide = h.Widen.numpy(np.array([1, 65535], dtype=np.uint16), 48)
+    assert wide.dtype == np.uint64 and wide.tolist() == [1 << 48, 65535 << 48]
+    assert h.Widen([1, 2], 63) == [1 << 63, 0]
+    assert h.Widen(array.array("H", [3]), 0) == [3]
+    assert h.MaxU32(np.array([7, 4_000_000_000], dtype=np.uint32)) == 4_000_000_000
+    assert h.MaxU32([1, 2**32 - 1]) == 2**32 - 1
+    assert h.Hits({"a": 200, "b": 55}) == 255
+
+    acc = h.NewAcc()
+    assert acc.Add(np.ones(4)) == 4
+    assert acc.Values.numpy().tolist() == [1.0] * 4
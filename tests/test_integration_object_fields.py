@@ -0,0 +1,104 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_test_module(mod_dir: Path) -> None:
+    (mod_dir / "go.mod").write_text(
+        "\n".join(
+            [
+                "module example.com/fieldmod",
+                "",
+                "go 1.21",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (mod_dir / "fieldmod.go").write_text(
+        "\n".join(
+            [
+                "package fieldmod",
+                "",
+                "type Point struct {",
+                '    X int64 `json:"x"`',
+                "    Y int64",
+                "}",
+                "",
+                "type Doc struct {",
+                "    Title string",
+                "    At    Point",
+                "    Tags  []string",
+                "    Blob  []byte",
+                '    Note  string `json:"note"`',
+                "}",
+                "",
+                "func (d *Doc) Summary() string {",
+                '    return d.Title + ":" + d.Tags[0]',
+                "}",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_object_field_access(tmp_path: Path):
+    import usegolib
+    from usegolib.errors import UnsupportedTypeError
+
+    mod_dir = tmp_path / "gomod"
+    mod_dir.mkdir()
+    _write_go_test_module(mod_dir)
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(mod_dir),
+            "--out",
+            str(out_dir),
+        ]
+    )
+
+    h = usegolib.import_("example.com/fieldmod", artifact_dir=out_dir)
+
+    with h.object("Doc", {"Title": "a", "At": {"x": 1, "Y": 2}, "Tags": ["t"], "Blob": b"\x00" * 1000, "note": ""}) as d:
+        assert d.get("Title") == "a"
+        assert d.get_many(["At", "Tags"]) == {"At": {"x": 1, "Y": 2}, "Tags": ["t"]}
+        d.set("Title", "b")
+        d.set("At", {"X": 5, "Y": 6})
+        assert d.Summary() == "b:t"
+        assert d.get("At") == {"x": 5, "Y": 6}
+        with pytest.raises(UnsupportedTypeError):
+            d.set("Title", 3)
+
+    # Without a schema the bridge checks field names and values itself.
+    import dataclasses
+
+    from usegolib.errors import UseGoLibError
+
+    bare = dataclasses.replace(h, _schema=None)
+    with bare.object("Doc") as d:
+        with pytest.raises(UseGoLibError, match="FieldNotFound"):
+            d.get("Nope")
+        with pytest.raises(UnsupportedTypeError, match="invalid field value"):
+            d.set("Tags", "x")
+        d.set("note", "n")
+        assert d.get("Note") == "n"
+
+    th = h.typed()
+    with th.object("Doc", th.types.Doc(Title="z", At=th.types.Point(X=1, Y=1), Tags=[], Blob=b"", Note="")) as td:
+        at = td.get("At")
+        assert (at.X, at.Y) == (1, 1)
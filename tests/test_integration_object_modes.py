@@ -0,0 +1,178 @@
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_test_module(mod_dir: Path) -> None:
+    (mod_dir / "go.mod").write_text(
+        "\n".join(
+            [
+                "module example.com/modemod",
+                "",
+                "go 1.22",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (mod_dir / "modemod.go").write_text(
+        "\n".join(
+            [
+                "package modemod",
+                "",
+                "import (",
+                '    "sync/atomic"',
+                '    "time"',
+                ")",
+                "",
+                "// Gauge records the highest number of method calls that overlapped.",
+                "type Gauge struct {",
+                "    N int64 `json:\"n\"`",
+                "    inflight int64",
+                "    peak int64",
+                "}",
+                "",
+                "func (g *Gauge) enter() {",
+                "    cur := atomic.AddInt64(&g.inflight, 1)",
+                "    for {",
+                "        p := atomic.LoadInt64(&g.peak)",
+                "        if cur <= p || atomic.CompareAndSwapInt64(&g.peak, p, cur) {",
+                "            break",
+                "        }",
+                "    }",
+                "    time.Sleep(50 * time.Millisecond)",
+                "    atomic.AddInt64(&g.inflight, -1)",
+                "}",
+                "",
+                "func (g *Gauge) Read() int64 {",
+                "    g.enter()",
+                "    return g.N",
+                "}",
+                "",
+                "func (g *Gauge) Write(n int64) {",
+                "    g.enter()",
+                "    g.N = n",
+                "}",
+                "",
+                "func (g *Gauge) Peak() int64 {",
+                "    return atomic.LoadInt64(&g.peak)",
+                "}",
+                "",
+                "// Count streams 0..n-1; the producer outlives the method call.",
+                "func (g *Gauge) Count(n int64) <-chan int64 {",
+                "    ch := make(chan int64)",
+                "    go func() {",
+                "        defer close(ch)",
+                "        for i := int64(0); i < n; i++ {",
+                "            ch <- i",
+                "        }",
+                "    }()",
+                "    return ch",
+                "}",
+                "",
+                "// Plain has no annotation: its handles take no lock.",
+                "type Plain struct {",
+                "    g Gauge",
+                "}",
+                "",
+                "func (p *Plain) Write(n int64) { p.g.Write(n) }",
+                "",
+                "func (p *Plain) Peak() int64 { return p.g.Peak() }",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+def _peak(obj, method: str, *, threads: int = 4) -> int:
+    barrier = threading.Barrier(threads)
+
+    def _worker() -> None:
+        barrier.wait()
+        if method == "Write":
+            obj.Write(1)
+        else:
+            obj.Read()
+
+    ts = [threading.Thread(target=_worker) for _ in range(threads)]
+    for t in ts:
+        t.start()
+    for t in ts:
+        t.join()
+    return obj.Peak()
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_object_concurrency_modes(tmp_path: Path):
+    import usegolib
+
+    mod_dir = tmp_path / "gomod"
+    mod_dir.mkdir()
+    _write_go_test_module(mod_dir)
+    annotations = tmp_path / "annotations.json"
+    annotations.write_text(
+        json.dumps(
+            {
+                "types": [
+                    {"pkg": "example.com/modemod", "name": "Gauge", "concurrency": "rwlock", "readonly": ["Read", "Peak"]}
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(mod_dir),
+            "--out",
+            str(out_dir),
+            "--annotations",
+            str(annotations),
+        ]
+    )
+
+    h = usegolib.import_("example.com/modemod", artifact_dir=out_dir)
+    assert h.schema.readonly_methods_by_pkg["example.com/modemod"]["Gauge"] == frozenset({"Read", "Peak"})
+
+    # Type default (rwlock): read-only methods overlap, writers are exclusive.
+    with h.object("Gauge") as g:
+        assert _peak(g, "Read") > 1
+    with h.object("Gauge") as g:
+        assert _peak(g, "Write") == 1
+
+    # Per-handle override.
+    with h.object("Gauge", mode="exclusive") as g:
+        assert _peak(g, "Read") == 1
+    with h.object("Gauge", mode="unsafe") as g:
+        assert _peak(g, "Write") > 1
+
+    with pytest.raises(ValueError):
+        h.object("Gauge", mode="bogus")
+
+    # A stream is read outside the handle's lock, so other calls do not wait for it.
+    with h.object("Gauge", mode="exclusive") as g:
+        stream = g.Count(3)
+        g.Write(2)
+        assert g.Read() == 2
+        assert list(stream) == [0, 1, 2]
+
+    # Unannotated types keep the no-lock behaviour; locking is opt-in.
+    with h.object("Plain") as p:
+        assert _peak(p, "Write") > 1
+    with h.object("Plain", mode="exclusive") as p:
+        assert _peak(p, "Write") == 1
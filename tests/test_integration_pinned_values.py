@@ -0,0 +1,127 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_test_module(mod_dir: Path) -> None:
+    (mod_dir / "go.mod").write_text(
+        "\n".join(
+            [
+                "module example.com/pinmod",
+                "",
+                "go 1.21",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (mod_dir / "pinmod.go").write_text(
+        "\n".join(
+            [
+                "package pinmod",
+                "",
+                "type Config struct {",
+                "    Scale float64",
+                "    Names []string",
+                "}",
+                "",
+                "func Score(weights map[string]float64, key string) float64 {",
+                "    return weights[key]",
+                "}",
+                "",
+                "func Size(blob []byte) int64 {",
+                "    return int64(len(blob))",
+                "}",
+                "",
+                "func Scaled(cfg Config, x float64) float64 {",
+                "    return cfg.Scale * x",
+                "}",
+                "",
+                "type Model struct {",
+                "    bias float64",
+                "}",
+                "",
+                "func (m *Model) Predict(weights map[string]float64, key string) float64 {",
+                "    return weights[key] + m.bias",
+                "}",
+                "",
+                "type hidden struct{}",
+                "",
+                "func NewHidden() *hidden {",
+                "    return &hidden{}",
+                "}",
+                "",
+                "func (h *hidden) Size(blob []byte) int64 {",
+                "    return int64(len(blob))",
+                "}",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_pinned_values_are_reused_across_calls(tmp_path: Path):
+    import usegolib
+    from usegolib.errors import UseGoLibError
+
+    mod_dir = tmp_path / "gomod"
+    mod_dir.mkdir()
+    _write_go_test_module(mod_dir)
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(mod_dir),
+            "--out",
+            str(out_dir),
+        ]
+    )
+
+    h = usegolib.import_("example.com/pinmod", artifact_dir=out_dir)
+
+    weights = h.pin({"a": 1.5, "b": 2.5}, go_type="map[string]float64")
+    blob = h.pin(b"\x01" * 1000, go_type="[]byte")
+    cfg = h.pin({"Scale": 2.0, "Names": ["x"]}, go_type="Config")
+
+    for _ in range(3):
+        assert h.Score(weights, "b") == 2.5
+        assert h.Size(blob) == 1000
+        assert h.Scaled(cfg, 4.0) == 8.0
+
+    with h.object("Model") as m:
+        assert m.Predict(weights, "a") == 1.5
+    # Methods dispatched by reflection resolve pins too.
+    assert h.NewHidden().Size(blob) == 1000
+
+    p = h.pipeline()
+    assert p.run(p.Score(weights, "a")) == 1.5
+
+    with h.pin(b"xy") as scoped:
+        assert h.Size(scoped) == 2
+
+    h.unpin(weights)
+    with pytest.raises(UseGoLibError, match="closed"):
+        h.Score(weights, "a")
+    blob.close()
+    cfg.close()
+
+    from usegolib.handle import Pin
+
+    stale = Pin(_client=h._client, _id=10**9)  # noqa: SLF001
+    with pytest.raises(UseGoLibError, match="PinNotFound"):
+        h.Size(stale)
+    with pytest.raises(UseGoLibError, match="PinNotFound"):
+        h.NewHidden().Size(stale)
@@ -0,0 +1,109 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_test_module(mod_dir: Path) -> None:
+    (mod_dir / "go.mod").write_text(
+        "\n".join(
+            [
+                "module example.com/pipemod",
+                "",
+                "go 1.21",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (mod_dir / "pipemod.go").write_text(
+        "\n".join(
+            [
+                "package pipemod",
+                "",
+                'import "errors"',
+                "",
+                "type Table struct {",
+                "    rows []string",
+                "}",
+                "",
+                "func NewTable(name string) *Table {",
+                "    return &Table{rows: []string{name}}",
+                "}",
+                "",
+                "func (t *Table) Append(row string) *Table {",
+                "    return &Table{rows: append(append([]string{}, t.rows...), row)}",
+                "}",
+                "",
+                "func (t *Table) Len() int64 {",
+                "    return int64(len(t.rows))",
+                "}",
+                "",
+                "func (t *Table) Rows() []string {",
+                "    return t.rows",
+                "}",
+                "",
+                "func Pair(a string) (string, string, error) {",
+                "    if a == \"\" {",
+                '        return "", "", errors.New("empty")',
+                "    }",
+                '    return a, a + a, nil',
+                "}",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_pipeline_runs_dependent_calls_in_one_request(tmp_path: Path):
+    import usegolib
+    from usegolib.errors import GoError
+
+    mod_dir = tmp_path / "gomod"
+    mod_dir.mkdir()
+    _write_go_test_module(mod_dir)
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(mod_dir),
+            "--out",
+            str(out_dir),
+        ]
+    )
+
+    h = usegolib.import_("example.com/pipemod", artifact_dir=out_dir)
+
+    p = h.pipeline()
+    pair = p.Pair("x")
+    t = p.NewTable(pair[1])
+    t = p.call(t, "Append", pair[0])
+    n = p.call(t, "Len")
+    rows = p.call(t, "Rows")
+    assert p.run(n, rows) == (2, ["xx", "x"])
+
+    # Returned handles stay alive; existing objects can be pipeline targets.
+    p = h.pipeline()
+    p.call(p.NewTable("a"), "Append", "b")
+    table = p.run()
+    assert table.Len() == 2
+    p = h.pipeline()
+    assert p.run(p.call(p.call(table, "Append", "c"), "Len")) == 3
+
+    p = h.pipeline()
+    p.NewTable("a")
+    p.Pair("")
+    with pytest.raises(GoError, match="empty"):
+        p.run()
@@ -0,0 +1,113 @@
+import gc
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_test_module(mod_dir: Path) -> None:
+    (mod_dir / "go.mod").write_text(
+        "\n".join(
+            [
+                "module example.com/poolmod",
+                "",
+                "go 1.22",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (mod_dir / "poolmod.go").write_text(
+        "\n".join(
+            [
+                "package poolmod",
+                "",
+                'import "os"',
+                "",
+                "func Pid() int64 {",
+                "    return int64(os.Getpid())",
+                "}",
+                "",
+                "func Checksum(b []byte) int64 {",
+                "    var s int64",
+                "    for _, x := range b {",
+                "        s += int64(x)",
+                "    }",
+                "    return s",
+                "}",
+                "",
+                "func Fill(n int64, v int64) []byte {",
+                "    out := make([]byte, n)",
+                "    for i := range out {",
+                "        out[i] = byte(v)",
+                "    }",
+                "    return out",
+                "}",
+                "",
+                "type Counter struct {",
+                "    N int64 `json:\"n\"`",
+                "}",
+                "",
+                "func (c *Counter) Inc(delta int64) int64 {",
+                "    c.N += delta",
+                "    return c.N",
+                "}",
+                "",
+                "func (c *Counter) Pid() int64 {",
+                "    return int64(os.Getpid())",
+                "}",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_process_pool(tmp_path: Path):
+    from usegolib.errors import UseGoLibError
+    from usegolib.pool import ProcessPool
+
+    mod_dir = tmp_path / "gomod"
+    mod_dir.mkdir()
+    _write_go_test_module(mod_dir)
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(mod_dir),
+            "--out",
+            str(out_dir),
+        ]
+    )
+
+    with ProcessPool("example.com/poolmod", artifact_dir=out_dir, workers=2, shm_threshold=1024) as pool:
+        pids = {pool.Pid() for _ in range(8)}
+        assert os.getpid() not in pids
+
+        # Large arguments and results travel through shared memory.
+        payload = bytes(range(256)) * 64
+        assert pool.Checksum(payload) == sum(payload)
+        assert pool.Fill(4096, 7) == b"\x07" * 4096
+
+        c = pool.object("Counter", {"n": 1})
+        owner = c.Pid()
+        assert [c.Inc(2), c.Inc(3)] == [3, 6]
+        assert c.Pid() == owner
+
+        # Objects dropped without close() are freed in their worker by a later request.
+        worker, obj_id = c._worker, c.id  # noqa: SLF001
+        del c
+        gc.collect()
+        with pytest.raises(UseGoLibError, match="ObjectNotFound"):
+            pool._submit(("obj_call", obj_id, "Inc", (1,)), worker=worker)  # noqa: SLF001
@@ -0,0 +1,119 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_test_module(mod_dir: Path) -> None:
+    (mod_dir / "go.mod").write_text(
+        "\n".join(
+            [
+                "module example.com/readermod",
+                "",
+                "go 1.21",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (mod_dir / "readermod.go").write_text(
+        "\n".join(
+            [
+                "package readermod",
+                "",
+                "import (",
+                '    "bufio"',
+                '    "io"',
+                ")",
+                "",
+                "func Size(r io.Reader) (int64, error) {",
+                "    return io.Copy(io.Discard, r)",
+                "}",
+                "",
+                "func CountLines(r io.Reader) (int64, error) {",
+                "    sc := bufio.NewScanner(r)",
+                "    n := int64(0)",
+                "    for sc.Scan() {",
+                "        n++",
+                "    }",
+                "    return n, sc.Err()",
+                "}",
+                "",
+                "func Head(r io.Reader, n int64) ([]byte, error) {",
+                "    buf := make([]byte, n)",
+                "    _, err := io.ReadFull(r, buf)",
+                "    return buf, err",
+                "}",
+                "",
+                "type Counter struct {",
+                "    Total int64",
+                "}",
+                "",
+                "func (c *Counter) Add(r io.Reader) (int64, error) {",
+                "    n, err := io.Copy(io.Discard, r)",
+                "    c.Total += n",
+                "    return c.Total, err",
+                "}",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_reader_params_stream_python_input(tmp_path: Path):
+    import itertools
+
+    import usegolib
+    from usegolib.reader import GoFile
+
+    mod_dir = tmp_path / "gomod"
+    mod_dir.mkdir()
+    _write_go_test_module(mod_dir)
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(mod_dir),
+            "--out",
+            str(out_dir),
+        ]
+    )
+
+    h = usegolib.import_("example.com/readermod", artifact_dir=out_dir)
+
+    assert h.Size(b"hello") == 5
+    data_file = tmp_path / "lines.txt"
+    data_file.write_bytes(b"line\n" * 500_000)
+    with data_file.open("rb") as f:
+        assert h.CountLines(f) == 500_000
+    assert h.CountLines(GoFile(path=data_file)) == 500_000
+    with data_file.open("rb") as f:
+        assert h.Size(GoFile(fd=f.fileno())) == 2_500_000
+        assert not f.closed
+
+    assert h.Size(b"x" * 1000 for _ in range(100)) == 100_000
+    # Go stops reading early: the feeder of an endless source stops too.
+    assert h.Head(itertools.repeat(b"ab"), 5) == b"ababa"
+
+    def _broken():
+        yield b"a\n"
+        raise ValueError("source failed")
+
+    with pytest.raises(ValueError, match="source failed"):
+        h.CountLines(_broken())
+
+    with h.object("Counter") as c:
+        c.Add(b"abc")
+        assert c.Add(iter([b"de", b"f"])) == 6
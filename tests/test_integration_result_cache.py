@@ -0,0 +1,88 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_test_module(mod_dir: Path) -> None:
+    (mod_dir / "go.mod").write_text(
+        "\n".join(
+            [
+                "module example.com/puremod",
+                "",
+                "go 1.22",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (mod_dir / "puremod.go").write_text(
+        "\n".join(
+            [
+                "package puremod",
+                "",
+                'import "sync/atomic"',
+                "",
+                "var calls int64",
+                "",
+                "func Double(n int64) int64 {",
+                "    atomic.AddInt64(&calls, 1)",
+                "    return n * 2",
+                "}",
+                "",
+                "func Calls() int64 {",
+                "    return atomic.LoadInt64(&calls)",
+                "}",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_pure_functions_are_cached(tmp_path: Path):
+    import usegolib
+
+    mod_dir = tmp_path / "gomod"
+    mod_dir.mkdir()
+    _write_go_test_module(mod_dir)
+    annotations = tmp_path / "annotations.json"
+    annotations.write_text(
+        json.dumps({"functions": [{"pkg": "example.com/puremod", "name": "Double", "pure": True}]}),
+        encoding="utf-8",
+    )
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(mod_dir),
+            "--out",
+            str(out_dir),
+            "--annotations",
+            str(annotations),
+        ]
+    )
+
+    h = usegolib.import_("example.com/puremod", artifact_dir=out_dir)
+    assert h.schema.pure_symbols_by_pkg == {"example.com/puremod": {"Double"}}
+
+    assert [h.Double(2) for _ in range(5)] == [4] * 5
+    assert h.Double(3) == 6
+    assert h.Calls() == 2
+    assert h.cache_stats()["Double"]["hits"] == 4
+
+    h.cache("Double", maxsize=0)
+    h.Double(2)
+    assert h.Calls() == 3
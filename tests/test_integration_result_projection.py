@@ -0,0 +1,107 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_test_module(mod_dir: Path) -> None:
+    (mod_dir / "go.mod").write_text(
+        "\n".join(
+            [
+                "module example.com/projmod",
+                "",
+                "go 1.21",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (mod_dir / "projmod.go").write_text(
+        "\n".join(
+            [
+                "package projmod",
+                "",
+                "type Meta struct {",
+                '    Tag   string `json:"tag"`',
+                "    Notes string",
+                "}",
+                "",
+                "type Row struct {",
+                "    ID    int64",
+                "    Score float64",
+                "    Body  string",
+                "    Meta  *Meta",
+                "    Tags  map[string]Meta",
+                "}",
+                "",
+                "func row(i int64) Row {",
+                '    return Row{ID: i, Score: float64(i) / 2, Body: "long body", Meta: &Meta{Tag: "t", Notes: "n"},',
+                '        Tags: map[string]Meta{"a": {Tag: "x", Notes: "y"}}}',
+                "}",
+                "",
+                "func Rows(n int64) ([]Row, error) {",
+                "    out := make([]Row, 0, n)",
+                "    for i := int64(0); i < n; i++ {",
+                "        out = append(out, row(i))",
+                "    }",
+                "    return out, nil",
+                "}",
+                "",
+                "func One() *Row {",
+                "    r := row(7)",
+                "    return &r",
+                "}",
+                "",
+                "type Store struct {",
+                "    rows []Row",
+                "}",
+                "",
+                "func (s *Store) Get(i int64) Row {",
+                "    return row(i)",
+                "}",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_result_projection_encodes_only_selected_fields(tmp_path: Path):
+    import usegolib
+
+    mod_dir = tmp_path / "gomod"
+    mod_dir.mkdir()
+    _write_go_test_module(mod_dir)
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(mod_dir),
+            "--out",
+            str(out_dir),
+        ]
+    )
+
+    h = usegolib.import_("example.com/projmod", artifact_dir=out_dir)
+
+    rows = h.Rows.select("ID", "Meta.Tag", "Tags.tag")(3)
+    assert rows[2] == {"ID": 2, "Meta": {"tag": "t"}, "Tags": {"a": {"tag": "x"}}}
+    assert h.One.select("Score", "Meta")() == {"Score": 3.5, "Meta": {"tag": "t", "Notes": "n"}}
+    assert set(h.Rows(1)[0]) == {"ID", "Score", "Body", "Meta", "Tags"}
+
+    with h.object("Store") as s:
+        assert s.Get.select("Body")(1) == {"Body": "long body"}
+
+    typed_row = h.typed().One.select("ID")()
+    assert typed_row.ID == 7 and typed_row.Body is None
@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_test_module(mod_dir: Path) -> None:
+    (mod_dir / "go.mod").write_text(
+        "\n".join(
+            [
+                "module example.com/flightmod",
+                "",
+                "go 1.22",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (mod_dir / "flightmod.go").write_text(
+        "\n".join(
+            [
+                "package flightmod",
+                "",
+                "import (",
+                '    "sync/atomic"',
+                '    "time"',
+                ")",
+                "",
+                "var calls int64",
+                "",
+                "// Lookup simulates an expensive index lookup.",
+                "func Lookup(key string) string {",
+                "    atomic.AddInt64(&calls, 1)",
+                "    time.Sleep(300 * time.Millisecond)",
+                '    return "v:" + key',
+                "}",
+                "",
+                "func Calls() int64 {",
+                "    return atomic.LoadInt64(&calls)",
+                "}",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_single_flight_collapses_concurrent_calls(tmp_path: Path):
+    import usegolib
+
+    mod_dir = tmp_path / "gomod"
+    mod_dir.mkdir()
+    _write_go_test_module(mod_dir)
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(mod_dir),
+            "--out",
+            str(out_dir),
+        ]
+    )
+
+    h = usegolib.import_("example.com/flightmod", artifact_dir=out_dir)
+    h.single_flight("Lookup")
+
+    barrier = threading.Barrier(8)
+    out: list = [None] * 8
+
+    def _worker(i: int) -> None:
+        barrier.wait()
+        out[i] = h.Lookup("k")
+
+    ts = [threading.Thread(target=_worker, args=(i,)) for i in range(8)]
+    for t in ts:
+        t.start()
+    for t in ts:
+        t.join()
+
+    assert out == ["v:k"] * 8
+    # Threads released by the barrier all arrive well within the 300ms call.
+    assert h.Calls() == 1
+    assert h.single_flight_stats()["Lookup"]["shared"] == 7
@@ -0,0 +1,112 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+def _write_go_test_module(mod_dir: Path) -> None:
+    (mod_dir / "go.mod").write_text(
+        "\n".join(
+            [
+                "module example.com/streammod",
+                "",
+                "go 1.21",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    (mod_dir / "streammod.go").write_text(
+        "\n".join(
+            [
+                "package streammod",
+                "",
+                "type Event struct {",
+                "    ID   int64",
+                "    Name string",
+                "}",
+                "",
+                "func Count(n int64) <-chan int64 {",
+                "    ch := make(chan int64)",
+                "    go func() {",
+                "        defer close(ch)",
+                "        for i := int64(0); i < n; i++ {",
+                "            ch <- i",
+                "        }",
+                "    }()",
+                "    return ch",
+                "}",
+                "",
+                "func Never() <-chan int64 {",
+                "    return make(chan int64)",
+                "}",
+                "",
+                "type Feed struct {",
+                "    Prefix string",
+                "}",
+                "",
+                "func (f *Feed) Events(n int64) (<-chan Event, error) {",
+                "    ch := make(chan Event, n)",
+                "    for i := int64(0); i < n; i++ {",
+                "        ch <- Event{ID: i, Name: f.Prefix}",
+                "    }",
+                "    close(ch)",
+                "    return ch, nil",
+                "}",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("USEGOLIB_INTEGRATION") != "1",
+    reason="set USEGOLIB_INTEGRATION=1 to run integration tests",
+)
+def test_channel_results_stream_into_iterators(tmp_path: Path):
+    import asyncio
+
+    import usegolib
+    from usegolib.errors import DeadlineExceededError
+
+    mod_dir = tmp_path / "gomod"
+    mod_dir.mkdir()
+    _write_go_test_module(mod_dir)
+
+    out_dir = tmp_path / "artifact"
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "usegolib",
+            "build",
+            "--module",
+            str(mod_dir),
+            "--out",
+            str(out_dir),
+        ]
+    )
+
+    h = usegolib.import_("example.com/streammod", artifact_dir=out_dir)
+
+    assert sum(h.Count(100_000)) == sum(range(100_000))
+
+    async def _collect(s):  # noqa: ANN001, ANN202
+        return [x async for x in s]
+
+    assert asyncio.run(_collect(h.Count(5))) == [0, 1, 2, 3, 4]
+
+    with h.object("Feed", {"Prefix": "p"}) as feed:
+        events = list(feed.Events(3))
+        assert events == [{"ID": i, "Name": "p"} for i in range(3)]
+        typed = h.typed().object("Feed", {"Prefix": "q"})
+        assert [e.Name for e in typed.Events(2)] == ["q", "q"]
+
+    with h.Count(10) as s:
+        assert next(s) == 0
+    with h.Never() as s:
+        with pytest.raises(DeadlineExceededError):
+            s.next_chunk(timeout=0.05)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import pytest
+
+from conftest import FakeClient
+
+
+class _FakeLazyClient(FakeClient):
+    """Serves lazy_* ops from in-memory values registered by `call` requests."""
+
+    def __init__(self, values: dict[str, object]) -> None:
+        super().__init__()
+        self._values = values
+        self._live: dict[int, object] = {}
+
+    def respond(self, req: dict) -> dict:
+        op = req["op"]
+        if op in ("call", "obj_call"):
+            v = self._values[req.get("fn") or req["method"]]
+            if not req.get("lazy"):
+                result = v
+            else:
+                lid = len(self._live) + 1
+                self._live[lid] = v
+                kind = "map" if isinstance(v, dict) else "slice"
+                result = {"$usegolib_lazy": lid, "kind": kind, "len": len(v)}
+        elif op == "obj_new":
+            result = 1
+        elif op == "lazy_range":
+            v = self._live[req["id"]]
+            items = sorted(v) if isinstance(v, dict) else v
+            result = items[req.get("start", 0) : req.get("stop", 0)]
+        elif op == "lazy_get":
+            v = self._live[req["id"]]
+            result = {k: v[k] for k in req["fields"] if k in v}
+        elif op == "lazy_free":
+            del self._live[req["id"]]
+            result = None
+        else:
+            result = None
+        return {"ok": True, "result": result}
+
+
+_MANIFEST = {
+    "structs": {
+        "example.com/p": {
+            "Row": [{"name": "ID", "type": "int64"}],
+            "Store": [],
+        }
+    },
+    "symbols": [
+        {"pkg": "example.com/p", "name": "Nums", "params": [], "results": ["[]int64", "error"]},
+        {"pkg": "example.com/p", "name": "Index", "params": [], "results": ["map[string]Row"]},
+        {"pkg": "example.com/p", "name": "Blob", "params": [], "results": ["[]byte"]},
+        {"pkg": "example.com/p", "name": "Stores", "params": [], "results": ["[]*Store"]},
+    ],
+    "methods": [
+        {"pkg": "example.com/p", "recv": "Store", "name": "Rows", "params": [], "results": ["[]Row"]},
+    ],
+}
+
+
+def test_lazy_sequence_fetches_windows_and_iterates_in_chunks(make_handle) -> None:  # noqa: ANN001
+    client = _FakeLazyClient({"Nums": list(range(100))})
+    h = make_handle(client, _MANIFEST)
+
+    seq = h.Nums.lazy(chunk=16)
+    assert client.reqs[0]["lazy"] is True
+    assert len(seq) == 100 and len(client.ops("lazy_range")) == 0
+    assert seq[3] == 3 and seq[15] == 15 and seq[-1] == 99
+    assert len(client.ops("lazy_range")) == 2  # [0:16) once, then the last window
+    assert seq[10:40:10] == [10, 20, 30]
+    assert seq[5:2:-1] == [5, 4, 3]
+    assert seq[200:] == []
+    with pytest.raises(IndexError):
+        seq[100]
+
+    before = len(client.ops("lazy_range"))
+    assert list(seq) == list(range(100))
+    assert len(client.ops("lazy_range")) - before == 7  # ceil(100 / 16)
+    assert seq.materialize() == list(range(100))
+
+    seq.close()
+    assert len(client.ops("lazy_free")) == 1
+    from usegolib.errors import UseGoLibError
+
+    with pytest.raises(UseGoLibError, match="closed"):
+        seq[50]
+
+
+def test_lazy_iteration_prefetches_on_one_thread(make_handle) -> None:  # noqa: ANN001
+    import threading
+
+    class _ThreadClient(_FakeLazyClient):
+        def respond(self, req: dict) -> dict:
+            if req["op"] == "lazy_range":
+                threads.append(threading.current_thread())
+            return super().respond(req)
+
+    threads: list[threading.Thread] = []
+    h = make_handle(_ThreadClient({"Nums": list(range(100))}), _MANIFEST)
+    seq = h.Nums.lazy(chunk=10)
+    assert list(seq) == list(range(100))
+    assert threads[0] is threading.current_thread()
+    assert len(threads) == 10 and len(set(threads[1:])) == 1
+    assert threads[1].name.startswith("usegolib-lazy-prefetch")
+
+    threads.clear()
+    assert list(h.Nums.lazy(chunk=100)) == list(range(100))
+    assert threads == [threading.current_thread()]  # one chunk: nothing to prefetch
+
+
+def test_lazy_mapping_and_typed_elements(make_handle) -> None:  # noqa: ANN001
+    rows = {f"k{i:02d}": {"ID": i} for i in range(10)}
+    client = _FakeLazyClient({"Index": rows, "Rows": [{"ID": 1}, {"ID": 2}]})
+    h = make_handle(client, _MANIFEST)
+
+    with h.Index.lazy(chunk=4) as m:
+        assert len(m) == 10
+        assert m["k03"] == {"ID": 3}
+        assert "k99" not in m
+        with pytest.raises(KeyError):
+            m["nope"]
+        assert list(m)[:3] == ["k00", "k01", "k02"]
+        assert m.materialize() == rows
+    assert len(client.ops("lazy_free")) == 1
+
+    th = h.typed()
+    tm = th.Index.lazy()
+    assert type(tm["k05"]).__name__ == "Row" and tm["k05"].ID == 5
+    store = th.object("Store")
+    trows = store.Rows.lazy()
+    assert [r.ID for r in trows] == [1, 2]
+    assert client.reqs[-1]["op"] == "lazy_range"
+
+
+def test_lazy_rejects_unsupported_results(make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import UnsupportedTypeError
+
+    h = make_handle(_FakeLazyClient({}), _MANIFEST)
+    with pytest.raises(UnsupportedTypeError, match="not a single slice"):
+        h.Blob.lazy()
+    with pytest.raises(UnsupportedTypeError, match="object handles"):
+        h.Stores.lazy()
+    with pytest.raises(ValueError, match="chunk"):
+        h.Nums.lazy(chunk=0)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import ctypes
+import struct
+from typing import Callable
+
+import pytest
+
+from conftest import FakeClient
+
+
+class _PinClient(FakeClient):
+    """Answers `pin_mem` with pin id 1 and every other request with 0."""
+
+    def respond(self, req: dict) -> dict:
+        return {"ok": True, "result": 1 if req["op"] == "pin_mem" else 0}
+
+
+class _ClosingClient(_PinClient):
+    """Runs `during` while Go "runs" a pipeline or a handle-array call."""
+
+    during: Callable[[], None] | None = None
+
+    def respond(self, req: dict) -> dict:
+        if req["op"] == "obj_new_many":
+            return {"ok": True, "result": struct.pack("<2Q", 7, 8)}
+        if req["op"] == "pipeline":
+            self.during()
+            return {"ok": True, "result": [0.0]}
+        if req["op"] == "obj_call_many":
+            self.during()
+            return {"ok": True, "result": [0, 0]}
+        return super().respond(req)
+
+
+_MANIFEST = {
+    "structs": {"example.com/p": {"Acc": []}},
+    "symbols": [
+        {"pkg": "example.com/p", "name": "Sum", "params": ["[]float64"], "results": ["float64"]},
+        {"pkg": "example.com/p", "name": "Count", "params": ["[]byte"], "results": ["int"]},
+    ],
+    "methods": [
+        {"pkg": "example.com/p", "recv": "Acc", "name": "Add", "params": ["[]float64"], "results": ["int"]},
+    ],
+}
+
+
+def test_mapped_npy_files_are_pinned_as_memory_refs(tmp_path, make_handle) -> None:  # noqa: ANN001
+    np = pytest.importorskip("numpy")
+    from usegolib.errors import UnsupportedTypeError
+    from usegolib.mapped import MappedFile
+
+    xs = np.arange(6, dtype=np.float64).reshape(2, 3)
+    np.save(tmp_path / "xs.npy", xs)
+    client = _PinClient()
+    m = MappedFile(client, tmp_path / "xs.npy")  # type: ignore[arg-type]
+    assert (m.dtype, m.shape, len(m), m.go_type) == ("float64", (2, 3), 6, "[]float64")
+    assert client.reqs[0]["op"] == "pin_mem"
+    ref = client.reqs[0]["value"]
+    assert (ref["dtype"], ref["len"]) == ("f8", 6)
+    assert ctypes.string_at(ref["addr"], 48) == xs.tobytes()
+    assert (m.array() == xs).all()
+
+    h = make_handle(client, _MANIFEST)
+    h.Sum(m)
+    assert client.reqs[-1]["args"] == [{"$usegolib_pin": 1}]
+    with pytest.raises(UnsupportedTypeError, match="pinned"):
+        h.Count(m)
+
+    with pytest.raises(UnsupportedTypeError, match="holds float64, not int32"):
+        MappedFile(client, tmp_path / "xs.npy", "int32")  # type: ignore[arg-type]
+
+
+def test_raw_mapped_files_need_a_matching_dtype(tmp_path, make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import UnsupportedTypeError
+    from usegolib.mapped import MappedFile
+
+    (tmp_path / "data.bin").write_bytes(b"abcabca")
+    client = _PinClient()
+    with pytest.raises(UnsupportedTypeError, match="raw files need a dtype"):
+        MappedFile(client, tmp_path / "data.bin")  # type: ignore[arg-type]
+    with pytest.raises(UnsupportedTypeError, match="do not match"):
+        MappedFile(client, tmp_path / "data.bin", "int32")  # type: ignore[arg-type]
+    with pytest.raises(UnsupportedTypeError, match="unsupported dtype"):
+        MappedFile(client, tmp_path / "data.bin", "complex128")  # type: ignore[arg-type]
+    assert client.reqs == []
+
+    b = MappedFile(client, tmp_path / "data.bin", "byte")  # type: ignore[arg-type]
+    assert (b.go_type, len(b), client.reqs[-1]["value"]["dtype"]) == ("[]byte", 7, "u1")
+    make_handle(client, _MANIFEST).Count(b)
+
+
+def test_closing_a_mapped_file_waits_for_running_calls(tmp_path, make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import UseGoLibError
+    from usegolib.handle import _pins_in_use
+    from usegolib.mapped import MappedFile
+
+    (tmp_path / "data.bin").write_bytes(bytes(16))
+    client = _PinClient()
+    m = MappedFile(client, tmp_path / "data.bin", "float64")  # type: ignore[arg-type]
+    with _pins_in_use((m, 1)):
+        m.close()
+        assert [r["op"] for r in client.reqs] == ["pin_mem"]
+        assert not m._mmap.closed  # noqa: SLF001
+    assert [r["op"] for r in client.reqs] == ["pin_mem", "pin_free"]
+    assert m._mmap.closed  # noqa: SLF001
+    with pytest.raises(UseGoLibError, match="closed"):
+        m.array()
+    with pytest.raises(UseGoLibError, match="closed"):
+        make_handle(client, _MANIFEST).Sum(m)
+
+
+def test_pipelines_and_handle_arrays_hold_mapped_files(tmp_path, make_handle) -> None:  # noqa: ANN001
+    from usegolib.mapped import MappedFile
+
+    (tmp_path / "data.bin").write_bytes(bytes(16))
+    client = _ClosingClient()
+    h = make_handle(client, _MANIFEST)
+    seen: list[bool] = []
+
+    def _close_while_running(m: MappedFile) -> Callable[[], None]:
+        def _during() -> None:
+            m.close()
+            seen.append(m._mmap.closed)  # noqa: SLF001
+
+        return _during
+
+    m = MappedFile(client, tmp_path / "data.bin", "float64")  # type: ignore[arg-type]
+    client.during = _close_while_running(m)
+    p = h.pipeline()
+    p.Sum(m)
+    p.run()
+    assert seen == [False] and m._mmap.closed  # noqa: SLF001
+
+    m = MappedFile(client, tmp_path / "data.bin", "float64")  # type: ignore[arg-type]
+    client.during = _close_while_running(m)
+    h.objects("Acc", 2).call("Add", m)
+    assert seen == [False, False] and m._mmap.closed  # noqa: SLF001
+    assert len(client.ops("pin_free")) == 2
+
+
+def test_map_file_needs_the_library_client(tmp_path, make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import UnsupportedTypeError
+
+    with pytest.raises(UnsupportedTypeError, match="in-process library client"):
+        make_handle(_PinClient(), _MANIFEST).map_file(tmp_path / "missing.bin", "byte")
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import array
+import struct
+
+import pytest
+
+from conftest import FakeClient
+
+
+_MANIFEST = {
+    "structs": {},
+    "symbols": [
+        {"pkg": "example.com/p", "name": "Sum", "params": ["[]float64"], "results": ["float64"]},
+        {"pkg": "example.com/p", "name": "Counts", "params": ["[]int32"], "results": ["[]int32"]},
+        {"pkg": "example.com/p", "name": "Grid", "params": ["[][]float64"], "results": ["[][]float64", "error"]},
+        {"pkg": "example.com/p", "name": "Name", "params": [], "results": ["string"]},
+        {"pkg": "example.com/p", "name": "Ports", "params": ["[]uint16"], "results": ["[]uint64"]},
+    ],
+}
+
+
+def test_numeric_array_type() -> None:
+    from usegolib.schema import numeric_array_type
+
+    assert numeric_array_type("[]float64") == ("f8", 1)
+    assert numeric_array_type("...int") == ("i8", 1)
+    assert numeric_array_type("[][]float32") == ("f4", 2)
+    assert numeric_array_type("[]uint16") == ("u2", 1)
+    assert numeric_array_type("[]uint8") is None  # []byte travels as bytes
+    assert numeric_array_type("[][][]float64") is None
+    assert numeric_array_type("[]string") is None
+    assert numeric_array_type("float64") is None
+
+
+def test_array_args_are_packed(make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import UnsupportedTypeError
+
+    client = FakeClient(result=6.0)
+    h = make_handle(client, _MANIFEST)
+
+    assert h.Sum(array.array("d", [1.0, 2.0, 3.0])) == 6.0
+    arg = client.reqs[-1]["args"][0]
+    assert arg == {"$usegolib_nd": "f8", "shape": [3], "data": struct.pack("<3d", 1, 2, 3)}
+
+    h.Sum(array.array("i", [1, 2]))  # integers widen to floats
+    assert client.reqs[-1]["args"][0]["data"] == struct.pack("<2d", 1, 2)
+    client.result = []
+    h.Counts(array.array("q", [7]))
+    assert client.reqs[-1]["args"][0] == {"$usegolib_nd": "i4", "shape": [1], "data": struct.pack("<i", 7)}
+
+    client.result = 3.0
+    h.Sum([1.0, 2.0])  # lists are sent as they are
+    assert client.reqs[-1]["args"][0] == [1.0, 2.0]
+
+    with pytest.raises(UnsupportedTypeError, match="array\\('d'\\)"):
+        h.Counts(array.array("d", [1.5]))
+    with pytest.raises(UnsupportedTypeError, match="out of range|overflow|int"):
+        h.Counts(array.array("q", [1 << 40]))
+    with pytest.raises(UnsupportedTypeError, match="NumPy"):
+        h.Grid(array.array("d", [1.0]))
+
+    client.result = []
+    h.Ports(array.array("H", [80, 65535]))
+    assert client.reqs[-1]["args"][0] == {"$usegolib_nd": "u2", "shape": [2], "data": struct.pack("<2H", 80, 65535)}
+    with pytest.raises(UnsupportedTypeError, match="out of range|overflow|negative|unsigned"):
+        h.Ports(array.array("i", [-1]))
+
+
+def test_numpy_args_and_results(make_handle) -> None:  # noqa: ANN001
+    np = pytest.importorskip("numpy")
+    from usegolib.errors import UnsupportedTypeError
+
+    grid = np.arange(6, dtype=np.float64).reshape(2, 3)
+    client = FakeClient(result={"$usegolib_nd": "f8", "shape": [2, 3], "data": grid.tobytes()})
+    h = make_handle(client, _MANIFEST)
+
+    out = h.Grid.numpy(grid.T)  # non-contiguous input is made contiguous
+    assert client.reqs[-1]["packed"] is True
+    sent = client.reqs[-1]["args"][0]
+    assert sent["shape"] == [3, 2] and sent["data"] == np.ascontiguousarray(grid.T).tobytes()
+    assert isinstance(out, np.ndarray) and out.shape == (2, 3) and (out == grid).all()
+    assert not out.flags.writeable
+
+    with pytest.raises(UnsupportedTypeError, match="2-D"):
+        h.Grid(np.zeros(3))
+    with pytest.raises(UnsupportedTypeError, match="float64 array as int32"):
+        h.Counts(np.zeros(3))
+    with pytest.raises(UnsupportedTypeError, match="numeric slice"):
+        h.Name.numpy()
+
+    client = FakeClient(result={"$usegolib_nd": "u8", "shape": [1], "data": struct.pack("<Q", 2**64 - 1)})
+    h = make_handle(client, _MANIFEST)
+    out = h.Ports.numpy(np.array([443], dtype=np.uint16))
+    assert client.reqs[-1]["args"][0]["$usegolib_nd"] == "u2"
+    assert out.dtype == np.uint64 and int(out[0]) == 2**64 - 1
+    with pytest.raises(UnsupportedTypeError, match="int64 array as uint16"):
+        h.Ports(np.array([1], dtype=np.int64))
+
+
+def test_numpy_results_from_ragged_rows_and_plain_lists(make_handle) -> None:  # noqa: ANN001
+    np = pytest.importorskip("numpy")
+
+    row = {"$usegolib_nd": "f8", "shape": [1], "data": struct.pack("<d", 1.5)}
+    h = make_handle(FakeClient(result=[row, None]), _MANIFEST)
+    a, b = h.Grid.numpy([])
+    assert a.tolist() == [1.5] and b is None
+
+    # Libraries built without packed arrays answer with lists.
+    h = make_handle(FakeClient(result=[1, 2, 3]), _MANIFEST)
+    out = h.Counts.numpy([])
+    assert out.dtype == np.dtype("<i4") and out.tolist() == [1, 2, 3]
+    assert make_handle(FakeClient(result=[]), _MANIFEST).Grid.numpy([]).shape == (0, 0)
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import pytest
+
+from conftest import FakeClient
+
+
+_MANIFEST = {
+    "structs": {
+        "example.com/p": {
+            "Point": [{"name": "X", "type": "int64", "key": "x"}, {"name": "Y", "type": "int64"}],
+            "Doc": [
+                {"name": "Title", "type": "string"},
+                {"name": "At", "type": "Point"},
+                {"name": "Tags", "type": "[]string"},
+            ],
+            "Engine": [],
+        }
+    },
+    "symbols": [],
+}
+
+
+def test_get_and_set_send_canonical_keys_and_validate(make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import UnsupportedTypeError
+
+    client = FakeClient(
+        {"ok": True, "result": 5},
+        {"ok": True, "result": ["t", {"x": 1, "Y": 2}]},
+        {"ok": True, "result": None},
+        {"ok": True, "result": [3]},
+    )
+    h = make_handle(client, _MANIFEST)
+    doc = h.object("Doc")
+
+    assert doc.get_many(["Title", "At"]) == {"Title": "t", "At": {"x": 1, "Y": 2}}
+    assert client.reqs[1] == {"abi": 0, "op": "obj_get", "pkg": "example.com/p", "type": "Doc", "id": 5, "fields": ["Title", "At"]}
+
+    doc.set("At", {"X": 7, "Y": 8})
+    assert client.reqs[2]["op"] == "obj_set"
+    assert client.reqs[2]["fields"] == ["At"] and client.reqs[2]["value"] == {"X": 7, "Y": 8}
+
+    with pytest.raises(UnsupportedTypeError, match="expected list"):
+        doc.set("Tags", "nope")
+    with pytest.raises(UnsupportedTypeError, match="unknown field Body"):
+        doc.get("Body")
+    with pytest.raises(UnsupportedTypeError, match="expected str"):
+        doc.get("Title")  # fake response [3] does not match `string`
+    assert len(client.reqs) == 4
+
+
+def test_typed_get_decodes_dataclasses_and_errors_map(make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import UseGoLibError
+
+    client = FakeClient(
+        {"ok": True, "result": 9},
+        {"ok": True, "result": [{"x": 1, "Y": 2}]},
+        {"ok": False, "error": {"type": "FieldNotFound", "message": "field not found"}},
+    )
+    th = make_handle(client, _MANIFEST).typed()
+    doc = th.object("Doc")
+    at = doc.get("At")
+    assert type(at).__name__ == "Point" and (at.X, at.Y) == (1, 2)
+
+    # Types without a schema entry are not checked client-side.
+    from usegolib.handle import GoObject
+
+    obj = GoObject(_pkg=make_handle(client, _MANIFEST), _type="Unknown", _id=1)
+    with pytest.raises(UseGoLibError, match="FieldNotFound"):
+        obj.get("Anything")
+    obj.close()
+    with pytest.raises(UseGoLibError, match="closed"):
+        obj.set("Anything", 1)
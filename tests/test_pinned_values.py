@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import pytest
+
+from conftest import FakeClient
+
+
+_MANIFEST = {
+    "structs": {"example.com/p": {"Model": []}},
+    "symbols": [
+        {"pkg": "example.com/p", "name": "Score", "params": ["map[string]float64", "string"], "results": ["float64"]},
+        {"pkg": "example.com/p", "name": "Load", "params": ["[]byte"], "results": ["int64"]},
+    ],
+    "methods": [
+        {"pkg": "example.com/p", "recv": "Model", "name": "Apply", "params": ["map[string]float64"], "results": []},
+    ],
+}
+
+
+def test_pins_are_uploaded_once_and_sent_as_markers(make_handle) -> None:  # noqa: ANN001
+    client = FakeClient(
+        {"ok": True, "result": 3}, {"ok": True, "result": 1.5}, {"ok": True, "result": 2}, {"ok": True, "result": None}
+    )
+    h = make_handle(client, _MANIFEST)
+
+    with h.pin({"a": 1.0, "b": 2.0}, go_type="map[string]float64") as weights:
+        assert weights.id == 3
+        assert h.Score(weights, "a") == 1.5
+        obj = h.object("Model")
+        obj.Apply(weights)
+
+    assert client.reqs[0] == {"abi": 0, "op": "pin_new", "value": {"a": 1.0, "b": 2.0}}
+    assert client.reqs[1]["args"] == [{"$usegolib_pin": 3}, "a"]
+    assert client.reqs[3]["op"] == "obj_call" and client.reqs[3]["args"] == [{"$usegolib_pin": 3}]
+    assert client.reqs[-1] == {"abi": 0, "op": "pin_free", "id": 3}
+    with pytest.raises(Exception, match="closed"):
+        h.Score(weights, "a")
+
+
+def test_pin_type_checks(make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import UnsupportedTypeError, UseGoLibError
+
+    h = make_handle(FakeClient({"ok": True, "result": 1}, result=0), _MANIFEST)
+    with pytest.raises(UnsupportedTypeError, match="expected bytes"):
+        h.pin("not bytes", go_type="[]byte")
+
+    blob = h.pin(b"\x00" * 16, go_type="[]byte")
+    with pytest.raises(UnsupportedTypeError, match="arg0"):
+        h.Score(blob, "a")
+
+    other = make_handle(FakeClient(result=0), _MANIFEST)
+    with pytest.raises(UseGoLibError, match="different Go runtime"):
+        other.Load(blob)
+    h.unpin(blob)
+    assert blob._closed  # noqa: SLF001
+
+
+def test_pin_errors_are_raised(make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import UseGoLibError
+
+    client = FakeClient(
+        {"ok": True, "result": 1},
+        {"ok": False, "error": {"type": "PinNotFound", "message": "pinned value not found"}},
+        result=0,
+    )
+    h = make_handle(client, _MANIFEST)
+    untyped = h.pin(b"x")
+    with pytest.raises(UseGoLibError, match="PinNotFound"):
+        h.Load(untyped)
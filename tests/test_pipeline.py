@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import pytest
+
+from conftest import FakeClient
+
+
+_MANIFEST = {
+    "structs": {"example.com/p": {"Table": []}},
+    "symbols": [
+        {"pkg": "example.com/p", "name": "NewTable", "params": ["string"], "results": ["*Table"]},
+        {"pkg": "example.com/p", "name": "Split", "params": ["string"], "results": ["string", "string", "error"]},
+        {"pkg": "example.com/p", "name": "Concat", "params": ["...string"], "results": ["string"]},
+        {"pkg": "example.com/p", "name": "Repeat", "params": ["string", "int64"], "results": ["string"]},
+    ],
+    "methods": [
+        {"pkg": "example.com/p", "recv": "Table", "name": "Append", "params": ["string"], "results": ["*Table"]},
+        {"pkg": "example.com/p", "recv": "Table", "name": "Len", "params": [], "results": ["int64"]},
+        {"pkg": "example.com/p", "recv": "Table", "name": "Insert", "params": ["string", "int64"], "results": []},
+    ],
+}
+
+
+def test_pipeline_encodes_refs_and_frees_unreturned_handles(make_handle) -> None:  # noqa: ANN001
+    client = FakeClient({"ok": True, "result": [2]})
+    h = make_handle(client, _MANIFEST)
+
+    p = h.pipeline()
+    t = p.NewTable("t")
+    t2 = p.call(t, "Append", "a")
+    n = p.call(t2, "Len")
+    assert p.run(n, timeout=1) == 2
+
+    (req,) = client.reqs
+    assert req["op"] == "pipeline"
+    assert req["pkg"] == "example.com/p"
+    assert req["timeout_ns"] == 1_000_000_000
+    assert req["steps"] == [
+        {"op": "call", "fn": "NewTable", "args": ["t"]},
+        {"op": "obj_call", "type": "Table", "target": {"$usegolib_ref": 0}, "method": "Append", "args": ["a"]},
+        {"op": "obj_call", "type": "Table", "target": {"$usegolib_ref": 1}, "method": "Len", "args": []},
+    ]
+    assert req["outputs"] == [2]
+    assert req["free"] == [{"$usegolib_ref": 0}, {"$usegolib_ref": 1}]
+
+
+def test_pipeline_decodes_handles_tuples_and_indexed_refs(make_handle) -> None:  # noqa: ANN001
+    from usegolib.handle import GoObject
+
+    client = FakeClient({"ok": True, "result": [["a", "b"], 9, "ab"]})
+    h = make_handle(client, _MANIFEST)
+
+    p = h.pipeline()
+    parts = p.Split("a,b")
+    t = p.NewTable(parts[0])
+    joined = p.Concat(parts[0], parts[1])
+    pair, table, s = p.run(parts, t, joined)
+
+    assert pair == ("a", "b")
+    assert isinstance(table, GoObject) and table.id == 9 and table.type_name == "Table"
+    assert s == "ab"
+    req = client.reqs[0]
+    assert req["steps"][1]["args"] == [{"$usegolib_ref": 0, "index": 0}]
+    assert req["steps"][2]["args"] == [[{"$usegolib_ref": 0, "index": 0}, {"$usegolib_ref": 0, "index": 1}]]
+    assert req["free"] == []
+
+
+def test_pipeline_default_output_and_errors(make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import GoError, UseGoLibError
+
+    client = FakeClient({"ok": True, "result": []}, {"ok": False, "error": {"type": "GoError", "message": "step 0: boom"}})
+    h = make_handle(client, _MANIFEST)
+
+    p = h.pipeline()
+    p.NewTable("t")
+    # The last step returns a handle which is the default output, so nothing is freed.
+    with pytest.raises(UseGoLibError, match="one result per output"):
+        p.run()
+    assert client.reqs[0]["outputs"] == [0] and client.reqs[0]["free"] == []
+
+    with pytest.raises(GoError, match="boom"):
+        p.run()
+
+    other = h.pipeline().NewTable("x")
+    with pytest.raises(UseGoLibError, match="different pipeline"):
+        p.call(other, "Len")
+    with pytest.raises(UseGoLibError, match="method not found"):
+        p.call(p.NewTable("y"), "Nope")
+    with pytest.raises(UseGoLibError, match="does not return an object handle"):
+        p.call(p.Concat("a"), "Len")
+    with pytest.raises(IndexError):
+        p.Split("x")[2]
+    with pytest.raises(UseGoLibError, match="symbol not found"):
+        p.Missing()
+
+
+def test_pipeline_validates_args_next_to_refs(make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import UnsupportedTypeError
+
+    h = make_handle(FakeClient(), _MANIFEST)
+    p = h.pipeline()
+    parts = p.Split("a,b")
+    t = p.NewTable(parts[0])
+
+    with pytest.raises(UnsupportedTypeError, match="arg1"):
+        p.Repeat(parts[0], "3")
+    with pytest.raises(UnsupportedTypeError, match="arg1"):
+        p.call(t, "Insert", parts[1], "3")
+    with pytest.raises(UnsupportedTypeError, match="arity"):
+        p.Repeat(parts[0])
+    p.Repeat(parts[0], 3)
+    p.call(t, "Insert", parts[1], 3)
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import array
+import os
+from dataclasses import dataclass
+
+import pytest
+
+from usegolib.handle import GoObject
+
+
+# Workers are started with `spawn`, so the fake handle and its loader must be
+# importable module-level objects.
+
+
+@dataclass
+class _FakeObj(GoObject):
+    count: int = 0
+
+    def close(self) -> None:
+        self._closed = True
+
+    def Inc(self, n: int) -> int:  # noqa: N802 - mirrors Go method naming
+        self.count += n
+        return self.count
+
+    def Pid(self) -> int:  # noqa: N802 - mirrors Go method naming
+        return os.getpid()
+
+    def Absorb(self, other: "_FakeObj") -> int:  # noqa: N802 - mirrors Go method naming
+        self.count += other.count
+        return self.count
+
+
+class _FakeHandle:
+    def __init__(self) -> None:
+        self._next = 0
+
+    def Echo(self, v):  # noqa: N802 - mirrors Go function naming
+        return v
+
+    def Sum(self, xs):  # noqa: N802 - mirrors Go function naming
+        return sum(xs)
+
+    def Pid(self) -> int:  # noqa: N802 - mirrors Go function naming
+        return os.getpid()
+
+    def Pair(self):  # noqa: N802 - mirrors Go function naming
+        a, b = self.object("Counter"), self.object("Counter")
+        return [a, {"b": b}]
+
+    def Count(self, obj: _FakeObj) -> int:  # noqa: N802 - mirrors Go function naming
+        return obj.count
+
+    def Crash(self) -> None:  # noqa: N802 - mirrors Go function naming
+        os._exit(3)
+
+    def Fail(self) -> None:  # noqa: N802 - mirrors Go function naming
+        from usegolib.errors import GoError
+
+        raise GoError("boom")
+
+    def object(self, type_name: str, init=None):
+        self._next += 1
+        return _FakeObj(_pkg=None, _type=type_name, _id=self._next)  # type: ignore[arg-type]
+
+
+def _fake_loader() -> _FakeHandle:
+    return _FakeHandle()
+
+
+@pytest.fixture()
+def pool():
+    from usegolib.pool import ProcessPool
+
+    p = ProcessPool._with_loader(_fake_loader, workers=2, shm_threshold=1024)  # noqa: SLF001 - test seam
+    try:
+        yield p
+    finally:
+        p.close()
+
+
+def test_pool_runs_calls_in_worker_processes(pool) -> None:
+    import usegolib.errors
+
+    pids = {pool.Pid() for _ in range(8)}
+    assert os.getpid() not in pids
+    assert pool.Echo([1, "a", None]) == [1, "a", None]
+    with pytest.raises(usegolib.errors.GoError, match="boom"):
+        pool.Fail()
+
+
+def test_large_binary_args_and_results_use_shared_memory(pool) -> None:
+    payload = os.urandom(64 * 1024)
+    assert pool.Echo(payload) == payload
+    assert pool.Echo(memoryview(bytearray(payload))) == payload
+    assert pool.Sum(array.array("q", range(1000))) == sum(range(1000))
+
+
+def test_object_methods_are_routed_to_the_owning_worker(pool) -> None:
+    obj = pool.object("Counter")
+    owner = obj.Pid()
+    for i in range(1, 6):
+        assert obj.Inc(1) == i
+        assert obj.Pid() == owner
+    obj.close()
+
+
+def test_objects_in_containers_and_as_arguments(pool) -> None:
+    import usegolib.errors
+    from usegolib.pool import PoolObject
+
+    a, nested = pool.Pair()
+    b = nested["b"]
+    assert isinstance(a, PoolObject) and isinstance(b, PoolObject)
+    assert a.worker_index == b.worker_index
+
+    b.Inc(5)
+    # Object arguments are resolved to the worker's own handle, not a copy.
+    assert a.Absorb(b) == 5
+    for _ in range(4):
+        assert pool.Count(a) == 5
+
+    others = [pool.object("Counter") for _ in range(4)]
+    foreign = next(o for o in others if o.worker_index != a.worker_index)
+    with pytest.raises(usegolib.errors.UseGoLibError, match="same pool worker"):
+        a.Absorb(foreign)
+    a.close()
+    with pytest.raises(usegolib.errors.UseGoLibError, match="closed"):
+        pool.Count(a)
+
+
+def test_finalized_objects_are_freed_on_the_next_request(pool) -> None:
+    import threading
+
+    import usegolib.errors
+
+    obj = pool.object("Counter")
+    worker, obj_id = obj._worker, obj.id  # noqa: SLF001
+    # GC may finalize the object while its worker's lock is held, e.g. mid-request.
+    with worker.lock:
+        t = threading.Thread(target=obj.__del__)
+        t.start()
+        t.join(timeout=5)
+        assert not t.is_alive()
+    assert list(worker.pending_frees) == [(obj_id, worker.generation)]
+
+    with pytest.raises(usegolib.errors.UseGoLibError, match="ObjectNotFound"):
+        pool._submit(("obj_call", obj_id, "Inc", (1,)), worker=worker)  # noqa: SLF001
+    assert not worker.pending_frees
+
+
+def test_crashed_worker_is_restarted_and_its_objects_invalidated(pool) -> None:
+    import usegolib.errors
+
+    objs = [pool.object("Counter") for _ in range(4)]
+    with pytest.raises(usegolib.errors.WorkerCrashedError):
+        pool.Crash()
+
+    # The pool keeps serving calls after the restart.
+    assert isinstance(pool.Pid(), int)
+    stale = 0
+    for obj in objs:
+        try:
+            obj.Inc(1)
+        except usegolib.errors.WorkerCrashedError:
+            stale += 1
+    assert stale >= 1
+
+
+def test_pool_rejects_fork_start_method() -> None:
+    from usegolib.pool import ProcessPool
+
+    with pytest.raises(ValueError, match="spawn"):
+        ProcessPool._with_loader(_fake_loader, workers=1, start_method="fork")  # noqa: SLF001 - test seam
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from usegolib.runtime.platform import host_goarch, host_goos
+
+
+def _write_artifact(root: Path, *, module: str, version: str) -> Path:
+    leaf = root / module.replace("/", "_") / f"v@{version}" / f"{host_goos()}-{host_goarch()}"
+    leaf.mkdir(parents=True, exist_ok=True)
+    lib_bytes = f"{module}@{version}".encode("utf-8")
+    (leaf / "libusegolib.so").write_bytes(lib_bytes)
+    manifest = {
+        "manifest_version": 1,
+        "abi_version": 0,
+        "module": module,
+        "version": version,
+        "goos": host_goos(),
+        "goarch": host_goarch(),
+        "packages": [module],
+        "symbols": [],
+        "library": {"path": "libusegolib.so", "sha256": hashlib.sha256(lib_bytes).hexdigest()},
+    }
+    (leaf / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    return leaf
+
+
+class _DummyClient:
+    loads: list[Path] = []
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def _load(self) -> None:
+        _DummyClient.loads.append(self.path)
+
+
+@pytest.fixture()
+def dummy_client(monkeypatch: pytest.MonkeyPatch):
+    import usegolib.handle
+
+    _DummyClient.loads = []
+    monkeypatch.setattr(usegolib.handle, "SharedLibClient", _DummyClient)
+    monkeypatch.setenv("USEGOLIB_VERIFY_CACHE", "0")
+    return _DummyClient
+
+
+def test_preload_loads_modules_eagerly(tmp_path: Path, dummy_client) -> None:
+    import usegolib
+
+    _write_artifact(tmp_path, module="example.com/a", version="v1.0.0")
+    _write_artifact(tmp_path, module="example.com/b", version="v2.0.0")
+
+    futs = usegolib.preload(["example.com/a", ("example.com/b", "v2.0.0")], artifact_dir=tmp_path)
+    handles = [f.result(timeout=10) for f in futs]
+    assert [(h.module, h.version) for h in handles] == [("example.com/a", "v1.0.0"), ("example.com/b", "v2.0.0")]
+    assert len(dummy_client.loads) == 2
+
+    # import_ reuses the preloaded runtime.
+    h = usegolib.import_("example.com/a", artifact_dir=tmp_path)
+    assert h._client is handles[0]._client  # noqa: SLF001 - test introspection
+    assert len(dummy_client.loads) == 2
+
+
+def test_concurrent_imports_share_one_load(tmp_path: Path, dummy_client, monkeypatch: pytest.MonkeyPatch) -> None:
+    import usegolib
+    import usegolib.handle
+
+    _write_artifact(tmp_path, module="example.com/a", version="v1.0.0")
+
+    real = usegolib.handle._sha256_file
+    hashed: list[str] = []
+
+    def _slow_sha256(path):
+        hashed.append(str(path))
+        time.sleep(0.2)
+        return real(path)
+
+    monkeypatch.setattr(usegolib.handle, "_sha256_file", _slow_sha256)
+
+    futs = usegolib.preload(["example.com/a"], artifact_dir=tmp_path)
+    results: list[object] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(usegolib.import_("example.com/a", artifact_dir=tmp_path)))
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    preloaded = futs[0].result(timeout=10)
+    assert len(hashed) == 1
+    assert all(h._client is preloaded._client for h in results)  # noqa: SLF001 - test introspection
+
+
+def test_failed_load_propagates_to_joiners_and_can_be_retried(
+    tmp_path: Path, dummy_client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import usegolib
+    import usegolib.handle
+
+    leaf = _write_artifact(tmp_path, module="example.com/a", version="v1.0.0")
+    good = (leaf / "libusegolib.so").read_bytes()
+    (leaf / "libusegolib.so").write_bytes(b"corrupted")
+
+    futs = usegolib.preload(["example.com/a"], artifact_dir=tmp_path)
+    with pytest.raises(usegolib.errors.LoadError, match="sha256 mismatch"):
+        futs[0].result(timeout=10)
+    assert "example.com/a" not in usegolib.handle._PENDING_RUNTIMES
+    assert "example.com/a" not in usegolib.handle._LOADED_RUNTIMES
+
+    (leaf / "libusegolib.so").write_bytes(good)
+    h = usegolib.import_("example.com/a", artifact_dir=tmp_path)
+    assert h.version == "v1.0.0"
+
+
+def test_import_of_other_version_conflicts_with_inflight_load(
+    tmp_path: Path, dummy_client, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import usegolib
+    import usegolib.handle
+
+    a1 = _write_artifact(tmp_path / "one", module="example.com/a", version="v1.0.0")
+    a2 = _write_artifact(tmp_path / "two", module="example.com/a", version="v2.0.0")
+
+    started = threading.Event()
+    release = threading.Event()
+    real = usegolib.handle._sha256_file
+
+    def _blocking_sha256(path):
+        started.set()
+        release.wait(10)
+        return real(path)
+
+    monkeypatch.setattr(usegolib.handle, "_sha256_file", _blocking_sha256)
+    fut = usegolib.preload(["example.com/a"], artifact_dir=a1.parent.parent.parent)[0]
+    assert started.wait(10)
+    try:
+        with pytest.raises(usegolib.errors.VersionConflictError):
+            usegolib.load_artifact(a2)
+    finally:
+        release.set()
+    assert fut.result(timeout=10).version == "v1.0.0"
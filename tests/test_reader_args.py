@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import io
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import msgpack
+import pytest
+
+from conftest import FakeClient
+
+
+class _FakeReaderClient(FakeClient):
+    """Collects reader_push chunks; a `call` answers with the bytes read once EOF arrives."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.data: dict[int, bytes] = {}
+        self.eof: dict[int, threading.Event] = {}
+
+    def respond(self, req: dict) -> dict:
+        op = req["op"]
+        if op == "reader_new":
+            rid = len(self.data) + 1
+            self.data[rid] = b""
+            self.eof[rid] = threading.Event()
+            result = rid
+        elif op == "reader_push":
+            if req.get("eof") or req.get("err"):
+                self.eof[req["id"]].set()
+            else:
+                self.data[req["id"]] += req["value"]
+            result = True
+        elif op == "call":
+            arg = req["args"][0]
+            if isinstance(arg, dict):
+                self.eof[arg["$usegolib_reader"]].wait(5)
+                arg = self.data[arg["$usegolib_reader"]]
+            result = len(arg)
+        else:
+            result = None
+        return {"ok": True, "result": result}
+
+
+_MANIFEST = {
+    "structs": {},
+    "symbols": [
+        {"pkg": "example.com/p", "name": "Size", "params": ["io.Reader"], "results": ["int64", "error"]},
+    ],
+}
+
+
+def test_reader_params_accept_bytes_files_and_iterables(make_handle) -> None:  # noqa: ANN001
+    client = _FakeReaderClient()
+    h = make_handle(client, _MANIFEST)
+
+    assert h.Size(b"abc") == 3
+    assert client.ops("reader_new") == []  # bytes are sent inline
+
+    assert h.Size(io.BytesIO(b"x" * 10)) == 10
+    assert h.Size(iter([b"ab", b"", b"cd"])) == 4
+    assert [r["id"] for r in client.ops("reader_free")] == [1, 2]
+    assert client.ops("reader_push")[-1]["eof"] is True
+
+
+def test_reader_params_reject_other_values_and_report_source_errors(make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import UnsupportedTypeError
+    from usegolib.reader import GoFile
+
+    client = _FakeReaderClient()
+    h = make_handle(client, _MANIFEST)
+    with pytest.raises(UnsupportedTypeError, match="io.Reader"):
+        h.Size("text")
+    with pytest.raises(ValueError, match="exactly one"):
+        GoFile()
+
+    def _broken():  # noqa: ANN202
+        yield b"a"
+        raise OSError("disk gone")
+
+    with pytest.raises(OSError, match="disk gone"):
+        h.Size(_broken())
+    assert client.ops("reader_push")[-1]["err"] == "OSError: disk gone"
+    assert len(client.ops("reader_free")) == 1
+
+
+class _UnbufferedGo:
+    """Stands in for `SharedLibClient._call`: a reader_push returns only once the call took its chunk."""
+
+    def __init__(self) -> None:
+        self.chunks: queue.Queue = queue.Queue()
+        self.release = threading.Event()
+
+    def send(self, req: bytes) -> bytes:
+        r = msgpack.unpackb(req, raw=False)
+        op = r["op"]
+        if op == "batch":
+            with ThreadPoolExecutor(len(r["batch"])) as ex:
+                result = list(ex.map(self.send, r["batch"]))
+        elif op == "reader_new":
+            result = 1
+        elif op == "reader_push":
+            taken = threading.Event()
+            self.chunks.put((r.get("value"), taken))
+            result = taken.wait(5)
+        elif op == "call" and r["fn"] == "Slow":
+            result = self.release.wait(5)
+        elif op == "call":
+            result = 0
+            while True:
+                data, taken = self.chunks.get(timeout=5)
+                taken.set()
+                if data is None:
+                    break
+                result += len(data)
+        else:
+            result = None
+        return msgpack.packb({"ok": True, "result": result}, use_bin_type=True)
+
+
+def test_reader_pushes_are_not_coalesced_with_the_reading_call(make_handle) -> None:  # noqa: ANN001
+    from usegolib import abi
+    from usegolib.runtime.cbridge import SharedLibClient
+
+    go = _UnbufferedGo()
+    client = SharedLibClient(Path("unused.so"))
+    client._call = go.send  # type: ignore[method-assign]  # noqa: SLF001
+    client.set_coalescing(max_delay=0.3)
+    h = make_handle(client, _MANIFEST)
+
+    # Keep Go busy so that requests wait to be batched.
+    slow_req = abi.encode_call_request(pkg="example.com/p", fn="Slow", args=[])
+    slow = threading.Thread(target=client.call, args=(slow_req,))
+    slow.start()
+    try:
+        assert h.Size(iter([b"ab", b"cde", b"f"])) == 6
+    finally:
+        go.release.set()
+        slow.join()
+
+
+def test_reader_params_are_accepted_at_build_time() -> None:
+    from usegolib.builder.build import _are_supported_params
+
+    assert _are_supported_params(["io.Reader", "int64"])
+    assert not _are_supported_params(["[]io.Reader"])
+    assert not _are_supported_params(["...io.Reader"])
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import pytest
+
+from conftest import FakeClient
+
+
+class _UpperClient(FakeClient):
+    def respond(self, req: dict) -> dict:
+        if req["op"] != "call":
+            return {"ok": True, "result": 1}  # pin_new / pin_free
+        if req["fn"] == "NewNode":
+            return {"ok": True, "result": 7}
+        arg = req["args"][0]
+        return {"ok": True, "result": "PINNED" if isinstance(arg, dict) else arg.upper()}
+
+
+def _manifest(*, pure: list[str] | None = None) -> dict:
+    return {
+        "structs": {"example.com/p": {"Node": []}},
+        "symbols": [
+            {"pkg": "example.com/p", "name": "Upper", "params": ["string"], "results": ["string"]},
+            {"pkg": "example.com/p", "name": "Trim", "params": ["string"], "results": ["string"]},
+            {"pkg": "example.com/p", "name": "NewNode", "params": [], "results": ["*Node"]},
+        ],
+        "functions": [{"pkg": "example.com/p", "name": n, "pure": True} for n in pure or []],
+    }
+
+
+def test_result_cache_lru_bytes_and_ttl() -> None:
+    from usegolib.cache import MISS, ResultCache
+
+    now = [0.0]
+    c = ResultCache(maxsize=2, clock=lambda: now[0])
+    c.put(b"a", 1, size=1)
+    c.put(b"b", 2, size=1)
+    assert c.get(b"a") == 1  # b is now least recently used
+    c.put(b"c", 3, size=1)
+    assert c.get(b"b") is MISS
+    assert c.stats()["evictions"] == 1
+
+    c = ResultCache(maxbytes=10)
+    c.put(b"a", 1, size=5)
+    c.put(b"b", 2, size=5)
+    assert c.stats()["entries"] == 1 and c.stats()["bytes"] == 6
+    c.put(b"huge", 3, size=100)
+    assert c.get(b"huge") is MISS
+
+    c = ResultCache(ttl=1.0, clock=lambda: now[0])
+    c.put(b"a", None, size=1)
+    assert c.get(b"a") is None
+    now[0] = 2.0
+    assert c.get(b"a") is MISS
+    assert c.stats()["hits"] == 1 and c.stats()["misses"] == 1
+
+
+def test_cache_hits_skip_the_go_call(make_handle) -> None:  # noqa: ANN001
+    client = _UpperClient()
+    h = make_handle(client, _manifest())
+
+    assert h.Upper("a") == "A"
+    assert h.Upper("a") == "A"
+    assert len(client.reqs) == 2  # not cached until requested
+
+    cache = h.cache("Upper", maxsize=8)
+    assert cache is not None
+    assert [h.Upper("a"), h.Upper("a"), h.Upper("b")] == ["A", "A", "B"]
+    assert len(client.reqs) == 4
+    assert h.cache_stats()["Upper"]["hits"] == 1
+    assert h.cache_stats()["Upper"]["misses"] == 2
+
+    assert h.cache("Upper", maxsize=0) is None
+    h.Upper("a")
+    assert len(client.reqs) == 5
+
+
+def test_mutating_a_hit_does_not_change_the_next_hit(make_handle) -> None:  # noqa: ANN001
+    from usegolib.cache import ResultCache
+
+    c = ResultCache()
+    c.put(b"k", {"xs": [1, 2]}, size=1)
+    c.get(b"k")["xs"].append(3)
+    assert c.get(b"k") == {"xs": [1, 2]}
+
+    client = FakeClient(result=[1, 2])
+    manifest = _manifest(pure=["Digits"])
+    manifest["symbols"].append(
+        {"pkg": "example.com/p", "name": "Digits", "params": ["string"], "results": ["[]int64"]}
+    )
+    h = make_handle(client, manifest)
+    first = h.Digits("a")
+    first.append(3)
+    second = h.Digits("a")
+    second.append(4)
+    assert h.Digits("a") == [1, 2]
+    assert len(client.reqs) == 1
+
+
+def test_pure_annotated_functions_are_cached_by_default(make_handle) -> None:  # noqa: ANN001
+    client = _UpperClient()
+    h = make_handle(client, _manifest(pure=["Trim"]))
+    h.Trim("x")
+    h.Trim("x")
+    h.Upper("x")
+    h.Upper("x")
+    assert [r["fn"] for r in client.reqs] == ["Trim", "Upper", "Upper"]
+    assert set(h.cache_stats()) == {"Trim"}
+
+
+def test_functions_returning_handles_are_not_cached(make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import UseGoLibError
+
+    client = _UpperClient()
+    h = make_handle(client, _manifest(pure=["NewNode"]))
+    with pytest.raises(UseGoLibError, match="object handles"):
+        h.cache("NewNode")
+    a = h.NewNode()
+    b = h.NewNode()
+    assert a is not b
+    assert len(client.reqs) == 2
+
+
+def test_calls_with_pinned_args_are_not_cached(make_handle) -> None:  # noqa: ANN001
+    client = _UpperClient()
+    h = make_handle(client, _manifest(pure=["Upper"]))
+    p = h.pin("a", go_type="string")
+    assert [h.Upper(p), h.Upper(p)] == ["PINNED", "PINNED"]
+    assert [r["args"] for r in client.ops("call")] == [[{"$usegolib_pin": 1}]] * 2
+    assert "Upper" not in h.cache_stats()
+
+
+def test_disk_cache_budget_isolation_and_ttl(tmp_path) -> None:  # noqa: ANN001
+    from usegolib.cache import DiskCache
+
+    dc = DiskCache(tmp_path / "results.sqlite3", maxbytes=100)
+    dc.put("lib1", b"a", b"x" * 40)
+    dc.put("lib1", b"b", b"x" * 40)
+    assert dc.get("lib1", b"a") == b"x" * 40  # a is now most recently used
+    dc.put("lib1", b"c", b"x" * 40)
+    assert dc.get("lib1", b"b") is None
+    assert dc.get("lib1", b"a") is not None
+    assert dc.get("lib2", b"a") is None  # another artifact never sees these rows
+    dc.put("lib1", b"huge", b"x" * 200)
+    assert dc.get("lib1", b"huge") is None
+    assert dc.get("lib1", b"a", ttl=1e-9) is None
+    st = dc.stats()
+    assert st["entries"] == 1 and st["bytes"] <= 100
+
+
+def test_disk_cache_keeps_a_running_size_total(tmp_path) -> None:  # noqa: ANN001
+    import sqlite3
+
+    from usegolib.cache import DiskCache
+
+    path = tmp_path / "results.sqlite3"
+    # A cache file written before the total was tracked.
+    old = sqlite3.connect(path)
+    old.execute(
+        "CREATE TABLE results (lib TEXT NOT NULL, key BLOB NOT NULL, value BLOB NOT NULL, "
+        "size INTEGER NOT NULL, ctime REAL NOT NULL, atime REAL NOT NULL, PRIMARY KEY (lib, key))"
+    )
+    old.execute("INSERT INTO results VALUES ('lib1', x'6f', x'0000', 3, 0, 0)")
+    old.commit()
+    old.close()
+
+    dc = DiskCache(path, maxbytes=100)
+    assert dc.stats()["bytes"] == 3
+    dc.put("lib1", b"a", b"x" * 40)
+    dc.put("lib1", b"a", b"x" * 20)  # overwrite
+    dc.put("lib1", b"b", b"x" * 30)
+    assert dc.stats()["bytes"] == 3 + 21 + 31
+    dc.put("lib1", b"c", b"x" * 50)  # evicts the oldest rows
+    assert dc.get("lib1", b"c", ttl=1e-9) is None  # expired and deleted
+    conn = sqlite3.connect(path)
+    (actual,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()
+    conn.close()
+    assert dc.stats()["bytes"] == actual
+    dc.clear()
+    assert dc.stats()["bytes"] == 0
+
+
+def test_disk_cache_is_shared_across_processes(tmp_path) -> None:  # noqa: ANN001
+    import subprocess
+    import sys
+
+    from usegolib.cache import DiskCache
+
+    path = tmp_path / "results.sqlite3"
+    code = (
+        "import sys; from usegolib.cache import DiskCache; "
+        "DiskCache(sys.argv[1]).put('lib', b'k', b'from-child')"
+    )
+    subprocess.check_call([sys.executable, "-c", code, str(path)])
+    assert DiskCache(path).get("lib", b"k") == b"from-child"
+
+
+def test_disk_tier_warms_a_fresh_handle(tmp_path, monkeypatch, make_handle) -> None:  # noqa: ANN001
+    from dataclasses import replace
+
+    monkeypatch.setenv("USEGOLIB_DISK_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("USEGOLIB_DISK_CACHE", "1")
+
+    client = _UpperClient()
+    h1 = replace(make_handle(client, _manifest(pure=["Upper"])), _library_sha256="a" * 64)
+    assert h1.Upper("q") == "Q"
+    assert len(client.reqs) == 1
+
+    # A new handle (e.g. a restarted worker) starts with an empty memory tier.
+    h2 = replace(make_handle(client, _manifest(pure=["Upper"])), _library_sha256="a" * 64)
+    assert h2.Upper("q") == "Q"
+    assert len(client.reqs) == 1
+    assert h2.cache_stats()["Upper"]["disk"]["hits"] >= 1
+
+    # A rebuilt artifact does not reuse results.
+    h3 = replace(make_handle(client, _manifest(pure=["Upper"])), _library_sha256="b" * 64)
+    assert h3.Upper("q") == "Q"
+    assert len(client.reqs) == 2
+
+    with pytest.raises(Exception, match="library.sha256"):
+        make_handle(client, _manifest()).cache("Upper", disk=True)
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import pytest
+
+from conftest import FakeClient
+
+
+_MANIFEST = {
+    "structs": {
+        "example.com/p": {
+            "Meta": [{"name": "Tag", "type": "string", "key": "tag"}, {"name": "Notes", "type": "string"}],
+            "Row": [
+                {"name": "ID", "type": "int64", "key": "id"},
+                {"name": "Score", "type": "float64"},
+                {"name": "Body", "type": "string"},
+                {"name": "Meta", "type": "*Meta"},
+            ],
+            "Store": [],
+        }
+    },
+    "symbols": [
+        {"pkg": "example.com/p", "name": "Rows", "params": ["int64"], "results": ["[]Row", "error"]},
+        {"pkg": "example.com/p", "name": "Count", "params": [], "results": ["int64"]},
+    ],
+    "methods": [
+        {"pkg": "example.com/p", "recv": "Store", "name": "Get", "params": ["int64"], "results": ["Row"]},
+    ],
+}
+
+
+def test_select_sends_canonical_paths_and_accepts_partial_records(make_handle) -> None:  # noqa: ANN001
+    client = FakeClient({"ok": True, "result": [{"id": 1, "Score": 0.5, "Meta": {"tag": "x"}}]})
+    h = make_handle(client, _MANIFEST)
+
+    rows = h.Rows.select("ID", "Score", "Meta.Tag", "id")(10, timeout=1)
+    assert rows == [{"id": 1, "Score": 0.5, "Meta": {"tag": "x"}}]
+    assert client.reqs[0]["select"] == ["id", "Score", "Meta.tag"]
+    assert client.reqs[0]["timeout_ns"] == 1_000_000_000
+
+    # Plain calls do not send a selection (and still require every field).
+    from usegolib.errors import UnsupportedTypeError
+
+    client._responses.append({"ok": True, "result": [{"id": 1}]})  # noqa: SLF001
+    with pytest.raises(UnsupportedTypeError, match="missing required"):
+        h.Rows(1)
+    assert "select" not in client.reqs[1]
+
+
+def test_select_validates_paths(make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import UnsupportedTypeError
+
+    h = make_handle(FakeClient(), _MANIFEST)
+    with pytest.raises(UnsupportedTypeError, match="unknown field Nope"):
+        h.Rows.select("Nope")
+    with pytest.raises(UnsupportedTypeError, match="not a record struct"):
+        h.Rows.select("Score.X")
+    with pytest.raises(UnsupportedTypeError, match="no record struct"):
+        h.Count.select("ID")
+    with pytest.raises(UnsupportedTypeError, match="invalid field path"):
+        h.Rows.select("Meta.")
+
+
+def test_select_on_methods_and_typed_partial_dataclasses(make_handle) -> None:  # noqa: ANN001
+    client = FakeClient(
+        {"ok": True, "result": 7},
+        {"ok": True, "result": {"Score": 2.0, "Meta": {"tag": "t"}}},
+        {"ok": True, "result": [{"id": 3}]},
+    )
+    h = make_handle(client, _MANIFEST)
+    th = h.typed()
+
+    obj = th.object("Store")
+    row = obj.Get.select("Score", "Meta.Tag")(1)
+    assert client.reqs[1]["op"] == "obj_call" and client.reqs[1]["select"] == ["Score", "Meta.tag"]
+    assert type(row).__name__ == "Row"
+    assert row.Score == 2.0 and row.ID is None and row.Body is None
+    assert row.Meta.Tag == "t" and row.Meta.Notes is None
+
+    (only,) = th.Rows.select("ID")(1)
+    assert only.ID == 3 and only.Score is None
@@ -81,3 +81,18 @@ def test_schema_multi_return_values_are_lists():
 
     with pytest.raises(UnsupportedTypeError, match=r"wrong result arity"):
         validate_call_result(schema=schema, pkg="example.com/p", fn="Pair", result=[1])
+
+
+def test_schema_unsigned_ints_are_range_checked():
+    schema = Schema.from_manifest(
+        {
+            "structs": {"example.com/p": {}},
+            "symbols": [{"pkg": "example.com/p", "name": "Put", "params": ["uint8", "uint64"], "results": []}],
+        }
+    )
+
+    validate_call_args(schema=schema, pkg="example.com/p", fn="Put", args=[255, 2**64 - 1])
+    with pytest.raises(UnsupportedTypeError, match="out of range"):
+        validate_call_args(schema=schema, pkg="example.com/p", fn="Put", args=[256, 0])
+    with pytest.raises(UnsupportedTypeError, match="out of range"):
+        validate_call_args(schema=schema, pkg="example.com/p", fn="Put", args=[0, -1])
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from conftest import FakeClient
+
+
+class _SlowClient(FakeClient):
+    """Fake client whose calls block until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+
+    def respond(self, req: dict) -> dict:
+        self.release.wait(5)
+        return {"ok": True, "result": [req["args"][0]]}
+
+
+def _call_in_threads(fn, args: list) -> tuple[list[threading.Thread], list]:  # noqa: ANN001
+    out: list = [None] * len(args)
+
+    def _worker(i: int) -> None:
+        out[i] = fn(args[i])
+
+    ts = [threading.Thread(target=_worker, args=(i,)) for i in range(len(args))]
+    for t in ts:
+        t.start()
+    return ts, out
+
+
+def test_concurrent_identical_calls_share_one_execution(make_handle) -> None:  # noqa: ANN001
+    client = _SlowClient()
+    h = make_handle(client)
+    h.single_flight("Lookup")
+
+    ts, out = _call_in_threads(h.Lookup, ["a"] * 8 + ["b"] * 2)
+    deadline = time.monotonic() + 5
+    while h.single_flight_stats()["Lookup"]["shared"] < 8 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    client.release.set()
+    for t in ts:
+        t.join()
+
+    assert len(client.reqs) == 2
+    assert out == [["a"]] * 8 + [["b"]] * 2
+    assert out[0] is not out[1]  # each waiter decodes its own result
+    assert h.single_flight_stats()["Lookup"] == {"calls": 2, "shared": 8, "in_flight": 0}
+
+    h.single_flight("Lookup", enabled=False)
+    assert h.single_flight_stats() == {}
+
+
+def test_single_flight_shares_exceptions() -> None:
+    from usegolib.cache import SingleFlight
+
+    sf = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def _boom() -> None:
+        started.set()
+        release.wait(5)
+        raise RuntimeError("boom")
+
+    errors: list[BaseException] = []
+
+    def _worker() -> None:
+        try:
+            sf.do(b"k", _boom)
+        except RuntimeError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=_worker)
+    leader.start()
+    started.wait(5)
+    follower = threading.Thread(target=_worker)
+    follower.start()
+    while sf.stats()["shared"] < 1:
+        time.sleep(0.01)
+    release.set()
+    leader.join()
+    follower.join()
+    assert len(errors) == 2
+    assert sf.stats()["in_flight"] == 0
+
+
+def test_single_flight_rejects_unknown_or_handle_returning_functions(make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import UseGoLibError
+    h = make_handle(
+        _SlowClient(),
+        {
+            "structs": {"example.com/p": {"Node": []}},
+            "symbols": [{"pkg": "example.com/p", "name": "NewNode", "params": [], "results": ["*Node"]}],
+        },
+    )
+    with pytest.raises(UseGoLibError, match="object handles"):
+        h.single_flight("NewNode")
+    with pytest.raises(UseGoLibError, match="symbol not found"):
+        h.single_flight("Missing")
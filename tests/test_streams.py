@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from conftest import FakeClient
+
+
+class _FakeStreamClient(FakeClient):
+    """Serves stream_* ops from in-memory item lists registered by `call` requests."""
+
+    def __init__(self, values: dict[str, list]) -> None:
+        super().__init__()
+        self._values = values
+        self._live: dict[int, list] = {}
+
+    def respond(self, req: dict) -> dict:
+        op = req["op"]
+        if op in ("call", "obj_call"):
+            sid = len(self._live) + 1
+            self._live[sid] = list(self._values[req.get("fn") or req["method"]])
+            result = {"$usegolib_stream": sid}
+        elif op == "obj_new":
+            result = 1
+        elif op == "stream_next":
+            items = self._live[req["id"]]
+            if items and items[0] == "boom":
+                err = {"type": "GoPanicError", "message": "panic"}
+                return {"ok": False, "error": err}
+            n = req.get("chunk") or 256
+            out, self._live[req["id"]] = items[:n], items[n:]
+            result = {"items": out, "done": not self._live[req["id"]]}
+        elif op == "stream_close":
+            self._live.pop(req["id"], None)
+            result = None
+        else:
+            result = None
+        return {"ok": True, "result": result}
+
+
+_MANIFEST = {
+    "structs": {
+        "example.com/p": {
+            "Event": [{"name": "ID", "type": "int64"}],
+            "Feed": [],
+        }
+    },
+    "symbols": [
+        {"pkg": "example.com/p", "name": "Ticks", "params": [], "results": ["<-chan int64"]},
+        {"pkg": "example.com/p", "name": "Pairs", "params": [], "results": ["iter.Seq2[string, int64]"]},
+        {"pkg": "example.com/p", "name": "Fail", "params": [], "results": ["iter.Seq[string]"]},
+    ],
+    "methods": [
+        {"pkg": "example.com/p", "recv": "Feed", "name": "Events", "params": [], "results": ["iter.Seq[Event]"]},
+    ],
+}
+
+
+def test_stream_item_types() -> None:
+    from usegolib.schema import stream_item_types
+
+    assert stream_item_types("<-chan int64") == ["int64"]
+    assert stream_item_types("chan []string") == ["[]string"]
+    assert stream_item_types("iter.Seq[*Event]") == ["*Event"]
+    assert stream_item_types("iter.Seq2[string, map[string][]int64]") == ["string", "map[string][]int64"]
+    assert stream_item_types("[]int64") is None
+    assert stream_item_types("chan<- int64") is None
+
+
+def test_stream_results_must_be_the_only_value() -> None:
+    from usegolib.builder.build import _are_supported_results
+
+    assert _are_supported_results(["<-chan int64"])
+    assert _are_supported_results(["iter.Seq2[string, int64]", "error"])
+    assert not _are_supported_results(["<-chan int64", "int64"])
+    assert not _are_supported_results(["iter.Seq[func()]"])
+
+
+def test_stream_iterates_in_chunks_and_closes_at_the_end(make_handle) -> None:  # noqa: ANN001
+    client = _FakeStreamClient({"Ticks": list(range(10))})
+    h = make_handle(client, _MANIFEST)
+
+    s = h.Ticks()
+    s.chunk = 4
+    assert list(s) == list(range(10))
+    assert [r["chunk"] for r in client.reqs if r["op"] == "stream_next"] == [4, 4, 4]
+    assert len(client.ops("stream_close")) == 1
+    assert list(s) == []
+
+    # Streams are consumed once: never cached or shared between callers.
+    h.Ticks()
+    assert len(client.ops("call")) == 2
+
+
+def test_stream_pairs_async_iteration_and_typed_items(make_handle) -> None:  # noqa: ANN001
+    client = _FakeStreamClient({"Pairs": [["a", 1], ["b", 2]], "Events": [{"ID": 1}, {"ID": 2}]})
+    h = make_handle(client, _MANIFEST)
+
+    async def _collect(s):  # noqa: ANN001, ANN202
+        return [x async for x in s]
+
+    assert asyncio.run(_collect(h.Pairs())) == [("a", 1), ("b", 2)]
+
+    feed = h.typed().object("Feed")
+    events = list(feed.Events())
+    assert [type(e).__name__ for e in events] == ["Event", "Event"] and events[1].ID == 2
+
+
+def test_stream_close_and_errors(make_handle) -> None:  # noqa: ANN001
+    from usegolib.errors import GoPanicError, UseGoLibError
+
+    client = _FakeStreamClient({"Ticks": list(range(1000)), "Fail": ["boom"]})
+    h = make_handle(client, _MANIFEST)
+
+    with h.Ticks() as s:
+        assert next(s) == 0
+    assert len(client.ops("stream_close")) == 1
+    with pytest.raises(UseGoLibError, match="closed"):
+        list(s)
+
+    with pytest.raises(GoPanicError):
+        list(h.Fail())
+    assert len(client.ops("stream_close")) == 2
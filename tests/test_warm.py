@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from usegolib.runtime.platform import host_goarch, host_goos
+
+
+_SCHEMA = {
+    "structs": {
+        "example.com/p": {
+            "Point": [
+                {"name": "X", "type": "int64", "key": "x", "aliases": ["x_"]},
+                {"name": "Tag", "type": "*string", "omitempty": True},
+            ]
+        }
+    },
+    "symbols": [
+        {"pkg": "example.com/p", "name": "Add", "params": ["int64", "int64"], "results": ["int64"], "doc": "Add adds."},
+        {"pkg": "example.com/p", "name": "Wait", "params": ["int64"], "results": ["error"], "context": True},
+        {"pkg": "example.com/p", "name": "Map_int64", "params": ["[]int64"], "results": ["[]int64"]},
+    ],
+    "methods": [{"pkg": "example.com/p", "recv": "Point", "name": "Len", "params": [], "results": ["float64"]}],
+    "generics": [{"pkg": "example.com/p", "name": "Map", "type_args": ["int64"], "symbol": "Map_int64"}],
+    "vars": [{"pkg": "example.com/p", "name": "Origin", "type": "*Point"}],
+    "types": [{"pkg": "example.com/p", "name": "Point", "concurrency": "rwlock", "readonly": ["Len"]}],
+    "functions": [{"pkg": "example.com/p", "name": "Add", "pure": True}],
+}
+
+
+def _write_artifact(
+    leaf: Path,
+    *,
+    version: str = "v1.0.0",
+    goos: str | None = None,
+    lib_bytes: bytes = b"not a real shared library",
+    sha: str | None = None,
+) -> Path:
+    leaf.mkdir(parents=True, exist_ok=True)
+    (leaf / "libusegolib.so").write_bytes(lib_bytes)
+    obj = {
+        "manifest_version": 1,
+        "abi_version": 0,
+        "module": "example.com/p",
+        "version": version,
+        "goos": goos or host_goos(),
+        "goarch": host_goarch(),
+        "packages": ["example.com/p"],
+        "symbols": [],
+        "schema": _SCHEMA,
+        "library": {
+            "path": "libusegolib.so",
+            "sha256": sha if sha is not None else hashlib.sha256(lib_bytes).hexdigest(),
+        },
+    }
+    (leaf / "manifest.json").write_text(json.dumps(obj), encoding="utf-8")
+    return leaf
+
+
+def test_warm_writes_index_verification_and_schema_caches(tmp_path: Path) -> None:
+    from usegolib.warm import warm_artifact_root
+
+    root = tmp_path / "artifacts"
+    leaf = _write_artifact(root / "example.com" / "p@v1.0.0" / f"{host_goos()}-{host_goarch()}")
+
+    results = warm_artifact_root(root, jobs=2)
+    assert [(r.manifest_dir, r.status) for r in results] == [(leaf, "ok")]
+    assert (root / ".usegolib-index.json").exists()
+    assert (leaf / ".usegolib-verified.json").exists()
+    assert (leaf / ".usegolib-schema.msgpack").exists()
+
+
+def test_warm_reports_hash_mismatch_and_skips_other_platforms(tmp_path: Path) -> None:
+    from usegolib.warm import warm_artifact_root
+
+    root = tmp_path / "artifacts"
+    bad = _write_artifact(root / "a" / "p@v1.0.0" / "x", sha="0" * 64)
+    other = _write_artifact(root / "b" / "p@v2.0.0" / "y", version="v2.0.0", goos="plan9")
+
+    by_dir = {r.manifest_dir: r for r in warm_artifact_root(root)}
+    assert by_dir[bad].status == "error"
+    assert "sha256 mismatch" in by_dir[bad].detail
+    assert not (bad / ".usegolib-verified.json").exists()
+    assert by_dir[other].status == "skipped"
+
+
+def test_load_after_warm_skips_hashing_and_schema_compile(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import usegolib
+    import usegolib.handle
+    from usegolib.schema import Schema
+    from usegolib.warm import warm_artifact_root
+
+    root = tmp_path / "artifacts"
+    leaf = _write_artifact(root / "example.com" / "p@v1.0.0" / f"{host_goos()}-{host_goarch()}")
+    warm_artifact_root(root)
+
+    class DummyClient:
+        def __init__(self, _path: Path):
+            pass
+
+    def _no_hash(_path):
+        raise AssertionError("library should not be re-hashed after warm")
+
+    def _no_compile(_schema):
+        raise AssertionError("schema should be loaded from the sidecar after warm")
+
+    monkeypatch.setattr(usegolib.handle, "SharedLibClient", DummyClient)
+    monkeypatch.setattr(usegolib.handle, "_sha256_file", _no_hash)
+    monkeypatch.setattr(Schema, "from_manifest", staticmethod(_no_compile))
+
+    h = usegolib.load_artifact(leaf)
+    assert h.schema is not None
+    assert h.schema.symbols_by_pkg["example.com/p"]["Add"] == (["int64", "int64"], ["int64"])
+
+
+def test_verification_cache_is_invalidated_by_library_change(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    import usegolib
+    import usegolib.errors
+    import usegolib.handle
+    from usegolib.warm import warm_artifact_root
+
+    root = tmp_path / "artifacts"
+    leaf = _write_artifact(root / "example.com" / "p@v1.0.0" / f"{host_goos()}-{host_goarch()}")
+    warm_artifact_root(root)
+
+    class DummyClient:
+        def __init__(self, _path: Path):
+            raise AssertionError("tampered library must not be loaded")
+
+    monkeypatch.setattr(usegolib.handle, "SharedLibClient", DummyClient)
+    (leaf / "libusegolib.so").write_bytes(b"tampered library bytes")
+
+    with pytest.raises(usegolib.errors.LoadError, match=r"sha256 mismatch"):
+        usegolib.load_artifact(leaf)
+
+
+def test_cli_warm_python_package(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys) -> None:
+    from usegolib.cli import main
+
+    site = tmp_path / "site"
+    pkg = site / "mypkg"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text("", encoding="utf-8")
+    leaf = _write_artifact(pkg / "_usegolib_artifacts" / "example.com" / "p@v1.0.0" / f"{host_goos()}-{host_goarch()}")
+    monkeypatch.syspath_prepend(str(site))
+    monkeypatch.setattr(sys, "argv", ["usegolib", "warm", "--python-package", "mypkg"])
+
+    main()
+    out = capsys.readouterr().out
+    assert f"ok: {leaf} (example.com/p@v1.0.0)" in out
+    assert (leaf / ".usegolib-verified.json").exists()
+
+
+def test_cli_warm_exits_nonzero_on_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from usegolib.cli import main
+
+    root = tmp_path / "artifacts"
+    _write_artifact(root / "example.com" / "p@v1.0.0" / f"{host_goos()}-{host_goarch()}", sha="0" * 64)
+    monkeypatch.setattr(sys, "argv", ["usegolib", "warm", "--artifact-dir", str(root)])
+
+    with pytest.raises(SystemExit) as ei:
+        main()
+    assert ei.value.code == 1
+
+
+def test_schema_sidecar_round_trips_and_stale_or_broken_is_a_miss(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import msgpack
+
+    import usegolib.artifact
+    from usegolib.artifact import read_manifest, read_schema_sidecar
+    from usegolib.schema import Schema
+    from usegolib.warm import warm_artifact_root
+
+    root = tmp_path / "artifacts"
+    leaf = _write_artifact(root / "example.com" / "p@v1.0.0" / f"{host_goos()}-{host_goarch()}")
+    warm_artifact_root(root)
+    manifest = read_manifest(leaf / "manifest.json")
+    sidecar = leaf / ".usegolib-schema.msgpack"
+    assert read_schema_sidecar(manifest) == Schema.from_manifest(manifest.schema)
+
+    # A sidecar written by different schema code (another version or an edited dev checkout) is stale.
+    monkeypatch.setattr(usegolib.artifact, "_schema_code_fingerprint", lambda: "other")
+    assert read_schema_sidecar(manifest) is None
+    monkeypatch.undo()
+
+    header = sidecar.read_bytes().partition(b"\n")[0]
+    for payload in (b"\xc1garbage", msgpack.packb({"structs": []}), msgpack.packb(["not a schema"]), b""):
+        sidecar.write_bytes(header + b"\n" + payload)
+        assert read_schema_sidecar(manifest) is None
+    sidecar.write_bytes(b"\x00\xff not a sidecar")
+    assert read_schema_sidecar(manifest) is None
@@ -0,0 +1,87 @@
+"""Measure Go call throughput as the number of Python threads grows.
+
+Usage:
+  python tools/bench_thread_scaling.py --artifact-dir out/artifacts \
+      --module example.com/mod --fn AddInt --args "[1, 2]" --threads 1,2,4,8
+
+On a free-threaded build (for example `python3.13t`) throughput should scale
+close to linearly with the thread count as long as the Go function itself is
+CPU-bound and does not contend on shared state. On a GIL build the Python-side
+encode/decode/validate work serializes and scaling flattens early.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import sysconfig
+import threading
+import time
+
+
+def _gil_enabled() -> bool:
+    probe = getattr(sys, "_is_gil_enabled", None)
+    return True if probe is None else bool(probe())
+
+
+def _measure(fn, args: list, *, threads: int, seconds: float) -> float:
+    stop = threading.Event()
+    barrier = threading.Barrier(threads + 1)
+    counts = [0] * threads
+
+    def _worker(i: int) -> None:
+        barrier.wait()
+        n = 0
+        while not stop.is_set():
+            fn(*args)
+            n += 1
+        counts[i] = n
+
+    ts = [threading.Thread(target=_worker, args=(i,)) for i in range(threads)]
+    for t in ts:
+        t.start()
+    barrier.wait()
+    start = time.perf_counter()
+    time.sleep(seconds)
+    stop.set()
+    for t in ts:
+        t.join()
+    return sum(counts) / (time.perf_counter() - start)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--artifact-dir", required=True)
+    ap.add_argument("--module", required=True)
+    ap.add_argument("--version", default=None)
+    ap.add_argument("--fn", required=True, help="exported Go function to call")
+    ap.add_argument("--args", default="[]", help="JSON list of call arguments")
+    ap.add_argument("--threads", default="1,2,4,8", help="comma-separated thread counts")
+    ap.add_argument("--seconds", type=float, default=2.0, help="measurement time per thread count")
+    ns = ap.parse_args()
+
+    import usegolib
+
+    h = usegolib.import_(ns.module, ns.version, artifact_dir=ns.artifact_dir, build_if_missing=False)
+    fn = getattr(h, ns.fn)
+    args = json.loads(ns.args)
+    fn(*args)  # warm up
+
+    print(
+        f"python {sys.version.split()[0]} "
+        f"free-threaded-build={bool(sysconfig.get_config_var('Py_GIL_DISABLED'))} "
+        f"gil-enabled={_gil_enabled()} cpus={os.cpu_count()}"
+    )
+    base: float | None = None
+    for n in (int(x) for x in ns.threads.split(",") if x.strip()):
+        rate = _measure(fn, args, threads=n, seconds=ns.seconds)
+        base = rate if base is None else base
+        speedup = rate / base
+        print(f"threads={n:<3} calls/s={rate:12.0f} speedup={speedup:5.2f} efficiency={speedup / n:5.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())